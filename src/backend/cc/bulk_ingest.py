@@ -0,0 +1,182 @@
+"""COPY-based bulk ingestion for the L1 memory layer.
+
+``log_l1`` is tuned for one interaction at a time: one ORM unit of work per event
+and a commit per call. Backfills and bursty agent sessions need thousands of
+records per second, so this module streams rows straight into ``base_log``,
+``event_log`` and ``prompt_trace`` with asyncpg's binary ``COPY`` protocol.
+
+Features:
+- Client-side UUIDs so child rows reference their parent without a round trip
+- One ``COPY`` per table, parents first, all inside the caller's transaction
+- Same record shape and return value as ``log_l1`` for each event
+- No Redis publishing: bulk loads are for backfills, not live fan-out
+"""
+
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import logfire
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.logger import get_logger
+from src.common.request_id_middleware import get_request_id
+
+from .logging import L1EventInput, parse_request_id
+
+logger = get_logger(__name__)
+
+BASE_LOG_COLUMNS = ("id", "timestamp", "level", "message", "payload")
+EVENT_LOG_COLUMNS = ("id", "base_log_id", "event_type", "event_data", "request_id", "trace_id", "created_at")
+PROMPT_TRACE_COLUMNS = (
+    "id",
+    "base_log_id",
+    "prompt_text",
+    "response_text",
+    "execution_time_ms",
+    "token_count",
+    "created_at",
+)
+
+
+def _json(value: dict[str, Any]) -> str:
+    # asyncpg JSON/JSONB codec expects *str* not *bytes* (see src/db/connection.py)
+    return orjson.dumps(value).decode()
+
+
+def build_l1_rows(
+    events: Sequence[L1EventInput],
+) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]], list[tuple[Any, ...]], list[dict[str, uuid.UUID]]]:
+    """Build COPY records for all three tables with client-generated UUIDs.
+
+    Returns
+    -------
+        Tuple of (base_log rows, event_log rows, prompt_trace rows, per-event id maps)
+
+    """
+    base_rows: list[tuple[Any, ...]] = []
+    event_rows: list[tuple[Any, ...]] = []
+    prompt_rows: list[tuple[Any, ...]] = []
+    result_ids: list[dict[str, uuid.UUID]] = []
+
+    context_request_id = get_request_id()
+    now = datetime.now(UTC)
+
+    for event in events:
+        event_type = event["event_type"]
+        payload = event.get("payload")
+        prompt_data = event.get("prompt_data")
+        created_at = event.get("timestamp") or now
+
+        base_log_id = uuid.uuid4()
+        ids = {"base_log_id": base_log_id}
+        base_rows.append((base_log_id, created_at, "INFO", f"Event: {event_type}", _json(payload or {})))
+
+        if payload is not None:
+            raw_request_id = event.get("request_id") or context_request_id
+            event_log_id = uuid.uuid4()
+            ids["event_log_id"] = event_log_id
+            event_rows.append(
+                (
+                    event_log_id,
+                    base_log_id,
+                    event_type,
+                    _json(payload),
+                    parse_request_id(raw_request_id) if raw_request_id else None,
+                    event.get("trace_id"),
+                    created_at,
+                )
+            )
+
+        if prompt_data is not None:
+            prompt_trace_id = uuid.uuid4()
+            ids["prompt_trace_id"] = prompt_trace_id
+            prompt_rows.append(
+                (
+                    prompt_trace_id,
+                    base_log_id,
+                    prompt_data.get("prompt_text", ""),
+                    prompt_data.get("response_text", ""),
+                    prompt_data.get("execution_time_ms", 0),
+                    prompt_data.get("token_count", 0),
+                    created_at,
+                )
+            )
+
+        result_ids.append(ids)
+
+    return base_rows, event_rows, prompt_rows, result_ids
+
+
+async def bulk_ingest_l1(
+    db: AsyncSession,
+    events: Sequence[L1EventInput],
+    *,
+    commit: bool = True,
+) -> list[dict[str, uuid.UUID]]:
+    """Bulk-load L1 events with ``COPY`` into base_log, event_log and prompt_trace.
+
+    Args:
+    ----
+        db: AsyncSession bound to an asyncpg engine
+        events: Events to persist; each follows the ``log_l1`` argument shape
+        commit: Commit the session after copying (set False to join a larger transaction)
+
+    Returns:
+    -------
+        One id map per input event, in input order (same keys as ``log_l1``)
+
+    Performance:
+        - Three COPY round trips regardless of batch size
+        - No per-row flush, identity-map bookkeeping or RETURNING
+
+    """
+    from src.backend.cc.mem0_models import BaseLog, EventLog, PromptTrace
+
+    if not events:
+        return []
+
+    base_rows, event_rows, prompt_rows, result_ids = build_l1_rows(events)
+
+    with logfire.span("bulk_ingest_l1", event_count=len(events)) as span:
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None or not hasattr(driver_connection, "copy_records_to_table"):
+            msg = "bulk_ingest_l1 requires an asyncpg-backed session"
+            raise RuntimeError(msg)
+
+        # Parents first so FK constraints on event_log/prompt_trace are satisfied
+        for model, columns, rows in (
+            (BaseLog, BASE_LOG_COLUMNS, base_rows),
+            (EventLog, EVENT_LOG_COLUMNS, event_rows),
+            (PromptTrace, PROMPT_TRACE_COLUMNS, prompt_rows),
+        ):
+            if rows:
+                await driver_connection.copy_records_to_table(
+                    model.__tablename__,
+                    records=rows,
+                    columns=columns,
+                    schema_name=model.__table__.schema,
+                )
+
+        span.set_attribute("base_log_rows", len(base_rows))
+        span.set_attribute("event_log_rows", len(event_rows))
+        span.set_attribute("prompt_trace_rows", len(prompt_rows))
+
+    if prompt_rows:
+        from src.backend.cc.prompt_rollups import mark_backfilled_traces
+
+        await mark_backfilled_traces(
+            db, (event.get("timestamp") for event in events if event.get("prompt_data") is not None)
+        )
+
+    if commit:
+        await db.commit()
+
+    logger.debug(
+        f"Bulk ingested {len(base_rows)} base_log, {len(event_rows)} event_log, {len(prompt_rows)} prompt_trace rows"
+    )
+    return result_ids
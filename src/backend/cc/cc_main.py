@@ -11,13 +11,18 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
+from core_v2.utils.log_writer import shutdown_log_writer
 from fastapi import APIRouter, FastAPI, Request, WebSocket
 
+from src.common.config import get_settings
 from src.common.logger import log_event
 from src.common.request_id_middleware import RequestIDMiddleware
 from src.graph.base import close_neo4j_connections
 from src.graph.router import router as graph_router
 
+from .outbox_relay import get_outbox_relay, shutdown_outbox_relay
+from .partitions import get_partition_maintenance, shutdown_partition_maintenance
+from .prompt_rollups import get_prompt_rollup_job, shutdown_prompt_rollup_job
 from .router import router
 
 # Initialize logging for this module
@@ -146,6 +151,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if logfire_initialized:
         instrumentation_applied = _instrument_fastapi_app(app)
 
+    # Relay durable outbox rows to Redis (safe to run in every worker process)
+    settings = get_settings()
+    if settings.L1_OUTBOX_MODE == "durable":
+        get_outbox_relay().start()
+
+    # Pre-create L1 log partitions and drop expired ones (partitioned databases only)
+    if settings.L1_PARTITION_MAINTENANCE_ENABLED:
+        get_partition_maintenance().start()
+
+    # Fold new prompt traces into hourly latency/token rollups
+    if settings.L1_ROLLUP_ENABLED:
+        get_prompt_rollup_job().start()
+
     log_event(
         source="cc",
         data={
@@ -170,6 +188,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Close Neo4j connections
     await close_neo4j_connections()
 
+    # Stop relaying outbox rows; unpublished rows stay in the table for the next start
+    await shutdown_outbox_relay()
+    await shutdown_partition_maintenance()
+    await shutdown_prompt_rollup_job()
+
+    # Persist any log events still queued on the background writer
+    await shutdown_log_writer()
+
 
 # Create FastAPI app for the module
 cc_app = FastAPI(
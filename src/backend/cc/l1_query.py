@@ -0,0 +1,319 @@
+"""Read path for L1 memory: filtered, keyset-paginated EventLog queries.
+
+Features:
+- Filters on event_type, created_at range, request_id and trace_id (all indexed)
+- Keyset pagination on ``(created_at, id)`` with opaque cursors instead of OFFSET
+- Constant-memory export that streams rows from a server-side cursor
+- Request/trace correlation timelines loaded in two queries and cached in an LRU
+"""
+
+import base64
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload
+
+from src.common.config import get_settings
+
+from .mem0_models import BaseLog, EventLog
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+
+
+@dataclass(slots=True, frozen=True)
+class EventLogFilter:
+    """Filter criteria for EventLog queries. ``None`` fields are ignored."""
+
+    event_type: str | None = None
+    since: datetime | None = None  # inclusive
+    until: datetime | None = None  # exclusive
+    request_id: uuid.UUID | None = None
+    trace_id: str | None = None
+
+
+def encode_cursor(created_at: datetime, event_id: uuid.UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    raw = f"{created_at.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises
+    ------
+        ValueError: If the cursor is malformed
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, event_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(event_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        msg = f"Invalid cursor: {cursor!r}"
+        raise ValueError(msg) from e
+
+
+def build_event_log_query(filters: EventLogFilter, *, descending: bool = True) -> Select[EventLog]:
+    """Build the filtered, keyset-ordered EventLog select, loading shared payload blobs."""
+    stmt = select(EventLog).options(selectinload(EventLog.payload_blob))
+    if filters.event_type is not None:
+        stmt = stmt.where(EventLog.event_type == filters.event_type)
+    if filters.since is not None:
+        stmt = stmt.where(EventLog.created_at >= filters.since)
+    if filters.until is not None:
+        stmt = stmt.where(EventLog.created_at < filters.until)
+    if filters.request_id is not None:
+        stmt = stmt.where(EventLog.request_id == filters.request_id)
+    if filters.trace_id is not None:
+        stmt = stmt.where(EventLog.trace_id == filters.trace_id)
+
+    if descending:
+        return stmt.order_by(EventLog.created_at.desc(), EventLog.id.desc())
+    return stmt.order_by(EventLog.created_at.asc(), EventLog.id.asc())
+
+
+async def query_event_logs(
+    db: AsyncSession,
+    filters: EventLogFilter,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> tuple[list[EventLog], str | None]:
+    """Fetch one page of event logs.
+
+    Args:
+    ----
+        db: AsyncSession for database operations
+        filters: Filter criteria
+        limit: Page size (capped at MAX_PAGE_SIZE)
+        cursor: Cursor from the previous page, or None for the first page
+        descending: Newest first (default) or oldest first
+
+    Returns:
+    -------
+        Tuple of (event logs, cursor for the next page or None if this is the last page)
+
+    Raises:
+    ------
+        ValueError: If the cursor is malformed
+
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    stmt = build_event_log_query(filters, descending=descending)
+
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        keyset = tuple_(EventLog.created_at, EventLog.id)
+        stmt = stmt.where(keyset < position if descending else keyset > position)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = list(result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
+
+
+async def stream_event_logs(
+    db: AsyncSession,
+    filters: EventLogFilter,
+    *,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    descending: bool = False,
+) -> AsyncIterator[EventLog]:
+    """Stream every matching event log through a server-side cursor.
+
+    Rows are fetched ``batch_size`` at a time and expunged after yielding, so
+    memory use stays constant regardless of result size.
+    """
+    stmt = build_event_log_query(filters, descending=descending).execution_options(yield_per=batch_size)
+    result = await db.stream(stmt)
+    async for partition in result.scalars().partitions():
+        for event_log in partition:
+            yield event_log
+        for event_log in partition:
+            db.expunge(event_log)
+
+
+def event_log_to_dict(event_log: EventLog) -> dict[str, Any]:
+    """Convert an EventLog to a JSON-friendly dictionary."""
+    return {
+        "id": str(event_log.id),
+        "base_log_id": str(event_log.base_log_id),
+        "event_type": event_log.event_type,
+        "event_data": event_log.resolved_event_data,
+        "request_id": str(event_log.request_id) if event_log.request_id else None,
+        "trace_id": event_log.trace_id,
+        "created_at": event_log.created_at.isoformat(),
+    }
+
+
+class CorrelationCache:
+    """Small LRU cache of recently viewed correlation timelines.
+
+    Entries expire after ``ttl`` seconds because a trace can still be growing
+    while it is being inspected.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 30.0) -> None:
+        """Initialize cache holding at most ``max_size`` timelines for ``ttl`` seconds."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> list[dict[str, Any]] | None:
+        """Return a cached timeline and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self._ttl:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: tuple[str, str], timeline: list[dict[str, Any]]) -> None:
+        """Store a timeline, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), timeline)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached timelines."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached timelines."""
+        return len(self._entries)
+
+
+async def load_correlated_logs(
+    db: AsyncSession, *, request_id: uuid.UUID | None = None, trace_id: str | None = None
+) -> list[BaseLog]:
+    """Load every base log correlated with a request or trace, with its children.
+
+    Event logs come from the same joined query (``contains_eager``), their
+    shared payload blobs and the prompt traces from one ``selectinload`` query
+    each, so the whole tree costs at most three round trips regardless of its
+    size (the blob query is skipped when no event log references a blob).
+
+    Raises
+    ------
+        ValueError: If neither or both of request_id and trace_id are given
+
+    """
+    if (request_id is None) == (trace_id is None):
+        msg = "Exactly one of request_id or trace_id is required"
+        raise ValueError(msg)
+
+    condition = EventLog.request_id == request_id if request_id is not None else EventLog.trace_id == trace_id
+    stmt = (
+        select(BaseLog)
+        .join(BaseLog.event_logs)
+        .where(condition)
+        .options(
+            contains_eager(BaseLog.event_logs).selectinload(EventLog.payload_blob),
+            selectinload(BaseLog.prompt_traces),
+        )
+        .order_by(BaseLog.timestamp, BaseLog.id)
+    )
+    result = await db.execute(stmt)
+    return list(result.unique().scalars().all())
+
+
+def build_timeline(base_logs: list[BaseLog]) -> list[dict[str, Any]]:
+    """Flatten a correlated log tree into JSON-friendly entries ordered by timestamp."""
+    entries: list[dict[str, Any]] = []
+    for base_log in base_logs:
+        entries.append(
+            {
+                "kind": "base_log",
+                "id": str(base_log.id),
+                "base_log_id": str(base_log.id),
+                "timestamp": base_log.timestamp.isoformat(),
+                "data": {"level": base_log.level, "message": base_log.message},
+            }
+        )
+        entries.extend(
+            {"kind": "event_log", **event_log_to_dict(event_log), "timestamp": event_log.created_at.isoformat()}
+            for event_log in base_log.event_logs
+        )
+        entries.extend(
+            {
+                "kind": "prompt_trace",
+                "id": str(prompt_trace.id),
+                "base_log_id": str(base_log.id),
+                "timestamp": prompt_trace.created_at.isoformat(),
+                "data": {
+                    "prompt_text": prompt_trace.prompt_text,
+                    "response_text": prompt_trace.response_text,
+                    "execution_time_ms": prompt_trace.execution_time_ms,
+                    "token_count": prompt_trace.token_count,
+                },
+            }
+            for prompt_trace in base_log.prompt_traces
+        )
+    entries.sort(key=lambda entry: entry["timestamp"])
+    return entries
+
+
+async def get_correlation_timeline(
+    db: AsyncSession, *, request_id: uuid.UUID | None = None, trace_id: str | None = None
+) -> tuple[list[dict[str, Any]], bool]:
+    """Get the timeline for a request or trace, serving repeat views from the LRU cache.
+
+    Returns
+    -------
+        Tuple of (timeline entries, whether the result came from the cache)
+
+    Raises
+    ------
+        ValueError: If neither or both of request_id and trace_id are given
+
+    """
+    if (request_id is None) == (trace_id is None):
+        msg = "Exactly one of request_id or trace_id is required"
+        raise ValueError(msg)
+    key = ("request_id", str(request_id)) if request_id is not None else ("trace_id", str(trace_id))
+    cache = get_correlation_cache()
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    timeline = build_timeline(await load_correlated_logs(db, request_id=request_id, trace_id=trace_id))
+    if timeline:
+        cache.put(key, timeline)
+    return timeline, False
+
+
+# Process-wide singleton
+_correlation_cache: CorrelationCache | None = None
+
+
+def get_correlation_cache() -> CorrelationCache:
+    """Get the process-wide correlation cache, sized from settings."""
+    global _correlation_cache
+    if _correlation_cache is None:
+        settings = get_settings()
+        _correlation_cache = CorrelationCache(
+            max_size=settings.L1_CORRELATION_CACHE_SIZE, ttl=settings.L1_CORRELATION_CACHE_TTL_S
+        )
+    return _correlation_cache
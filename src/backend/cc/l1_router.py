@@ -0,0 +1,99 @@
+"""API router for reading L1 memory (mem0 event logs).
+
+Provides filtered, keyset-paginated listing, a streaming NDJSON export,
+request/trace correlation timelines and hourly prompt trace rollups.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import l1_query, prompt_rollups
+from .deps import get_cc_db
+from .schemas import CorrelationTimeline, EventLogPage, EventLogRecord, PromptRollupResponse
+
+router = APIRouter(prefix="/l1", tags=["l1"])
+
+
+def _event_filter(
+    event_type: str | None = Query(None, description="Filter by event type"),
+    since: datetime | None = Query(None, description="Only events at or after this time"),  # noqa: B008
+    until: datetime | None = Query(None, description="Only events before this time"),  # noqa: B008
+    request_id: UUID | None = Query(None, description="Filter by request ID"),  # noqa: B008
+    trace_id: str | None = Query(None, description="Filter by trace ID"),
+) -> l1_query.EventLogFilter:
+    return l1_query.EventLogFilter(
+        event_type=event_type, since=since, until=until, request_id=request_id, trace_id=trace_id
+    )
+
+
+@router.get("/events", response_model=EventLogPage)
+async def list_events(
+    filters: l1_query.EventLogFilter = Depends(_event_filter),  # noqa: B008
+    db: AsyncSession = Depends(get_cc_db),  # noqa: B008
+    limit: int = Query(l1_query.DEFAULT_PAGE_SIZE, description="Page size", ge=1, le=l1_query.MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="Cursor returned by the previous page"),
+    order: str = Query("desc", description="Sort order by created_at", pattern="^(asc|desc)$"),
+) -> EventLogPage:
+    """List event logs newest first (or oldest first) with keyset pagination."""
+    try:
+        rows, next_cursor = await l1_query.query_event_logs(
+            db, filters, limit=limit, cursor=cursor, descending=order == "desc"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    items = [EventLogRecord.model_validate(l1_query.event_log_to_dict(row)) for row in rows]
+    return EventLogPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/events/export")
+async def export_events(
+    filters: l1_query.EventLogFilter = Depends(_event_filter),  # noqa: B008
+) -> StreamingResponse:
+    """Export all matching event logs, oldest first, as newline-delimited JSON."""
+    from src.db.connection import get_async_session_maker
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        # The request-scoped session closes before the body is sent, so the stream owns its own session
+        async with get_async_session_maker()() as session:
+            async for event_log in l1_query.stream_event_logs(session, filters):
+                yield orjson.dumps(l1_query.event_log_to_dict(event_log)) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/correlation", response_model=CorrelationTimeline)
+async def get_correlation(
+    db: AsyncSession = Depends(get_cc_db),  # noqa: B008
+    request_id: UUID | None = Query(None, description="Request ID to correlate"),  # noqa: B008
+    trace_id: str | None = Query(None, description="Trace ID to correlate"),
+) -> CorrelationTimeline:
+    """Get every base log, event log and prompt trace for a request or trace as a timeline."""
+    try:
+        entries, cached = await l1_query.get_correlation_timeline(db, request_id=request_id, trace_id=trace_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not entries:
+        raise HTTPException(status_code=404, detail="No records found for this request or trace")
+    return CorrelationTimeline.model_validate(
+        {"request_id": request_id, "trace_id": trace_id, "entries": entries, "cached": cached}
+    )
+
+
+@router.get("/prompt-rollups", response_model=PromptRollupResponse)
+async def get_prompt_rollups(
+    start: datetime = Query(..., description="Range start (truncated to the hour)"),  # noqa: B008
+    end: datetime = Query(..., description="Range end (exclusive)"),  # noqa: B008
+    db: AsyncSession = Depends(get_cc_db),  # noqa: B008
+) -> PromptRollupResponse:
+    """Get prompt trace latency and token percentiles for a time range from hourly rollups."""
+    try:
+        rollups = await prompt_rollups.get_rollups(db, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return PromptRollupResponse.model_validate(rollups)
@@ -8,26 +8,65 @@ Features:
 - Logfire span integration with trace_id extraction and custom attributes
 - Request ID context handling with UUID fallback
 - Performance-optimized: P95 latency target < 2ms
+- Client-side UUIDs: one flush per call and no cross-session locking
+- Batch API (log_l1_many) with multi-row INSERT and one pipelined Redis publish
+- Optional durable outbox (L1_OUTBOX_MODE="durable") relayed by outbox_relay
 - Comprehensive error handling with graceful degradation
 """
 
 import asyncio
 import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NotRequired, Required, TypedDict
 
 import logfire
-from sqlalchemy import event
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.common.config import get_settings
 from src.common.logger import get_logger
 from src.common.pubsub import get_pubsub
 from src.common.request_id_middleware import get_request_id
 
-_flush_lock = asyncio.Lock()
 logger = get_logger(__name__)
 
+L1_CHANNEL = "mem0.recorded.cc"
+
+# Keep fire-and-forget batch publishes referenced until they finish so they are not garbage collected
+_publish_tasks: set[asyncio.Task[None]] = set()
+
+
+class L1EventInput(TypedDict, total=False):
+    """A single L1 event, mirroring the arguments of ``log_l1``."""
+
+    event_type: Required[str]
+    payload: dict[str, Any] | None
+    prompt_data: dict[str, Any] | None
+    request_id: str | None
+    trace_id: str | None
+    timestamp: NotRequired[datetime]  # defaults to now; set for backfills
+
+
+def _current_trace_id() -> str | None:
+    """Get the trace ID of the current Logfire span, if any."""
+    try:
+        current_span_func = getattr(logfire, "current_span", None)
+        if current_span_func:
+            current_span = current_span_func()
+            if current_span and hasattr(current_span, "context"):
+                return str(current_span.context.trace_id)
+    except (AttributeError, RuntimeError, ValueError):
+        # Graceful degradation - continue without trace_id
+        pass
+    return None
+
+
+def _durable_outbox_enabled() -> bool:
+    """Return True if L1 events go through the mem0 outbox table instead of the session outbox."""
+    return get_settings().L1_OUTBOX_MODE == "durable"
+
 
 async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> None:
     """Publish L1 event to Redis after successful database commit with enhanced error handling.
@@ -52,7 +91,7 @@ async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> No
             pubsub = await get_pubsub()
 
             # Publish to the L1 Redis channel with correlation ID
-            subscriber_count = await pubsub.publish("mem0.recorded.cc", event_data, correlation_id=correlation_id)
+            subscriber_count = await pubsub.publish(L1_CHANNEL, event_data, correlation_id=correlation_id)
 
             # Set comprehensive span attributes for observability
             span.set_attribute("log_id", str(log_id))
@@ -66,7 +105,7 @@ async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> No
                 "L1 event published successfully to Redis",
                 log_id=str(log_id),
                 correlation_id=correlation_id,
-                channel="mem0.recorded.cc",
+                channel=L1_CHANNEL,
                 subscriber_count=subscriber_count,
                 event_type=event_data.get("event", {}).get("event_type", "unknown"),
             )
@@ -78,7 +117,7 @@ async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> No
             "correlation_id": correlation_id,
             "error": str(e),
             "error_type": type(e).__name__,
-            "channel": "mem0.recorded.cc",
+            "channel": L1_CHANNEL,
             "event_type": event_data.get("event", {}).get("event_type", "unknown"),
             "event_data_size": len(str(event_data)),
             "success": False,
@@ -101,7 +140,7 @@ async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> No
         try:
             if hasattr(pubsub, "publish_with_fallback"):
                 fallback_result = await pubsub.publish_with_fallback(
-                    "mem0.recorded.cc", event_data, correlation_id=correlation_id, fallback_strategy="log_only"
+                    L1_CHANNEL, event_data, correlation_id=correlation_id, fallback_strategy="log_only"
                 )
 
                 logfire.info(
@@ -121,6 +160,29 @@ async def _publish_l1_event(log_id: uuid.UUID, event_data: dict[str, Any]) -> No
             )
 
 
+def parse_request_id(request_id: str | uuid.UUID) -> uuid.UUID:
+    """Convert a request ID to a UUID, generating a new one if it is not valid.
+
+    Args:
+    ----
+        request_id: Request ID string (or UUID) from the caller or request context
+
+    Returns:
+    -------
+        Parsed UUID, or a freshly generated UUID for invalid input
+
+    """
+    if isinstance(request_id, uuid.UUID):
+        return request_id
+    try:
+        return uuid.UUID(request_id)
+    except (TypeError, ValueError, AttributeError):
+        # If request_id is not a valid UUID, generate a new one and log the original
+        parsed_request_id = uuid.uuid4()
+        logger.debug(f"Invalid UUID format for request_id '{request_id}', generated new UUID: {parsed_request_id}")
+        return parsed_request_id
+
+
 @event.listens_for(Session, "after_commit", named=True)
 def _after_commit_publish_events(session: Session, **kw: Any) -> None:
     """SQLAlchemy after_commit event listener for Redis publishing.
@@ -153,6 +215,73 @@ def _after_commit_publish_events(session: Session, **kw: Any) -> None:
         logfire.warn("No running event loop for Redis publishing", event_count=len(outbox_events))
 
 
+async def _publish_l1_events(outbox_events: list[tuple[uuid.UUID, dict[str, Any]]]) -> None:
+    """Publish a batch of L1 events to Redis as one pipeline after commit.
+
+    Like :func:`_publish_l1_event`, all exceptions are caught and logged. If the
+    pipeline fails, each event falls back to the ``log_only`` strategy.
+
+    Args:
+    ----
+        outbox_events: (log_id, event_data) pairs queued by ``log_l1_many``
+
+    """
+    pubsub = None
+    try:
+        with logfire.span("publish_l1_events", kind="producer", batch_size=len(outbox_events)) as span:
+            pubsub = await get_pubsub()
+            subscriber_counts = await pubsub.publish_many([(L1_CHANNEL, event_data) for _, event_data in outbox_events])
+            span.set_attribute("subscriber_count", sum(subscriber_counts))
+            span.set_attribute("success", True)
+
+    except Exception as e:
+        logfire.error(
+            "Failed to publish L1 event batch to Redis - implementing graceful degradation",
+            batch_size=len(outbox_events),
+            error=str(e),
+            error_type=type(e).__name__,
+            channel=L1_CHANNEL,
+        )
+        logger.error(f"Redis batch publish failed for {len(outbox_events)} L1 events: {e}")
+
+        if pubsub is None or not hasattr(pubsub, "publish_with_fallback"):
+            return
+        for log_id, event_data in outbox_events:
+            try:
+                await pubsub.publish_with_fallback(L1_CHANNEL, event_data, fallback_strategy="log_only")
+            except Exception as fallback_error:
+                logfire.error(
+                    "L1 event fallback strategy also failed", log_id=str(log_id), fallback_error=str(fallback_error)
+                )
+
+
+@event.listens_for(Session, "after_commit", named=True)
+def _after_commit_publish_batches(session: Session, **kw: Any) -> None:
+    """SQLAlchemy after_commit listener that publishes ``log_l1_many`` batches.
+
+    Each batch in ``session.info["l1_outbox_batches"]`` is published by one task
+    using a single Redis pipeline.
+
+    Args:
+    ----
+        session: The Session that was committed
+        **kw: Additional event arguments (ignored)
+
+    """
+    batches = session.info.pop("l1_outbox_batches", None)
+    if not batches:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+        for batch in batches:
+            task = loop.create_task(_publish_l1_events(batch))
+            _publish_tasks.add(task)
+            task.add_done_callback(_publish_tasks.discard)
+    except RuntimeError:
+        logfire.warn("No running event loop for Redis publishing", event_count=sum(len(batch) for batch in batches))
+
+
 async def log_l1(
     db: AsyncSession,
     event_type: str,
@@ -178,12 +307,13 @@ async def log_l1(
 
     Performance:
         - Target P95 latency: < 2ms
-        - Uses AsyncSession with optimized flush/commit patterns
+        - IDs are generated client-side, so all rows go out in the commit's single flush
+        - No process-wide lock: concurrent callers on different sessions proceed in parallel
         - Minimal Logfire overhead with graceful error handling
 
     """
     # Import models directly to avoid registry conflicts
-    from src.backend.cc.mem0_models import BaseLog, EventLog, PromptTrace
+    from src.backend.cc.mem0_models import BaseLog, EventLog, L1Outbox, PromptTrace
 
     base_log_cls = BaseLog
     event_log_cls = EventLog
@@ -197,45 +327,20 @@ async def log_l1(
 
     # Get trace_id from Logfire if not provided
     if not trace_id:
-        try:
-            current_span_func = getattr(logfire, "current_span", None)
-            if current_span_func:
-                current_span = current_span_func()
-                if current_span and hasattr(current_span, "context"):
-                    trace_id = str(current_span.context.trace_id)
-        except (AttributeError, RuntimeError, ValueError):
-            # Graceful degradation - continue without trace_id
-            pass
-
-    # Create base log record
-    base_log = base_log_cls(level="INFO", message=f"Event: {event_type}", payload=payload or {})
+        trace_id = _current_trace_id()
+
+    # Create base log record with a client-side ID so children can reference it before any flush
+    base_log = base_log_cls(id=uuid.uuid4(), level="INFO", message=f"Event: {event_type}", payload=payload or {})
     db.add(base_log)
-    async with _flush_lock:
-        await db.flush()  # Flush to get the ID without committing
 
     result_ids = {"base_log_id": base_log.id}
 
     # Create event log if payload provided
     if payload is not None:
-        # Handle request_id conversion with validation
-        try:
-            if isinstance(request_id, str):
-                # Try to parse as UUID, but fall back to generating new UUID if invalid
-                try:
-                    parsed_request_id = uuid.UUID(request_id)
-                except ValueError:
-                    # If request_id is not a valid UUID, generate a new one and log the original
-                    parsed_request_id = uuid.uuid4()
-                    logger.debug(
-                        f"Invalid UUID format for request_id '{request_id}', generated new UUID: {parsed_request_id}"
-                    )
-            else:
-                parsed_request_id = request_id
-        except Exception:
-            # Ultimate fallback - generate new UUID
-            parsed_request_id = uuid.uuid4()
+        parsed_request_id = parse_request_id(request_id)
 
         event_log = event_log_cls(
+            id=uuid.uuid4(),
             event_type=event_type,
             event_data=payload,
             request_id=parsed_request_id,
@@ -243,8 +348,6 @@ async def log_l1(
             base_log_id=base_log.id,
         )
         db.add(event_log)
-        async with _flush_lock:
-            await db.flush()
         result_ids["event_log_id"] = event_log.id
 
         # Queue event for Redis publishing after commit
@@ -259,14 +362,19 @@ async def log_l1(
             },
         }
 
-        # Add to session outbox for after_commit publishing
-        if "l1_outbox" not in db.info:
-            db.info["l1_outbox"] = []
-        db.info["l1_outbox"].append((event_log.id, event_publish_data))
+        if _durable_outbox_enabled():
+            # Written in the same transaction; the outbox relay publishes it
+            db.add(L1Outbox(channel=L1_CHANNEL, payload=event_publish_data))
+        else:
+            # Add to session outbox for after_commit publishing
+            if "l1_outbox" not in db.info:
+                db.info["l1_outbox"] = []
+            db.info["l1_outbox"].append((event_log.id, event_publish_data))
 
     # Create prompt trace if prompt_data provided
     if prompt_data is not None:
         prompt_trace = prompt_trace_cls(
+            id=uuid.uuid4(),
             prompt_text=prompt_data.get("prompt_text", ""),
             response_text=prompt_data.get("response_text", ""),
             execution_time_ms=prompt_data.get("execution_time_ms", 0),
@@ -274,8 +382,6 @@ async def log_l1(
             base_log_id=base_log.id,
         )
         db.add(prompt_trace)
-        async with _flush_lock:
-            await db.flush()
         result_ids["prompt_trace_id"] = prompt_trace.id
 
     # Add custom attributes to current Logfire span
@@ -291,7 +397,129 @@ async def log_l1(
         # Graceful degradation - span attributes are optional
         pass
 
-    # Commit transaction to persist all records
-    async with _flush_lock:
-        await db.commit()
+    # Commit flushes all pending rows in one unit of work (parents ordered before children)
+    await db.commit()
+    return result_ids
+
+
+async def log_l1_many(
+    db: AsyncSession,
+    events: Sequence[L1EventInput],
+    request_id: str | None = None,
+    trace_id: str | None = None,
+) -> list[dict[str, uuid.UUID]]:
+    """Log many events to L1 memory in one transaction.
+
+    Rows are written with one multi-row ``INSERT ... RETURNING`` per table and all
+    event logs are published to Redis as a single pipeline after commit.
+
+    Args:
+    ----
+        db: AsyncSession for database operations
+        events: Events to log; each follows the ``log_l1`` argument shape
+        request_id: Default request ID for events without one (uses context if not provided)
+        trace_id: Default trace ID for events without one (uses current span if not provided)
+
+    Returns:
+    -------
+        One dictionary of created record IDs per input event, in input order
+
+    Performance:
+        - Three INSERT statements and one commit regardless of batch size
+        - One Redis pipeline round trip for all published events
+
+    """
+    from src.backend.cc.mem0_models import BaseLog, EventLog, L1Outbox, PromptTrace
+
+    if not events:
+        return []
+
+    request_id = request_id or get_request_id() or str(uuid.uuid4())
+    trace_id = trace_id or _current_trace_id()
+    now = datetime.now(UTC)
+
+    base_rows = [
+        {
+            "level": "INFO",
+            "message": f"Event: {item['event_type']}",
+            "payload": item.get("payload") or {},
+            "timestamp": item.get("timestamp") or now,
+        }
+        for item in events
+    ]
+    base_result = await db.execute(insert(BaseLog).returning(BaseLog.id, sort_by_parameter_order=True), base_rows)
+    base_log_ids = base_result.scalars().all()
+    result_ids: list[dict[str, uuid.UUID]] = [{"base_log_id": base_log_id} for base_log_id in base_log_ids]
+
+    event_indexes = [index for index, item in enumerate(events) if item.get("payload") is not None]
+    if event_indexes:
+        event_rows = [
+            {
+                "base_log_id": base_log_ids[index],
+                "event_type": events[index]["event_type"],
+                "event_data": events[index]["payload"],
+                "request_id": parse_request_id(events[index].get("request_id") or request_id),
+                "trace_id": events[index].get("trace_id") or trace_id,
+                "created_at": events[index].get("timestamp") or now,
+            }
+            for index in event_indexes
+        ]
+        event_result = await db.execute(
+            insert(EventLog).returning(EventLog.id, sort_by_parameter_order=True), event_rows
+        )
+        event_log_ids = event_result.scalars().all()
+
+        created_at = now.isoformat()
+        outbox_batch = []
+        for index, event_log_id in zip(event_indexes, event_log_ids, strict=True):
+            result_ids[index]["event_log_id"] = event_log_id
+            outbox_batch.append(
+                (
+                    event_log_id,
+                    {
+                        "log_id": str(event_log_id),
+                        "created_at": created_at,
+                        "event": {
+                            "event_type": events[index]["event_type"],
+                            "event_data": events[index]["payload"],
+                            "request_id": events[index].get("request_id") or request_id,
+                            "trace_id": events[index].get("trace_id") or trace_id,
+                        },
+                    },
+                )
+            )
+        if _durable_outbox_enabled():
+            await db.execute(
+                insert(L1Outbox), [{"channel": L1_CHANNEL, "payload": event_data} for _, event_data in outbox_batch]
+            )
+        else:
+            db.info.setdefault("l1_outbox_batches", []).append(outbox_batch)
+
+    prompt_indexes = [index for index, item in enumerate(events) if item.get("prompt_data") is not None]
+    if prompt_indexes:
+        prompt_rows = []
+        for index in prompt_indexes:
+            prompt_data = events[index]["prompt_data"] or {}
+            prompt_rows.append(
+                {
+                    "base_log_id": base_log_ids[index],
+                    "prompt_text": prompt_data.get("prompt_text", ""),
+                    "response_text": prompt_data.get("response_text", ""),
+                    "execution_time_ms": prompt_data.get("execution_time_ms", 0),
+                    "token_count": prompt_data.get("token_count", 0),
+                    "created_at": events[index].get("timestamp") or now,
+                }
+            )
+        prompt_result = await db.execute(
+            insert(PromptTrace).returning(PromptTrace.id, sort_by_parameter_order=True), prompt_rows
+        )
+        prompt_trace_ids = prompt_result.scalars().all()
+        for index, prompt_trace_id in zip(prompt_indexes, prompt_trace_ids, strict=True):
+            result_ids[index]["prompt_trace_id"] = prompt_trace_id
+
+        from src.backend.cc.prompt_rollups import mark_backfilled_traces
+
+        await mark_backfilled_traces(db, (events[index].get("timestamp") for index in prompt_indexes), now=now)
+
+    await db.commit()
     return result_ids
@@ -10,7 +10,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy import TIMESTAMP, BigInteger, ForeignKey, Identity, Index, Integer, String, Text, text
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -95,6 +95,9 @@ class BaseLog(Base):
 
     Stores primary logging events with structured payload support.
     All other logging tables reference this as the source of truth.
+
+    Migrated databases range-partition this table on ``timestamp`` (see
+    ``src.backend.cc.partitions``); foreign keys to it are not enforced there.
     """
 
     __tablename__ = "base_log"
@@ -103,6 +106,7 @@ class BaseLog(Base):
         Index("ix_base_log_timestamp", "timestamp"),
         Index("ix_base_log_level", "level"),
         Index("ix_base_log_level_timestamp", "level", "timestamp"),
+        Index("ix_base_log_payload_hash", "payload_hash"),
         get_mem0_table_args(),
     )
 
@@ -137,6 +141,16 @@ class BaseLog(Base):
         postgresql.JSONB, nullable=True, comment="Structured payload data as JSONB"
     )
 
+    # Content-addressed shared payload (see PayloadBlob); payload then holds only per-row fields
+    payload_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, comment="SHA-256 of the shared payload_blob content"
+    )
+    payload_blob: Mapped["PayloadBlob | None"] = relationship(
+        "PayloadBlob",
+        primaryjoin="foreign(BaseLog.payload_hash) == PayloadBlob.hash",
+        viewonly=True,
+    )
+
     # Relationships to child tables
     prompt_traces: Mapped[list["PromptTrace"]] = relationship(
         "PromptTrace", back_populates="base_log", cascade="all, delete-orphan"
@@ -145,6 +159,13 @@ class BaseLog(Base):
         "EventLog", back_populates="base_log", cascade="all, delete-orphan"
     )
 
+    @property
+    def resolved_payload(self) -> dict[str, Any] | None:
+        """Get the full payload, merging shared blob content with the per-row fields."""
+        if self.payload_blob is None:
+            return self.payload
+        return {**self.payload_blob.content, **(self.payload or {})}
+
     def __repr__(self) -> str:
         """Return string representation of BaseLog."""
         return f"<BaseLog(id={self.id}, level='{self.level}', timestamp={self.timestamp})>"
@@ -224,6 +245,8 @@ class EventLog(Base):
 
     Stores structured event data with request/trace correlation.
     References BaseLog for complete audit trail.
+
+    Migrated databases range-partition this table on ``created_at``.
     """
 
     __tablename__ = "event_log"
@@ -235,6 +258,7 @@ class EventLog(Base):
         Index("ix_event_log_trace_id", "trace_id"),
         Index("ix_event_log_created_at", "created_at"),
         Index("ix_event_log_type_created", "event_type", "created_at"),
+        Index("ix_event_log_payload_hash", "payload_hash"),
         get_mem0_table_args(),
     )
 
@@ -266,6 +290,16 @@ class EventLog(Base):
         postgresql.JSONB, nullable=True, comment="Structured event data as JSONB"
     )
 
+    # Content-addressed shared event data (see PayloadBlob); event_data then holds only per-row fields
+    payload_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, comment="SHA-256 of the shared payload_blob content"
+    )
+    payload_blob: Mapped["PayloadBlob | None"] = relationship(
+        "PayloadBlob",
+        primaryjoin="foreign(EventLog.payload_hash) == PayloadBlob.hash",
+        viewonly=True,
+    )
+
     # Request correlation
     request_id: Mapped[UUID | None] = mapped_column(
         postgresql.UUID(as_uuid=True), nullable=True, index=True, comment="Request ID for correlation across services"
@@ -288,6 +322,179 @@ class EventLog(Base):
     # Relationship to parent BaseLog
     base_log: Mapped["BaseLog"] = relationship("BaseLog", back_populates="event_logs")
 
+    @property
+    def resolved_event_data(self) -> dict[str, Any] | None:
+        """Get the full event data, merging shared blob content with the per-row fields."""
+        if self.payload_blob is None:
+            return self.event_data
+        return {**self.payload_blob.content, **(self.event_data or {})}
+
     def __repr__(self) -> str:
         """Return string representation of EventLog."""
         return f"<EventLog(id={self.id}, event_type='{self.event_type}', request_id={self.request_id})>"
+
+
+class L1Outbox(Base):
+    """Durable transactional outbox for L1 events awaiting Redis publication.
+
+    Rows are written in the same transaction as the EventLog they describe and
+    removed by the outbox relay once published, so events survive crashes and
+    sessions committed outside a running event loop.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # Relay lag and backlog age queries
+        Index("ix_outbox_created_at", "created_at"),
+        get_mem0_table_args(),
+    )
+
+    # Allocated at insert, not commit: concurrent transactions can commit out of id order
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=False), primary_key=True, comment="Outbox sequence")
+
+    # Target Redis channel
+    channel: Mapped[str] = mapped_column(String(200), nullable=False, comment="Redis channel to publish to")
+
+    # Message body exactly as it will be published
+    payload: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB, nullable=False, comment="Message payload")
+
+    # Enqueue timestamp for relay lag measurement
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("NOW()"),
+        nullable=False,
+        comment="UTC timestamp the message was enqueued",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of L1Outbox."""
+        return f"<L1Outbox(id={self.id}, channel='{self.channel}', created_at={self.created_at})>"
+
+
+class PromptTraceRollup(Base):
+    """Hourly PromptTrace latency and token rollup.
+
+    Each row folds every prompt trace created in one UTC hour into counters and
+    mergeable quantile sketches (``src.common.quantile_sketch``), so percentiles
+    for any range of hours are computed by merging sketches instead of scanning
+    raw traces.
+    """
+
+    __tablename__ = "prompt_trace_rollup"
+    __table_args__ = (get_mem0_table_args(),)
+
+    # Start of the UTC hour this row covers
+    bucket_start: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), primary_key=True, comment="Start of the UTC hour covered by this rollup"
+    )
+
+    call_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Number of prompt traces")
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Sum of token_count")
+    total_execution_ms: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, comment="Sum of execution_time_ms"
+    )
+
+    # Serialized QuantileSketch instances
+    latency_sketch: Mapped[dict[str, Any]] = mapped_column(
+        postgresql.JSONB, nullable=False, comment="Mergeable execution_time_ms quantile sketch"
+    )
+    token_sketch: Mapped[dict[str, Any]] = mapped_column(
+        postgresql.JSONB, nullable=False, comment="Mergeable token_count quantile sketch"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        server_default=text("NOW()"),
+        nullable=False,
+        comment="UTC timestamp of the last fold into this rollup",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of PromptTraceRollup."""
+        return f"<PromptTraceRollup(bucket_start={self.bucket_start}, call_count={self.call_count})>"
+
+
+class PromptTraceRollupRefold(Base):
+    """UTC hour whose rollup must be rebuilt because traces were backfilled behind the watermark.
+
+    Backfills (``log_l1_many`` / ``bulk_ingest_l1`` with an explicit
+    ``timestamp``) can insert prompt traces whose ``created_at`` is already below
+    the rollup watermark. They record the affected hours here in the same
+    transaction, and the rollup job rebuilds those hours from raw traces.
+    """
+
+    __tablename__ = "prompt_trace_rollup_refold"
+    __table_args__ = (get_mem0_table_args(),)
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), primary_key=True, comment="Start of the UTC hour to rebuild"
+    )
+    requested_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("NOW()"),
+        nullable=False,
+        comment="UTC timestamp of the first backfill into this hour since the last rebuild",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of PromptTraceRollupRefold."""
+        return f"<PromptTraceRollupRefold(bucket_start={self.bucket_start})>"
+
+
+class RollupWatermark(Base):
+    """High-water mark of the last source row folded by an incremental rollup job."""
+
+    __tablename__ = "rollup_watermark"
+    __table_args__ = (get_mem0_table_args(),)
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Rollup job name")
+    last_created_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True, comment="created_at of the last folded row"
+    )
+    last_id: Mapped[UUID | None] = mapped_column(
+        postgresql.UUID(as_uuid=True), nullable=True, comment="ID of the last folded row (tie breaker)"
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of RollupWatermark."""
+        return f"<RollupWatermark(name='{self.name}', last_created_at={self.last_created_at})>"
+
+
+class PayloadBlob(Base):
+    """Content-addressed store for log payloads shared by many log rows.
+
+    ``log_event`` writes the same ``data``/``tags``/``memo`` into both
+    ``BaseLog.payload`` and ``EventLog.event_data``, and high-volume sources
+    repeat identical content. With ``LOG_PAYLOAD_DEDUP`` enabled that content is
+    stored once here, keyed by the SHA-256 of its canonical JSON, and log rows
+    keep only their per-row fields plus ``payload_hash``.
+    """
+
+    __tablename__ = "payload_blob"
+    __table_args__ = (get_mem0_table_args(),)
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True, comment="SHA-256 hex digest of canonical content")
+    content: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB, nullable=False, comment="Shared payload content")
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, comment="Canonical JSON size in bytes")
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("NOW()"),
+        nullable=False,
+        comment="UTC timestamp of first use",
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("NOW()"),
+        nullable=False,
+        comment="UTC timestamp of the latest reuse (refreshed at most hourly)",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of PayloadBlob."""
+        return f"<PayloadBlob(hash='{self.hash[:12]}', size_bytes={self.size_bytes})>"
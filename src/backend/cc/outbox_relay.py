@@ -0,0 +1,206 @@
+"""Relay worker for the durable L1 outbox.
+
+When ``L1_OUTBOX_MODE`` is ``"durable"``, ``log_l1`` and ``log_l1_many`` write
+the messages destined for ``mem0.recorded.cc`` into the ``mem0_cc.outbox`` table
+in the same transaction as the log rows. This worker drains that table:
+
+- Claims rows in ``id`` order in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``
+- Publishes each batch through one Redis pipeline (``RedisPubSub.publish_many``)
+- Deletes the rows in the claiming transaction, so a failed publish leaves them for retry
+- Runs safely in several processes at once: locked rows are skipped, never double-claimed
+
+Delivery is at-least-once: a crash between publish and commit republishes the batch.
+Ordering is best-effort: ``id`` is allocated when a row is inserted, so rows from
+concurrent transactions can commit (and become visible) out of ``id`` order, and
+parallel relays publish their batches independently. Subscribers must not rely
+on strict commit order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.common.logger import get_logger
+from src.common.pubsub import get_pubsub
+
+logger = get_logger(__name__)
+
+
+class OutboxRelay:
+    """Background task that publishes and deletes outbox rows in batches."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 500,
+        poll_interval: float = 0.2,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        """Initialize the relay.
+
+        Args:
+        ----
+            batch_size: Maximum rows claimed per transaction
+            poll_interval: Seconds to sleep when the outbox is drained
+            session_maker: Optional async session factory (resolved lazily if omitted)
+
+        """
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._session_maker = session_maker
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+        # Metrics
+        self._started_at: float | None = None
+        self._relayed_count = 0
+        self._batch_count = 0
+        self._failed_batches = 0
+        self._last_batch_ms = 0.0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+
+    async def relay_once(self) -> int:
+        """Claim, publish and delete one batch of outbox rows.
+
+        Returns
+        -------
+            Number of rows relayed (0 if the outbox was empty or the publish failed)
+
+        """
+        from src.backend.cc.mem0_models import L1Outbox
+
+        start = time.perf_counter()
+        async with self._get_session_maker()() as session:
+            # id order is allocation order, not commit order (see module docstring)
+            claim = (
+                select(L1Outbox.id, L1Outbox.channel, L1Outbox.payload, L1Outbox.created_at)
+                .order_by(L1Outbox.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = (await session.execute(claim)).all()
+            if not rows:
+                await session.rollback()
+                return 0
+
+            try:
+                pubsub = await get_pubsub()
+                await pubsub.publish_many([(row.channel, row.payload) for row in rows])
+            except Exception as e:
+                # Rolling back releases the row locks so this or another worker retries them
+                await session.rollback()
+                self._failed_batches += 1
+                logger.error(f"Outbox relay failed to publish {len(rows)} messages: {e}")
+                return 0
+
+            await session.execute(delete(L1Outbox).where(L1Outbox.id.in_([row.id for row in rows])))
+            await session.commit()
+
+        now = datetime.now(UTC)
+        lag_ms = (now - min(row.created_at for row in rows)).total_seconds() * 1000
+        self._relayed_count += len(rows)
+        self._batch_count += 1
+        self._last_batch_ms = (time.perf_counter() - start) * 1000
+        self._last_lag_ms = lag_ms
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        return len(rows)
+
+    async def pending_count(self) -> int:
+        """Count rows waiting in the outbox (including rows claimed by other workers)."""
+        from src.backend.cc.mem0_models import L1Outbox
+
+        async with self._get_session_maker()() as session:
+            return int((await session.execute(select(func.count()).select_from(L1Outbox))).scalar_one())
+
+    def start(self) -> None:
+        """Start the relay loop on the running event loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping.clear()
+        self._started_at = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="l1-outbox-relay")
+
+    async def stop(self) -> None:
+        """Stop the relay loop after the current batch."""
+        self._stopping.set()
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the relay loop is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get relay lag and throughput metrics."""
+        uptime = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "running": self.is_running,
+            "batch_size": self._batch_size,
+            "relayed_count": self._relayed_count,
+            "batch_count": self._batch_count,
+            "failed_batches": self._failed_batches,
+            "last_batch_ms": self._last_batch_ms,
+            "last_lag_ms": self._last_lag_ms,
+            "max_lag_ms": self._max_lag_ms,
+            "throughput_per_sec": self._relayed_count / uptime if uptime > 0 else 0.0,
+        }
+
+    async def _run(self) -> None:
+        """Relay batches back to back while the outbox is full, poll when it is drained."""
+        while not self._stopping.is_set():
+            try:
+                relayed = await self.relay_once()
+            except Exception:
+                # Catch all exceptions to prevent the relay from dying silently (e.g. database restarts)
+                logger.exception("Outbox relay iteration failed")
+                relayed = 0
+            if relayed < self._batch_size:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+
+    def _get_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_maker is None:
+            from src.db.connection import get_async_session_maker
+
+            self._session_maker = get_async_session_maker()
+        return self._session_maker
+
+
+# Process-wide singleton
+_relay: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Get the process-wide outbox relay, configured from settings."""
+    global _relay
+    if _relay is None:
+        from src.common.config import get_settings
+
+        settings = get_settings()
+        _relay = OutboxRelay(
+            batch_size=settings.L1_OUTBOX_RELAY_BATCH_SIZE,
+            poll_interval=settings.L1_OUTBOX_RELAY_POLL_INTERVAL_MS / 1000,
+        )
+    return _relay
+
+
+async def shutdown_outbox_relay() -> None:
+    """Stop the process-wide relay if it was started."""
+    global _relay
+    if _relay is not None:
+        try:
+            await _relay.stop()
+        finally:
+            _relay = None
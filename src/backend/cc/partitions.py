@@ -0,0 +1,346 @@
+"""Range-partition maintenance for the append-only L1 log tables.
+
+Migration ``5d2a9c7e41b8`` converts ``base_log`` (on ``timestamp``) and
+``event_log`` (on ``created_at``) into natively range-partitioned tables. This
+module keeps them healthy at runtime:
+
+- Creates daily or monthly partitions ahead of time so inserts never miss a partition
+- Moves rows that landed in the DEFAULT partition (while maintenance was not
+  running) into the period partition created for them
+- Enforces retention by detaching and dropping whole partitions instead of DELETE
+- Leaves non-partitioned tables (e.g. test databases built from metadata) untouched
+
+Queries that filter on the partition key, such as the ``ix_event_log_type_created``
+path (``event_type`` + ``created_at`` range), are pruned to matching partitions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.config import get_settings
+from src.common.logger import get_logger
+
+from .payload_store import prune_orphan_blobs
+
+logger = get_logger(__name__)
+
+Granularity = Literal["day", "month"]
+
+# Partitioned table -> partition key column
+PARTITIONED_TABLES: dict[str, str] = {"base_log": "timestamp", "event_log": "created_at"}
+
+_BOUND_PATTERN = re.compile(r"FROM \((?P<lower>.+?)\) TO \((?P<upper>.+?)\)")
+
+
+@dataclass(slots=True)
+class PartitionInfo:
+    """A child partition and its range bounds (``None`` means MINVALUE/MAXVALUE)."""
+
+    table: str
+    name: str
+    lower: datetime | None
+    upper: datetime | None
+
+
+def _parse_bound(value: str) -> datetime | None:
+    if value.upper() in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+def period_start(moment: datetime, granularity: Granularity) -> datetime:
+    """Truncate a timestamp to the start of its day or month (UTC)."""
+    moment = moment.astimezone(UTC)
+    if granularity == "month":
+        return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_period(start: datetime, granularity: Granularity) -> datetime:
+    """Get the start of the period following ``start``."""
+    if granularity == "month":
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start + timedelta(days=1)
+
+
+def partition_name(table: str, start: datetime, granularity: Granularity) -> str:
+    """Build the child table name for the period starting at ``start``."""
+    return f"{table}_p{start:%Y%m}" if granularity == "month" else f"{table}_p{start:%Y%m%d}"
+
+
+async def is_partitioned(db: AsyncSession, table: str, schema: str) -> bool:
+    """Check whether ``schema.table`` is a partitioned parent table."""
+    result = await db.execute(
+        text(
+            "SELECT c.relkind = 'p' FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :table"
+        ),
+        {"schema": schema, "table": table},
+    )
+    return bool(result.scalar())
+
+
+async def list_partitions(db: AsyncSession, table: str, schema: str) -> list[PartitionInfo]:
+    """List the child partitions of ``schema.table`` ordered by lower bound."""
+    result = await db.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_namespace n ON n.oid = parent.relnamespace "
+            "WHERE n.nspname = :schema AND parent.relname = :table"
+        ),
+        {"schema": schema, "table": table},
+    )
+
+    partitions = []
+    for name, bound in result.tuples():
+        match = _BOUND_PATTERN.search(str(bound or ""))
+        if match is None:
+            continue  # DEFAULT partition
+        partitions.append(
+            PartitionInfo(
+                table=table,
+                name=str(name),
+                lower=_parse_bound(match.group("lower")),
+                upper=_parse_bound(match.group("upper")),
+            )
+        )
+    partitions.sort(key=lambda p: p.lower or datetime.min.replace(tzinfo=UTC))
+    return partitions
+
+
+async def default_partition(db: AsyncSession, table: str, schema: str) -> str | None:
+    """Get the name of the DEFAULT partition of ``schema.table``, if it has one."""
+    result = await db.execute(
+        text(
+            "SELECT child.relname "
+            "FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_namespace n ON n.oid = parent.relnamespace "
+            "WHERE n.nspname = :schema AND parent.relname = :table "
+            "AND pg_get_expr(child.relpartbound, child.oid) = 'DEFAULT'"
+        ),
+        {"schema": schema, "table": table},
+    )
+    return result.scalar()
+
+
+async def _create_partition(
+    db: AsyncSession, schema: str, table: str, name: str, lower: datetime, upper: datetime, default: str | None
+) -> None:
+    bounds = f"FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    if default is None:
+        await db.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{schema}"."{name}" PARTITION OF "{schema}"."{table}" FOR VALUES {bounds}'
+            )
+        )
+        return
+
+    # Postgres refuses a new partition while the DEFAULT partition holds rows in its range,
+    # so build the partition standalone, move those rows into it, then attach it.
+    # Identifiers come from PARTITIONED_TABLES and the catalog, never from user input.
+    key = PARTITIONED_TABLES[table]
+    # Block inserts into the DEFAULT partition until commit, so no row lands in the new
+    # range between the move and the ATTACH (which would then fail its constraint check)
+    await db.execute(text(f'LOCK TABLE "{schema}"."{default}" IN SHARE ROW EXCLUSIVE MODE'))
+    await db.execute(
+        text(f'CREATE TABLE "{schema}"."{name}" (LIKE "{schema}"."{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    )
+    result = cast(
+        "CursorResult[Any]",
+        await db.execute(
+            text(
+                f'WITH moved AS (DELETE FROM "{schema}"."{default}" WHERE "{key}" >= :lower AND "{key}" < :upper '  # noqa: S608
+                f'RETURNING *) INSERT INTO "{schema}"."{name}" SELECT * FROM moved'
+            ),
+            {"lower": lower, "upper": upper},
+        ),
+    )
+    await db.execute(text(f'ALTER TABLE "{schema}"."{table}" ATTACH PARTITION "{schema}"."{name}" FOR VALUES {bounds}'))
+    if result.rowcount:
+        logger.warning(f"Moved {result.rowcount} rows from {default} into new partition {name}")
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    *,
+    ahead: int,
+    granularity: Granularity = "day",
+    now: datetime | None = None,
+) -> list[str]:
+    """Create partitions for the current period and ``ahead`` periods after it.
+
+    Periods already covered by an existing partition (including a history
+    partition from the migration) are skipped; partially covered periods start
+    where the existing partition ends. Rows already sitting in the DEFAULT
+    partition for a created period are moved into the new partition; the
+    DEFAULT partition then stays locked against inserts until the caller commits.
+
+    Returns
+    -------
+        Names of partitions created
+
+    """
+    schema = get_settings().MEM0_SCHEMA
+    created: list[str] = []
+
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(db, table, schema):
+            continue
+
+        existing = await list_partitions(db, table, schema)
+        default = await default_partition(db, table, schema)
+        start = period_start(now or datetime.now(UTC), granularity)
+        for _ in range(ahead + 1):
+            end = next_period(start, granularity)
+            lower = start
+            for partition in existing:  # ordered by lower bound
+                overlaps = (partition.lower is None or partition.lower < end) and (
+                    partition.upper is None or partition.upper > lower
+                )
+                if not overlaps:
+                    continue
+                if partition.lower is not None and partition.lower > lower:
+                    # An existing partition starts mid-period (e.g. after a granularity change); leave it alone
+                    lower = end
+                else:
+                    lower = end if partition.upper is None else max(lower, partition.upper)
+            if lower < end:
+                name = partition_name(table, start, granularity)
+                await _create_partition(db, schema, table, name, lower, end, default)
+                existing.append(PartitionInfo(table=table, name=name, lower=lower, upper=end))
+                created.append(name)
+            start = end
+
+    return created
+
+
+async def drop_expired_partitions(
+    db: AsyncSession,
+    *,
+    retention_days: int,
+    now: datetime | None = None,
+) -> list[str]:
+    """Detach and drop partitions whose whole range is older than the retention window.
+
+    Expired rows left in the DEFAULT partition are deleted. Prompt traces are
+    not partitioned; rows older than the cutoff are deleted so they do not
+    outlive their base_log records.
+
+    Returns
+    -------
+        Names of partitions dropped
+
+    """
+    schema = get_settings().MEM0_SCHEMA
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=retention_days)
+    dropped: list[str] = []
+
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(db, table, schema):
+            continue
+        for partition in await list_partitions(db, table, schema):
+            if partition.upper is None or partition.upper > cutoff:
+                continue
+            await db.execute(text(f'ALTER TABLE "{schema}"."{table}" DETACH PARTITION "{schema}"."{partition.name}"'))
+            await db.execute(text(f'DROP TABLE "{schema}"."{partition.name}"'))
+            dropped.append(partition.name)
+        default = await default_partition(db, table, schema)
+        if default is not None:
+            key = PARTITIONED_TABLES[table]
+            expired = text(f'DELETE FROM "{schema}"."{default}" WHERE "{key}" < :cutoff')  # noqa: S608
+            await db.execute(expired, {"cutoff": cutoff})
+
+    if dropped:
+        expired = text(f'DELETE FROM "{schema}"."prompt_trace" WHERE created_at < :cutoff')  # noqa: S608
+        await db.execute(expired, {"cutoff": cutoff})
+
+    return dropped
+
+
+async def run_partition_maintenance(db: AsyncSession) -> dict[str, Any]:
+    """Pre-create upcoming partitions and drop expired ones using settings."""
+    settings = get_settings()
+    created = await ensure_partitions(
+        db, ahead=settings.L1_PARTITION_PREMAKE, granularity=settings.L1_PARTITION_GRANULARITY
+    )
+    dropped = await drop_expired_partitions(db, retention_days=settings.L1_RETENTION_DAYS)
+    pruned_blobs = await prune_orphan_blobs(db, retention_days=settings.L1_RETENTION_DAYS)
+    await db.commit()
+
+    if created or dropped or pruned_blobs:
+        logger.info(
+            f"Partition maintenance created {len(created)} and dropped {len(dropped)} partitions, "
+            f"pruned {pruned_blobs} payload blobs"
+        )
+    return {"created": created, "dropped": dropped, "pruned_blobs": pruned_blobs}
+
+
+class PartitionMaintenance:
+    """Background task that runs partition maintenance on a fixed interval."""
+
+    def __init__(self, *, interval: float = 3600.0) -> None:
+        """Initialize with ``interval`` seconds between runs."""
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self.last_result: dict[str, Any] | None = None
+
+    def start(self) -> None:
+        """Start the maintenance loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="l1-partition-maintenance")
+
+    async def stop(self) -> None:
+        """Cancel the maintenance loop."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        from src.db.connection import get_async_session_maker
+
+        while True:
+            try:
+                async with get_async_session_maker()() as session:
+                    self.last_result = await run_partition_maintenance(session)
+            except Exception:
+                # Catch all exceptions so a transient database error does not stop future runs
+                logger.exception("Partition maintenance failed")
+            await asyncio.sleep(self._interval)
+
+
+# Process-wide singleton
+_maintenance: PartitionMaintenance | None = None
+
+
+def get_partition_maintenance() -> PartitionMaintenance:
+    """Get the process-wide partition maintenance task, configured from settings."""
+    global _maintenance
+    if _maintenance is None:
+        _maintenance = PartitionMaintenance(interval=get_settings().L1_PARTITION_MAINTENANCE_INTERVAL_S)
+    return _maintenance
+
+
+async def shutdown_partition_maintenance() -> None:
+    """Stop the process-wide maintenance task if it was started."""
+    global _maintenance
+    if _maintenance is not None:
+        try:
+            await _maintenance.stop()
+        finally:
+            _maintenance = None
@@ -0,0 +1,105 @@
+"""Content-addressed payload store for L1 log rows.
+
+``log_event`` persists ``data``/``tags``/``memo`` twice per event (in
+``BaseLog.payload`` and ``EventLog.event_data``), and high-volume sources repeat
+the same content across events. With ``LOG_PAYLOAD_DEDUP`` enabled:
+
+- The shared content is serialized to canonical JSON (sorted keys, orjson) and
+  keyed by its SHA-256 digest
+- Each distinct blob is written once to ``payload_blob``; reuse only touches
+  the row to refresh ``last_used_at``, at most once per hour
+- Log rows keep only their per-row fields (source, timestamp, log_id) inline
+  and reference the blob through ``payload_hash``
+
+Readers use ``BaseLog.resolved_payload`` / ``EventLog.resolved_event_data``,
+which merge the blob back in; async queries must eager-load ``payload_blob``
+(``selectinload``) on the rows they resolve. Rows written before the migration (or with dedup
+disabled) have no ``payload_hash`` and resolve to their inline JSON unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import orjson
+from sqlalchemy import CursorResult, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .mem0_models import BaseLog, EventLog, PayloadBlob
+
+# Keys moved from the inline payload into the shared blob
+SHARED_KEYS = ("data", "tags", "memo")
+
+# How stale last_used_at may get before a reuse refreshes it
+TOUCH_INTERVAL = timedelta(hours=1)
+
+
+def canonical_bytes(content: Mapping[str, Any]) -> bytes:
+    """Serialize content to canonical JSON so equal content always hashes equally."""
+    return orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+
+
+def content_hash(content: Mapping[str, Any]) -> tuple[str, int]:
+    """Return the SHA-256 hex digest and canonical size in bytes of ``content``."""
+    raw = canonical_bytes(content)
+    return hashlib.sha256(raw).hexdigest(), len(raw)
+
+
+def split_shared(payload: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split a log payload into (shared blob content, per-row fields)."""
+    shared = {key: payload[key] for key in SHARED_KEYS if key in payload}
+    inline = {key: value for key, value in payload.items() if key not in SHARED_KEYS}
+    return shared, inline
+
+
+def blob_row(content: dict[str, Any]) -> dict[str, Any]:
+    """Build a ``payload_blob`` row for ``content``."""
+    digest, size = content_hash(content)
+    return {"hash": digest, "content": content, "size_bytes": size}
+
+
+async def store_blobs(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert blob rows built by :func:`blob_row`, refreshing ``last_used_at`` of stale existing ones.
+
+    Duplicates within ``rows`` are collapsed first, since Postgres rejects an
+    ``ON CONFLICT`` insert that touches the same key twice.
+    """
+    # Sorted so concurrent writers lock existing blobs in the same order
+    unique = sorted({row["hash"]: row for row in rows}.values(), key=lambda row: row["hash"])
+    if not unique:
+        return
+    stmt = pg_insert(PayloadBlob).values(unique)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["hash"],
+        set_={"last_used_at": func.now()},
+        where=PayloadBlob.last_used_at < func.now() - TOUCH_INTERVAL,
+    )
+    await db.execute(stmt)
+
+
+async def prune_orphan_blobs(db: AsyncSession, *, retention_days: int, now: datetime | None = None) -> int:
+    """Delete blobs unused for ``retention_days`` that no log row references.
+
+    A writer reusing a stale blob updates its ``last_used_at`` first, which
+    locks the row, so a concurrent prune either waits and skips it or deletes
+    it before the writer re-inserts it.
+
+    Returns
+    -------
+        Number of blobs deleted
+
+    """
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=retention_days)
+    referenced_by_base = exists(select(BaseLog.id).where(BaseLog.payload_hash == PayloadBlob.hash))
+    referenced_by_event = exists(select(EventLog.id).where(EventLog.payload_hash == PayloadBlob.hash))
+    result = cast(
+        "CursorResult[Any]",
+        await db.execute(
+            delete(PayloadBlob).where(PayloadBlob.last_used_at < cutoff, ~referenced_by_base, ~referenced_by_event)
+        ),
+    )
+    return result.rowcount or 0
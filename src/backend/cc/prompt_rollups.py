@@ -0,0 +1,404 @@
+"""Incremental hourly rollups of PromptTrace latency and token usage.
+
+Computing percentiles over raw ``prompt_trace`` rows does not scale to
+dashboards, so a background job folds new traces into one
+``prompt_trace_rollup`` row per UTC hour:
+
+- A high-water mark on ``(created_at, id)`` in ``rollup_watermark`` means each
+  run only reads traces created since the previous run, in keyset order
+- Counters and mergeable quantile sketches (``src.common.quantile_sketch``)
+  are updated read-modify-write under the watermark row lock, so concurrent
+  workers serialize instead of double counting
+- Traces younger than a short settle window are left for the next run, so a
+  transaction that commits slightly late is not skipped by the watermark
+- Backfilled traces (an explicit ``timestamp`` older than the settle window)
+  can land behind the watermark, so their writers queue the affected hours in
+  ``prompt_trace_rollup_refold`` and each run first rebuilds those hours from
+  raw traces. Hours whose raw traces are already past partition retention are
+  not rebuilt; backfills that old are dropped by retention anyway
+
+Range queries read at most one row per hour and merge the sketches, so they
+answer in milliseconds regardless of how many traces the range covers. Rollups
+also outlive raw traces dropped by partition retention.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.config import get_settings
+from src.common.logger import get_logger
+from src.common.quantile_sketch import QuantileSketch
+
+from .mem0_models import PromptTrace, PromptTraceRollup, PromptTraceRollupRefold, RollupWatermark
+
+logger = get_logger(__name__)
+
+ROLLUP_NAME = "prompt_trace_hourly"
+SUMMARY_QUANTILES: dict[str, float] = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+
+def bucket_start(moment: datetime) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour."""
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def summarize_sketch(sketch: QuantileSketch) -> dict[str, Any]:
+    """Summarize a sketch as count, mean, min, max and p50/p95/p99."""
+    return {
+        "count": sketch.count,
+        "mean": sketch.mean,
+        "min": sketch.min if sketch.count else None,
+        "max": sketch.max if sketch.count else None,
+        **{name: sketch.quantile(q) for name, q in SUMMARY_QUANTILES.items()},
+    }
+
+
+async def _lock_watermark(db: AsyncSession) -> RollupWatermark:
+    # Create the row on first use, then lock it so only one worker folds at a time
+    create = pg_insert(RollupWatermark).values(name=ROLLUP_NAME).on_conflict_do_nothing(index_elements=["name"])
+    await db.execute(create)
+    result = await db.execute(select(RollupWatermark).where(RollupWatermark.name == ROLLUP_NAME).with_for_update())
+    return result.scalar_one()
+
+
+def _new_rollup(hour: datetime) -> PromptTraceRollup:
+    return PromptTraceRollup(
+        bucket_start=hour,
+        call_count=0,
+        total_tokens=0,
+        total_execution_ms=0,
+        latency_sketch=QuantileSketch().to_dict(),
+        token_sketch=QuantileSketch().to_dict(),
+    )
+
+
+def _add_traces(rollup: PromptTraceRollup, traces: Sequence[Any]) -> None:
+    latency = QuantileSketch.from_dict(rollup.latency_sketch)
+    tokens = QuantileSketch.from_dict(rollup.token_sketch)
+    for trace in traces:
+        if trace.execution_time_ms is not None:
+            latency.add(trace.execution_time_ms)
+        if trace.token_count is not None:
+            tokens.add(trace.token_count)
+
+    rollup.call_count += len(traces)
+    rollup.total_execution_ms += sum(trace.execution_time_ms or 0 for trace in traces)
+    rollup.total_tokens += sum(trace.token_count or 0 for trace in traces)
+    # Assign new dicts so the JSONB columns are flagged dirty
+    rollup.latency_sketch = latency.to_dict()
+    rollup.token_sketch = tokens.to_dict()
+
+
+async def mark_backfilled_traces(
+    db: AsyncSession, timestamps: Iterable[datetime | None], *, now: datetime | None = None
+) -> int:
+    """Queue rollup hours that backfilled prompt traces may have landed behind the watermark in.
+
+    Call in the transaction that inserts the traces, with the explicit
+    ``timestamp`` of each one (``None`` entries are skipped). Timestamps inside
+    the settle window are ignored because ``fold_new_traces`` still picks them
+    up. Does nothing unless ``L1_ROLLUP_ENABLED`` is set.
+
+    Args:
+    ----
+        db: AsyncSession for database operations (not committed)
+        timestamps: Explicit ``created_at`` values of the inserted traces
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+    -------
+        Number of distinct hours queued
+
+    """
+    settings = get_settings()
+    if not settings.L1_ROLLUP_ENABLED:
+        return 0
+
+    cutoff = (now or datetime.now(UTC)) - timedelta(seconds=settings.L1_ROLLUP_SETTLE_S)
+    hours = sorted({bucket_start(moment) for moment in timestamps if moment is not None and moment < cutoff})
+    if hours:
+        stmt = pg_insert(PromptTraceRollupRefold).values([{"bucket_start": hour} for hour in hours])
+        await db.execute(stmt.on_conflict_do_nothing(index_elements=["bucket_start"]))
+    return len(hours)
+
+
+async def refold_backfilled_hours(
+    db: AsyncSession,
+    *,
+    retention_days: int | None = None,
+    now: datetime | None = None,
+) -> list[datetime]:
+    """Rebuild the rollups of hours queued by ``mark_backfilled_traces``.
+
+    Each queued hour is recomputed from its raw traces up to the watermark;
+    traces after the watermark are left to ``fold_new_traces`` as usual.
+
+    Args:
+    ----
+        db: AsyncSession for database operations
+        retention_days: Raw trace retention; older hours keep their rollup as is
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+    -------
+        Start of each hour that was rebuilt
+
+    """
+    watermark = await _lock_watermark(db)
+    claimed = await db.execute(delete(PromptTraceRollupRefold).returning(PromptTraceRollupRefold.bucket_start))
+    hours = sorted(claimed.scalars().all())
+    if not hours or watermark.last_created_at is None:
+        # Nothing folded yet, so fold_new_traces will pick the backfills up from the start
+        await db.commit()
+        return []
+
+    last_hour = bucket_start(watermark.last_created_at)
+    expired_before = None
+    if retention_days is not None:
+        expired_before = bucket_start((now or datetime.now(UTC)) - timedelta(days=retention_days))
+
+    rebuilt: list[datetime] = []
+    for hour in hours:
+        if hour > last_hour:
+            continue
+        if expired_before is not None and hour < expired_before:
+            logger.warning(f"Not rebuilding prompt rollup for {hour.isoformat()}: raw traces are past retention")
+            continue
+
+        stmt = select(PromptTrace.execution_time_ms, PromptTrace.token_count).where(
+            PromptTrace.created_at >= hour,
+            PromptTrace.created_at < hour + timedelta(hours=1),
+            tuple_(PromptTrace.created_at, PromptTrace.id) <= (watermark.last_created_at, watermark.last_id),
+        )
+        traces = (await db.execute(stmt)).all()
+
+        rollup = await db.get(PromptTraceRollup, hour)
+        if rollup is None:
+            rollup = _new_rollup(hour)
+            db.add(rollup)
+        else:
+            rollup.call_count = 0
+            rollup.total_tokens = 0
+            rollup.total_execution_ms = 0
+            rollup.latency_sketch = QuantileSketch().to_dict()
+            rollup.token_sketch = QuantileSketch().to_dict()
+        _add_traces(rollup, traces)
+        rebuilt.append(hour)
+
+    await db.commit()
+    if rebuilt:
+        logger.info(f"Rebuilt {len(rebuilt)} prompt rollup hours after backfill")
+    return rebuilt
+
+
+async def fold_new_traces(
+    db: AsyncSession,
+    *,
+    batch_size: int = 5000,
+    settle_seconds: float = 5.0,
+    now: datetime | None = None,
+) -> int:
+    """Fold the next batch of unprocessed prompt traces into hourly rollups.
+
+    Args:
+    ----
+        db: AsyncSession for database operations
+        batch_size: Maximum number of traces to fold in this call
+        settle_seconds: Skip traces newer than this, leaving them for a later run
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+    -------
+        Number of traces folded (0 when caught up)
+
+    """
+    watermark = await _lock_watermark(db)
+    cutoff = (now or datetime.now(UTC)) - timedelta(seconds=settle_seconds)
+
+    stmt = select(PromptTrace.id, PromptTrace.created_at, PromptTrace.execution_time_ms, PromptTrace.token_count)
+    stmt = stmt.where(PromptTrace.created_at < cutoff)
+    if watermark.last_created_at is not None:
+        keyset = tuple_(PromptTrace.created_at, PromptTrace.id)
+        stmt = stmt.where(keyset > (watermark.last_created_at, watermark.last_id))
+    result = await db.execute(stmt.order_by(PromptTrace.created_at, PromptTrace.id).limit(batch_size))
+    traces = result.all()
+
+    if not traces:
+        await db.commit()
+        return 0
+
+    by_hour: dict[datetime, list[Any]] = defaultdict(list)
+    for trace in traces:
+        by_hour[bucket_start(trace.created_at)].append(trace)
+
+    existing_result = await db.execute(
+        select(PromptTraceRollup).where(PromptTraceRollup.bucket_start.in_(list(by_hour)))
+    )
+    rollups = {rollup.bucket_start: rollup for rollup in existing_result.scalars().all()}
+
+    for hour, hour_traces in by_hour.items():
+        rollup = rollups.get(hour)
+        if rollup is None:
+            rollup = _new_rollup(hour)
+            db.add(rollup)
+        _add_traces(rollup, hour_traces)
+
+    watermark.last_created_at = traces[-1].created_at
+    watermark.last_id = traces[-1].id
+    await db.commit()
+    return len(traces)
+
+
+async def get_rollups(db: AsyncSession, start: datetime, end: datetime) -> dict[str, Any]:
+    """Get merged latency and token statistics for ``[start, end)``.
+
+    The range is widened to whole UTC hours, the rollup resolution.
+
+    Returns
+    -------
+        Dictionary with the range summary and one entry per non-empty hour
+
+    Raises
+    ------
+        ValueError: If end is not after start
+
+    """
+    if end <= start:
+        msg = "end must be after start"
+        raise ValueError(msg)
+
+    result = await db.execute(
+        select(PromptTraceRollup)
+        .where(PromptTraceRollup.bucket_start >= bucket_start(start), PromptTraceRollup.bucket_start < end)
+        .order_by(PromptTraceRollup.bucket_start)
+    )
+
+    latency_total = QuantileSketch()
+    tokens_total = QuantileSketch()
+    buckets: list[dict[str, Any]] = []
+    call_count = 0
+    total_tokens = 0
+    for rollup in result.scalars().all():
+        latency = QuantileSketch.from_dict(rollup.latency_sketch)
+        tokens = QuantileSketch.from_dict(rollup.token_sketch)
+        latency_total.merge(latency)
+        tokens_total.merge(tokens)
+        call_count += rollup.call_count
+        total_tokens += rollup.total_tokens
+        buckets.append(
+            {
+                "bucket_start": rollup.bucket_start,
+                "call_count": rollup.call_count,
+                "total_tokens": rollup.total_tokens,
+                "latency_ms": summarize_sketch(latency),
+                "tokens": summarize_sketch(tokens),
+            }
+        )
+
+    return {
+        "start": bucket_start(start),
+        "end": end,
+        "call_count": call_count,
+        "total_tokens": total_tokens,
+        "latency_ms": summarize_sketch(latency_total),
+        "tokens": summarize_sketch(tokens_total),
+        "buckets": buckets,
+    }
+
+
+class PromptRollupJob:
+    """Background task that folds new prompt traces into hourly rollups."""
+
+    def __init__(
+        self,
+        *,
+        interval: float = 60.0,
+        batch_size: int = 5000,
+        settle_seconds: float = 5.0,
+        retention_days: int | None = None,
+    ) -> None:
+        """Initialize with ``interval`` seconds between catch-up runs."""
+        self._interval = interval
+        self._batch_size = batch_size
+        self._settle_seconds = settle_seconds
+        self._retention_days = retention_days
+        self._task: asyncio.Task[None] | None = None
+        self.traces_folded = 0
+        self.last_run_at: datetime | None = None
+
+    def start(self) -> None:
+        """Start the rollup loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="l1-prompt-rollups")
+
+    async def stop(self) -> None:
+        """Cancel the rollup loop."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Rebuild backfilled hours, then fold batches until caught up and return the number of traces folded."""
+        from src.db.connection import get_async_session_maker
+
+        folded = 0
+        async with get_async_session_maker()() as session:
+            await refold_backfilled_hours(session, retention_days=self._retention_days)
+            while True:
+                count = await fold_new_traces(session, batch_size=self._batch_size, settle_seconds=self._settle_seconds)
+                folded += count
+                if count < self._batch_size:
+                    break
+        self.traces_folded += folded
+        self.last_run_at = datetime.now(UTC)
+        return folded
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                # Catch all exceptions so a transient database error does not stop future runs
+                logger.exception("Prompt trace rollup failed")
+            await asyncio.sleep(self._interval)
+
+
+# Process-wide singleton
+_rollup_job: PromptRollupJob | None = None
+
+
+def get_prompt_rollup_job() -> PromptRollupJob:
+    """Get the process-wide rollup job, configured from settings."""
+    global _rollup_job
+    if _rollup_job is None:
+        settings = get_settings()
+        _rollup_job = PromptRollupJob(
+            interval=settings.L1_ROLLUP_INTERVAL_S,
+            batch_size=settings.L1_ROLLUP_BATCH_SIZE,
+            settle_seconds=settings.L1_ROLLUP_SETTLE_S,
+            # Without partition maintenance raw traces are kept, so every hour can be rebuilt
+            retention_days=settings.L1_RETENTION_DAYS if settings.L1_PARTITION_MAINTENANCE_ENABLED else None,
+        )
+    return _rollup_job
+
+
+async def shutdown_prompt_rollup_job() -> None:
+    """Stop the process-wide rollup job if it was started."""
+    global _rollup_job
+    if _rollup_job is not None:
+        try:
+            await _rollup_job.stop()
+        finally:
+            _rollup_job = None
@@ -12,20 +12,24 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.backend.cc.logging import log_l1
+from src.backend.cc.logging import L1EventInput, log_l1, log_l1_many
 from src.common.logger import log_event
 
 from .deps import ModuleConfig, get_cc_db, get_module_config
+from .l1_router import router as l1_router
 from .mem0_router import router as mem0_router
 from .schemas import (
     CCConfig,
     CircuitBreakerStatus,
     ConnectionPoolStatus,
+    DebugLogBatchRequest,
+    DebugLogBatchResponse,
     DebugLogRequest,
     DebugLogResponse,
     DLQMetrics,
     EnhancedHealthResponse,
     HealthStatusResponse,
+    LogPolicyUpdateRequest,
     Module,
     ModuleCreate,
     ModuleHealthStatus,
@@ -49,6 +53,9 @@ router = APIRouter()
 # Mount mem0 scratch data router
 router.include_router(mem0_router, prefix="/mem0", tags=["mem0"])
 
+# Mount L1 memory read router
+router.include_router(l1_router)
+
 
 @router.get(
     "/health",
@@ -386,6 +393,67 @@ async def create_debug_log(
         ) from exc
 
 
+@router.post(
+    "/debug/log/batch",
+    response_model=DebugLogBatchResponse,
+    summary="Batched Debug Logging Endpoint",
+    description="Create many debug log entries in one transaction with a single pipelined Redis publish.",
+    tags=["Debug"],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_debug_log_batch(
+    request: DebugLogBatchRequest,
+    db: AsyncSession = Depends(get_cc_db),
+) -> DebugLogBatchResponse:
+    """Create a batch of debug log entries via :pyfunc:`src.backend.cc.logging.log_l1_many`."""
+    start_time = time.perf_counter()
+
+    try:
+        log_ids = await log_l1_many(
+            db=db,
+            events=[
+                L1EventInput(
+                    event_type=event.event_type,
+                    payload=event.payload,
+                    prompt_data=event.prompt_data,
+                    request_id=event.request_id,
+                    trace_id=event.trace_id,
+                )
+                for event in request.events
+            ],
+            request_id=request.request_id,
+            trace_id=request.trace_id,
+        )
+    except Exception as exc:
+        log_event(
+            source="cc",
+            data={"event_count": len(request.events), "error": str(exc)},
+            tags=["debug", "log", "batch", "error", "cc_router"],
+            memo="Failed to create debug log batch via /debug/log/batch endpoint.",
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create debug log batch: {exc}",
+        ) from exc
+
+    performance_ms = (time.perf_counter() - start_time) * 1000
+
+    log_event(
+        source="cc",
+        data={"event_count": len(log_ids), "performance_ms": performance_ms},
+        tags=["debug", "log", "batch", "cc_router"],
+        memo="Debug log batch created via /debug/log/batch endpoint.",
+    )
+
+    return DebugLogBatchResponse(
+        success=True,
+        message=f"Debug log batch created successfully with {len(log_ids)} events",
+        count=len(log_ids),
+        log_ids=log_ids,
+        performance_ms=performance_ms,
+    )
+
+
 async def _validate_redis_publishing(request: DebugLogRequest) -> RedisValidationInfo:
     """Validate Redis publishing by attempting to publish a test message.
 
@@ -520,6 +588,7 @@ async def redis_health_check() -> RedisHealthResponse:
             last_successful_operation=current_time.isoformat() + "Z",
             operations_per_second=cb_metrics.get("total_successes", 0) / max(1, time.perf_counter() - check_start_time),
             error_rate=cb_metrics.get("failure_rate", 0.0) * 100,
+            operation_latency=pubsub.latency_metrics,
         )
 
         # Determine overall health status
@@ -582,6 +651,103 @@ async def redis_health_check() -> RedisHealthResponse:
         )
 
 
+@router.get(
+    "/debug/log-policy",
+    response_model=dict[str, Any],
+    summary="Log Admission Policy",
+    description="Active log_event admission rules with kept/dropped counters and background writer metrics.",
+    tags=["Debug"],
+)
+async def get_log_policy_status() -> dict[str, Any]:
+    """Return the active admission policy, its counters and the log writer metrics."""
+    from core_v2.utils.log_policy import get_log_policy
+    from core_v2.utils.log_writer import get_log_writer
+
+    return {"policy": get_log_policy().metrics, "writer": get_log_writer().metrics}
+
+
+@router.put(
+    "/debug/log-policy",
+    response_model=dict[str, Any],
+    summary="Update Log Admission Policy",
+    description="Replace log_event sampling and rate-limit rules at runtime without a restart.",
+    tags=["Debug"],
+)
+async def update_log_policy(request: LogPolicyUpdateRequest) -> dict[str, Any]:
+    """Replace the process-wide admission rules."""
+    from core_v2.utils.log_policy import configure_log_policy
+
+    try:
+        policy = configure_log_policy(
+            [rule.model_dump() for rule in request.rules],
+            always_keep_tags=request.always_keep_tags,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    return {"policy": policy.metrics}
+
+
+@router.get(
+    "/debug/outbox",
+    response_model=dict[str, Any],
+    summary="L1 Outbox Relay Status",
+    description="Durable outbox mode, pending row count and relay lag/throughput metrics.",
+    tags=["Debug"],
+)
+async def get_outbox_status() -> dict[str, Any]:
+    """Return outbox relay metrics and the number of rows awaiting publication."""
+    from src.common.config import get_settings
+
+    from .outbox_relay import get_outbox_relay
+
+    relay = get_outbox_relay()
+    mode = get_settings().L1_OUTBOX_MODE
+    pending = await relay.pending_count() if mode == "durable" else 0
+    return {"mode": mode, "pending": pending, "relay": relay.metrics}
+
+
+@router.get(
+    "/debug/partitions",
+    response_model=dict[str, Any],
+    summary="L1 Log Partitions",
+    description="Range partitions of base_log and event_log with their bounds.",
+    tags=["Debug"],
+)
+async def get_log_partitions(db: AsyncSession = Depends(get_cc_db)) -> dict[str, Any]:
+    """List the partitions of each partitioned L1 table."""
+    from src.common.config import get_settings
+
+    from .partitions import PARTITIONED_TABLES, list_partitions
+
+    schema = get_settings().MEM0_SCHEMA
+    return {
+        table: [
+            {
+                "name": partition.name,
+                "from": partition.lower.isoformat() if partition.lower else None,
+                "to": partition.upper.isoformat() if partition.upper else None,
+            }
+            for partition in await list_partitions(db, table, schema)
+        ]
+        for table in PARTITIONED_TABLES
+    }
+
+
+@router.post(
+    "/debug/partitions/maintenance",
+    response_model=dict[str, Any],
+    summary="Run L1 Partition Maintenance",
+    description="Create upcoming partitions and detach/drop partitions past the retention window.",
+    tags=["Debug"],
+)
+async def run_log_partition_maintenance(db: AsyncSession = Depends(get_cc_db)) -> dict[str, Any]:
+    """Run partition maintenance immediately."""
+    from .partitions import run_partition_maintenance
+
+    return await run_partition_maintenance(db)
+
+
 # Module CRUD Endpoints
 @router.post(
     "/modules",
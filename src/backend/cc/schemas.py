@@ -347,6 +347,144 @@ class DebugLogResponse(BaseModel):
     )
 
 
+class DebugLogBatchRequest(BaseModel):
+    """Request model for the batched debug logging endpoint."""
+
+    events: list[DebugLogRequest] = Field(
+        ..., min_length=1, max_length=1000, description="Events to log in a single transaction"
+    )
+    request_id: str | None = Field(None, description="Default request ID for events without one")
+    trace_id: str | None = Field(None, description="Default Logfire trace ID for events without one")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "events": [
+                    {"event_type": "agent_step", "payload": {"step": 1}},
+                    {"event_type": "agent_step", "payload": {"step": 2}},
+                ],
+            }
+        }
+    )
+
+
+class DebugLogBatchResponse(BaseModel):
+    """Response model for the batched debug logging endpoint."""
+
+    success: bool = Field(..., description="Whether the logging operation succeeded")
+    message: str = Field(..., description="Human-readable status message")
+    count: int = Field(..., description="Number of events logged")
+    log_ids: list[dict[str, UUID]] = Field(..., description="UUIDs of created log records, one entry per event")
+    performance_ms: float = Field(..., description="Execution time in milliseconds")
+
+
+class EventLogRecord(BaseModel):
+    """Schema for an L1 event log record."""
+
+    id: UUID = Field(..., description="Event log ID")
+    base_log_id: UUID = Field(..., description="Parent base log ID")
+    event_type: str = Field(..., description="Event type")
+    event_data: dict[str, Any] | None = Field(None, description="Structured event data")
+    request_id: UUID | None = Field(None, description="Request ID for correlation")
+    trace_id: str | None = Field(None, description="Distributed trace ID")
+    created_at: datetime = Field(..., description="Event timestamp")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventLogPage(BaseModel):
+    """One page of L1 event logs with a keyset cursor for the next page."""
+
+    items: list[EventLogRecord] = Field(..., description="Event logs on this page")
+    next_cursor: str | None = Field(None, description="Cursor for the next page (null on the last page)")
+
+
+class CorrelationTimelineEntry(BaseModel):
+    """One record in a request/trace correlation timeline."""
+
+    kind: Literal["base_log", "event_log", "prompt_trace"] = Field(..., description="Source table of the entry")
+    id: UUID = Field(..., description="Record ID")
+    base_log_id: UUID = Field(..., description="Parent base log ID")
+    timestamp: datetime = Field(..., description="Record timestamp")
+    event_type: str | None = Field(None, description="Event type (event_log entries only)")
+    event_data: dict[str, Any] | None = Field(None, description="Event data (event_log entries only)")
+    request_id: UUID | None = Field(None, description="Request ID (event_log entries only)")
+    trace_id: str | None = Field(None, description="Trace ID (event_log entries only)")
+    data: dict[str, Any] | None = Field(None, description="Record fields for base_log and prompt_trace entries")
+
+
+class CorrelationTimeline(BaseModel):
+    """Every L1 record for one request or trace, ordered by timestamp."""
+
+    request_id: UUID | None = Field(None, description="Request ID that was looked up")
+    trace_id: str | None = Field(None, description="Trace ID that was looked up")
+    entries: list[CorrelationTimelineEntry] = Field(..., description="Timeline entries, oldest first")
+    cached: bool = Field(..., description="Whether the timeline was served from the LRU cache")
+
+
+class QuantileSummary(BaseModel):
+    """Distribution summary computed from a merged quantile sketch."""
+
+    count: int = Field(..., description="Number of recorded values")
+    mean: float | None = Field(None, description="Exact mean")
+    min: float | None = Field(None, description="Smallest value")
+    max: float | None = Field(None, description="Largest value")
+    p50: float | None = Field(None, description="Median (within 1% relative error)")
+    p95: float | None = Field(None, description="95th percentile (within 1% relative error)")
+    p99: float | None = Field(None, description="99th percentile (within 1% relative error)")
+
+
+class PromptRollupBucket(BaseModel):
+    """Prompt trace statistics for one UTC hour."""
+
+    bucket_start: datetime = Field(..., description="Start of the hour")
+    call_count: int = Field(..., description="Number of prompt traces")
+    total_tokens: int = Field(..., description="Sum of token counts")
+    latency_ms: QuantileSummary = Field(..., description="Execution time distribution in milliseconds")
+    tokens: QuantileSummary = Field(..., description="Token count distribution")
+
+
+class PromptRollupResponse(BaseModel):
+    """Prompt trace statistics merged over a time range."""
+
+    start: datetime = Field(..., description="Range start, truncated to the hour")
+    end: datetime = Field(..., description="Range end (exclusive)")
+    call_count: int = Field(..., description="Number of prompt traces in the range")
+    total_tokens: int = Field(..., description="Sum of token counts in the range")
+    latency_ms: QuantileSummary = Field(..., description="Execution time distribution in milliseconds")
+    tokens: QuantileSummary = Field(..., description="Token count distribution")
+    buckets: list[PromptRollupBucket] = Field(..., description="Per-hour statistics, oldest first")
+
+
+class LogPolicyRuleConfig(BaseModel):
+    """A single log_event admission rule."""
+
+    source: str = Field("*", description="Event source to match ('*' matches any source)")
+    tags: list[str] = Field(default_factory=list, description="Tags that must all be present for the rule to match")
+    sample_rate: float = Field(1.0, ge=0.0, le=1.0, description="Fraction of matching events to keep")
+    rate_limit: float | None = Field(None, gt=0, description="Maximum matching events per second")
+    burst: int | None = Field(None, ge=1, description="Token bucket capacity for rate_limit")
+
+
+class LogPolicyUpdateRequest(BaseModel):
+    """Request model for replacing the log_event admission policy at runtime."""
+
+    rules: list[LogPolicyRuleConfig] = Field(..., description="Ordered rules; the first match wins")
+    always_keep_tags: list[str] | None = Field(None, description="Tags that bypass all rules (unchanged if omitted)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "rules": [
+                    {"source": "graph", "tags": ["query", "success"], "sample_rate": 0.1},
+                    {"source": "cc", "tags": ["read"], "rate_limit": 50, "burst": 100},
+                ],
+                "always_keep_tags": ["error"],
+            }
+        }
+    )
+
+
 class RedisValidationInfo(BaseModel):
     """Redis validation information for debug endpoints."""
 
@@ -388,6 +526,19 @@ class ConnectionPoolStatus(BaseModel):
     )
 
 
+class OperationLatency(BaseModel):
+    """Rolling latency histogram summary and adaptive timeout for one kind of Redis call."""
+
+    count: int = Field(..., description="Calls recorded in the current window")
+    total: int = Field(..., description="Calls recorded since startup")
+    timed_out: int = Field(..., description="Calls that hit their timeout since startup")
+    p50_ms: float | None = Field(None, description="Median latency in the window in milliseconds")
+    p99_ms: float | None = Field(None, description="99th percentile latency in the window in milliseconds")
+    p999_ms: float | None = Field(None, description="99.9th percentile latency in the window in milliseconds")
+    max_ms: float = Field(..., description="Slowest call since startup in milliseconds")
+    timeout_ms: float = Field(..., description="Timeout currently applied to this kind of call in milliseconds")
+
+
 class RedisPerformanceMetrics(BaseModel):
     """Redis performance metrics for monitoring."""
 
@@ -395,6 +546,9 @@ class RedisPerformanceMetrics(BaseModel):
     last_successful_operation: str | None = Field(None, description="ISO-8601 timestamp of last successful operation")
     operations_per_second: float | None = Field(None, description="Recent operations per second")
     error_rate: float | None = Field(None, description="Error rate as a percentage")
+    operation_latency: dict[str, OperationLatency] | None = Field(
+        None, description="Per-operation latency and timeout, when adaptive timeouts are enabled"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -0,0 +1,203 @@
+"""Operation timeouts derived from observed latency.
+
+A fixed timeout has to cover the slowest healthy call, so when a dependency
+stalls every caller waits that long even though healthy calls finish in a
+fraction of it. ``AdaptiveTimeouts`` keeps a rolling latency histogram per
+operation and sets that operation's timeout to a high quantile (p99.9 by
+default) times a multiplier, clamped between a floor and a ceiling. Until an
+operation has ``min_samples`` observations in the window, the configured
+default applies.
+
+``LatencyHistogram`` follows the HDR histogram layout: microsecond values are
+counted in fixed-size integer arrays of ``SUB_BUCKETS`` linear sub-buckets per
+power of two, so recording is a few integer operations, memory does not grow
+with the number of samples, and any quantile is within 1 / ``SUB_BUCKETS``
+relative error. The window is split into ``slots`` arrays that are reused in
+turn, so old samples age out without per-sample bookkeeping.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+SUB_BUCKETS = 16
+_SUB_BITS = SUB_BUCKETS.bit_length() - 1
+# 1us up to 2**32us (~71 minutes); anything slower is counted in the last bucket
+_OCTAVES = 32
+_BUCKETS = (_OCTAVES - _SUB_BITS + 1) * SUB_BUCKETS
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - _SUB_BITS - 1
+    index = (shift + 1) * SUB_BUCKETS + (micros >> shift) - SUB_BUCKETS
+    return index if index < _BUCKETS else _BUCKETS - 1
+
+
+def _bucket_upper(index: int) -> int:
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return ((index % SUB_BUCKETS + SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Rolling log-linear latency histogram over the last ``window`` seconds."""
+
+    __slots__ = ("_counts", "_slot_ids", "_slot_width", "_zeros", "max_us", "total")
+
+    def __init__(self, *, window: float = 60.0, slots: int = 6) -> None:
+        """Initialize ``slots`` zeroed arrays that together cover ``window`` seconds."""
+        self._slot_width = window / slots
+        self._counts = [[0] * _BUCKETS for _ in range(slots)]
+        self._slot_ids = [-1] * slots
+        self._zeros = [0] * _BUCKETS
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """Count one operation that took ``seconds``."""
+        slot_id = int(time.monotonic() / self._slot_width)
+        slot = slot_id % len(self._counts)
+        counts = self._counts[slot]
+        if self._slot_ids[slot] != slot_id:
+            self._slot_ids[slot] = slot_id
+            counts[:] = self._zeros
+        micros = int(seconds * 1_000_000)
+        counts[_bucket_index(micros)] += 1
+        self.total += 1
+        if micros > self.max_us:
+            self.max_us = micros
+
+    def _window_counts(self) -> list[int]:
+        oldest = int(time.monotonic() / self._slot_width) - len(self._counts) + 1
+        merged = [0] * _BUCKETS
+        for slot, slot_id in enumerate(self._slot_ids):
+            if slot_id >= oldest:
+                merged = [a + b for a, b in zip(merged, self._counts[slot], strict=True)]
+        return merged
+
+    @property
+    def count(self) -> int:
+        """Get the number of operations recorded in the current window."""
+        return sum(self._window_counts())
+
+    def quantiles(self, *qs: float) -> list[float | None]:
+        """Estimate each ``q`` quantile of the window in seconds (bucket upper bound), None when empty."""
+        counts = self._window_counts()
+        total = sum(counts)
+        if total == 0:
+            return [None] * len(qs)
+        results: list[float | None] = []
+        for q in qs:
+            rank = q * (total - 1)
+            seen = 0
+            for index, bucket_count in enumerate(counts):
+                seen += bucket_count
+                if seen > rank:
+                    results.append(_bucket_upper(index) / 1_000_000)
+                    break
+        return results
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile of the window in seconds, or None when empty."""
+        return self.quantiles(q)[0]
+
+
+class AdaptiveTimeouts:
+    """Per-operation timeouts set from a latency quantile of recent calls.
+
+    Each operation name gets its own :class:`LatencyHistogram` on first use.
+    The timeout is recomputed every ``refresh_every`` recorded calls, so asking
+    for it costs a dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: float,
+        floor: float,
+        ceiling: float,
+        multiplier: float = 4.0,
+        quantile: float = 0.999,
+        min_samples: int = 100,
+        window: float = 60.0,
+        refresh_every: int = 64,
+    ) -> None:
+        """Initialize with the timeout bounds and how they are derived.
+
+        Args:
+        ----
+            default: Timeout in seconds while an operation has fewer than ``min_samples`` calls
+            floor: Lowest derived timeout in seconds
+            ceiling: Highest derived timeout in seconds
+            multiplier: Factor applied to the latency quantile
+            quantile: Latency quantile (0-1) the timeout is derived from
+            min_samples: Calls an operation needs in the window before its timeout adapts
+            window: Seconds of latency history kept per operation
+            refresh_every: Recorded calls between timeout recomputations
+
+        """
+        if not 0 < floor <= ceiling:
+            msg = f"Timeout floor must be positive and at most the ceiling, got {floor} and {ceiling}"
+            raise ValueError(msg)
+        self.default = default
+        self.floor = floor
+        self.ceiling = ceiling
+        self.multiplier = multiplier
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window = window
+        self.refresh_every = refresh_every
+
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._timeouts: dict[str, float] = {}
+        self._since_refresh: dict[str, int] = {}
+        self._timed_out: dict[str, int] = {}
+
+    def timeout(self, operation: str) -> float:
+        """Get the current timeout in seconds for ``operation``."""
+        return self._timeouts.get(operation, self.default)
+
+    def record(self, operation: str, seconds: float, *, timed_out: bool = False) -> None:
+        """Record a call of ``operation``; a timed-out call is recorded with the time it was given."""
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            histogram = self._histograms[operation] = LatencyHistogram(window=self.window)
+            self._since_refresh[operation] = 0
+            self._timed_out[operation] = 0
+        histogram.record(seconds)
+        if timed_out:
+            self._timed_out[operation] += 1
+        self._since_refresh[operation] += 1
+        if self._since_refresh[operation] >= self.refresh_every:
+            self._since_refresh[operation] = 0
+            self._refresh(operation)
+
+    def _refresh(self, operation: str) -> None:
+        histogram = self._histograms[operation]
+        if histogram.count < self.min_samples:
+            self._timeouts.pop(operation, None)
+            return
+        latency = histogram.quantile(self.quantile) or 0.0
+        self._timeouts[operation] = min(self.ceiling, max(self.floor, latency * self.multiplier))
+
+    @property
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Get window latency quantiles, call counts and the current timeout per operation."""
+        result: dict[str, dict[str, Any]] = {}
+        for operation, histogram in self._histograms.items():
+            p50, p99, p999 = histogram.quantiles(0.5, 0.99, 0.999)
+            result[operation] = {
+                "count": histogram.count,
+                "total": histogram.total,
+                "timed_out": self._timed_out[operation],
+                "p50_ms": p50 * 1000 if p50 is not None else None,
+                "p99_ms": p99 * 1000 if p99 is not None else None,
+                "p999_ms": p999 * 1000 if p999 is not None else None,
+                "max_ms": histogram.max_us / 1000,
+                "timeout_ms": self.timeout(operation) * 1000,
+            }
+        return result
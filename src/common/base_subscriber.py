@@ -8,6 +8,8 @@ This module provides the foundation for L2 consumers with:
 - Batch processing option
 - Dead-letter queue (DLQ) for permanently failed messages
 - Pure asyncio implementation with bounded parallelism
+- Optional Redis Streams transport: consumer groups split work across
+  processes and entries are acknowledged only after processing
 - Observability via structured logging
 """
 
@@ -52,6 +54,7 @@ except ImportError:
     async_timeout = DummyAsyncTimeout()  # type: ignore[assignment]
 
 from .pubsub import CircuitBreaker, get_pubsub
+from .redis_streams import RedisStreams, get_streams
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +94,8 @@ class BaseSubscriber(ABC):
         batch_size: int = DEFAULT_BATCH_SIZE,
         batch_window: float = DEFAULT_BATCH_WINDOW,
         message_ttl: int = DEFAULT_MESSAGE_TTL,
+        streams: RedisStreams | None = None,
+        consumer_group: str | None = None,
     ) -> None:
         """Initialize BaseSubscriber with configuration parameters.
 
@@ -103,6 +108,8 @@ class BaseSubscriber(ABC):
             batch_size: Number of messages to collect before processing batch
             batch_window: Time window in seconds to wait for batch completion
             message_ttl: Time-to-live in seconds for message acknowledgement tracking
+            streams: Consume Redis Streams through this transport instead of Pub/Sub
+            consumer_group: Streams consumer group shared by all instances (defaults to the class name)
 
         """
         self._concurrency = concurrency
@@ -113,6 +120,8 @@ class BaseSubscriber(ABC):
         self._batch_size = batch_size
         self._batch_window = batch_window
         self._message_ttl = message_ttl
+        self._streams = streams
+        self._consumer_group = consumer_group or type(self).__name__
 
         # Runtime state
         self._consuming_tasks: set[asyncio.Task[None]] = set()
@@ -257,7 +266,12 @@ class BaseSubscriber(ABC):
     async def _consume_loop(self, channel: str) -> None:
         """Consume messages from a specific channel."""
         try:
-            async for message in subscribe_to_channel(channel):
+            source = (
+                subscribe_to_stream(channel, group=self._consumer_group, streams=self._streams)
+                if self._streams is not None
+                else subscribe_to_channel(channel)
+            )
+            async for message in source:
                 if self._stop_event.is_set():
                     break
 
@@ -449,6 +463,18 @@ class BaseSubscriber(ABC):
             if processing_key:
                 await self._acknowledge_message(processing_key)  # Still ACK to prevent reprocessing
 
+        # Stream entries stay pending (and are redelivered) until processed or dead-lettered
+        await self._ack_stream_entry(message)
+
+    async def _ack_stream_entry(self, message: MessageDict) -> None:
+        """Acknowledge the stream entry a message came from (no-op for Pub/Sub messages)."""
+        if self._streams is None:
+            return
+        try:
+            await self._streams.ack_message(message)
+        except Exception:
+            logger.exception("Failed to acknowledge stream entry %s", message.get("_stream_id"))
+
     async def _set_processing_state(self, message_id: str) -> str:
         """Set processing state in Redis for acknowledgement tracking."""
         processing_key = f"processing:{message_id}"
@@ -524,6 +550,7 @@ class BaseSubscriber(ABC):
             "active_channels": len(self._channels),
             "batch_buffer_size": len(self._batch_buffer),
             "concurrency_limit": self._concurrency,
+            "transport": "streams" if self._streams is not None else "pubsub",
             "circuit_breaker_metrics": self._circuit_breaker.metrics if self._circuit_breaker else None,
         }
 
@@ -559,7 +586,8 @@ async def subscribe_to_channel(channel: str, *, max_idle_time: float = 30.0) ->
 
     Yields:
     ------
-        Message dictionaries from the channel
+        Message dictionaries from the channel (non-dict payloads, such as raw
+        codec bytes, are wrapped as ``{"payload": value}``)
 
     """
     pubsub = await get_pubsub()
@@ -567,8 +595,12 @@ async def subscribe_to_channel(channel: str, *, max_idle_time: float = 30.0) ->
     # Use the existing subscription mechanism with a custom handler
     message_queue: asyncio.Queue[MessageDict] = asyncio.Queue()
 
-    async def message_handler(_ch: str, message: MessageDict) -> None:
+    async def message_handler(_ch: str, message: Any) -> None:
         """Put messages in the queue."""
+        # Raw-codec bytes and JSON arrays are wrapped so consumers always get a dict,
+        # matching the envelope subscribe_to_stream uses
+        if not isinstance(message, dict):
+            message = {"payload": message}
         await message_queue.put(message)
 
     # Subscribe to the channel
@@ -623,6 +655,59 @@ async def subscribe_to_channel(channel: str, *, max_idle_time: float = 30.0) ->
             logger.exception("Error during unsubscribe from '%s'", channel)
 
 
+async def subscribe_to_stream(
+    channel: str,
+    *,
+    group: str,
+    consumer: str | None = None,
+    streams: RedisStreams | None = None,
+    max_idle_time: float = 30.0,
+) -> AsyncGenerator[MessageDict, None]:
+    """Async iterator over a Redis stream as one consumer of ``group``.
+
+    Streams counterpart of :func:`subscribe_to_channel`. Entries are delivered
+    unacknowledged, carrying ``_stream``/``_stream_group``/``_stream_id``; the
+    consumer must call :meth:`RedisStreams.ack_message` once done, otherwise
+    the entry is redelivered to the group after it has been idle long enough.
+
+    Args:
+    ----
+        channel: Stream key
+        group: Consumer group name
+        consumer: Consumer name (generated when omitted)
+        streams: Transport to use (defaults to the process-wide instance)
+        max_idle_time: Maximum seconds to wait for messages before exiting (default: 30.0)
+
+    Yields:
+    ------
+        Message dictionaries from the stream
+
+    """
+    streams = streams or await get_streams()
+    message_queue: asyncio.Queue[MessageDict] = asyncio.Queue()
+
+    async def message_handler(_ch: str, message: MessageDict) -> None:
+        """Put messages in the queue."""
+        await message_queue.put(message)
+
+    await streams.subscribe(channel, message_handler, group=group, consumer=consumer, auto_ack=False)
+
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(message_queue.get(), timeout=max_idle_time)
+                yield message
+            except TimeoutError:
+                logger.debug("No entries received on stream '%s' for %ss, exiting iterator", channel, max_idle_time)
+                break
+    finally:
+        # Entries still queued here were never processed; they stay pending and are claimed later
+        try:
+            await streams.unsubscribe(channel, message_handler)
+        except Exception:
+            logger.exception("Error stopping consumer on stream '%s'", channel)
+
+
 # ----- DLQ helper function ---------------------------------------------
 async def publish_to_dlq(channel: str, message: MessageDict) -> None:
     """Publish a message to the dead letter queue.
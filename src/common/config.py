@@ -1,6 +1,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Literal
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -33,11 +34,53 @@ class Settings(BaseSettings):
     NEO4J_PASSWORD: str = Field(default="test", validation_alias="NEO4J_PASSWORD")
     ENABLE_GRAPH_INTEGRATION: bool = Field(default=False, validation_alias="ENABLE_GRAPH_INTEGRATION")
 
+    # Neo4j query timeouts from observed p99.9 latency per query type (see src.common.adaptive_timeout)
+    NEO4J_ADAPTIVE_TIMEOUTS: bool = Field(default=False)
+    NEO4J_TIMEOUT_FLOOR_S: float = Field(default=1.0, gt=0)
+    NEO4J_TIMEOUT_CEILING_S: float = Field(default=30.0, gt=0)
+    NEO4J_TIMEOUT_MULTIPLIER: float = Field(default=4.0, ge=1)
+
     # Scratch Data Configuration (Task 10)
     SCRATCH_DEFAULT_TTL_DAYS: int = Field(default=7, ge=1, le=365)
     SCRATCH_CLEANUP_BATCH_SIZE: int = Field(default=1000, ge=100, le=10000)
     SCRATCH_ENABLE_AUTO_CLEANUP: bool = Field(default=True)
 
+    # Background log_event writer configuration
+    LOG_WRITER_QUEUE_SIZE: int = Field(default=10000, ge=100, le=1_000_000)
+    LOG_WRITER_MAX_BATCH: int = Field(default=500, ge=1, le=5000)
+    LOG_WRITER_FLUSH_INTERVAL_MS: int = Field(default=50, ge=1, le=10000)
+
+    # Store log_event data/tags/memo once per distinct content in mem0 payload_blob
+    LOG_PAYLOAD_DEDUP: bool = Field(default=False)
+
+    # log_event admission policy: JSON list of {source, tags, sample_rate, rate_limit, burst}
+    LOG_POLICY_RULES: list[dict[str, Any]] = Field(default_factory=list)
+    LOG_POLICY_ALWAYS_KEEP_TAGS: list[str] = Field(default_factory=lambda: ["error"])
+
+    # L1 publish outbox: "session" publishes from the committing process, "durable" writes
+    # mem0 outbox rows that the relay worker publishes
+    L1_OUTBOX_MODE: Literal["session", "durable"] = Field(default="session")
+    L1_OUTBOX_RELAY_BATCH_SIZE: int = Field(default=500, ge=1, le=10000)
+    L1_OUTBOX_RELAY_POLL_INTERVAL_MS: int = Field(default=200, ge=10, le=60000)
+
+    # L1 range partitioning (requires migration 5d2a9c7e41b8) and partition-drop retention.
+    # Without maintenance, rows past the migration's pre-made partitions land in the DEFAULT partition
+    L1_PARTITION_MAINTENANCE_ENABLED: bool = Field(default=False)
+    L1_PARTITION_GRANULARITY: Literal["day", "month"] = Field(default="day")
+    L1_PARTITION_PREMAKE: int = Field(default=7, ge=1, le=366)
+    L1_RETENTION_DAYS: int = Field(default=90, ge=1)
+    L1_PARTITION_MAINTENANCE_INTERVAL_S: int = Field(default=3600, ge=60)
+
+    # L1 correlation view LRU cache
+    L1_CORRELATION_CACHE_SIZE: int = Field(default=256, ge=1, le=100_000)
+    L1_CORRELATION_CACHE_TTL_S: float = Field(default=30.0, gt=0)
+
+    # Incremental hourly PromptTrace rollups
+    L1_ROLLUP_ENABLED: bool = Field(default=False)
+    L1_ROLLUP_INTERVAL_S: float = Field(default=60.0, gt=0)
+    L1_ROLLUP_BATCH_SIZE: int = Field(default=5000, ge=1, le=100_000)
+    L1_ROLLUP_SETTLE_S: float = Field(default=5.0, ge=0)
+
     model_config = SettingsConfigDict(env_file=None)  # dotenv loaded manually
 
     @property
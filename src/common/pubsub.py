@@ -8,18 +8,27 @@ correlation ID tracking for distributed observability.
 from __future__ import annotations
 
 import asyncio
+import binascii
 import contextlib
-import json
 import logging
+import random
 import time
 import uuid
-from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
+from .adaptive_timeout import AdaptiveTimeouts
+from .pubsub_batching import PublishBatcher
+from .pubsub_codecs import DEFAULT_CODEC, PayloadCodec, decode_payload, get_codec
+from .pubsub_dispatch import ChannelDispatcher, OverflowPolicy
+from .pubsub_fallback import FallbackReplayer, ReplayRing
+from .pubsub_loopback import LoopbackEchoes
+from .pubsub_router import ChannelRouter
 from .redis_config import get_redis_config
 
 # Import Redis with graceful degradation - use Any for type hints to avoid linter issues
@@ -48,6 +57,44 @@ except ImportError:
 correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
 
+# Listen loop message types carrying a payload
+_DATA_MESSAGE_TYPES = frozenset({"message", "pmessage", "smessage"})
+
+# Redis Cluster hash slot count
+_CLUSTER_SLOTS = 16384
+
+# Hash holding a retained channel's last message (see RedisPubSub.set_channel_retained)
+_RETAINED_KEY_PREFIX = "retained:"
+
+
+def _retained_key(channel: str) -> str:
+    return f"{_RETAINED_KEY_PREFIX}{channel}"
+
+
+def key_slot(channel: str) -> int:
+    """Get the Redis Cluster hash slot of a channel, honouring ``{hash tags}``."""
+    key = channel.encode()
+    start = key.find(b"{")
+    if start != -1:
+        end = key.find(b"}", start + 1)
+        if end > start + 1:
+            key = key[start + 1 : end]
+    return binascii.crc_hqx(key, 0) % _CLUSTER_SLOTS
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Map ``key`` onto one of ``buckets`` with jump consistent hashing.
+
+    Growing from n to n + 1 buckets moves only 1/(n + 1) of the keys.
+    """
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
 @dataclass
 class RedisOperationMetrics:
     """Metrics for Redis operation tracking and observability."""
@@ -63,6 +110,7 @@ class RedisOperationMetrics:
     error_message: str | None = None
     subscriber_count: int | None = None
     message_size_bytes: int | None = None
+    message_count: int | None = None
     circuit_breaker_state: str | None = None
 
     def mark_completed(self, *, success: bool = True, error: Exception | None = None) -> None:
@@ -102,6 +150,8 @@ except ImportError:
 # Type aliases for clarity
 MessageHandler = Callable[[str, dict[str, Any]], Coroutine[Any, Any, None]]
 MessageData = dict[str, Any]
+# Raw-codec channels publish pre-encoded bytes
+MessagePayload = MessageData | bytes
 
 
 class CircuitBreakerState(Enum):
@@ -383,6 +433,81 @@ class SubscribeError(PubSubError):
     """Exception raised when subscription operations fail."""
 
 
+class PublishTimings:
+    """Preallocated publish latency counters for the lean publish path.
+
+    Every field is a plain integer updated in place and latencies are counted in
+    a fixed array of power-of-two microsecond buckets, so recording a publish
+    creates no objects beyond the integers themselves.
+    """
+
+    BUCKETS = 24  # 1us up to ~8.6s; the last bucket also holds anything slower
+    SLOW_NS = 1_000_000  # The 1ms publish target
+
+    __slots__ = ("buckets", "bytes", "count", "errors", "max_ns", "slow", "total_ns")
+
+    def __init__(self) -> None:
+        """Initialize zeroed counters."""
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.slow = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, elapsed_ns: int, size: int) -> None:
+        """Count one successful publish of ``size`` bytes that took ``elapsed_ns``."""
+        self.count += 1
+        self.bytes += size
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if elapsed_ns > self.SLOW_NS:
+            self.slow += 1
+        # ns >> 10 approximates microseconds; bucket i holds [2**(i-1), 2**i) of those
+        index = (elapsed_ns >> 10).bit_length()
+        self.buckets[index if index < self.BUCKETS else self.BUCKETS - 1] += 1
+
+    def quantile_ms(self, q: float) -> float | None:
+        """Estimate the ``q`` latency quantile in ms as its bucket's upper bound, or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen > rank:
+                # The last bucket is open-ended, so only the observed maximum bounds it
+                upper = self.max_ns if index == self.BUCKETS - 1 else min(1 << (index + 10), self.max_ns)
+                return upper / 1_000_000
+        return self.max_ns / 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the counters."""
+        return {
+            "publishes": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "slow_publishes": self.slow,
+            "avg_ms": self.total_ns / self.count / 1_000_000 if self.count else None,
+            "max_ms": self.max_ns / 1_000_000 if self.count else None,
+            "p50_ms": self.quantile_ms(0.5),
+            "p99_ms": self.quantile_ms(0.99),
+        }
+
+
+@dataclass
+class _PubSubShard:
+    """One subscriber connection of the sharded mode and its listen task."""
+
+    index: int
+    connection: Any = None  # Redis PubSub instance, created on first subscribe
+    task: asyncio.Task[None] | None = None
+    channels: set[str] = field(default_factory=set)
+    received: int = 0
+
+
 class RedisPubSub:
     """High-performance Redis Pub/Sub wrapper with connection pooling and circuit breaker.
 
@@ -402,8 +527,64 @@ class RedisPubSub:
         self._pubsub: Any = None  # Redis PubSub instance
         self._subscribers: set[str] = set()
         self._handlers: dict[str, list[MessageHandler]] = {}
+        self._pattern_handlers: dict[str, list[MessageHandler]] = {}
+        self._router = ChannelRouter()
         self._listening_task: asyncio.Task[None] | None = None
         self._connected = False
+        self._batcher: PublishBatcher | None = None
+        self._dispatcher: ChannelDispatcher | None = None
+
+        # In-process delivery (see enable_loopback)
+        self._loopback: LoopbackEchoes | None = None
+        self._loopback_tasks: set[asyncio.Task[None]] = set()
+
+        # Replay of messages parked by publish_with_fallback (see configure_fallback)
+        self._fallback: FallbackReplayer | None = None
+
+        # Rebuilding of failed subscriber connections (see configure_reconnect)
+        self._reconnect_backoff_base = 0.05
+        self._reconnect_backoff_max = 5.0
+        self._reconnect_stats: dict[str, Any] = {
+            "reconnects": 0,
+            "attempts": 0,
+            "failed_attempts": 0,
+            "last_gap_s": None,
+            "max_gap_s": 0.0,
+            "total_gap_s": 0.0,
+        }
+
+        # Last message of selected channels kept for late subscribers (see set_channel_retained)
+        self._retained: dict[str, float] = {}
+        self._retained_stats: dict[str, int] = {"stored": 0, "delivered": 0, "missed": 0}
+
+        # Per-operation timeouts from observed latency (see enable_adaptive_timeouts)
+        self._adaptive_timeouts: AdaptiveTimeouts | None = None
+
+        # Sharded subscriber connections (see enable_sharding)
+        self._shards: list[_PubSubShard] = []
+        self._sharded_commands = False
+
+        # Payload codecs (see src.common.pubsub_codecs)
+        self._default_codec: PayloadCodec = get_codec(DEFAULT_CODEC)
+        self._channel_codecs: dict[str, PayloadCodec] = {}
+
+        # Lean publish mode (see enable_lean_publish); timings also cover publish_encoded
+        self._lean = False
+        self._lean_sample_every = 0
+        self._lean_calls = 0
+        self._publish_timings = PublishTimings()
+
+        # Aggregate publish_many metrics
+        self._batch_totals: dict[str, Any] = {
+            "batches": 0,
+            "failed_batches": 0,
+            "messages": 0,
+            "failed_messages": 0,
+            "bytes": 0,
+            "deliveries": 0,
+            "total_ms": 0.0,
+            "last_batch_ms": 0.0,
+        }
 
         # Initialize circuit breaker for Redis operations
         self._circuit_breaker = CircuitBreaker(
@@ -460,7 +641,7 @@ class RedisPubSub:
 
         try:
             # Use circuit breaker to protect connection operation
-            await self._circuit_breaker.call(_connect_operation)
+            await self._breaker_call("connect", _connect_operation)
             self._connected = True
             logger.info("Redis Pub/Sub connected successfully")
 
@@ -476,8 +657,18 @@ class RedisPubSub:
     async def disconnect(self) -> None:
         """Gracefully disconnect from Redis."""
         if not self._connected:
+            # Replay also runs while Redis is down, e.g. after get_pubsub's first connect failed
+            if self._fallback is not None:
+                await self._fallback.stop()
             return
 
+        try:
+            # Deliver messages still lingering in the auto-batcher
+            if self._batcher is not None:
+                await self._batcher.flush()
+        except Exception:
+            logger.exception("Error flushing auto-batched messages during disconnect")
+
         try:
             # Stop listening task
             if self._listening_task and not self._listening_task.done():
@@ -488,6 +679,33 @@ class RedisPubSub:
         except Exception:
             logger.exception("Error stopping listening task during disconnect")
 
+        for shard in self._shards:
+            try:
+                if shard.task and not shard.task.done():
+                    shard.task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await shard.task
+                if shard.connection:
+                    await shard.connection.aclose()
+            except Exception:
+                logger.exception("Error closing pubsub shard %d during disconnect", shard.index)
+            shard.connection, shard.task = None, None
+            shard.channels.clear()
+
+        try:
+            # Stop replaying; the file queue keeps its messages for the next run
+            if self._fallback is not None:
+                await self._fallback.stop()
+        except Exception:
+            logger.exception("Error stopping fallback replay during disconnect")
+
+        try:
+            # Stop dispatcher workers; messages still queued are discarded
+            if self._dispatcher is not None:
+                await self._dispatcher.close()
+        except Exception:
+            logger.exception("Error stopping dispatcher workers during disconnect")
+
         try:
             # Close pubsub connection
             if self._pubsub:
@@ -516,15 +734,17 @@ class RedisPubSub:
         self._connected = False
         self._subscribers.clear()
         self._handlers.clear()
+        self._pattern_handlers.clear()
+        self._router = ChannelRouter()
         logger.info("Redis Pub/Sub disconnected")
 
-    async def publish(self, channel: str, message: MessageData, correlation_id: str | None = None) -> int:
+    async def publish(self, channel: str, message: MessagePayload, correlation_id: str | None = None) -> int:
         """Publish message to Redis channel with <1ms latency target and comprehensive observability.
 
         Args:
         ----
             channel: Redis channel name
-            message: Message data to publish (will be JSON serialized)
+            message: Message data to publish, encoded with the channel's codec
             correlation_id: Optional correlation ID for distributed tracing
 
         Returns:
@@ -537,6 +757,20 @@ class RedisPubSub:
             CircuitBreakerError: If circuit breaker is open
 
         """
+        # Loopback: local handlers get the message object now, other processes via Redis
+        if self._loopback is not None and (targets := self._router.match(channel)):
+            return await self._publish_looped_back(channel, message, targets)
+
+        # Auto-batching: wait for a shared pipelined flush instead of a dedicated round trip
+        if self._batcher is not None:
+            return await self._batcher.submit(channel, self._encode_for_publish(channel, message))
+
+        # Lean mode: every call but each sampled one skips the traced path below
+        if self._lean:
+            self._lean_calls += 1
+            if not self._lean_sample_every or self._lean_calls % self._lean_sample_every:
+                return await self._publish_lean(channel, self._encode_for_publish(channel, message))
+
         # Get or generate correlation ID
         if not correlation_id:
             correlation_id = correlation_id or str(uuid.uuid4())
@@ -568,11 +802,11 @@ class RedisPubSub:
 
                 assert self._redis is not None  # mypy assertion  # nosec B101
 
-                # Pre-serialize JSON for performance
+                # Pre-serialize for performance; the byte length doubles as the size metric
                 try:
-                    serialized = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
-                    metrics.message_size_bytes = len(serialized.encode("utf-8"))
-                except (json.JSONDecodeError, TypeError) as e:
+                    serialized = self.encode_message(channel, message)
+                    metrics.message_size_bytes = len(serialized)
+                except (TypeError, ValueError) as e:
                     logger.exception("Failed to serialize message for channel '%s'", channel)
                     metrics.mark_completed(success=False, error=e)
 
@@ -587,7 +821,7 @@ class RedisPubSub:
                 async def _publish_operation() -> int:
                     # Publish with timing measurement
                     start_time = time.perf_counter()
-                    result = await self._redis.publish(channel, serialized)
+                    result = await self._sender(channel)(channel, serialized)
                     elapsed = (time.perf_counter() - start_time) * 1000
 
                     # Update metrics with subscriber count
@@ -609,7 +843,7 @@ class RedisPubSub:
                     return int(result)
 
                 # Use circuit breaker to protect publish operation
-                result = await self._circuit_breaker.call(_publish_operation)
+                result = await self._breaker_call("publish", _publish_operation)
                 if not isinstance(result, int):
                     error_msg = f"Circuit breaker should return int from _publish_operation, got {type(result)}"
                     raise TypeError(error_msg)
@@ -661,9 +895,469 @@ class RedisPubSub:
                 msg = f"Unexpected publish error: {e}"
                 raise PublishError(msg) from e
 
+    def encode_message(self, channel: str, message: MessagePayload) -> bytes:
+        """Encode a message with the channel's codec, header byte included.
+
+        The result can be passed to :meth:`publish_encoded` any number of times.
+
+        Raises
+        ------
+            ValueError: If the codec rejects the message
+            TypeError: If the message contains unserializable values
+
+        """
+        return self._channel_codecs.get(channel, self._default_codec).frame(message)
+
+    def set_default_codec(self, name: str) -> None:
+        """Select the codec for channels without their own (``orjson`` initially).
+
+        Raises
+        ------
+            ValueError: If no codec with that name is registered
+
+        """
+        self._default_codec = get_codec(name)
+
+    def set_channel_codec(self, channel: str, name: str | None) -> None:
+        """Select the codec used to publish on ``channel``, or restore the default with None.
+
+        Subscribers need no configuration: each payload's header byte names its codec.
+
+        Raises
+        ------
+            ValueError: If no codec with that name is registered
+
+        """
+        if name is None:
+            self._channel_codecs.pop(channel, None)
+        else:
+            self._channel_codecs[channel] = get_codec(name)
+
+    @property
+    def codecs(self) -> dict[str, Any]:
+        """Get the default codec name and per-channel overrides."""
+        return {
+            "default": self._default_codec.name,
+            "channels": {channel: codec.name for channel, codec in self._channel_codecs.items()},
+        }
+
+    def set_channel_retained(self, channel: str, ttl: float | None) -> None:
+        """Keep the last message published on ``channel`` for ``ttl`` seconds, or stop with None.
+
+        Every publish to a retained channel also stores the encoded message in
+        the Redis hash ``retained:<channel>`` (fields ``payload`` and
+        ``published_at``) in the same pipeline, and refreshes the key's TTL.
+        :meth:`subscribe` hands the stored message to each handler it attaches,
+        so a consumer that starts after the last publish still receives the
+        current state. A message published while the handler attaches can
+        reach it twice, once retained and once live, so handlers on retained
+        channels should be idempotent.
+
+        Publishers and subscribers must both mark the channel as retained.
+        Stopping leaves the stored message to expire.
+
+        Raises
+        ------
+            ValueError: If ttl is not positive
+
+        """
+        if ttl is None:
+            self._retained.pop(channel, None)
+            return
+        if ttl <= 0:
+            msg = f"Retained message TTL must be positive, got {ttl}"
+            raise ValueError(msg)
+        self._retained[channel] = ttl
+
+    @property
+    def retained_metrics(self) -> dict[str, Any]:
+        """Get the retained channels with their TTLs, and store and delivery counters."""
+        return {"channels": dict(self._retained), **self._retained_stats}
+
+    async def get_retained(self, channel: str) -> tuple[Any, float] | None:
+        """Get the message retained on ``channel`` and its publish time (epoch seconds), or None.
+
+        Raises
+        ------
+            ValueError: If the stored payload cannot be decoded
+            RedisError: If reading the hash fails
+            CircuitBreakerError: If circuit breaker is open
+
+        """
+        if not self._connected or not self._redis:
+            await self.connect()
+        fields = await self._breaker_call(
+            "retained", self._redis.hmget, _retained_key(channel), "payload", "published_at"
+        )
+        if not isinstance(fields, list) or fields[0] is None:
+            return None
+        return decode_payload(fields[0]), float(fields[1])
+
+    async def _deliver_retained(self, channel: str, handler: MessageHandler) -> None:
+        """Hand a newly attached handler the message retained on ``channel``, if there is one."""
+        try:
+            retained = await self.get_retained(channel)
+        except (RedisError, CircuitBreakerError, ValueError):
+            # The subscription itself worked; the handler just starts with the next live message
+            logger.warning("Could not read retained message of channel '%s'", channel, exc_info=True)
+            return
+        if retained is None:
+            self._retained_stats["missed"] += 1
+            return
+        try:
+            await handler(channel, retained[0])
+        except Exception:
+            logger.exception("Error handling retained message from channel '%s'", channel)
+        self._retained_stats["delivered"] += 1
+
+    def _sender(self, channel: str) -> Callable[[str, bytes], Awaitable[Any]]:
+        """Get the coroutine function that publishes one encoded message on ``channel``."""
+        if self._retained and channel in self._retained:
+            return self._publish_retained
+        return self._redis.spublish if self._sharded_commands else self._redis.publish  # type: ignore[no-any-return]
+
+    async def _publish_retained(self, channel: str, payload: bytes) -> int:
+        """Store and publish a message through one pipeline; returns the PUBLISH reply."""
+        pipe = self._redis.pipeline(transaction=False)
+        self._stage_retained(pipe, channel, payload)
+        (pipe.spublish if self._sharded_commands else pipe.publish)(channel, payload)
+        *_, count = await pipe.execute()
+        self._retained_stats["stored"] += 1
+        return int(count)
+
+    def _stage_retained(self, pipe: Any, channel: str, payload: bytes) -> None:
+        key = _retained_key(channel)
+        pipe.hset(key, mapping={"payload": payload, "published_at": time.time()})
+        pipe.pexpire(key, int(self._retained[channel] * 1000))
+
+    def _encode_for_publish(self, channel: str, message: MessagePayload) -> bytes:
+        """Encode a message for the untraced publish paths, wrapping errors in PublishError."""
+        try:
+            return self.encode_message(channel, message)
+        except (TypeError, ValueError) as e:
+            logger.exception("Failed to serialize message for channel '%s'", channel)
+            msg = f"Failed to serialize message: {e}"
+            raise PublishError(msg) from e
+
+    async def publish_encoded(self, channel: str, payload: bytes) -> int:
+        """Publish an already encoded message without tracing.
+
+        Lets callers encode a message once and send it to several channels (or
+        resend it) with no per-call span, metrics object or correlation ID; the
+        latency is counted in :attr:`lean_publish_metrics`.
+
+        Args:
+        ----
+            channel: Redis channel name
+            payload: Message bytes from :meth:`encode_message` (bare JSON is also accepted by subscribers)
+
+        Returns:
+        -------
+            Number of subscribers that received the message
+
+        Raises:
+        ------
+            PublishError: If publishing fails
+
+        """
+        return await self._publish_lean(channel, payload)
+
+    async def _publish_lean(self, channel: str, payload: bytes) -> int:
+        """Publish encoded bytes, recording only into the preallocated timing counters."""
+        timings = self._publish_timings
+        started = time.perf_counter_ns()
+        try:
+            if not self._connected or not self._redis:
+                await self.connect()
+                started = time.perf_counter_ns()
+            result = await self._breaker_call("publish", self._sender(channel), channel, payload)
+        except CircuitBreakerError as e:
+            timings.errors += 1
+            logger.exception("Circuit breaker prevented publish to channel '%s'", channel)
+            msg = f"Publish blocked by circuit breaker: {e}"
+            raise PublishError(msg) from e
+        except Exception as e:
+            timings.errors += 1
+            logger.exception("Failed to publish to channel '%s'", channel)
+            msg = f"Failed to publish message: {e}"
+            raise PublishError(msg) from e
+        timings.record(time.perf_counter_ns() - started, len(payload))
+        if not isinstance(result, int):
+            error_msg = f"Circuit breaker should return int from publish, got {type(result)}"
+            raise TypeError(error_msg)
+        return result
+
+    def enable_lean_publish(self, *, sample_rate: float = 0.01) -> None:
+        """Skip per-message tracing on :meth:`publish` except for a sample of calls.
+
+        Unsampled calls encode the message once and publish it with no Logfire
+        span, metrics object or correlation ID, timing themselves into the
+        preallocated counters behind :attr:`lean_publish_metrics`. Every
+        ``1 / sample_rate``-th call still takes the fully traced path. Failures
+        are always logged.
+
+        Args:
+        ----
+            sample_rate: Fraction of calls to trace (0 traces none, 1 traces all)
+
+        Raises:
+        ------
+            ValueError: If sample_rate is outside [0, 1]
+
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            msg = f"sample_rate must be between 0 and 1, got {sample_rate}"
+            raise ValueError(msg)
+        self._lean = True
+        self._lean_sample_every = round(1 / sample_rate) if sample_rate else 0
+        self._lean_calls = 0
+
+    def disable_lean_publish(self) -> None:
+        """Trace every :meth:`publish` call again."""
+        self._lean = False
+
+    @property
+    def lean_publish_metrics(self) -> dict[str, Any]:
+        """Get latency counters for untraced publishes (lean mode and :meth:`publish_encoded`)."""
+        return {
+            "enabled": self._lean,
+            "sample_every": self._lean_sample_every,
+            **self._publish_timings.to_dict(),
+        }
+
+    async def publish_many(
+        self, items: Sequence[tuple[str, MessagePayload]], correlation_id: str | None = None
+    ) -> list[int]:
+        """Publish a batch of messages through one Redis pipeline.
+
+        The batch costs one round trip, one circuit breaker call and one Logfire
+        span; batch-level metrics are recorded instead of per-message ones and
+        accumulated in :attr:`publish_batch_metrics`.
+
+        Args:
+        ----
+            items: Sequence of (channel, message) pairs, published in order
+            correlation_id: Optional correlation ID shared by the whole batch
+
+        Returns:
+        -------
+            Subscriber count for each message, in input order
+
+        Raises:
+        ------
+            PublishError: If serialization or the pipeline fails (no partial results are returned)
+
+        """
+        if not items:
+            return []
+
+        try:
+            # Encode once; the byte length doubles as the size metric
+            serialized = [(channel, self.encode_message(channel, message)) for channel, message in items]
+        except (TypeError, ValueError) as e:
+            logger.exception("Failed to serialize batch of %d messages", len(items))
+            metrics = self._batch_metrics([channel for channel, _ in items], correlation_id)
+            self._record_batch(metrics, success=False, error=e)
+            msg = f"Failed to serialize message: {e}"
+            raise PublishError(msg) from e
+
+        if self._loopback is None:
+            return await self._publish_encoded(serialized, correlation_id)
+
+        echoes = []
+        for (channel, message), (_, payload) in zip(items, serialized, strict=True):
+            if targets := self._router.match(channel):
+                self._loopback.expect(channel, payload, len(targets))
+                echoes.append((channel, payload, len(targets)))
+                await self._deliver_locally(channel, message, targets)
+        try:
+            return await self._publish_encoded(serialized, correlation_id)
+        except PublishError:
+            for echo in echoes:
+                self._loopback.forget(*echo)
+            raise
+
+    def _batch_metrics(self, channels: Sequence[str], correlation_id: str | None) -> RedisOperationMetrics:
+        """Create metrics for one pipelined batch."""
+        distinct = set(channels)
+        return RedisOperationMetrics(
+            operation="PUBLISH_BATCH",
+            channel=next(iter(distinct)) if len(distinct) == 1 else None,
+            correlation_id=correlation_id or str(uuid.uuid4()),
+            circuit_breaker_state=self._circuit_breaker.state.value,
+            message_count=len(channels),
+        )
+
+    async def _publish_encoded(
+        self, serialized: Sequence[tuple[str, bytes]], correlation_id: str | None = None
+    ) -> list[int]:
+        """Send pre-encoded messages through one pipeline under one circuit breaker call."""
+        metrics = self._batch_metrics([channel for channel, _ in serialized], correlation_id)
+        metrics.message_size_bytes = sum(len(payload) for _, payload in serialized)
+
+        span_context: Any = (
+            logfire.span("Redis PUBLISH batch", batch_size=len(serialized), correlation_id=metrics.correlation_id)
+            if _LOGFIRE_AVAILABLE
+            else contextlib.nullcontext()
+        )
+
+        with span_context as span:
+            try:
+                if not self._connected or not self._redis:
+                    await self.connect()
+
+                assert self._redis is not None  # mypy assertion  # nosec B101
+
+                async def _publish_batch_operation() -> list[int]:
+                    pipe = self._redis.pipeline(transaction=False)
+                    send = pipe.spublish if self._sharded_commands else pipe.publish
+                    if not self._retained:
+                        for channel, payload in serialized:
+                            send(channel, payload)
+                        return [int(count) for count in await pipe.execute()]
+
+                    # Retained channels add HSET and PEXPIRE replies; keep the PUBLISH positions
+                    positions = []
+                    for channel, payload in serialized:
+                        if channel in self._retained:
+                            self._stage_retained(pipe, channel, payload)
+                        positions.append(len(pipe))
+                        send(channel, payload)
+                    replies = await pipe.execute()
+                    self._retained_stats["stored"] += (len(replies) - len(positions)) // 2
+                    return [int(replies[index]) for index in positions]
+
+                result = await self._breaker_call("publish_many", _publish_batch_operation)
+                if not isinstance(result, list):
+                    error_msg = f"Circuit breaker should return list from _publish_batch_operation, got {type(result)}"
+                    raise TypeError(error_msg)
+
+                metrics.subscriber_count = sum(result)
+                self._record_batch(metrics, success=True)
+                if _LOGFIRE_AVAILABLE and logfire and span:
+                    span.set_attributes(metrics.to_dict())
+                return result
+
+            except CircuitBreakerError as e:
+                logger.exception("Circuit breaker prevented batch publish of %d messages", len(serialized))
+                self._record_batch(metrics, success=False, error=e, span=span)
+                msg = f"Publish blocked by circuit breaker: {e}"
+                raise PublishError(msg) from e
+
+            except Exception as e:
+                logger.exception("Failed to publish batch of %d messages", len(serialized))
+                self._record_batch(metrics, success=False, error=e, span=span)
+                msg = f"Failed to publish message batch: {e}"
+                raise PublishError(msg) from e
+
+    def _record_batch(
+        self,
+        metrics: RedisOperationMetrics,
+        *,
+        success: bool,
+        error: Exception | None = None,
+        span: Any = None,
+    ) -> None:
+        """Complete batch metrics and fold them into the aggregate counters."""
+        metrics.mark_completed(success=success, error=error)
+        totals = self._batch_totals
+        totals["batches"] += 1
+        if success:
+            totals["messages"] += metrics.message_count or 0
+            totals["bytes"] += metrics.message_size_bytes or 0
+            totals["deliveries"] += metrics.subscriber_count or 0
+            totals["total_ms"] += metrics.duration_ms or 0.0
+            totals["last_batch_ms"] = metrics.duration_ms or 0.0
+        else:
+            totals["failed_batches"] += 1
+            totals["failed_messages"] += metrics.message_count or 0
+            if _LOGFIRE_AVAILABLE and logfire and span:
+                span.record_exception(error)
+                span.set_attributes(metrics.to_dict())
+
+    @property
+    def publish_batch_metrics(self) -> dict[str, Any]:
+        """Get aggregate metrics for :meth:`publish_many` calls."""
+        totals = self._batch_totals
+        succeeded = totals["batches"] - totals["failed_batches"]
+        return {
+            **totals,
+            "avg_batch_size": totals["messages"] / max(1, succeeded),
+            "avg_batch_ms": totals["total_ms"] / max(1, succeeded),
+            "avg_ms_per_message": totals["total_ms"] / max(1, totals["messages"]),
+        }
+
+    def enable_auto_batching(self, *, linger_ms: float = 1.0, max_batch: int = 100) -> None:
+        """Gather concurrent :meth:`publish` calls into pipelined batches.
+
+        Each call waits up to ``linger_ms`` for others to share its round trip.
+        Per-message correlation IDs, spans and latency warnings are replaced by
+        batch-level ones.
+
+        Args:
+        ----
+            linger_ms: Maximum time the first message of a batch waits for company
+            max_batch: Flush immediately once this many messages are waiting
+
+        """
+        self._batcher = PublishBatcher(self, linger=linger_ms / 1000, max_batch=max_batch)
+
+    async def disable_auto_batching(self) -> None:
+        """Flush pending auto-batched messages and return to one round trip per publish."""
+        batcher, self._batcher = self._batcher, None
+        if batcher is not None:
+            await batcher.flush()
+
+    @property
+    def auto_batching_metrics(self) -> dict[str, Any] | None:
+        """Get auto-batching flush statistics, or None when auto-batching is off."""
+        return self._batcher.metrics if self._batcher is not None else None
+
+    async def enable_dispatcher(
+        self,
+        *,
+        queue_size: int = 1000,
+        workers: int = 1,
+        policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        spill_size: int = 10_000,
+    ) -> None:
+        """Hand received messages to per-channel worker tasks instead of handling them in the listen loop.
+
+        See :class:`ChannelDispatcher` for the overflow policies. Takes effect for
+        messages received from now on; a dispatcher already enabled is first
+        disabled, letting its queued messages finish and stopping its workers.
+
+        Args:
+        ----
+            queue_size: Maximum messages queued per channel
+            workers: Worker tasks per channel; more than one gives up per-channel ordering
+            policy: What to do when a channel's queue is full: block, drop_oldest or spill
+            spill_size: Maximum messages in a channel's overflow buffer (spill policy)
+
+        """
+        await self.disable_dispatcher()
+        self._dispatcher = ChannelDispatcher(
+            self, queue_size=queue_size, workers=workers, policy=OverflowPolicy(policy), spill_size=spill_size
+        )
+
+    async def disable_dispatcher(self) -> None:
+        """Let queued messages finish, then return to handling messages in the listen loop."""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            await dispatcher.join()
+            await dispatcher.close()
+
+    @property
+    def dispatcher_metrics(self) -> dict[str, Any] | None:
+        """Get per-channel queue depth and counters, or None when the dispatcher is off."""
+        return self._dispatcher.metrics if self._dispatcher is not None else None
+
     async def subscribe(self, channel: str, handler: MessageHandler) -> None:
         """Subscribe to Redis channel with message handler.
 
+        On a retained channel (see :meth:`set_channel_retained`) the handler is
+        first given the channel's last message, before this call returns.
+
         Args:
         ----
             channel: Redis channel name to subscribe to
@@ -679,6 +1373,12 @@ class RedisPubSub:
 
         assert self._redis is not None  # mypy assertion  # nosec B101
         try:
+            if self._shards:
+                await self._subscribe_sharded(channel, handler)
+                if channel in self._retained:
+                    await self._deliver_retained(channel, handler)
+                return
+
             # Initialize pubsub if needed
             if not self._pubsub:
                 self._pubsub = self._redis.pubsub()
@@ -686,6 +1386,7 @@ class RedisPubSub:
             # Add handler to channel handlers
             if channel not in self._handlers:
                 self._handlers[channel] = []
+                self._rebuild_router()
             self._handlers[channel].append(handler)
 
             # Subscribe to channel if not already subscribed
@@ -699,6 +1400,9 @@ class RedisPubSub:
             if not self._listening_task or self._listening_task.done():
                 self._listening_task = asyncio.create_task(self._listen_loop())
 
+            if channel in self._retained:
+                await self._deliver_retained(channel, handler)
+
         except RedisError as e:
             logger.exception("Failed to subscribe to channel '%s'", channel)
             msg = f"Failed to subscribe: {e}"
@@ -717,9 +1421,13 @@ class RedisPubSub:
             SubscribeError: If unsubscription fails
 
         """
-        if not self._pubsub or channel not in self._subscribers:
+        if channel not in self._subscribers or not (self._pubsub or self._shards):
             return
 
+        # Sharded channels live on their shard's connection
+        connection = self._shard_for(channel).connection if self._shards else self._pubsub
+        unsubscribe = connection.sunsubscribe if self._sharded_commands else connection.unsubscribe
+
         try:
             # Remove specific handler or all handlers
             if handler and channel in self._handlers:
@@ -729,70 +1437,455 @@ class RedisPubSub:
                 # If no handlers left, unsubscribe from channel
                 if not self._handlers[channel]:
                     del self._handlers[channel]
-                    await self._pubsub.unsubscribe(channel)
+                    self._rebuild_router()
+                    await unsubscribe(channel)
                     self._subscribers.remove(channel)
                     logger.info("Unsubscribed from channel '%s'", channel)
             else:
                 # Remove all handlers and unsubscribe
                 if channel in self._handlers:
                     del self._handlers[channel]
-                await self._pubsub.unsubscribe(channel)
+                    self._rebuild_router()
+                await unsubscribe(channel)
                 self._subscribers.remove(channel)
                 logger.info("Unsubscribed from channel '%s' (all handlers)", channel)
 
+            if channel not in self._subscribers:
+                if self._shards:
+                    self._shard_for(channel).channels.discard(channel)
+                if self._dispatcher is not None:
+                    await self._dispatcher.close_channel(channel)
+
         except RedisError as e:
             logger.exception("Failed to unsubscribe from channel '%s'", channel)
             msg = f"Failed to unsubscribe: {e}"
             raise SubscribeError(msg) from e
 
-    async def _listen_loop(self) -> None:
-        """Process incoming messages in main listening loop."""
-        if not self._pubsub:
+    async def psubscribe(self, pattern: str, handler: MessageHandler) -> None:
+        """Subscribe to every channel matching a glob pattern (Redis PSUBSCRIBE).
+
+        Handlers receive the actual channel name. A channel matching several
+        patterns (or also subscribed exactly) is delivered once per subscription.
+
+        Args:
+        ----
+            pattern: Redis glob pattern such as ``mem0.recorded.*``
+            handler: Async function to handle received messages
+
+        Raises:
+        ------
+            SubscribeError: If subscription fails
+
+        """
+        if self._sharded_commands:
+            msg = "Pattern subscriptions do not receive SPUBLISH messages; disable sharded pub/sub commands"
+            raise SubscribeError(msg)
+
+        if not self._connected or not self._redis:
+            await self.connect()
+
+        assert self._redis is not None  # mypy assertion  # nosec B101
+        try:
+            if not self._pubsub:
+                self._pubsub = self._redis.pubsub()
+
+            if pattern not in self._pattern_handlers:
+                assert self._pubsub is not None  # mypy assertion  # nosec B101
+                await self._pubsub.psubscribe(pattern)
+                self._pattern_handlers[pattern] = []
+                self._rebuild_router()
+                logger.info("Subscribed to pattern '%s'", pattern)
+            self._pattern_handlers[pattern].append(handler)
+
+            if not self._listening_task or self._listening_task.done():
+                self._listening_task = asyncio.create_task(self._listen_loop())
+
+        except RedisError as e:
+            logger.exception("Failed to subscribe to pattern '%s'", pattern)
+            msg = f"Failed to subscribe: {e}"
+            raise SubscribeError(msg) from e
+
+    async def punsubscribe(self, pattern: str, handler: MessageHandler | None = None) -> None:
+        """Unsubscribe from a pattern subscription.
+
+        Args:
+        ----
+            pattern: Glob pattern passed to :meth:`psubscribe`
+            handler: Specific handler to remove (if None, removes all handlers)
+
+        Raises:
+        ------
+            SubscribeError: If unsubscription fails
+
+        """
+        handlers = self._pattern_handlers.get(pattern)
+        if not self._pubsub or handlers is None:
             return
 
+        if handler is not None:
+            if handler in handlers:
+                handlers.remove(handler)
+            if handlers:
+                return
+
         try:
-            async for message in self._pubsub.listen():
-                if message["type"] == "message":
-                    await self._handle_message(message)
+            del self._pattern_handlers[pattern]
+            self._rebuild_router()
+            await self._pubsub.punsubscribe(pattern)
+            logger.info("Unsubscribed from pattern '%s'", pattern)
+            if self._dispatcher is not None:
+                await self._dispatcher.close_channel(pattern)
+        except RedisError as e:
+            logger.exception("Failed to unsubscribe from pattern '%s'", pattern)
+            msg = f"Failed to unsubscribe: {e}"
+            raise SubscribeError(msg) from e
+
+    def matching_subscriptions(self, channel: str) -> tuple[str, ...]:
+        """Get the subscriptions that receive messages published to ``channel``.
+
+        Returns
+        -------
+            The channel itself if subscribed exactly, then every matching pattern
+
+        """
+        return self._router.match(channel)
+
+    def enable_loopback(self, *, echo_ttl: float = 5.0) -> None:
+        """Deliver messages published by this instance to its own subscribers in-process.
+
+        :meth:`publish` and :meth:`publish_many` hand the message object straight
+        to matching local handlers (exact and pattern subscriptions), with no
+        encoding or round trip, and still publish it to Redis for other
+        processes. The copy Redis sends back to this instance is recognized and
+        dropped. Local handlers share the published object, so they must not
+        modify it, and they receive it even if the Redis publish then fails.
+
+        Looped-back :meth:`publish` calls take the untraced path (auto-batched
+        when enabled), as in lean mode. :meth:`publish_encoded` is not looped back.
+
+        Args:
+        ----
+            echo_ttl: Seconds to wait for the copy from Redis before no longer expecting it
+
+        """
+        self._loopback = LoopbackEchoes(ttl=echo_ttl)
+
+    def disable_loopback(self) -> None:
+        """Deliver every message through Redis again."""
+        self._loopback = None
 
-        except asyncio.CancelledError:
-            logger.debug("Pub/Sub listening loop cancelled")
+    @property
+    def loopback_metrics(self) -> dict[str, Any] | None:
+        """Get local delivery and echo suppression counters, or None when loopback is off."""
+        return self._loopback.metrics if self._loopback is not None else None
+
+    async def _publish_looped_back(self, channel: str, message: MessagePayload, targets: tuple[str, ...]) -> int:
+        assert self._loopback is not None  # nosec B101
+        payload = self._encode_for_publish(channel, message)
+        # Expect the echo before sending so a fast reply is already recognized
+        self._loopback.expect(channel, payload, len(targets))
+        await self._deliver_locally(channel, message, targets)
+        try:
+            if self._batcher is not None:
+                return await self._batcher.submit(channel, payload)
+            return await self._publish_lean(channel, payload)
+        except PublishError:
+            self._loopback.forget(channel, payload, len(targets))
             raise
-        except RedisError:
-            logger.exception("Error in Pub/Sub listening loop")
-            # Attempt reconnection
-            try:
+
+    async def _deliver_locally(self, channel: str, message: Any, targets: tuple[str, ...]) -> None:
+        """Hand a message to the local subscriptions ``targets`` (from the router) without Redis."""
+        assert self._loopback is not None  # nosec B101
+        # The router lists the exact subscription first, then patterns
+        exact = channel in self._handlers
+        for index, key in enumerate(targets):
+            pattern = None if exact and index == 0 else key
+            if self._dispatcher is not None:
+                await self._dispatcher.submit(channel, message, pattern)
+            else:
+                task = asyncio.create_task(self._deliver(channel, message, pattern))
+                # Hold a reference until done so the delivery is not garbage collected
+                self._loopback_tasks.add(task)
+                task.add_done_callback(self._loopback_tasks.discard)
+        self._loopback.delivered += 1
+
+    async def enable_sharding(self, shards: int, *, sharded_commands: bool | None = None) -> None:
+        """Spread channel subscriptions over ``shards`` subscriber connections, each with its own listen loop.
+
+        Channels map to a shard by jump consistent hashing of their Redis
+        Cluster hash slot, so the same channel always lands on the same
+        connection and changing the shard count moves few channels. Pattern
+        subscriptions stay on the main connection. Must be called before
+        subscribing to any channel.
+
+        With ``sharded_commands`` the shards use SSUBSCRIBE and every publish
+        uses SPUBLISH (Redis 7+), which carries over to Redis Cluster where
+        each shard channel is served by its slot's node. SPUBLISH messages only
+        reach SSUBSCRIBE subscribers, so every process on the channels must
+        agree on this setting, and pattern subscriptions are refused.
+
+        Args:
+        ----
+            shards: Number of subscriber connections
+            sharded_commands: Use SSUBSCRIBE/SPUBLISH; None uses them when the server is reachable and supports them
+
+        Raises:
+        ------
+            SubscribeError: If channels are already subscribed or ``shards`` is below 1
+
+        """
+        if shards < 1:
+            msg = f"shards must be at least 1, got {shards}"
+            raise SubscribeError(msg)
+        if self._subscribers:
+            msg = "Sharding must be enabled before subscribing to channels"
+            raise SubscribeError(msg)
+        if sharded_commands is None:
+            sharded_commands = await self._supports_sharded_commands()
+        if sharded_commands and self._pattern_handlers:
+            msg = "Pattern subscriptions do not receive SPUBLISH messages; disable sharded pub/sub commands"
+            raise SubscribeError(msg)
+        self._shards = [_PubSubShard(index) for index in range(shards)]
+        self._sharded_commands = sharded_commands
+        logger.info("Pub/Sub sharding enabled: %d shards, sharded commands %s", shards, sharded_commands)
+
+    @property
+    def sharding_metrics(self) -> dict[str, Any] | None:
+        """Get per-shard channel and received message counts, or None when sharding is off."""
+        if not self._shards:
+            return None
+        return {
+            "shards": len(self._shards),
+            "sharded_commands": self._sharded_commands,
+            "per_shard": [
+                {"shard": shard.index, "channels": len(shard.channels), "received": shard.received}
+                for shard in self._shards
+            ],
+        }
+
+    def _shard_for(self, channel: str) -> _PubSubShard:
+        return self._shards[jump_hash(key_slot(channel), len(self._shards))]
+
+    async def _supports_sharded_commands(self) -> bool:
+        try:
+            if not self._connected or not self._redis:
                 await self.connect()
-                if self._pubsub and self._subscribers:
-                    # Re-subscribe to all channels
-                    for channel in list(self._subscribers):
-                        await self._pubsub.subscribe(channel)
+            info = await self._redis.info("server")
+            major = int(str(info.get("redis_version", "0")).split(".", 1)[0])
+        except Exception:
+            logger.warning("Could not read the Redis version; using SUBSCRIBE/PUBLISH for shards", exc_info=True)
+            return False
+        return major >= 7
+
+    async def _subscribe_sharded(self, channel: str, handler: MessageHandler) -> None:
+        if channel not in self._handlers:
+            self._handlers[channel] = []
+            self._rebuild_router()
+        self._handlers[channel].append(handler)
+
+        if channel in self._subscribers:
+            return
+        shard = self._shard_for(channel)
+        if shard.connection is None:
+            shard.connection = self._redis.pubsub()
+        await self._shard_subscribe(shard, channel)
+        shard.channels.add(channel)
+        self._subscribers.add(channel)
+        logger.info("Subscribed to channel '%s' on shard %d", channel, shard.index)
+
+        if shard.task is None or shard.task.done():
+            shard.task = asyncio.create_task(self._listen_loop(shard), name=f"pubsub-shard-{shard.index}")
+
+    async def _shard_subscribe(self, shard: _PubSubShard, *channels: str) -> None:
+        if self._sharded_commands:
+            await shard.connection.ssubscribe(*channels)
+        else:
+            await shard.connection.subscribe(*channels)
+
+    def _rebuild_router(self) -> None:
+        self._router = ChannelRouter(self._handlers, self._pattern_handlers)
+
+    async def _listen_loop(self, shard: _PubSubShard | None = None) -> None:
+        """Process incoming messages of the main connection, or of one shard's connection.
+
+        When the connection fails, the loop reconnects (see :meth:`_reconnect_listener`)
+        and carries on listening; it only ends when cancelled, when nothing is
+        subscribed any more, or when reconnecting fails with an unexpected error.
+        """
+        while True:
+            connection = self._pubsub if shard is None else shard.connection
+            if not connection:
+                return
+
+            try:
+                async for message in connection.listen():
+                    if message["type"] in _DATA_MESSAGE_TYPES:
+                        if shard is not None:
+                            shard.received += 1
+                        if self._dispatcher is not None:
+                            await self._dispatch_message(message)
+                        else:
+                            await self._handle_message(message)
+                return
+
+            except asyncio.CancelledError:
+                logger.debug("Pub/Sub listening loop cancelled")
+                raise
+            except RedisError:
+                logger.exception("Error in Pub/Sub listening loop")
+                if not await self._reconnect_listener(shard):
+                    return
+
+    async def _reconnect_listener(self, shard: _PubSubShard | None) -> bool:
+        """Rebuild a failed subscriber connection, retrying with jittered exponential backoff until it works.
+
+        Each attempt pings Redis through the pool, opens a new PubSub connection
+        and resubscribes everything the failed one carried: one SUBSCRIBE (or
+        SSUBSCRIBE) for all channels and one PSUBSCRIBE for all patterns. The
+        time from the failure to the resubscription is recorded as the gap.
+        Connection errors are retried; any other error gives up.
+
+        Returns
+        -------
+            True once reconnected, False if reconnecting failed with an unexpected error
+
+        """
+        failed_at = time.perf_counter()
+        stats = self._reconnect_stats
+        attempt = 0
+        while True:
+            # Full jitter keeps many processes from reconnecting in lockstep after a restart
+            delay = min(self._reconnect_backoff_max, self._reconnect_backoff_base * 2**attempt)
+            await asyncio.sleep(random.uniform(0, delay))  # noqa: S311  # nosec B311
+            attempt += 1
+            stats["attempts"] += 1
+            try:
+                await self._resubscribe_listener(shard)
+            except (RedisError, OSError) as e:
+                stats["failed_attempts"] += 1
+                logger.warning("Pub/Sub reconnect attempt %d failed: %s", attempt, e)
+                continue
             except Exception:
-                logger.exception("Failed to reconnect")
+                stats["failed_attempts"] += 1
+                logger.exception("Failed to reconnect the Pub/Sub listener")
+                return False
+            break
+
+        gap = time.perf_counter() - failed_at
+        stats["reconnects"] += 1
+        stats["last_gap_s"] = gap
+        stats["max_gap_s"] = max(stats["max_gap_s"], gap)
+        stats["total_gap_s"] += gap
+        logger.info("Pub/Sub listener reconnected after %.3fs and %d attempt(s)", gap, attempt)
+        return True
+
+    async def _resubscribe_listener(self, shard: _PubSubShard | None) -> None:
+        if not self._redis:
+            self._connected = False
+        # A no-op while the client is up; the ping below is what checks the server is back
+        await self.connect()
+        assert self._redis is not None  # mypy assertion  # nosec B101
+        await self._redis.ping()
+
+        connection = self._redis.pubsub()
+        try:
+            if shard is not None:
+                if shard.channels:
+                    subscribe = connection.ssubscribe if self._sharded_commands else connection.subscribe
+                    await subscribe(*shard.channels)
+            else:
+                if self._subscribers and not self._shards:
+                    await connection.subscribe(*self._subscribers)
+                if self._pattern_handlers:
+                    await connection.psubscribe(*self._pattern_handlers)
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await connection.aclose()
+            raise
+
+        if shard is not None:
+            stale, shard.connection = shard.connection, connection
+        else:
+            stale, self._pubsub = self._pubsub, connection
+        if stale is not None:
+            with contextlib.suppress(Exception):
+                await stale.aclose()
+
+    def configure_reconnect(self, *, backoff_base: float = 0.05, backoff_max: float = 5.0) -> None:
+        """Set the backoff between attempts to rebuild a failed subscriber connection.
+
+        Attempt ``n`` waits a random time between 0 and
+        ``min(backoff_max, backoff_base * 2**n)`` seconds.
+
+        Args:
+        ----
+            backoff_base: Upper bound in seconds of the wait before the first attempt
+            backoff_max: Cap in seconds on the wait between attempts
+
+        """
+        self._reconnect_backoff_base = backoff_base
+        self._reconnect_backoff_max = backoff_max
+
+    @property
+    def reconnect_metrics(self) -> dict[str, Any]:
+        """Get subscriber reconnect counts and the gaps in delivery they caused, in seconds."""
+        return dict(self._reconnect_stats)
 
     async def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle incoming Redis message by calling registered handlers.
 
         Args:
         ----
-            message: Raw Redis message dictionary
+            message: Raw Redis message dictionary (``message`` or ``pmessage``)
 
         """
+        decoded = self._decode_incoming(message)
+        if decoded is not None:
+            await self._deliver(*decoded)
+
+    async def _dispatch_message(self, message: dict[str, Any]) -> None:
+        """Decode an incoming message and queue it on its subscription's dispatcher queue."""
+        assert self._dispatcher is not None  # nosec B101
+        decoded = self._decode_incoming(message)
+        if decoded is not None:
+            channel, message_data, pattern = decoded
+            await self._dispatcher.submit(channel, message_data, pattern)
+
+    def _decode_incoming(self, message: dict[str, Any]) -> tuple[str, Any, str | None] | None:
+        """Get (channel, decoded data, matched pattern) for a subscribed message, or None to skip it."""
         channel = message["channel"].decode() if isinstance(message["channel"], bytes) else message["channel"]
-        data_bytes = message["data"]
+        pattern = message.get("pattern")
+        if isinstance(pattern, bytes):
+            pattern = pattern.decode()
 
-        if channel not in self._handlers:
-            return
+        # pmessage names the pattern it matched, so both kinds resolve with one dict lookup
+        if pattern is None:
+            if channel not in self._handlers:
+                return None
+        elif pattern not in self._pattern_handlers:
+            return None
 
-        try:
-            # Deserialize JSON data
-            data_str = data_bytes.decode("utf-8") if isinstance(data_bytes, bytes) else str(data_bytes)
+        data = message["data"]
+        if isinstance(data, str):
+            data = data.encode()
+        if self._loopback is not None and self._loopback.consume(channel, data):
+            # Already delivered in-process when this instance published it
+            return None
 
-            message_data = json.loads(data_str)
+        try:
+            # The header byte picks the codec; headerless payloads are legacy JSON
+            return channel, decode_payload(data), pattern
+        except ValueError:
+            logger.exception("Failed to decode message from channel '%s'", channel)
+            return None
 
-            # Call all handlers for this channel
+    async def _deliver(self, channel: str, message_data: Any, pattern: str | None = None) -> None:
+        """Run every handler of the subscription (``channel``, or ``pattern`` if given) on a decoded message."""
+        handlers = self._handlers.get(channel) if pattern is None else self._pattern_handlers.get(pattern)
+        try:
+            # Call all handlers for this subscription
             tasks: list[asyncio.Task[None]] = [
-                asyncio.create_task(handler(channel, message_data)) for handler in self._handlers[channel]
+                asyncio.create_task(handler(channel, message_data)) for handler in handlers or ()
             ]
 
             if tasks:
@@ -800,10 +1893,8 @@ class RedisPubSub:
                 # Log any exceptions from handlers
                 for result in results:
                     if isinstance(result, Exception):
-                        logger.exception("Error handling message from channel '%s'", channel)
+                        logger.error("Error handling message from channel '%s'", channel, exc_info=result)
 
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            logger.exception("Failed to decode message from channel '%s'", channel)
         except Exception:
             logger.exception("Error handling message from channel '%s'", channel)
 
@@ -865,7 +1956,7 @@ class RedisPubSub:
             return int(result[channel]) if channel in result else 0
 
         try:
-            result = await self._circuit_breaker.call(_get_count_operation)
+            result = await self._breaker_call("numsub", _get_count_operation)
             if not isinstance(result, int):
                 error_msg = f"Circuit breaker should return int from _get_count_operation, got {type(result)}"
                 raise TypeError(error_msg)
@@ -884,6 +1975,123 @@ class RedisPubSub:
         """Get set of currently subscribed channels."""
         return self._subscribers.copy()
 
+    @property
+    def active_pattern_subscriptions(self) -> set[str]:
+        """Get set of currently subscribed patterns."""
+        return set(self._pattern_handlers)
+
+    def enable_sliding_window_breaker(
+        self,
+        *,
+        window: float = 10.0,
+        buckets: int = 10,
+        minimum_calls: int = 20,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 1.0,
+    ) -> None:
+        """Guard Redis calls with a :class:`SlidingWindowCircuitBreaker` instead of the consecutive-failure one.
+
+        Recovery timeout, probe successes, operation timeout and counted
+        exceptions carry over from the current breaker; its state does not.
+
+        Args:
+        ----
+            window: Seconds of call outcomes the rates are computed over
+            buckets: Number of time buckets the window is split into
+            minimum_calls: Calls the window must hold before the rates are evaluated
+            failure_rate_threshold: Fraction of failed calls (0-1) that opens the circuit
+            slow_call_rate_threshold: Fraction of slow calls (0-1) that opens the circuit
+            slow_call_duration: Seconds after which a call counts as slow
+
+        """
+        from .pubsub_breaker import SlidingWindowCircuitBreaker
+
+        current = self._circuit_breaker
+        self._circuit_breaker = SlidingWindowCircuitBreaker(
+            window=window,
+            buckets=buckets,
+            minimum_calls=minimum_calls,
+            failure_rate_threshold=failure_rate_threshold,
+            slow_call_rate_threshold=slow_call_rate_threshold,
+            slow_call_duration=slow_call_duration,
+            recovery_timeout=current.recovery_timeout,
+            success_threshold=current.success_threshold,
+            timeout=current.timeout,
+            expected_exception=current.expected_exception,
+        )
+
+    def enable_adaptive_timeouts(
+        self,
+        *,
+        floor: float = 0.05,
+        ceiling: float | None = None,
+        multiplier: float = 4.0,
+        quantile: float = 0.999,
+        min_samples: int = 100,
+        window: float = 60.0,
+    ) -> None:
+        """Time out each kind of Redis call from its own recent latency instead of the breaker's fixed timeout.
+
+        Connect, publish, publish_many, numsub, ping and info calls are timed
+        into rolling per-operation histograms, and each operation's timeout
+        becomes its ``quantile`` latency times ``multiplier``, clamped to
+        ``[floor, ceiling]``. A stalled Redis then releases callers after a
+        few multiples of the healthy tail latency rather than after seconds.
+        Until an operation has ``min_samples`` calls in the window, the
+        breaker's fixed timeout applies.
+
+        Args:
+        ----
+            floor: Lowest timeout in seconds
+            ceiling: Highest timeout in seconds (defaults to the breaker's fixed timeout, which still bounds every call)
+            multiplier: Factor applied to the latency quantile
+            quantile: Latency quantile (0-1) the timeouts are derived from
+            min_samples: Calls an operation needs in the window before its timeout adapts
+            window: Seconds of latency history kept per operation
+
+        """
+        fixed = self._circuit_breaker.timeout
+        self._adaptive_timeouts = AdaptiveTimeouts(
+            default=fixed,
+            floor=floor,
+            ceiling=ceiling if ceiling is not None else fixed,
+            multiplier=multiplier,
+            quantile=quantile,
+            min_samples=min_samples,
+            window=window,
+        )
+
+    def disable_adaptive_timeouts(self) -> None:
+        """Use the breaker's fixed timeout for every call again."""
+        self._adaptive_timeouts = None
+
+    @property
+    def latency_metrics(self) -> dict[str, dict[str, Any]] | None:
+        """Get per-operation latency quantiles and timeouts, or None when adaptive timeouts are off."""
+        return self._adaptive_timeouts.metrics if self._adaptive_timeouts is not None else None
+
+    async def _breaker_call(self, operation: str, func: Callable[..., Awaitable[Any]], *args: object) -> object:
+        adaptive = self._adaptive_timeouts
+        if adaptive is None:
+            return await self._circuit_breaker.call(func, *args)
+        timeout = adaptive.timeout(operation)
+
+        async def bounded(*call_args: object) -> object:
+            async with asyncio.timeout(timeout):
+                return await func(*call_args)
+
+        started = time.perf_counter()
+        try:
+            # The breaker counts the TimeoutError as a failure, as it does its own fixed timeout
+            result = await self._circuit_breaker.call(bounded, *args)
+        except TimeoutError:
+            # A stall still tells the histogram that the operation can take this long
+            adaptive.record(operation, timeout, timed_out=True)
+            raise
+        adaptive.record(operation, time.perf_counter() - started)
+        return result
+
     @property
     def circuit_breaker_state(self) -> CircuitBreakerState:
         """Get current circuit breaker state."""
@@ -940,7 +2148,20 @@ class RedisPubSub:
                 "logfire_available": _LOGFIRE_AVAILABLE,
                 "active_subscriptions": len(self._subscribers),
                 "subscriber_channels": list(self._subscribers),
+                "subscriber_patterns": list(self._pattern_handlers),
             }
+            if self._dispatcher is not None:
+                health_status["dispatcher"] = self._dispatcher.metrics
+            if self._shards:
+                health_status["sharding"] = self.sharding_metrics
+            if self._loopback is not None:
+                health_status["loopback"] = self._loopback.metrics
+            if self._fallback is not None:
+                health_status["fallback"] = self._fallback.metrics
+            if self._reconnect_stats["reconnects"]:
+                health_status["reconnects"] = self.reconnect_metrics
+            if self._adaptive_timeouts is not None:
+                health_status["operation_latency"] = self._adaptive_timeouts.metrics
 
             # Test Redis connection if available
             ping_start_time = time.perf_counter()
@@ -951,7 +2172,7 @@ class RedisPubSub:
                         await self._redis.ping()
                         return True
 
-                    await self._circuit_breaker.call(_ping_operation)
+                    await self._breaker_call("ping", _ping_operation)
                     ping_duration = (time.perf_counter() - ping_start_time) * 1000
 
                     health_status["redis_ping"] = "success"
@@ -964,7 +2185,7 @@ class RedisPubSub:
                             info_result = await self._redis.info()
                             return dict(info_result) if info_result else {}
 
-                        result = await self._circuit_breaker.call(_info_operation)
+                        result = await self._breaker_call("info", _info_operation)
                         if not isinstance(result, dict):
                             error_msg = f"Circuit breaker should return dict from _info_operation, got {type(result)}"
                             raise TypeError(error_msg)
@@ -1027,6 +2248,67 @@ class RedisPubSub:
 
             return health_status
 
+    async def configure_fallback(
+        self,
+        *,
+        memory_max_messages: int = 10_000,
+        memory_max_bytes: int = 16 * 1024 * 1024,
+        file_dir: str | Path | None = None,
+        segment_bytes: int = 8 * 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        fsync_every: int = 64,
+        replay_rate: float = 2000.0,
+        replay_batch: int = 100,
+    ) -> None:
+        """Size the stores behind :meth:`publish_with_fallback` and how fast they are replayed.
+
+        Messages parked with the ``memory_queue`` or ``file_queue`` strategy are
+        re-published by a :class:`FallbackReplayer` once the circuit breaker lets
+        calls through. The file queue locks ``file_dir``, so a directory already
+        held by another process is refused and its messages are kept in memory.
+        If ``file_dir`` holds messages left by a previous run, their replay
+        starts now. Without this call the defaults below are used.
+
+        Args:
+        ----
+            memory_max_messages: Messages kept in memory; the oldest are dropped beyond this
+            memory_max_bytes: Payload bytes kept in memory; the oldest are dropped beyond this
+            file_dir: Directory of the file queue, used by this process alone; without one,
+                ``file_queue`` messages are kept in memory
+            segment_bytes: Size at which the file queue starts a new segment file
+            max_bytes: Size beyond which the file queue deletes its oldest segments
+            fsync_every: File queue records appended between fsyncs
+            replay_rate: Maximum replayed messages per second (0 for unpaced)
+            replay_batch: Messages per pipelined replay batch
+
+        """
+        if self._fallback is not None:
+            await self._fallback.stop()
+        file_options = None
+        if file_dir is not None:
+            file_options = {
+                "directory": Path(file_dir),
+                "segment_bytes": segment_bytes,
+                "max_bytes": max_bytes,
+                "fsync_every": fsync_every,
+            }
+        self._fallback = FallbackReplayer(
+            self,
+            memory=ReplayRing(max_messages=memory_max_messages, max_bytes=memory_max_bytes),
+            file_options=file_options,
+            rate=replay_rate,
+            batch_size=replay_batch,
+        )
+        if file_dir is not None and any(Path(file_dir).glob("*.seg")):
+            queue = await self._fallback.open_file_queue()
+            if queue is not None and len(queue):
+                self._fallback.wake()
+
+    @property
+    def fallback_metrics(self) -> dict[str, Any] | None:
+        """Get fallback queue depths and replay counters, or None before anything was parked or configured."""
+        return self._fallback.metrics if self._fallback is not None else None
+
     async def publish_with_fallback(
         self,
         channel: str,
@@ -1094,42 +2376,25 @@ class RedisPubSub:
                 )
                 result["success"] = True  # Consider log-only as success
 
-            elif fallback_strategy == "memory_queue":
-                # Store in memory queue (implement based on requirements)
-                if not hasattr(self, "_memory_queue"):
-                    self._memory_queue = []
-
-                self._memory_queue.append(
-                    {
-                        "channel": channel,
-                        "message": message,
-                        "correlation_id": result["correlation_id"],
-                        "timestamp": time.time(),
-                    },
-                )
-
-                logger.info(
-                    "Message queued in memory for later delivery: channel='%s', correlation_id='%s'",
-                    channel,
-                    result["correlation_id"],
-                )
-                result["success"] = True
-
-            elif fallback_strategy == "file_queue":
-                # Store in file queue for persistence (implement based on requirements)
+            elif fallback_strategy in ("memory_queue", "file_queue"):
+                # Park the encoded message; the replayer publishes it once Redis recovers
+                durable = fallback_strategy == "file_queue"
+                if self._fallback is None:
+                    await self.configure_fallback()
+                assert self._fallback is not None  # nosec B101
                 try:
-                    # This would need proper file queue implementation
-                    # For now, just log the intent to queue
+                    await self._fallback.park(channel, self.encode_message(channel, message), durable=durable)
                     logger.info(
-                        "Message would be queued to file: channel='%s', correlation_id='%s'",
+                        "Message queued %s for replay: channel='%s', correlation_id='%s'",
+                        "to file" if durable else "in memory",
                         channel,
                         result["correlation_id"],
                     )
                     result["success"] = True
 
-                except Exception as file_error:
-                    logger.exception("File queue fallback failed")
-                    result["error"] = f"Primary and file fallback failed: {file_error}"
+                except (TypeError, ValueError, OSError) as queue_error:
+                    logger.exception("%s fallback failed", "File queue" if durable else "Memory queue")
+                    result["error"] = f"Primary and {fallback_strategy} fallback failed: {queue_error}"
 
             if _LOGFIRE_AVAILABLE:
                 logfire.info("Fallback strategy applied", extra=result)
@@ -1141,20 +2406,100 @@ class RedisPubSub:
 
 # Global singleton instance
 _pubsub_instance: RedisPubSub | None = None
+# Held while the singleton is configured and connected, so no caller sees it half-configured
+_pubsub_lock: asyncio.Lock | None = None
+_pubsub_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_pubsub_lock() -> asyncio.Lock:
+    """Get the singleton's init lock, a new one per event loop since an asyncio lock is bound to its loop."""
+    global _pubsub_lock, _pubsub_lock_loop
+    loop = asyncio.get_running_loop()
+    if _pubsub_lock is None or _pubsub_lock_loop is not loop:
+        _pubsub_lock, _pubsub_lock_loop = asyncio.Lock(), loop
+    return _pubsub_lock
+
+
+async def _configure_pubsub(pubsub: RedisPubSub) -> None:
+    """Apply the Redis settings to a new instance before it connects."""
+    config = get_redis_config()
+    if config.redis_adaptive_timeouts:
+        pubsub.enable_adaptive_timeouts(
+            floor=config.redis_adaptive_timeout_floor,
+            ceiling=config.redis_adaptive_timeout_ceiling,
+            multiplier=config.redis_adaptive_timeout_multiplier,
+        )
+    if config.redis_circuit_breaker_mode == "sliding_window":
+        pubsub.enable_sliding_window_breaker(
+            window=config.redis_circuit_breaker_window,
+            buckets=config.redis_circuit_breaker_buckets,
+            minimum_calls=config.redis_circuit_breaker_minimum_calls,
+            failure_rate_threshold=config.redis_circuit_breaker_failure_rate,
+            slow_call_rate_threshold=config.redis_circuit_breaker_slow_call_rate,
+            slow_call_duration=config.redis_circuit_breaker_slow_call_duration,
+        )
+    pubsub.configure_reconnect(
+        backoff_base=config.redis_reconnect_backoff_base, backoff_max=config.redis_reconnect_backoff_max
+    )
+    if config.redis_publish_linger_ms > 0:
+        pubsub.enable_auto_batching(linger_ms=config.redis_publish_linger_ms, max_batch=config.redis_publish_max_batch)
+    pubsub.set_default_codec(config.redis_pubsub_codec)
+    for channel, codec in config.redis_pubsub_channel_codecs.items():
+        pubsub.set_channel_codec(channel, codec)
+    for channel, ttl in config.redis_pubsub_retained_channels.items():
+        pubsub.set_channel_retained(channel, ttl)
+    if config.redis_publish_lean:
+        pubsub.enable_lean_publish(sample_rate=config.redis_publish_trace_sample_rate)
+    if config.redis_pubsub_shards > 1:
+        await pubsub.enable_sharding(config.redis_pubsub_shards, sharded_commands=config.redis_pubsub_sharded_commands)
+    if config.redis_pubsub_loopback:
+        pubsub.enable_loopback()
+    if config.redis_dispatch_queue_size > 0:
+        await pubsub.enable_dispatcher(
+            queue_size=config.redis_dispatch_queue_size,
+            workers=config.redis_dispatch_workers,
+            policy=config.redis_dispatch_overflow,
+            spill_size=config.redis_dispatch_spill_size,
+        )
+    await pubsub.configure_fallback(
+        memory_max_messages=config.redis_fallback_memory_max_messages,
+        memory_max_bytes=config.redis_fallback_memory_max_bytes,
+        file_dir=config.redis_fallback_dir,
+        segment_bytes=config.redis_fallback_segment_bytes,
+        max_bytes=config.redis_fallback_max_bytes,
+        fsync_every=config.redis_fallback_fsync_every,
+        replay_rate=config.redis_fallback_replay_rate,
+        replay_batch=config.redis_fallback_replay_batch,
+    )
 
 
 async def get_pubsub() -> RedisPubSub:
     """Get singleton Redis Pub/Sub instance.
 
+    The instance is configured before it connects and is kept even if the
+    first connect fails, so publishes made while Redis is down still reach
+    its fallback stores and later calls reconnect.
+
     Returns
     -------
         Configured RedisPubSub instance
 
+    Raises
+    ------
+        PubSubError: If the first connect fails
+
     """
     global _pubsub_instance
     if _pubsub_instance is None:
-        _pubsub_instance = RedisPubSub()
-        await _pubsub_instance.connect()
+        async with _get_pubsub_lock():
+            if _pubsub_instance is None:
+                pubsub = RedisPubSub()
+                await _configure_pubsub(pubsub)
+                try:
+                    await pubsub.connect()
+                finally:
+                    # Kept even if Redis is down: publishes park in its fallback stores meanwhile
+                    _pubsub_instance = pubsub
     return _pubsub_instance
 
 
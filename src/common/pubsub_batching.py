@@ -0,0 +1,130 @@
+"""Automatic batching of concurrent pub/sub publishes.
+
+With auto-batching enabled, ``RedisPubSub.publish`` hands encoded messages to
+a ``PublishBatcher``, which sends them through one pipeline per flush instead
+of one round trip per message. Flushes are triggered by a linger timer or a
+full batch, whichever comes first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from .quantile_sketch import QuantileSketch
+
+if TYPE_CHECKING:
+    from .pubsub import RedisPubSub
+
+
+class PublishBatcher:
+    """Gathers concurrent ``publish`` calls into pipelined batches.
+
+    The first message of a batch starts a ``linger`` timer; the batch is sent
+    through :meth:`RedisPubSub.publish_many`'s pipeline when the timer fires or
+    ``max_batch`` messages are waiting, whichever comes first. Every caller
+    awaits its own future and receives its own subscriber count (or the batch
+    error). Flush sizes and the time messages spent waiting for their flush are
+    kept in quantile sketches so the linger can be tuned.
+    """
+
+    def __init__(self, pubsub: RedisPubSub, *, linger: float, max_batch: int) -> None:
+        """Initialize with ``linger`` seconds of wait and at most ``max_batch`` messages per flush."""
+        self._pubsub = pubsub
+        self._linger = linger
+        self._max_batch = max_batch
+        self._pending: list[tuple[str, bytes, asyncio.Future[int], float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+        # Metrics
+        self._flush_sizes = QuantileSketch()
+        self._linger_waits_ms = QuantileSketch()
+        self._size_flushes = 0
+        self._linger_flushes = 0
+        self._failed_flushes = 0
+
+    async def submit(self, channel: str, payload: bytes) -> int:
+        """Queue an encoded message and wait for the batch carrying it to be published.
+
+        Raises
+        ------
+            PublishError: If the batch carrying this message fails
+
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+        self._pending.append((channel, payload, future, time.perf_counter()))
+
+        if len(self._pending) >= self._max_batch:
+            self._size_flushes += 1
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._linger, self._on_linger_expired)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Publish pending messages now and wait for every in-flight batch."""
+        if self._pending:
+            self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get flush size and added latency statistics."""
+        return {
+            "linger_ms": self._linger * 1000,
+            "max_batch": self._max_batch,
+            "pending": len(self._pending),
+            "flushes": self._flush_sizes.count,
+            "size_flushes": self._size_flushes,
+            "linger_flushes": self._linger_flushes,
+            "failed_flushes": self._failed_flushes,
+            "messages": int(self._flush_sizes.sum),
+            "avg_flush_size": self._flush_sizes.mean,
+            "flush_size_p50": self._flush_sizes.quantile(0.5),
+            "flush_size_p95": self._flush_sizes.quantile(0.95),
+            "max_flush_size": self._flush_sizes.max if self._flush_sizes.count else None,
+            "avg_added_latency_ms": self._linger_waits_ms.mean,
+            "added_latency_p50_ms": self._linger_waits_ms.quantile(0.5),
+            "added_latency_p99_ms": self._linger_waits_ms.quantile(0.99),
+        }
+
+    def _on_linger_expired(self) -> None:
+        self._timer = None
+        if self._pending:
+            self._linger_flushes += 1
+            self._start_flush()
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._flush_batch(batch))
+        # Hold a reference until done so the flush is not garbage collected mid-flight
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_batch(self, batch: list[tuple[str, bytes, asyncio.Future[int], float]]) -> None:
+        started = time.perf_counter()
+        self._flush_sizes.add(len(batch))
+        for *_, enqueued_at in batch:
+            self._linger_waits_ms.add((started - enqueued_at) * 1000)
+
+        try:
+            counts = await self._pubsub._publish_encoded([(channel, payload) for channel, payload, _, _ in batch])
+        except Exception as e:
+            self._failed_flushes += 1
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future, _), count in zip(batch, counts, strict=True):
+            # Callers that were cancelled while waiting no longer need a result
+            if not future.done():
+                future.set_result(count)
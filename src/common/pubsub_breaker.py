@@ -0,0 +1,275 @@
+"""Sliding-window circuit breaker for Redis pub/sub calls.
+
+``RedisPubSub.enable_sliding_window_breaker`` swaps the consecutive-failure
+``CircuitBreaker`` for a ``SlidingWindowCircuitBreaker``, which opens on the
+failure and slow-call rates of the last few seconds of calls instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .pubsub import CircuitBreaker, CircuitBreakerError, CircuitBreakerState
+
+logger = logging.getLogger(__name__)
+
+# Import Logfire with graceful degradation
+try:
+    import logfire
+
+    _LOGFIRE_AVAILABLE = True
+except ImportError:
+    _LOGFIRE_AVAILABLE = False
+
+
+class SlidingWindowCircuitBreaker(CircuitBreaker):
+    """Circuit breaker that opens on the failure and slow-call rates of a sliding time window.
+
+    Call outcomes are counted in ``buckets`` time buckets covering the last
+    ``window`` seconds. Once the window holds at least ``minimum_calls`` calls,
+    the circuit opens when the fraction of failed calls reaches
+    ``failure_rate_threshold`` or the fraction of calls slower than
+    ``slow_call_duration`` reaches ``slow_call_rate_threshold``, so an
+    occasional success no longer hides a high error rate.
+
+    While CLOSED, :meth:`call` takes no lock: bucket updates and the opening
+    transition run between awaits on the event loop thread and cannot
+    interleave. The lock is only taken when leaving OPEN, and HALF_OPEN admits
+    at most ``half_open_max_calls`` concurrent probes; a probe that fails or is
+    slow reopens the circuit. Failure warnings go out at most once per
+    ``log_interval`` seconds, carrying the number suppressed in between.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 10.0,
+        buckets: int = 10,
+        minimum_calls: int = 20,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 1.0,
+        half_open_max_calls: int = 1,
+        log_interval: float = 5.0,
+        recovery_timeout: float = 60.0,
+        success_threshold: int = 3,
+        timeout: float = 10.0,
+        expected_exception: type[Exception] | tuple[type[Exception], ...] = Exception,
+    ) -> None:
+        """Initialize circuit breaker with window and rate thresholds.
+
+        Args:
+        ----
+            window: Seconds of call outcomes the rates are computed over
+            buckets: Number of time buckets the window is split into
+            minimum_calls: Calls the window must hold before the rates are evaluated
+            failure_rate_threshold: Fraction of failed calls (0-1) that opens the circuit
+            slow_call_rate_threshold: Fraction of slow calls (0-1) that opens the circuit
+            slow_call_duration: Seconds after which a call counts as slow
+            half_open_max_calls: Concurrent probe calls allowed in HALF_OPEN
+            log_interval: Minimum seconds between failure warnings
+            recovery_timeout: Seconds to wait before attempting recovery (OPEN -> HALF_OPEN)
+            success_threshold: Number of successful probes needed to close circuit in HALF_OPEN
+            timeout: Timeout in seconds for individual operations
+            expected_exception: Exception type(s) that should trigger circuit breaker
+
+        """
+        super().__init__(
+            recovery_timeout=recovery_timeout,
+            success_threshold=success_threshold,
+            timeout=timeout,
+            expected_exception=expected_exception,
+        )
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.log_interval = log_interval
+
+        # Ring of time buckets; a slot is reset when a newer bucket reuses it
+        self._bucket_count = buckets
+        self._bucket_width = window / buckets
+        self._bucket_ids = [-1] * buckets
+        self._calls = [0] * buckets
+        self._failures = [0] * buckets
+        self._slow = [0] * buckets
+
+        self._probes = 0
+        self._last_log = float("-inf")
+        self._suppressed_logs = 0
+
+    @property
+    def window_counts(self) -> tuple[int, int, int]:
+        """Get the calls, failures and slow calls recorded in the current window."""
+        oldest = int(time.monotonic() / self._bucket_width) - self._bucket_count + 1
+        calls = failures = slow = 0
+        for index, bucket_id in enumerate(self._bucket_ids):
+            if bucket_id >= oldest:
+                calls += self._calls[index]
+                failures += self._failures[index]
+                slow += self._slow[index]
+        return calls, failures, slow
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get circuit breaker metrics, including the current window's rates."""
+        calls, failures, slow = self.window_counts
+        return {
+            **super().metrics,
+            "window_calls": calls,
+            "window_failure_rate": failures / max(1, calls),
+            "window_slow_call_rate": slow / max(1, calls),
+            "suppressed_logs": self._suppressed_logs,
+        }
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args: object, **kwargs: object) -> object:
+        """Execute a function with circuit breaker protection.
+
+        Args:
+        ----
+            func: Async function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+        -------
+            Result of the function call
+
+        Raises:
+        ------
+            CircuitBreakerError: If circuit breaker is open or HALF_OPEN has no probe slot left
+            Exception: Any exception raised by the wrapped function
+
+        """
+        probe = False
+        if self._state is not CircuitBreakerState.CLOSED:
+            async with self._lock:
+                if not await self._can_attempt_request():
+                    msg = f"Circuit breaker is {self._state.value}. Next attempt at {self._next_attempt_time}"
+                    raise CircuitBreakerError(msg)
+                if self._state is CircuitBreakerState.HALF_OPEN:
+                    if self._probes >= self.half_open_max_calls:
+                        msg = "Circuit breaker is half_open and all probe slots are taken"
+                        raise CircuitBreakerError(msg)
+                    self._probes += 1
+                    probe = True
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.timeout)
+        except self.expected_exception:
+            self._record_outcome(started, failed=True, probe=probe)
+            raise
+        except TimeoutError:
+            # Treat timeouts as failures
+            self._record_outcome(started, failed=True, probe=probe)
+            raise
+        except Exception:
+            # For unexpected exceptions, don't count as circuit breaker failure
+            self._total_requests += 1
+            raise
+        else:
+            self._record_outcome(started, failed=False, probe=probe)
+            return result
+        finally:
+            if probe:
+                self._probes -= 1
+
+    # ----- Internal logic -------------------------------------------------
+    def _record_outcome(self, started: float, *, failed: bool, probe: bool) -> None:
+        now = time.monotonic()
+        slow = now - started >= self.slow_call_duration
+        bucket_id = int(now / self._bucket_width)
+        index = bucket_id % self._bucket_count
+        if self._bucket_ids[index] != bucket_id:
+            self._bucket_ids[index] = bucket_id
+            self._calls[index] = self._failures[index] = self._slow[index] = 0
+        self._calls[index] += 1
+        self._total_requests += 1
+        if slow:
+            self._slow[index] += 1
+        if failed:
+            self._failures[index] += 1
+            self._total_failures += 1
+            self._failure_count += 1
+            self._log_failure()
+        else:
+            self._total_successes += 1
+            self._failure_count = 0
+
+        if probe and self._state is CircuitBreakerState.HALF_OPEN:
+            if failed or slow:
+                self._open()
+            else:
+                self._success_count += 1
+                if self._success_count >= self.success_threshold:
+                    self._close()
+        elif (failed or slow) and self._state is CircuitBreakerState.CLOSED and self._window_tripped():
+            self._open()
+
+    def _window_tripped(self) -> bool:
+        calls, failures, slow = self.window_counts
+        if calls < self.minimum_calls:
+            return False
+        return failures >= self.failure_rate_threshold * calls or slow >= self.slow_call_rate_threshold * calls
+
+    def _open(self) -> None:
+        if self._state is CircuitBreakerState.CLOSED:
+            self._state_transitions["closed_to_open"] += 1
+        else:
+            self._state_transitions["half_open_to_open"] += 1
+        self._state = CircuitBreakerState.OPEN
+        self._last_failure_time = time.time()
+        jitter = (self._last_failure_time % 1) * 0.1  # Add jitter to prevent thundering herd
+        self._next_attempt_time = self._last_failure_time + self.recovery_timeout + jitter
+
+        calls, failures, slow = self.window_counts
+        logger.warning(
+            "Circuit breaker opened: %d/%d calls failed, %d slow in the last %.0fs. Next attempt at %s",
+            failures,
+            calls,
+            slow,
+            self.window,
+            self._next_attempt_time,
+        )
+
+    def _close(self) -> None:
+        self._state = CircuitBreakerState.CLOSED
+        self._failure_count = 0
+        self._success_count = 0
+        self._last_failure_time = None
+        self._next_attempt_time = None
+        self._state_transitions["half_open_to_closed"] += 1
+        # Outcomes from before the outage must not reopen the circuit straight away
+        self._bucket_ids = [-1] * self._bucket_count
+        logger.info("Circuit breaker closed - normal operation restored")
+
+    def _log_failure(self) -> None:
+        now = time.monotonic()
+        if now - self._last_log < self.log_interval:
+            self._suppressed_logs += 1
+            return
+        calls, failures, _ = self.window_counts
+        logger.warning(
+            "Circuit breaker failures recorded: %d/%d calls failed in the last %.0fs (%d warnings suppressed)",
+            failures,
+            calls,
+            self.window,
+            self._suppressed_logs,
+        )
+        if _LOGFIRE_AVAILABLE:
+            logfire.warning(
+                "Circuit breaker failures recorded",
+                state=self._state.value,
+                window_calls=calls,
+                window_failures=failures,
+                suppressed=self._suppressed_logs,
+            )
+        self._last_log = now
+        self._suppressed_logs = 0
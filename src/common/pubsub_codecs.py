@@ -0,0 +1,212 @@
+"""Pluggable payload codecs for Redis pub/sub messages.
+
+Every payload published by ``RedisPubSub`` starts with one header byte naming
+the codec that produced it, so subscribers decode each message with the right
+codec even when publishers on a channel disagree:
+
+- ``orjson`` (``0x01``, default): compact UTF-8 JSON bytes
+- ``msgpack`` (``0x02``): MessagePack, smaller for numeric payloads (needs the
+  optional ``msgpack`` package on both ends)
+- ``raw`` (``0x03``): bytes the publisher already encoded, such as
+  ``message_format.build_message`` envelopes, passed through untouched and
+  delivered to handlers as bytes
+
+Header bytes are ASCII control characters, which can never start a JSON
+document, so payloads from publishers that predate the header (bare JSON) are
+still recognized and decoded as JSON.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Import msgpack with graceful degradation
+try:
+    import msgpack
+
+    _MSGPACK_AVAILABLE = True
+except ImportError:
+    logger.debug("msgpack package not available. The msgpack pub/sub codec will be disabled.")
+    _MSGPACK_AVAILABLE = False
+
+DEFAULT_CODEC = "orjson"
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be encoded or decoded."""
+
+
+class PayloadCodec:
+    """Base class for pub/sub payload codecs.
+
+    Subclasses set a unique ``name`` and one-byte ``header`` and implement
+    :meth:`encode` and :meth:`decode` for the payload body.
+    """
+
+    name: str = ""
+    header: bytes = b""
+
+    def encode(self, message: Any) -> bytes:
+        """Encode a message body (without header)."""
+        raise NotImplementedError
+
+    def decode(self, body: memoryview) -> Any:
+        """Decode a message body (without header)."""
+        raise NotImplementedError
+
+    def frame(self, message: Any) -> bytes:
+        """Encode a message and prefix it with this codec's header byte."""
+        return self.header + self.encode(message)
+
+
+class OrjsonCodec(PayloadCodec):
+    """Compact UTF-8 JSON via orjson."""
+
+    name = "orjson"
+    header = b"\x01"
+
+    def encode(self, message: Any) -> bytes:
+        """Encode to JSON; non-string dict keys are stringified like ``json.dumps`` does."""
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, body: memoryview) -> Any:
+        """Decode JSON."""
+        return orjson.loads(body)
+
+
+class MsgpackCodec(PayloadCodec):
+    """MessagePack via the optional ``msgpack`` package."""
+
+    name = "msgpack"
+    header = b"\x02"
+
+    def encode(self, message: Any) -> bytes:
+        """Encode to MessagePack.
+
+        Raises
+        ------
+            CodecError: If msgpack is not installed or the message is not serializable
+
+        """
+        if not _MSGPACK_AVAILABLE:
+            msg = "msgpack codec requires the msgpack package. Install with: pip install msgpack"
+            raise CodecError(msg)
+        try:
+            packed: bytes = msgpack.packb(message, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise CodecError(str(e)) from e
+        return packed
+
+    def decode(self, body: memoryview) -> Any:
+        """Decode MessagePack.
+
+        Raises
+        ------
+            CodecError: If msgpack is not installed or the body is malformed
+
+        """
+        if not _MSGPACK_AVAILABLE:
+            msg = "Received a msgpack payload but the msgpack package is not installed"
+            raise CodecError(msg)
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise CodecError(str(e)) from e
+
+
+class RawCodec(PayloadCodec):
+    """Passthrough for payloads the publisher already encoded.
+
+    Decodes to ``bytes``; ``subscribe_to_channel`` (and so ``BaseSubscriber``)
+    delivers them as ``{"payload": body}``.
+    """
+
+    name = "raw"
+    header = b"\x03"
+
+    def encode(self, message: Any) -> bytes:
+        """Pass bytes through unchanged (``str`` is UTF-8 encoded).
+
+        Raises
+        ------
+            CodecError: If the message is not bytes-like or str
+
+        """
+        if isinstance(message, bytes):
+            return message
+        if isinstance(message, bytearray | memoryview):
+            return bytes(message)
+        if isinstance(message, str):
+            return message.encode("utf-8")
+        msg = f"raw codec needs bytes or str, got {type(message).__name__}"
+        raise CodecError(msg)
+
+    def decode(self, body: memoryview) -> bytes:
+        """Return the body bytes unchanged."""
+        return body.tobytes()
+
+
+_codecs_by_name: dict[str, PayloadCodec] = {}
+_codecs_by_header: dict[int, PayloadCodec] = {}
+
+
+def register_codec(codec: PayloadCodec) -> None:
+    """Register a codec so it can be selected by name and recognized by its header.
+
+    Raises
+    ------
+        ValueError: If the header is not a single control byte, or is taken by a codec with another name
+
+    """
+    if len(codec.header) != 1 or codec.header[0] >= 0x20 or codec.header[0] in b"\t\n\r":
+        msg = f"Codec header must be one non-whitespace control byte, got {codec.header!r}"
+        raise ValueError(msg)
+    existing = _codecs_by_header.get(codec.header[0])
+    if existing is not None and existing.name != codec.name:
+        msg = f"Codec header {codec.header!r} is already used by codec '{existing.name}'"
+        raise ValueError(msg)
+    _codecs_by_name[codec.name] = codec
+    _codecs_by_header[codec.header[0]] = codec
+
+
+def get_codec(name: str) -> PayloadCodec:
+    """Get a registered codec by name.
+
+    Raises
+    ------
+        ValueError: If no codec with that name is registered
+
+    """
+    try:
+        return _codecs_by_name[name]
+    except KeyError:
+        msg = f"Unknown pub/sub codec '{name}'. Available: {', '.join(sorted(_codecs_by_name))}"
+        raise ValueError(msg) from None
+
+
+def decode_payload(data: bytes | str) -> Any:
+    """Decode a received payload with the codec named by its header byte.
+
+    Payloads without a recognized header are treated as bare JSON from a
+    publisher that predates codec headers.
+
+    Raises
+    ------
+        ValueError: If the payload is malformed for its codec
+
+    """
+    if isinstance(data, bytes) and data:
+        codec = _codecs_by_header.get(data[0])
+        if codec is not None:
+            return codec.decode(memoryview(data)[1:])
+    return orjson.loads(data)
+
+
+register_codec(OrjsonCodec())
+register_codec(MsgpackCodec())
+register_codec(RawCodec())
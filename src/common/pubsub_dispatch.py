@@ -0,0 +1,189 @@
+"""Per-channel dispatch queues between the pub/sub listen loop and its handlers.
+
+With dispatching enabled, ``RedisPubSub``'s listen loop only decodes a
+message and hands it to a ``ChannelDispatcher``; the channel's own worker
+tasks run the handlers. A slow handler then backs up its channel's queue
+instead of the Redis socket, and ``OverflowPolicy`` decides what happens
+when that queue is full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pubsub import RedisPubSub
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What the dispatcher does with a message whose channel queue is full."""
+
+    BLOCK = "block"  # Stop reading from Redis until the channel's workers catch up
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message to make room
+    SPILL = "spill"  # Park the message in the channel's overflow buffer
+
+
+# (channel, matched pattern or None, decoded message)
+_QueuedMessage = tuple[str, str | None, Any]
+
+
+@dataclass
+class _ChannelQueue:
+    """Bounded queue, overflow buffer and worker tasks of one channel."""
+
+    queue: asyncio.Queue[_QueuedMessage]
+    spill: deque[_QueuedMessage] = field(default_factory=deque)
+    workers: list[asyncio.Task[None]] = field(default_factory=list)
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"enqueued": 0, "delivered": 0, "dropped": 0, "spilled": 0, "max_depth": 0}
+    )
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize() + len(self.spill)
+
+
+class ChannelDispatcher:
+    """Moves received messages off the listen loop into bounded per-channel queues.
+
+    Each channel gets its own queue of at most ``queue_size`` decoded messages,
+    served by ``workers`` tasks that run the channel's handlers, so a slow
+    handler only delays its own channel while the listen loop keeps draining
+    the Redis socket. A full queue is handled by ``policy``:
+
+    - ``block`` waits for room, stalling the listen loop (and every channel) as before
+    - ``drop_oldest`` discards the oldest queued message
+    - ``spill`` parks the message in an overflow buffer of up to ``spill_size``
+      messages that the workers drain once the queue has room; beyond that the
+      oldest spilled message is dropped
+
+    Pattern subscriptions get one queue per pattern rather than per channel.
+    With one worker per queue messages are handled in publish order.
+    """
+
+    def __init__(
+        self,
+        pubsub: RedisPubSub,
+        *,
+        queue_size: int,
+        workers: int = 1,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_size: int = 10_000,
+    ) -> None:
+        """Initialize the dispatcher; channel queues and workers are created on first message."""
+        self._pubsub = pubsub
+        self._queue_size = queue_size
+        self._workers = workers
+        self._policy = policy
+        self._spill_size = spill_size
+        self._channels: dict[str, _ChannelQueue] = {}
+
+    async def submit(self, channel: str, message: Any, pattern: str | None = None) -> None:
+        """Queue a decoded message for its subscription's workers, applying the overflow policy.
+
+        Messages delivered through a pattern subscription are queued under ``pattern``.
+        """
+        key = channel if pattern is None else pattern
+        item: _QueuedMessage = (channel, pattern, message)
+        state = self._channels.get(key)
+        if state is None:
+            state = self._channels[key] = self._start_channel(key)
+
+        if state.spill:
+            # Keep FIFO order: nothing overtakes messages already spilled
+            self._spill(key, state, item)
+        elif not state.queue.full():
+            state.queue.put_nowait(item)
+        elif self._policy is OverflowPolicy.DROP_OLDEST:
+            state.queue.get_nowait()
+            state.queue.task_done()
+            state.stats["dropped"] += 1
+            state.queue.put_nowait(item)
+        elif self._policy is OverflowPolicy.SPILL:
+            self._spill(key, state, item)
+        else:
+            await state.queue.put(item)
+
+        state.stats["enqueued"] += 1
+        state.stats["max_depth"] = max(state.stats["max_depth"], state.depth)
+
+    async def close_channel(self, channel: str) -> None:
+        """Stop the workers of a channel (or pattern) and discard its queued messages."""
+        state = self._channels.pop(channel, None)
+        if state is not None:
+            await self._stop([state])
+
+    async def close(self) -> None:
+        """Stop every worker and discard all queued messages."""
+        states = list(self._channels.values())
+        self._channels.clear()
+        await self._stop(states)
+
+    async def join(self) -> None:
+        """Wait until every message queued so far has been handled."""
+        for state in list(self._channels.values()):
+            # Workers refill from the spill buffer before marking a message done
+            await state.queue.join()
+
+    def depth(self, channel: str) -> int:
+        """Get the number of messages waiting on ``channel``, including spilled ones."""
+        state = self._channels.get(channel)
+        return state.depth if state is not None else 0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get the dispatcher settings and per-channel queue depth and counters."""
+        return {
+            "policy": self._policy.value,
+            "queue_size": self._queue_size,
+            "workers_per_channel": self._workers,
+            "channels": {
+                channel: {"depth": state.queue.qsize(), "spill_depth": len(state.spill), **state.stats}
+                for channel, state in self._channels.items()
+            },
+        }
+
+    def _start_channel(self, channel: str) -> _ChannelQueue:
+        state = _ChannelQueue(queue=asyncio.Queue(maxsize=self._queue_size))
+        state.workers = [
+            asyncio.create_task(self._work(state), name=f"pubsub-dispatch-{channel}-{index}")
+            for index in range(self._workers)
+        ]
+        return state
+
+    def _spill(self, channel: str, state: _ChannelQueue, message: _QueuedMessage) -> None:
+        if not state.spill:
+            logger.warning("Queue for channel '%s' is full; spilling messages to the overflow buffer", channel)
+        if len(state.spill) >= self._spill_size:
+            state.spill.popleft()
+            state.stats["dropped"] += 1
+        state.spill.append(message)
+        state.stats["spilled"] += 1
+
+    async def _work(self, state: _ChannelQueue) -> None:
+        while True:
+            channel, pattern, message = await state.queue.get()
+            if state.spill:
+                state.queue.put_nowait(state.spill.popleft())
+            try:
+                await self._pubsub._deliver(channel, message, pattern)
+            finally:
+                state.stats["delivered"] += 1
+                state.queue.task_done()
+
+    @staticmethod
+    async def _stop(states: list[_ChannelQueue]) -> None:
+        workers = [task for state in states for task in state.workers]
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
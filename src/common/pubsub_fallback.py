@@ -0,0 +1,609 @@
+"""Bounded stores for messages published while Redis is unavailable.
+
+``RedisPubSub.publish_with_fallback`` parks encoded messages in one of these
+stores when the primary publish fails, and a ``FallbackReplayer`` re-publishes
+them once the circuit breaker lets calls through again:
+
+- ``ReplayRing`` (``memory_queue`` strategy) keeps at most ``max_messages``
+  messages and ``max_bytes`` payload bytes in memory, dropping the oldest
+- ``SegmentFileQueue`` (``file_queue`` strategy) appends CRC-checked records
+  to fixed-size segment files, fsyncing every ``fsync_every`` records, so
+  queued messages survive a restart; the oldest segments are deleted once
+  the queue exceeds ``max_bytes``. The queue holds an exclusive lock on its
+  directory, so each process needs a directory of its own
+
+Both stores hand out batches with ``peek`` and only drop them on ``commit``,
+after the replayed batch was published. The file queue persists its read
+position on commit, so at most the last uncommitted batch is replayed twice
+after a crash. Its file I/O runs in worker threads, one operation at a time,
+so a slow disk does not stall the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
+
+# Directory locking is POSIX-only; elsewhere a directory is not protected from a second process
+try:
+    import fcntl
+
+    _FCNTL_AVAILABLE = True
+except ImportError:
+    _FCNTL_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .pubsub import RedisPubSub
+
+logger = logging.getLogger(__name__)
+
+# Record header: CRC32 of channel + payload, channel length, payload length
+_HEADER = struct.Struct(">IHI")
+_SEGMENT_SUFFIX = ".seg"
+_CURSOR_FILE = "cursor"
+_LOCK_FILE = "lock"
+
+QueuedMessage = tuple[str, bytes]
+
+_T = TypeVar("_T")
+
+
+class QueueLockedError(OSError):
+    """Raised when another process (or another queue in this one) holds a file queue directory."""
+
+
+class ReplayRing:
+    """In-memory ring buffer of encoded messages bounded by count and bytes."""
+
+    def __init__(self, *, max_messages: int = 10_000, max_bytes: int = 16 * 1024 * 1024) -> None:
+        """Initialize an empty ring holding at most ``max_messages`` messages and ``max_bytes`` payload bytes."""
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._items: deque[QueuedMessage] = deque()
+        self._bytes = 0
+        # Absolute positions of the first queued message and of the end of the last peek
+        self._first = 0
+        self._peeked_end = 0
+        self.enqueued = 0
+        self.dropped = 0
+        self.replayed = 0
+
+    def __len__(self) -> int:
+        """Get the number of queued messages."""
+        return len(self._items)
+
+    async def append(self, channel: str, payload: bytes) -> None:
+        """Queue a message, dropping the oldest ones if a limit is exceeded."""
+        self._items.append((channel, payload))
+        self._bytes += len(payload)
+        self.enqueued += 1
+        while len(self._items) > self._max_messages or (self._bytes > self._max_bytes and len(self._items) > 1):
+            _, dropped = self._items.popleft()
+            self._bytes -= len(dropped)
+            self._first += 1
+            self.dropped += 1
+
+    async def peek(self, count: int) -> list[QueuedMessage]:
+        """Get up to ``count`` of the oldest messages without removing them."""
+        records = [self._items[index] for index in range(min(count, len(self._items)))]
+        self._peeked_end = self._first + len(records)
+        return records
+
+    async def commit(self, count: int) -> None:
+        """Remove the messages returned by the last :meth:`peek` after they were replayed.
+
+        Messages of the batch that were already dropped to make room are not
+        removed twice, so newer messages are never lost to a late commit.
+        """
+        while self._items and self._first < self._peeked_end:
+            _, payload = self._items.popleft()
+            self._bytes -= len(payload)
+            self._first += 1
+        self.replayed += count
+
+    async def close(self) -> None:
+        """Nothing to release; present for symmetry with SegmentFileQueue."""
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get queue depth and counters."""
+        return {
+            "depth": len(self._items),
+            "bytes": self._bytes,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "replayed": self.replayed,
+        }
+
+
+class SegmentFileQueue:
+    """Append-only queue of encoded messages stored in segment files.
+
+    Create it with :meth:`open`; the constructor does blocking file I/O.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        segment_bytes: int = 8 * 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        fsync_every: int = 64,
+    ) -> None:
+        """Open the queue in ``directory``, picking up segments left by a previous run.
+
+        Args:
+        ----
+            directory: Directory holding the segment files (created if missing)
+            segment_bytes: A new segment is started once the current one reaches this size
+            max_bytes: Oldest segments are deleted while the queue is larger than this
+            fsync_every: Appended records between fsyncs of the current segment
+
+        Raises:
+        ------
+            QueueLockedError: If another queue holds ``directory``
+
+        """
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._lock = self._acquire_lock()
+        self._segment_bytes = segment_bytes
+        self._max_bytes = max_bytes
+        self._fsync_every = fsync_every
+        self._io_lock = asyncio.Lock()
+
+        self.enqueued = 0
+        self.dropped_segments = 0
+        self.replayed = 0
+        self.corrupt = 0
+
+        self._segments = sorted(int(path.stem) for path in self._dir.glob(f"*{_SEGMENT_SUFFIX}"))
+        self._sizes = {seq: self._path(seq).stat().st_size for seq in self._segments}
+        self._read_seq, self._read_offset, pending = self._load_cursor()
+        if pending is None:
+            # No clean close recorded the depth, so count what is left
+            pending = sum(
+                self._count_records(seq, self._read_offset if seq == self._read_seq else 0)
+                for seq in self._segments
+                if seq >= self._read_seq
+            )
+        self._pending = pending
+        # Forget the depth until the next clean close, so a crash forces a recount
+        self._save_cursor()
+
+        # Always write to a fresh segment so a torn tail from a crash is never appended to
+        self._write_seq = (self._segments[-1] + 1) if self._segments else 0
+        self._segments.append(self._write_seq)
+        self._sizes[self._write_seq] = 0
+        self._writer: BinaryIO = self._path(self._write_seq).open("ab")
+        self._write_size = 0
+        self._unsynced = 0
+        self._peeked: tuple[int, int, int] | None = None  # (count, seq, offset) after the last peek
+        self._peek_dropped = False
+
+    @classmethod
+    async def open(
+        cls,
+        directory: str | Path,
+        *,
+        segment_bytes: int = 8 * 1024 * 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        fsync_every: int = 64,
+    ) -> SegmentFileQueue:
+        """Open the queue in a worker thread; see the constructor for the arguments.
+
+        Raises
+        ------
+            QueueLockedError: If another queue holds ``directory``
+
+        """
+        return await asyncio.to_thread(
+            cls, directory, segment_bytes=segment_bytes, max_bytes=max_bytes, fsync_every=fsync_every
+        )
+
+    def __len__(self) -> int:
+        """Get the number of queued messages."""
+        return self._pending
+
+    async def append(self, channel: str, payload: bytes) -> None:
+        """Append a message; every ``fsync_every`` records are flushed to disk."""
+        name = channel.encode()
+        record = _HEADER.pack(zlib.crc32(name + payload), len(name), len(payload)) + name + payload
+        await self._run_io(self._append, record)
+
+    async def sync(self) -> None:
+        """Flush and fsync the current segment."""
+        await self._run_io(self._sync)
+
+    async def peek(self, count: int) -> list[QueuedMessage]:
+        """Read up to ``count`` of the oldest messages without removing them."""
+        return await self._run_io(self._peek, count)
+
+    async def commit(self, count: int) -> None:
+        """Drop the messages returned by the last :meth:`peek` after they were replayed."""
+        await self._run_io(self._commit, count)
+
+    async def close(self) -> None:
+        """Fsync and close the current segment, record the queue depth and release the directory."""
+        await self._run_io(self._close)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get queue depth, disk usage and counters."""
+        return {
+            "depth": self._pending,
+            "bytes": sum(self._sizes.values()),
+            "segments": len(self._segments),
+            "enqueued": self.enqueued,
+            "dropped_segments": self.dropped_segments,
+            "corrupt_records": self.corrupt,
+            "replayed": self.replayed,
+        }
+
+    # ----- Internal logic (run in worker threads) ---------------------------
+    async def _run_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run ``func`` in a worker thread, one at a time per queue."""
+        async with self._io_lock:
+            future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The thread cannot be stopped; keep the lock until it is done
+                await asyncio.wait([future])
+                raise
+
+    def _append(self, record: bytes) -> None:
+        self._writer.write(record)
+        self._write_size += len(record)
+        self._sizes[self._write_seq] = self._write_size
+        self._pending += 1
+        self.enqueued += 1
+        self._unsynced += 1
+
+        if self._write_size >= self._segment_bytes:
+            self._roll()
+        elif self._unsynced >= self._fsync_every:
+            self._sync()
+        self._enforce_limit()
+
+    def _sync(self) -> None:
+        self._writer.flush()
+        self._unsynced = 0
+        os.fsync(self._writer.fileno())
+
+    def _peek(self, count: int) -> list[QueuedMessage]:
+        self._writer.flush()
+        records: list[QueuedMessage] = []
+        seq, offset = self._read_seq, self._read_offset
+        while len(records) < count:
+            if seq not in self._segments:
+                later = [s for s in self._segments if s > seq]
+                if not later:
+                    break
+                seq, offset = later[0], 0
+            read, offset, complete = self._read_records(seq, offset, count - len(records))
+            records.extend(read)
+            if not complete or seq == self._write_seq:
+                break
+            later = [s for s in self._segments if s > seq]
+            if not later:
+                break
+            seq, offset = later[0], 0
+        if not records:
+            # Nothing readable is left, whatever the count said (e.g. a damaged tail)
+            self._pending = 0
+        self._peeked = (len(records), seq, offset)
+        self._peek_dropped = False
+        return records
+
+    def _commit(self, count: int) -> None:
+        if self._peek_dropped:
+            # The batch's segment was dropped over the size limit; the cursor already moved past it
+            self._peek_dropped = False
+            self._peeked = None
+            return
+        if self._peeked is None or self._peeked[0] != count:
+            msg = "commit() must follow peek() with the number of messages it returned"
+            raise ValueError(msg)
+        _, seq, offset = self._peeked
+        self._peeked = None
+        # Segments fully read before the new position are done
+        for done in [s for s in self._segments if s < seq]:
+            self._segments.remove(done)
+            del self._sizes[done]
+            self._path(done).unlink(missing_ok=True)
+        self._read_seq, self._read_offset = seq, offset
+        self._pending = max(0, self._pending - count)
+        self.replayed += count
+        self._save_cursor()
+
+    def _close(self) -> None:
+        if not self._writer.closed:
+            self._sync()
+            self._writer.close()
+            self._save_cursor(self._pending)
+        # Closing the file drops the lock
+        self._lock.close()
+
+    def _acquire_lock(self) -> BinaryIO:
+        lock = (self._dir / _LOCK_FILE).open("ab")
+        if _FCNTL_AVAILABLE:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as e:
+                lock.close()
+                msg = f"Fallback file queue directory {self._dir} is in use by another queue"
+                raise QueueLockedError(msg) from e
+        return lock
+
+    def _path(self, seq: int) -> Path:
+        return self._dir / f"{seq:012d}{_SEGMENT_SUFFIX}"
+
+    def _roll(self) -> None:
+        self._sync()
+        self._writer.close()
+        self._write_seq += 1
+        self._segments.append(self._write_seq)
+        self._sizes[self._write_seq] = 0
+        self._writer = self._path(self._write_seq).open("ab")
+        self._write_size = 0
+
+    def _enforce_limit(self) -> None:
+        while len(self._segments) > 1 and sum(self._sizes.values()) > self._max_bytes:
+            oldest = self._segments.pop(0)
+            del self._sizes[oldest]
+            skipped = self._count_records(oldest, self._read_offset if oldest == self._read_seq else 0)
+            self._path(oldest).unlink(missing_ok=True)
+            self._pending = max(0, self._pending - skipped)
+            self.dropped_segments += 1
+            if self._read_seq <= oldest:
+                self._read_seq, self._read_offset = self._segments[0], 0
+            self._peek_dropped = self._peeked is not None
+            logger.warning(
+                "Fallback file queue over %d bytes; dropped segment %d (%d messages)", self._max_bytes, oldest, skipped
+            )
+
+    def _read_records(self, seq: int, offset: int, limit: int) -> tuple[list[QueuedMessage], int, bool]:
+        """Read up to ``limit`` records of a segment from ``offset``.
+
+        Returns the records, the offset after them and whether the segment end was reached.
+        """
+        records: list[QueuedMessage] = []
+        with self._path(seq).open("rb") as segment:
+            segment.seek(offset)
+            while len(records) < limit:
+                header = segment.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return records, offset, True
+                crc, name_len, payload_len = _HEADER.unpack(header)
+                body = segment.read(name_len + payload_len)
+                if len(body) < name_len + payload_len or zlib.crc32(body) != crc:
+                    # Torn or damaged tail left by a crash; nothing after it can be trusted
+                    self.corrupt += 1
+                    logger.warning("Corrupt record in fallback segment %d at offset %d; skipping rest", seq, offset)
+                    return records, segment.seek(0, os.SEEK_END), True
+                records.append((body[:name_len].decode(), body[name_len:]))
+                offset += _HEADER.size + len(body)
+        return records, offset, False
+
+    def _count_records(self, seq: int, offset: int) -> int:
+        count = 0
+        while True:
+            records, offset, complete = self._read_records(seq, offset, 1024)
+            count += len(records)
+            if complete:
+                return count
+
+    def _load_cursor(self) -> tuple[int, int, int | None]:
+        """Get the read position and, after a clean close, the queue depth."""
+        first = self._segments[0] if self._segments else 0
+        try:
+            parts = [int(part) for part in (self._dir / _CURSOR_FILE).read_text().split()]
+        except (OSError, ValueError):
+            return first, 0, None
+        if len(parts) not in (2, 3) or parts[0] not in self._segments:
+            return first, 0, None
+        return parts[0], parts[1], parts[2] if len(parts) == 3 else None
+
+    def _save_cursor(self, pending: int | None = None) -> None:
+        temporary = self._dir / f"{_CURSOR_FILE}.tmp"
+        depth = f" {pending}" if pending is not None else ""
+        temporary.write_text(f"{self._read_seq} {self._read_offset}{depth}")
+        temporary.replace(self._dir / _CURSOR_FILE)
+
+
+class FallbackReplayer:
+    """Re-publishes messages parked by ``publish_with_fallback`` once Redis takes calls again.
+
+    A background task drains the memory ring first, then the file queue,
+    through pipelined batches. While the circuit breaker is open it sleeps
+    until the breaker's next attempt time, and while it is half-open it sends
+    single-message probes, so a Redis that is still down sees one call per
+    recovery window instead of a burst. Replay is paced to ``rate`` messages
+    per second so a backlog does not crowd out live publishes. A batch is
+    removed from its store only after it was published, so delivery is at
+    least once.
+    """
+
+    def __init__(
+        self,
+        pubsub: RedisPubSub,
+        *,
+        memory: ReplayRing,
+        file_options: dict[str, Any] | None,
+        rate: float = 2000.0,
+        batch_size: int = 100,
+        retry_interval: float = 1.0,
+    ) -> None:
+        """Initialize with the memory ring and the options of the lazily opened file queue.
+
+        Args:
+        ----
+            pubsub: Instance whose pipeline and circuit breaker replays go through
+            memory: Store for the ``memory_queue`` strategy
+            file_options: ``SegmentFileQueue`` arguments for the ``file_queue`` strategy, or None to
+                keep its messages in memory
+            rate: Maximum replayed messages per second (0 for unpaced)
+            batch_size: Messages per pipelined replay batch while the breaker is closed
+            retry_interval: Seconds to wait after a failed replay batch or store error
+
+        """
+        self._pubsub = pubsub
+        self.memory = memory
+        self._file_options = file_options
+        self._file_queue: SegmentFileQueue | None = None
+        self._file_unavailable_logged = False
+        self._rate = rate
+        self._batch_size = batch_size
+        self._retry_interval = retry_interval
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+        # Metrics
+        self.replayed_batches = 0
+        self.failed_batches = 0
+        self.store_errors = 0
+
+    async def open_file_queue(self) -> SegmentFileQueue | None:
+        """Get the file queue, opening it on first use; None without a directory or when it is locked."""
+        if self._file_queue is None and self._file_options is not None:
+            try:
+                self._file_queue = await SegmentFileQueue.open(**self._file_options)
+            except QueueLockedError:
+                logger.exception("Fallback file queue unavailable; file_queue messages are kept in memory")
+                self._file_options = None
+                self._file_unavailable_logged = True
+        return self._file_queue
+
+    async def park(self, channel: str, payload: bytes, *, durable: bool) -> None:
+        """Queue an encoded message for replay, in the file queue if ``durable`` and available, else in memory."""
+        store: ReplayRing | SegmentFileQueue | None = await self.open_file_queue() if durable else None
+        if store is None:
+            if durable and not self._file_unavailable_logged:
+                logger.warning("No fallback file queue directory configured; file_queue messages are kept in memory")
+                self._file_unavailable_logged = True
+            store = self.memory
+        await store.append(channel, payload)
+        self.wake()
+
+    def wake(self) -> None:
+        """Start or resume replaying queued messages."""
+        self._ready.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop replaying and close the file queue; queued messages stay queued."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        if self._file_queue is not None:
+            await self._file_queue.close()
+            self._file_queue = None
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get queue depths and replay counters."""
+        return {
+            "memory": self.memory.metrics,
+            "file": self._file_queue.metrics if self._file_queue is not None else None,
+            "replaying": self._task is not None and not self._task.done(),
+            "replay_rate": self._rate,
+            "replay_batch": self._batch_size,
+            "replayed_batches": self.replayed_batches,
+            "failed_batches": self.failed_batches,
+            "store_errors": self.store_errors,
+        }
+
+    def _next_store(self) -> ReplayRing | SegmentFileQueue | None:
+        if len(self.memory):
+            return self.memory
+        if self._file_queue is not None and len(self._file_queue):
+            return self._file_queue
+        return None
+
+    def _breaker_wait(self) -> float:
+        """Get the seconds until the circuit breaker lets the next call through."""
+        from .pubsub import CircuitBreakerState
+
+        breaker = self._pubsub._circuit_breaker
+        if breaker.state is not CircuitBreakerState.OPEN:
+            return 0.0
+        next_attempt: float | None = breaker.metrics["next_attempt_time"]
+        if next_attempt is None or next_attempt == float("inf"):
+            return self._retry_interval
+        return max(0.0, next_attempt - time.time())
+
+    async def _run(self) -> None:
+        # pubsub imports this module, so its names are imported on use
+        from .pubsub import CircuitBreakerState, PublishError
+
+        while True:
+            store = self._next_store()
+            if store is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            wait = self._breaker_wait()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            # Probe with a single message until the breaker has closed again
+            closed = self._pubsub._circuit_breaker.state is CircuitBreakerState.CLOSED
+            try:
+                batch = await store.peek(self._batch_size if closed else 1)
+            except (OSError, ValueError):
+                # E.g. a segment deleted or unreadable; the messages stay queued for the next try
+                self.store_errors += 1
+                logger.exception("Failed to read a fallback replay batch")
+                await asyncio.sleep(self._retry_interval)
+                continue
+            try:
+                await self._send(batch)
+            except PublishError:
+                self.failed_batches += 1
+                await asyncio.sleep(self._retry_interval)
+                continue
+
+            try:
+                await store.commit(len(batch))
+            except (OSError, ValueError):
+                # The batch was published but stays queued, so it is replayed again
+                self.store_errors += 1
+                logger.exception("Failed to commit a replayed fallback batch")
+                await asyncio.sleep(self._retry_interval)
+                continue
+            self.replayed_batches += 1
+            if self._rate > 0:
+                await asyncio.sleep(len(batch) / self._rate)
+
+    async def _send(self, batch: list[QueuedMessage]) -> None:
+        from .pubsub import PublishError
+
+        # Looped-back messages already reached local handlers when first published; drop their echoes
+        loopback = self._pubsub._loopback
+        echoes = []
+        if loopback is not None:
+            for channel, payload in batch:
+                if targets := self._pubsub._router.match(channel):
+                    loopback.expect(channel, payload, len(targets))
+                    echoes.append((channel, payload, len(targets)))
+        try:
+            await self._pubsub._publish_encoded(batch)
+        except PublishError:
+            for echo in echoes:
+                loopback.forget(*echo)  # type: ignore[union-attr]
+            raise
@@ -0,0 +1,87 @@
+"""In-process delivery bookkeeping for looped-back pub/sub publishes.
+
+With loopback enabled, ``RedisPubSub`` hands a publish straight to the
+matching local subscriptions and sends it to Redis for other processes. The
+copies Redis then delivers back to this process are echoes of messages its
+handlers already saw; ``LoopbackEchoes`` remembers which ones to expect so
+the listen loop can drop them.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class LoopbackEchoes:
+    """Payloads already delivered in-process whose copies coming back from Redis are dropped.
+
+    A looped-back publish expects one copy per matching local subscription.
+    Copies are matched on (channel, payload bytes), so an identical message
+    from another process is only mistaken for an echo while one is expected.
+    Expectations that are never met (the subscription went away before the
+    copy arrived) expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, *, ttl: float = 5.0, max_pending: int = 10_000) -> None:
+        """Initialize with expectations kept for ``ttl`` seconds, at most ``max_pending`` at a time."""
+        self._ttl = ttl
+        self._max_pending = max_pending
+        self._pending: dict[tuple[str, bytes], list[float]] = {}  # key -> [copies, deadline]
+        self.delivered = 0
+        self.suppressed = 0
+        self.expired = 0
+
+    def expect(self, channel: str, payload: bytes, copies: int) -> None:
+        """Expect ``copies`` echoes of a payload published to ``channel``."""
+        now = time.monotonic()
+        entry = self._pending.get((channel, payload))
+        if entry is not None:
+            entry[0] += copies
+            entry[1] = now + self._ttl
+            return
+        self._expire(now)
+        self._pending[(channel, payload)] = [copies, now + self._ttl]
+
+    def forget(self, channel: str, payload: bytes, copies: int) -> None:
+        """Withdraw expected echoes of a publish that failed."""
+        entry = self._pending.get((channel, payload))
+        if entry is not None:
+            entry[0] -= copies
+            if entry[0] <= 0:
+                del self._pending[(channel, payload)]
+
+    def consume(self, channel: str, payload: bytes) -> bool:
+        """Check whether a received message is an expected echo, consuming one expected copy if so."""
+        key = (channel, payload)
+        entry = self._pending.get(key)
+        if entry is None:
+            return False
+        if entry[1] < time.monotonic():
+            del self._pending[key]
+            self.expired += 1
+            return False
+        entry[0] -= 1
+        if entry[0] <= 0:
+            del self._pending[key]
+        self.suppressed += 1
+        return True
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get local delivery and echo suppression counters."""
+        return {
+            "delivered": self.delivered,
+            "suppressed": self.suppressed,
+            "expired": self.expired,
+            "pending": len(self._pending),
+        }
+
+    def _expire(self, now: float) -> None:
+        # Insertion order approximates deadline order; stop at the first live entry
+        while self._pending:
+            key, (_, deadline) = next(iter(self._pending.items()))
+            if deadline >= now and len(self._pending) < self._max_pending:
+                break
+            del self._pending[key]
+            self.expired += 1
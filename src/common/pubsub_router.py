@@ -0,0 +1,166 @@
+"""Channel routing table for exact and pattern pub/sub subscriptions.
+
+``ChannelRouter`` resolves a channel name to the subscriptions that receive
+it. It is compiled from the current subscription set and rebuilt whenever a
+subscription is added or removed, so routing never re-parses patterns:
+
+- Exact channel names are a dict lookup
+- Patterns use Redis ``PSUBSCRIBE`` glob syntax (``*``, ``?``, ``[abc]``,
+  ``[^a]``, ``[a-z]`` and backslash escapes) and are merged into one trie, so
+  patterns sharing a prefix such as ``mem0.recorded.`` are walked once
+  however many there are
+- Resolved channels are cached until the next rebuild
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+# Trie edge tokens: ("=", char), ("?",), ("*",) or ("[", negate, chars, ranges)
+_Token = tuple[Any, ...]
+_STAR: _Token = ("*",)
+_ONE: _Token = ("?",)
+
+
+def _parse_class(body: str) -> _Token:
+    negate = body.startswith("^")
+    if negate:
+        body = body[1:]
+    chars: set[str] = set()
+    ranges: list[tuple[str, str]] = []
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c == "\\" and i + 1 < len(body):
+            chars.add(body[i + 1])
+            i += 2
+        elif i + 2 < len(body) and body[i + 1] == "-":
+            low, high = sorted((c, body[i + 2]))
+            ranges.append((low, high))
+            i += 3
+        else:
+            chars.add(c)
+            i += 1
+    return ("[", negate, frozenset(chars), tuple(ranges))
+
+
+def glob_tokens(pattern: str) -> list[_Token]:
+    """Split a Redis glob pattern into trie edge tokens."""
+    tokens: list[_Token] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\" and i + 1 < len(pattern):
+            tokens.append(("=", pattern[i + 1]))
+            i += 2
+            continue
+        if c == "*":
+            # Consecutive stars match the same strings as one
+            if not tokens or tokens[-1] != _STAR:
+                tokens.append(_STAR)
+        elif c == "?":
+            tokens.append(_ONE)
+        elif c == "[" and (end := pattern.find("]", i + 1)) != -1:
+            tokens.append(_parse_class(pattern[i + 1 : end]))
+            i = end + 1
+            continue
+        else:
+            tokens.append(("=", c))
+        i += 1
+    return tokens
+
+
+def _matches_one(token: _Token, char: str) -> bool:
+    if token == _ONE:
+        return True
+    negate: bool = token[1]
+    chars: frozenset[str] = token[2]
+    ranges: tuple[tuple[str, str], ...] = token[3]
+    hit = char in chars or any(low <= char <= high for low, high in ranges)
+    return hit != negate
+
+
+class _TrieNode:
+    __slots__ = ("literals", "patterns", "wildcards")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _TrieNode] = {}
+        self.wildcards: dict[_Token, _TrieNode] = {}
+        self.patterns: list[str] = []
+
+
+class ChannelRouter:
+    """Compiled routing table from channel names to matching subscriptions."""
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, channels: Iterable[str] = (), patterns: Iterable[str] = ()) -> None:
+        """Compile the routing table for exact ``channels`` and glob ``patterns``."""
+        self._channels = frozenset(channels)
+        self._patterns = tuple(dict.fromkeys(patterns))
+        self._order = {pattern: index for index, pattern in enumerate(self._patterns)}
+        self._root = _TrieNode()
+        for pattern in self._patterns:
+            self._insert(pattern)
+        self._cache: dict[str, tuple[str, ...]] = {}
+
+    @property
+    def channels(self) -> frozenset[str]:
+        """Get the exact channel subscriptions."""
+        return self._channels
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        """Get the pattern subscriptions, in subscription order."""
+        return self._patterns
+
+    def match(self, channel: str) -> tuple[str, ...]:
+        """Get the subscriptions receiving ``channel``: the channel itself if subscribed, then matching patterns."""
+        cached = self._cache.get(channel)
+        if cached is not None:
+            return cached
+
+        matched = self.match_patterns(channel)
+        result = (channel, *matched) if channel in self._channels else matched
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[channel] = result
+        return result
+
+    def match_patterns(self, channel: str) -> tuple[str, ...]:
+        """Get the pattern subscriptions matching ``channel``, in subscription order."""
+        if not self._patterns:
+            return ()
+        found: set[str] = set()
+        end = len(channel)
+        # Depth-first walk over (node, position) states; each state is expanded once
+        stack: list[tuple[_TrieNode, int]] = [(self._root, 0)]
+        seen: set[tuple[int, int]] = set()
+        while stack:
+            node, i = stack.pop()
+            state = (id(node), i)
+            if state in seen:
+                continue
+            seen.add(state)
+            if i == end:
+                found.update(node.patterns)
+            else:
+                child = node.literals.get(channel[i])
+                if child is not None:
+                    stack.append((child, i + 1))
+            for token, child in node.wildcards.items():
+                if token == _STAR:
+                    stack.extend((child, j) for j in range(i, end + 1))
+                elif i < end and _matches_one(token, channel[i]):
+                    stack.append((child, i + 1))
+        return tuple(sorted(found, key=self._order.__getitem__))
+
+    def _insert(self, pattern: str) -> None:
+        node = self._root
+        for token in glob_tokens(pattern):
+            if token[0] == "=":
+                node = node.literals.setdefault(token[1], _TrieNode())
+            else:
+                node = node.wildcards.setdefault(token, _TrieNode())
+        node.patterns.append(pattern)
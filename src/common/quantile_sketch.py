@@ -0,0 +1,122 @@
+"""Mergeable quantile sketch with bounded relative error.
+
+Values are counted in logarithmically sized buckets (the DDSketch / HDR
+histogram idea): bucket ``i`` covers ``(gamma**(i-1), gamma**i]`` where
+``gamma = (1 + alpha) / (1 - alpha)``. Any quantile estimate is within
+``alpha`` relative error of the true value, memory grows with the logarithm of
+the value range rather than the number of samples, and two sketches merge by
+adding bucket counts - so hourly sketches can be combined into daily or
+arbitrary-range percentiles without revisiting raw rows.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch for non-negative values."""
+
+    __slots__ = ("_bins", "_gamma", "_log_gamma", "alpha", "count", "max", "min", "sum", "zero_count")
+
+    def __init__(self, alpha: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        """Initialize an empty sketch with relative accuracy ``alpha`` (0 < alpha < 1)."""
+        if not 0.0 < alpha < 1.0:
+            msg = f"alpha must be between 0 and 1, got {alpha}"
+            raise ValueError(msg)
+        self.alpha = alpha
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record ``value`` (negative values are clamped to zero) ``count`` times."""
+        value = max(0.0, float(value))
+        if value == 0.0:
+            self.zero_count += count
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[index] = self._bins.get(index, 0) + count
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Record every value in ``values``."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold another sketch with the same accuracy into this one.
+
+        Raises
+        ------
+            ValueError: If the sketches use different relative accuracy
+
+        """
+        if other.alpha != self.alpha:
+            msg = f"Cannot merge sketches with alpha {self.alpha} and {other.alpha}"
+            raise ValueError(msg)
+        for index, bucket_count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + bucket_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms keeps the error within alpha
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        """Get the exact mean of recorded values."""
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-friendly dictionary."""
+        return {
+            "alpha": self.alpha,
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "bins": {str(index): bucket_count for index, bucket_count in self._bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QuantileSketch:
+        """Deserialize a sketch produced by :meth:`to_dict`."""
+        sketch = cls(alpha=data.get("alpha", DEFAULT_RELATIVE_ACCURACY))
+        sketch._bins = {int(index): int(bucket_count) for index, bucket_count in data.get("bins", {}).items()}
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
@@ -11,7 +11,7 @@ This module provides Redis configuration management with support for:
 import os
 import urllib.parse
 from functools import lru_cache
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -101,6 +101,123 @@ class RedisConfig(BaseSettings):
     redis_retry_on_timeout: bool = Field(default=True, description="Retry on timeout")
     redis_health_check_interval: int = Field(default=30, ge=1, description="Health check interval in seconds")
 
+    # Circuit breaker guarding Redis calls (see RedisPubSub.enable_sliding_window_breaker)
+    redis_circuit_breaker_mode: Literal["consecutive", "sliding_window"] = Field(
+        default="consecutive", description="Open on consecutive failures or on sliding-window failure/slow-call rates"
+    )
+    redis_circuit_breaker_window: float = Field(default=10.0, gt=0, description="Sliding window length in seconds")
+    redis_circuit_breaker_buckets: int = Field(default=10, ge=1, description="Time buckets per sliding window")
+    redis_circuit_breaker_minimum_calls: int = Field(
+        default=20, ge=1, description="Calls a window must hold before its rates can open the circuit"
+    )
+    redis_circuit_breaker_failure_rate: float = Field(
+        default=0.5, gt=0, le=1, description="Fraction of failed calls in the window that opens the circuit"
+    )
+    redis_circuit_breaker_slow_call_rate: float = Field(
+        default=1.0, gt=0, le=1, description="Fraction of slow calls in the window that opens the circuit"
+    )
+    redis_circuit_breaker_slow_call_duration: float = Field(
+        default=1.0, gt=0, description="Seconds after which a Redis call counts as slow"
+    )
+
+    # Subscriber reconnects (see RedisPubSub.configure_reconnect)
+    redis_reconnect_backoff_base: float = Field(
+        default=0.05, gt=0, description="Upper bound in seconds of the wait before the first reconnect attempt"
+    )
+    redis_reconnect_backoff_max: float = Field(
+        default=5.0, gt=0, description="Cap in seconds on the wait between reconnect attempts"
+    )
+
+    # Timeouts from observed latency (see RedisPubSub.enable_adaptive_timeouts)
+    redis_adaptive_timeouts: bool = Field(
+        default=False, description="Derive per-operation Redis timeouts from their recent p99.9 latency"
+    )
+    redis_adaptive_timeout_floor: float = Field(default=0.05, gt=0, description="Lowest adaptive timeout in seconds")
+    redis_adaptive_timeout_ceiling: float = Field(default=5.0, gt=0, description="Highest adaptive timeout in seconds")
+    redis_adaptive_timeout_multiplier: float = Field(
+        default=4.0, ge=1, description="Factor applied to the p99.9 latency to get a timeout"
+    )
+
+    # Publish auto-batching (see RedisPubSub.enable_auto_batching)
+    redis_publish_linger_ms: float = Field(
+        default=0.0, ge=0, description="Linger window for auto-batched publish in ms (0 disables)"
+    )
+    redis_publish_max_batch: int = Field(default=100, ge=1, description="Maximum messages per auto-batched flush")
+
+    # Pub/sub payload codecs (see src.common.pubsub_codecs)
+    redis_pubsub_codec: str = Field(default="orjson", description="Default payload codec: orjson, msgpack or raw")
+    redis_pubsub_channel_codecs: dict[str, str] = Field(
+        default_factory=dict, description="Per-channel payload codec overrides as a JSON object"
+    )
+
+    # Retained last message per channel (see RedisPubSub.set_channel_retained)
+    redis_pubsub_retained_channels: dict[str, float] = Field(
+        default_factory=dict,
+        description="Channels whose last message is kept for late subscribers, as a JSON object of TTLs in seconds",
+    )
+
+    # Redis Streams transport (see src.common.redis_streams)
+    redis_stream_maxlen: int = Field(default=100_000, ge=1, description="Approximate max entries kept per stream")
+    redis_stream_read_count: int = Field(default=100, ge=1, description="Entries fetched per stream read")
+    redis_stream_block_ms: int = Field(default=1000, ge=1, description="XREADGROUP block time in ms")
+    redis_stream_claim_idle_ms: int = Field(
+        default=60_000, ge=1, description="Idle time in ms before a pending entry is claimed by another consumer"
+    )
+
+    # Lean publish (see RedisPubSub.enable_lean_publish)
+    redis_publish_lean: bool = Field(default=False, description="Skip per-message tracing on publish")
+    redis_publish_trace_sample_rate: float = Field(
+        default=0.01, ge=0, le=1, description="Fraction of lean publishes that are still traced"
+    )
+
+    # Subscriber dispatch queues (see RedisPubSub.enable_dispatcher)
+    redis_dispatch_queue_size: int = Field(
+        default=0, ge=0, description="Messages queued per subscribed channel (0 handles them in the listen loop)"
+    )
+    redis_dispatch_workers: int = Field(default=1, ge=1, description="Handler worker tasks per subscribed channel")
+    redis_dispatch_overflow: Literal["block", "drop_oldest", "spill"] = Field(
+        default="block", description="Full channel queue policy: block, drop_oldest or spill"
+    )
+    redis_dispatch_spill_size: int = Field(
+        default=10_000, ge=1, description="Overflow buffer size per channel for the spill policy"
+    )
+
+    # Sharded subscriber connections (see RedisPubSub.enable_sharding)
+    redis_pubsub_shards: int = Field(default=1, ge=1, description="Subscriber connections channels are hashed across")
+    redis_pubsub_sharded_commands: bool | None = Field(
+        default=None,
+        description="Use SSUBSCRIBE/SPUBLISH when sharded (unset: when the server supports them); "
+        "all processes on a channel must agree",
+    )
+
+    # In-process delivery (see RedisPubSub.enable_loopback)
+    redis_pubsub_loopback: bool = Field(
+        default=False, description="Deliver messages to subscribers in the publishing process without Redis"
+    )
+
+    # Replay of messages parked by publish_with_fallback (see RedisPubSub.configure_fallback)
+    redis_fallback_memory_max_messages: int = Field(
+        default=10_000, ge=1, description="Messages the memory_queue fallback keeps before dropping the oldest"
+    )
+    redis_fallback_memory_max_bytes: int = Field(
+        default=16 * 1024 * 1024, ge=1, description="Payload bytes the memory_queue fallback keeps"
+    )
+    redis_fallback_dir: str | None = Field(
+        default=None,
+        description="Directory of the file_queue fallback, one per process (unset: file_queue messages stay in memory)",
+    )
+    redis_fallback_segment_bytes: int = Field(
+        default=8 * 1024 * 1024, ge=1024, description="File queue segment size before starting a new segment"
+    )
+    redis_fallback_max_bytes: int = Field(
+        default=256 * 1024 * 1024, ge=1024, description="File queue size beyond which the oldest segments are deleted"
+    )
+    redis_fallback_fsync_every: int = Field(default=64, ge=1, description="File queue records appended between fsyncs")
+    redis_fallback_replay_rate: float = Field(
+        default=2000.0, ge=0, description="Maximum replayed messages per second (0 for unpaced)"
+    )
+    redis_fallback_replay_batch: int = Field(default=100, ge=1, description="Messages per pipelined replay batch")
+
     @model_validator(mode="before")
     @classmethod
     def apply_env_defaults(cls, data: Any) -> Any:
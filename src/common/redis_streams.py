@@ -0,0 +1,465 @@
+"""Redis Streams transport with consumer groups.
+
+Plain Pub/Sub drops messages published while a subscriber is disconnected and
+delivers every message to every subscriber. This module offers the same
+publish/subscribe surface as :class:`~src.common.pubsub.RedisPubSub` on top of
+Redis Streams:
+
+- ``publish`` appends with ``XADD ... MAXLEN ~ n`` so the stream stays bounded
+- Each ``subscribe`` call runs one consumer of a consumer group; consumers in
+  the same group split the stream between them (``XREADGROUP``), so adding
+  consumer processes scales throughput, while separate groups each see every
+  message
+- An entry is acknowledged (``XACK``) only after its handler succeeds; entries
+  left pending by a crashed or stuck consumer are taken over by the group's
+  live consumers with ``XAUTOCLAIM`` once idle for ``claim_idle_ms``, giving
+  at-least-once delivery
+- A restarted consumer first re-reads its own pending entries before new ones
+
+Payloads use the pub/sub codecs (``src.common.pubsub_codecs``) and are stored
+in a single ``d`` field. The connection, codecs and circuit breaker are shared
+with the process-wide ``RedisPubSub``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .pubsub import CircuitBreakerError, MessagePayload, PublishError, RedisPubSub, SubscribeError, get_pubsub
+from .pubsub_codecs import decode_payload
+from .redis_config import get_redis_config
+
+logger = logging.getLogger(__name__)
+
+# Stream entry fields: codec-framed payload and optional correlation ID
+PAYLOAD_FIELD = "d"
+CORRELATION_FIELD = "c"
+
+# Keys added to messages delivered with auto_ack=False, used by ack_message()
+STREAM_KEY = "_stream"
+STREAM_GROUP_KEY = "_stream_group"
+STREAM_ID_KEY = "_stream_id"
+
+StreamHandler = Callable[[str, Any], Awaitable[None]]
+
+
+def default_consumer_name() -> str:
+    """Build a consumer name unique to this process: host, pid and a random suffix."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+@dataclass
+class _StreamSubscription:
+    """One consumer of a consumer group and its reader task."""
+
+    channel: str
+    group: str
+    consumer: str
+    handler: StreamHandler
+    auto_ack: bool
+    task: asyncio.Task[None] | None = None
+    stop_event: asyncio.Event = field(default_factory=asyncio.Event)
+    claim_cursor: str = "0-0"
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"delivered": 0, "acked": 0, "claimed": 0, "handler_errors": 0, "decode_errors": 0}
+    )
+
+
+class RedisStreams:
+    """Redis Streams publish/subscribe with consumer groups and at-least-once delivery."""
+
+    def __init__(
+        self,
+        pubsub: RedisPubSub,
+        *,
+        maxlen: int = 100_000,
+        read_count: int = 100,
+        block_ms: int = 1000,
+        claim_idle_ms: int = 60_000,
+        claim_interval: float = 5.0,
+    ) -> None:
+        """Initialize on top of a RedisPubSub whose connection, codecs and circuit breaker are reused.
+
+        Args:
+        ----
+            pubsub: RedisPubSub instance providing the Redis connection
+            maxlen: Approximate maximum entries kept per stream (trimmed on XADD)
+            read_count: Maximum entries fetched per XREADGROUP/XAUTOCLAIM call
+            block_ms: How long one XREADGROUP call blocks waiting for new entries
+            claim_idle_ms: Pending entries idle this long are claimed from their consumer
+            claim_interval: Seconds between XAUTOCLAIM passes of each consumer
+
+        """
+        self._pubsub = pubsub
+        self._maxlen = maxlen
+        self._read_count = read_count
+        self._block_ms = block_ms
+        self._claim_idle_ms = claim_idle_ms
+        self._claim_interval = claim_interval
+        self._subscriptions: list[_StreamSubscription] = []
+        self._groups: set[tuple[str, str]] = set()
+        self._published = 0
+
+    async def _client(self) -> Any:
+        if not self._pubsub.is_connected or self._pubsub._redis is None:
+            await self._pubsub.connect()
+        return self._pubsub._redis
+
+    async def publish(self, channel: str, message: MessagePayload, correlation_id: str | None = None) -> str:
+        """Append a message to the stream ``channel``.
+
+        Args:
+        ----
+            channel: Stream key
+            message: Message data, encoded with the channel's pub/sub codec
+            correlation_id: Optional correlation ID, kept on the entry for inspection with XRANGE
+
+        Returns:
+        -------
+            ID of the new stream entry
+
+        Raises:
+        ------
+            PublishError: If encoding or XADD fails
+
+        """
+        return (await self.publish_many([(channel, message)], correlation_id))[0]
+
+    async def publish_many(
+        self, items: Sequence[tuple[str, MessagePayload]], correlation_id: str | None = None
+    ) -> list[str]:
+        """Append a batch of messages through one pipeline.
+
+        Returns
+        -------
+            Stream entry IDs, in input order
+
+        Raises
+        ------
+            PublishError: If encoding or the pipeline fails
+
+        """
+        if not items:
+            return []
+        try:
+            encoded = [(channel, self._pubsub.encode_message(channel, message)) for channel, message in items]
+        except (TypeError, ValueError) as e:
+            logger.exception("Failed to serialize %d stream messages", len(items))
+            msg = f"Failed to serialize message: {e}"
+            raise PublishError(msg) from e
+
+        extra = {CORRELATION_FIELD: correlation_id} if correlation_id else {}
+
+        async def _xadd_operation() -> list[Any]:
+            pipe = client.pipeline(transaction=False)
+            for channel, payload in encoded:
+                pipe.xadd(channel, {PAYLOAD_FIELD: payload, **extra}, maxlen=self._maxlen, approximate=True)
+            return list(await pipe.execute())
+
+        try:
+            client = await self._client()
+            ids = await self._pubsub._circuit_breaker.call(_xadd_operation)
+            if not isinstance(ids, list):
+                error_msg = f"Circuit breaker should return list from _xadd_operation, got {type(ids)}"
+                raise TypeError(error_msg)
+        except CircuitBreakerError as e:
+            logger.exception("Circuit breaker prevented stream publish")
+            msg = f"Publish blocked by circuit breaker: {e}"
+            raise PublishError(msg) from e
+        except Exception as e:
+            logger.exception("Failed to append %d messages to streams", len(items))
+            msg = f"Failed to publish stream message: {e}"
+            raise PublishError(msg) from e
+
+        self._published += len(encoded)
+        return [_text(entry_id) for entry_id in ids]
+
+    async def subscribe(
+        self,
+        channel: str,
+        handler: StreamHandler,
+        *,
+        group: str,
+        consumer: str | None = None,
+        auto_ack: bool = True,
+    ) -> str:
+        """Start a consumer of ``group`` on the stream ``channel``.
+
+        The group is created at the current end of the stream if it does not
+        exist yet. Call once per worker; consumers sharing a group split the
+        entries between them.
+
+        Args:
+        ----
+            channel: Stream key
+            handler: Async function called with (channel, message) for each entry
+            group: Consumer group name
+            consumer: Consumer name, unique within the group (generated when omitted)
+            auto_ack: Acknowledge each entry once the handler returns. When False,
+                dict messages carry ``_stream``/``_stream_group``/``_stream_id``
+                (non-dict payloads are wrapped as ``{"payload": value}``) and the
+                caller acknowledges with :meth:`ack_message`
+
+        Returns:
+        -------
+            The consumer name
+
+        Raises:
+        ------
+            SubscribeError: If the consumer group cannot be created
+
+        """
+        await self._ensure_group(channel, group)
+        subscription = _StreamSubscription(
+            channel=channel,
+            group=group,
+            consumer=consumer or default_consumer_name(),
+            handler=handler,
+            auto_ack=auto_ack,
+        )
+        subscription.task = asyncio.create_task(
+            self._consume(subscription), name=f"stream-{channel}-{group}-{subscription.consumer}"
+        )
+        self._subscriptions.append(subscription)
+        logger.info("Consumer '%s' of group '%s' started on stream '%s'", subscription.consumer, group, channel)
+        return subscription.consumer
+
+    async def unsubscribe(self, channel: str, handler: StreamHandler | None = None) -> None:
+        """Stop consumers on ``channel`` (only those running ``handler`` if given).
+
+        Entries they had read but not acknowledged stay pending and are
+        claimed by the group's remaining consumers.
+        """
+        stopping = [sub for sub in self._subscriptions if sub.channel == channel and handler in (None, sub.handler)]
+        for sub in stopping:
+            self._subscriptions.remove(sub)
+        await self._stop(stopping)
+
+    async def disconnect(self) -> None:
+        """Stop every consumer."""
+        stopping, self._subscriptions = self._subscriptions, []
+        await self._stop(stopping)
+
+    async def ack(self, channel: str, group: str, *entry_ids: str) -> int:
+        """Acknowledge entries so they are not redelivered; returns how many were pending."""
+        if not entry_ids:
+            return 0
+        client = await self._client()
+        return int(await client.xack(channel, group, *entry_ids))
+
+    async def ack_message(self, message: dict[str, Any]) -> bool:
+        """Acknowledge a message delivered with ``auto_ack=False``.
+
+        Returns
+        -------
+            True if the entry was pending and is now acknowledged
+
+        """
+        entry_id = message.get(STREAM_ID_KEY)
+        if entry_id is None:
+            return False
+        acked = await self.ack(message[STREAM_KEY], message[STREAM_GROUP_KEY], entry_id) == 1
+        if acked:
+            for sub in self._subscriptions:
+                if sub.channel == message[STREAM_KEY] and sub.group == message[STREAM_GROUP_KEY]:
+                    sub.stats["acked"] += 1
+                    break
+        return acked
+
+    async def pending_count(self, channel: str, group: str) -> int:
+        """Get the number of entries read by ``group`` but not yet acknowledged."""
+        client = await self._client()
+        summary = await client.xpending(channel, group)
+        return int(summary["pending"])
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get publish totals and per-consumer delivery statistics."""
+        return {
+            "published": self._published,
+            "consumers": [
+                {"channel": sub.channel, "group": sub.group, "consumer": sub.consumer, **sub.stats}
+                for sub in self._subscriptions
+            ],
+        }
+
+    # ----- Internal logic -------------------------------------------------
+    async def _ensure_group(self, channel: str, group: str) -> None:
+        if (channel, group) in self._groups:
+            return
+        client = await self._client()
+        try:
+            await client.xgroup_create(channel, group, id="$", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                logger.exception("Failed to create consumer group '%s' on stream '%s'", group, channel)
+                msg = f"Failed to create consumer group '{group}' on '{channel}': {e}"
+                raise SubscribeError(msg) from e
+        self._groups.add((channel, group))
+
+    async def _stop(self, subscriptions: list[_StreamSubscription]) -> None:
+        for sub in subscriptions:
+            sub.stop_event.set()
+        tasks = [sub.task for sub in subscriptions if sub.task is not None]
+        if not tasks:
+            return
+        # Let each consumer finish its in-flight XREADGROUP (at most block_ms) and exit on its own;
+        # cancelling mid-command would leave an unread reply on the pooled connection
+        _, pending = await asyncio.wait(tasks, timeout=self._block_ms / 1000 + 1.0)
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _consume(self, sub: _StreamSubscription) -> None:
+        # Re-read our own pending entries (left by a previous run) before new ones
+        backlog_cursor: str | None = "0"
+        next_claim = 0.0
+        while not sub.stop_event.is_set():
+            try:
+                client = await self._client()
+                if time.monotonic() >= next_claim:
+                    next_claim = time.monotonic() + self._claim_interval
+                    await self._claim_stuck(client, sub)
+
+                response = await client.xreadgroup(
+                    sub.group,
+                    sub.consumer,
+                    {sub.channel: backlog_cursor or ">"},
+                    count=self._read_count,
+                    block=None if backlog_cursor else self._block_ms,
+                )
+                entries = response[0][1] if response else []
+                if backlog_cursor is not None:
+                    if not entries:
+                        backlog_cursor = None
+                        continue
+                    backlog_cursor = _text(entries[-1][0])
+                elif not entries:
+                    # Servers that return early from a blocking read must not starve the loop
+                    await asyncio.sleep(0)
+                    continue
+                await self._dispatch(client, sub, entries)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if "NOGROUP" in str(e):
+                    # Stream or group deleted underneath us; recreate and carry on
+                    self._groups.discard((sub.channel, sub.group))
+                    with contextlib.suppress(SubscribeError):
+                        await self._ensure_group(sub.channel, sub.group)
+                else:
+                    logger.exception("Error reading stream '%s' as '%s'", sub.channel, sub.consumer)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(sub.stop_event.wait(), timeout=1.0)
+
+    async def _claim_stuck(self, client: Any, sub: _StreamSubscription) -> None:
+        """Take over entries another consumer left pending for longer than claim_idle_ms."""
+        response = await client.xautoclaim(
+            sub.channel,
+            sub.group,
+            sub.consumer,
+            min_idle_time=self._claim_idle_ms,
+            start_id=sub.claim_cursor,
+            count=self._read_count,
+        )
+        sub.claim_cursor = _text(response[0])
+        claimed = response[1]
+        if claimed:
+            sub.stats["claimed"] += len(claimed)
+            logger.info("Consumer '%s' claimed %d stuck entries on '%s'", sub.consumer, len(claimed), sub.channel)
+            # Redis < 7 lists trimmed entries inline with no fields; _dispatch acknowledges those
+            await self._dispatch(client, sub, claimed)
+
+    async def _dispatch(self, client: Any, sub: _StreamSubscription, entries: list[Any]) -> None:
+        acked: list[str] = []
+        for raw_id, fields in entries:
+            entry_id = _text(raw_id)
+            if not fields:
+                # Trimmed by MAXLEN while pending; nothing left to deliver
+                acked.append(entry_id)
+                continue
+            sub.stats["delivered"] += 1
+            payload = fields.get(PAYLOAD_FIELD.encode(), fields.get(PAYLOAD_FIELD))
+            try:
+                message = decode_payload(payload.encode() if isinstance(payload, str) else payload)
+            except Exception:
+                # Undecodable entries would be redelivered forever; drop them from the PEL
+                sub.stats["decode_errors"] += 1
+                logger.exception("Failed to decode entry %s on stream '%s'", entry_id, sub.channel)
+                acked.append(entry_id)
+                continue
+
+            if not sub.auto_ack:
+                if not isinstance(message, dict):
+                    message = {"payload": message}
+                message[STREAM_KEY] = sub.channel
+                message[STREAM_GROUP_KEY] = sub.group
+                message[STREAM_ID_KEY] = entry_id
+
+            try:
+                await sub.handler(sub.channel, message)
+            except Exception:
+                # Left pending: redelivered by XAUTOCLAIM once idle
+                sub.stats["handler_errors"] += 1
+                logger.exception("Handler failed for entry %s on stream '%s'", entry_id, sub.channel)
+                continue
+            if sub.auto_ack:
+                acked.append(entry_id)
+
+        if acked:
+            await client.xack(sub.channel, sub.group, *acked)
+            sub.stats["acked"] += len(acked)
+
+
+# Global singleton instance
+_streams_instance: RedisStreams | None = None
+
+
+async def get_streams() -> RedisStreams:
+    """Get the process-wide RedisStreams instance, sharing the Pub/Sub connection.
+
+    Returns
+    -------
+        Configured RedisStreams instance
+
+    """
+    global _streams_instance
+    if _streams_instance is None:
+        config = get_redis_config()
+        _streams_instance = RedisStreams(
+            await get_pubsub(),
+            maxlen=config.redis_stream_maxlen,
+            read_count=config.redis_stream_read_count,
+            block_ms=config.redis_stream_block_ms,
+            claim_idle_ms=config.redis_stream_claim_idle_ms,
+        )
+    return _streams_instance
+
+
+async def cleanup_streams() -> None:
+    """Stop every consumer of the singleton RedisStreams instance."""
+    global _streams_instance
+    if _streams_instance:
+        try:
+            await _streams_instance.disconnect()
+        except Exception:
+            # Log but don't raise - cleanup should be graceful
+            logger.exception("Error during streams cleanup")
+        finally:
+            _streams_instance = None
@@ -3,6 +3,8 @@
 Enhanced utilities with improved type safety and async support.
 """
 
+from core_v2.utils.log_policy import LogAdmissionPolicy, configure_log_policy, get_log_policy
+from core_v2.utils.log_writer import LogEventWriter, get_log_writer, shutdown_log_writer
 from core_v2.utils.logger import (
     get_logger,
     log_event,
@@ -12,9 +14,15 @@ from core_v2.utils.logger import (
 )
 
 __all__ = [
+    "LogAdmissionPolicy",
+    "LogEventWriter",
+    "configure_log_policy",
+    "get_log_policy",
+    "get_log_writer",
     "get_logger",
     "log_event",
     "log_event_async",
     "logger",
     "mem",
+    "shutdown_log_writer",
 ]
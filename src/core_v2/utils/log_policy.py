@@ -0,0 +1,237 @@
+"""Admission control and sampling policy for log_event.
+
+Every ``log_event`` call with a memo becomes an L1 write. Under load the audit
+trail can generate more database traffic than the work it describes, so this
+module decides - before any payload is built - whether an event is kept.
+
+Policy model:
+- Rules match on source (``"*"`` for any) and a set of tags that must all be present
+- The first matching rule applies its sampling ratio, then its token-bucket rate limit
+- Events carrying an "always keep" tag (``error`` by default) bypass every rule
+- Rules are loaded from settings and can be replaced at runtime
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+logger: logging.Logger = logging.getLogger("cos.log_policy")
+
+DEFAULT_ALWAYS_KEEP_TAGS = ("error",)
+
+AdmissionOutcome = Literal["kept", "sampled_out", "rate_limited"]
+
+
+@dataclass(slots=True)
+class LogPolicyRule:
+    """A single declarative admission rule."""
+
+    source: str = "*"
+    tags: frozenset[str] = field(default_factory=frozenset)
+    sample_rate: float = 1.0
+    rate_limit: float | None = None  # events per second
+    burst: int | None = None
+
+    def matches(self, source: str, tags: frozenset[str]) -> bool:
+        """Return True if the rule applies to an event with this source and tags."""
+        return (self.source in ("*", source)) and self.tags <= tags
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert rule to a JSON-friendly dictionary."""
+        return {
+            "source": self.source,
+            "tags": sorted(self.tags),
+            "sample_rate": self.sample_rate,
+            "rate_limit": self.rate_limit,
+            "burst": self.burst,
+        }
+
+
+class TokenBucket:
+    """Token bucket rate limiter refilled lazily on each acquire."""
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Initialize bucket with ``rate`` tokens/second and ``burst`` capacity."""
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        """Take one token if available."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+def parse_rules(raw_rules: Iterable[Mapping[str, Any]]) -> list[LogPolicyRule]:
+    """Build rules from dictionaries (e.g. the ``LOG_POLICY_RULES`` setting).
+
+    Raises
+    ------
+        ValueError: If a sample rate or rate limit is out of range
+
+    """
+    rules = []
+    for raw in raw_rules:
+        rule = LogPolicyRule(
+            source=str(raw.get("source", "*")),
+            tags=frozenset(raw.get("tags") or ()),
+            sample_rate=float(raw.get("sample_rate", 1.0)),
+            rate_limit=float(raw["rate_limit"]) if raw.get("rate_limit") is not None else None,
+            burst=int(raw["burst"]) if raw.get("burst") is not None else None,
+        )
+        if not 0.0 <= rule.sample_rate <= 1.0:
+            msg = f"sample_rate must be between 0 and 1, got {rule.sample_rate}"
+            raise ValueError(msg)
+        if rule.rate_limit is not None and rule.rate_limit <= 0:
+            msg = f"rate_limit must be positive, got {rule.rate_limit}"
+            raise ValueError(msg)
+        rules.append(rule)
+    return rules
+
+
+class LogAdmissionPolicy:
+    """Decides whether a log event is persisted and counts the outcome."""
+
+    def __init__(
+        self,
+        rules: Iterable[LogPolicyRule] = (),
+        always_keep_tags: Iterable[str] = DEFAULT_ALWAYS_KEEP_TAGS,
+        random_func: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize policy.
+
+        Args:
+        ----
+            rules: Ordered rules; the first match wins
+            always_keep_tags: Tags that force an event to be kept
+            random_func: Source of uniform [0, 1) values (injectable for tests)
+
+        """
+        self._random = random_func
+        self._lock = threading.Lock()
+        self._rules: list[LogPolicyRule] = []
+        self._buckets: dict[int, TokenBucket] = {}
+        self._always_keep: frozenset[str] = frozenset()
+        self._counters: dict[str, dict[str, int]] = {}
+        self.configure(rules, always_keep_tags)
+
+    def configure(self, rules: Iterable[LogPolicyRule], always_keep_tags: Iterable[str] | None = None) -> None:
+        """Replace the active rule set at runtime. Counters are preserved."""
+        new_rules = list(rules)
+        buckets = {
+            index: TokenBucket(rule.rate_limit, rule.burst)
+            for index, rule in enumerate(new_rules)
+            if rule.rate_limit is not None
+        }
+        with self._lock:
+            self._rules = new_rules
+            self._buckets = buckets
+            if always_keep_tags is not None:
+                self._always_keep = frozenset(always_keep_tags)
+
+    def admit(self, source: str, tags: Iterable[str] | None) -> bool:
+        """Return True if the event should be persisted."""
+        return self.decide(source, tags) == "kept"
+
+    def decide(self, source: str, tags: Iterable[str] | None) -> AdmissionOutcome:
+        """Decide whether the event is kept, sampled out or rate limited, and count the outcome."""
+        tag_set = frozenset(tags or ())
+        outcome: AdmissionOutcome = "kept"
+
+        with self._lock:
+            if not self._always_keep & tag_set:
+                for index, rule in enumerate(self._rules):
+                    if not rule.matches(source, tag_set):
+                        continue
+                    if rule.sample_rate < 1.0 and self._random() >= rule.sample_rate:
+                        outcome = "sampled_out"
+                    else:
+                        bucket = self._buckets.get(index)
+                        if bucket is not None and not bucket.try_acquire():
+                            outcome = "rate_limited"
+                    break
+            self._count(source, outcome)
+
+        return outcome
+
+    def reset_metrics(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counters.clear()
+
+    @property
+    def rules(self) -> list[LogPolicyRule]:
+        """Get a copy of the active rules."""
+        return list(self._rules)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get kept/dropped counters overall and per source."""
+        with self._lock:
+            by_source = {source: counts.copy() for source, counts in self._counters.items()}
+        totals = {"kept": 0, "sampled_out": 0, "rate_limited": 0}
+        for counts in by_source.values():
+            for outcome, value in counts.items():
+                totals[outcome] += value
+        return {
+            **totals,
+            "dropped": totals["sampled_out"] + totals["rate_limited"],
+            "by_source": by_source,
+            "rules": [rule.to_dict() for rule in self._rules],
+            "always_keep_tags": sorted(self._always_keep),
+        }
+
+    def _count(self, source: str, outcome: str) -> None:
+        # Caller holds self._lock
+        counts = self._counters.setdefault(source, {"kept": 0, "sampled_out": 0, "rate_limited": 0})
+        counts[outcome] += 1
+
+
+# Process-wide singleton
+_policy: LogAdmissionPolicy | None = None
+
+
+def get_log_policy() -> LogAdmissionPolicy:
+    """Get the process-wide admission policy, loaded from settings on first use."""
+    global _policy
+    if _policy is None:
+        try:
+            from src.common.config import get_settings
+
+            settings = get_settings()
+            _policy = LogAdmissionPolicy(
+                rules=parse_rules(settings.LOG_POLICY_RULES),
+                always_keep_tags=settings.LOG_POLICY_ALWAYS_KEEP_TAGS,
+            )
+        except Exception:
+            # Settings unavailable or invalid - admit everything rather than lose audit events
+            logger.exception("Invalid log admission policy settings; admitting all log events")
+            _policy = LogAdmissionPolicy()
+    return _policy
+
+
+def configure_log_policy(
+    rules: Iterable[Mapping[str, Any]], always_keep_tags: Iterable[str] | None = None
+) -> LogAdmissionPolicy:
+    """Replace the process-wide rules at runtime.
+
+    Raises
+    ------
+        ValueError: If any rule is invalid (the active rules are left unchanged)
+
+    """
+    policy = get_log_policy()
+    policy.configure(parse_rules(rules), always_keep_tags)
+    return policy
@@ -0,0 +1,332 @@
+"""Background batched writer for L1 log events.
+
+``log_event`` is called from every CRUD helper, router handler and graph
+operation. Writing each event synchronously costs a database round trip (and,
+inside a running event loop, used to cost a thread pool and a fresh event
+loop per call). This module provides a process-wide writer that accepts events
+into a bounded in-memory queue and drains them from a single background task,
+grouping ``BaseLog``/``EventLog`` rows into multi-row INSERTs per flush.
+
+Key Features:
+- Non-blocking ``submit`` that returns in microseconds
+- Client-side UUIDs so callers get record IDs before the write happens
+- Bounded queue with drop accounting instead of unbounded memory growth
+- Queue depth, drop count and flush latency metrics
+- One upsert per flush for content-addressed payload blobs (``LOG_PAYLOAD_DEDUP``)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger: logging.Logger = logging.getLogger("cos.log_writer")
+
+# Defaults used when settings are unavailable
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_MAX_BATCH = 500
+DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+DEFAULT_SHUTDOWN_TIMEOUT = 5.0  # seconds to let an in-flight batch finish
+
+
+@dataclass(slots=True)
+class PendingLogEvent:
+    """A log event accepted by the writer but not yet persisted."""
+
+    base_log_id: uuid.UUID
+    event_log_id: uuid.UUID
+    source: str
+    message: str
+    payload: dict[str, Any]
+    event_data: dict[str, Any]
+    timestamp: datetime
+    blob: dict[str, Any] | None = None  # payload_blob row when payloads are deduplicated
+
+
+class LogEventWriter:
+    """Bounded queue drained by one background task into batched INSERTs.
+
+    The writer is bound to the event loop that first submits to it. If the
+    loop changes (e.g. successive ``asyncio.run`` calls in tests), pending
+    events are discarded with the old queue and a fresh drain task is started.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        payload_dedup: bool = False,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+        ----
+            queue_size: Maximum number of pending events before new ones are dropped
+            max_batch: Maximum number of events written per INSERT batch
+            flush_interval: Seconds to linger after the first event before flushing
+            payload_dedup: Whether ``log_event`` stores shared payload content as blobs
+            session_maker: Optional async session factory (resolved lazily if omitted)
+
+        """
+        self._queue_size = queue_size
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._payload_dedup = payload_dedup
+        self._session_maker = session_maker
+
+        self._queue: asyncio.Queue[PendingLogEvent] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stop: asyncio.Event | None = None
+        self._idle = False  # True while the drain task waits for an event with no batch in hand
+
+        # Metrics
+        self._submitted_count = 0
+        self._written_count = 0
+        self._dropped_count = 0
+        self._failed_count = 0
+        self._flush_count = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    # ----- Public API -----------------------------------------------------
+    def submit(self, event: PendingLogEvent) -> bool:
+        """Enqueue an event for background persistence.
+
+        Must be called from within a running event loop.
+
+        Returns
+        -------
+            True if the event was queued, False if it was dropped
+
+        """
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._dropped_count += 1
+            return False
+        self._submitted_count += 1
+        return True
+
+    async def flush(self) -> None:
+        """Write everything currently queued, bypassing the linger window."""
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            await self._write_batch(self._drain_nowait([]))
+
+    async def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Stop the drain task and persist any remaining events.
+
+        The batch the drain task already holds is written before it stops.
+        It is only cancelled if that write takes longer than ``timeout``.
+
+        Args:
+        ----
+            timeout: Seconds to wait for the in-flight batch before cancelling
+
+        """
+        task = self._task
+        if task is not None and not task.done():
+            assert self._stop is not None  # nosec B101
+            self._stop.set()
+            if self._idle:
+                # Waiting on an empty queue: nothing is in hand, and a cancelled get leaves items queued
+                task.cancel()
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if not done:
+                logger.warning(f"Log event writer did not finish its batch within {timeout}s, cancelling")
+                task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._task = None
+        await self.flush()
+
+    @property
+    def payload_dedup(self) -> bool:
+        """Whether shared payload content is stored content-addressed (``LOG_PAYLOAD_DEDUP``)."""
+        return self._payload_dedup
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get writer metrics for monitoring."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self._queue_size,
+            "submitted_count": self._submitted_count,
+            "written_count": self._written_count,
+            "dropped_count": self._dropped_count,
+            "failed_count": self._failed_count,
+            "flush_count": self._flush_count,
+            "last_flush_ms": self._last_flush_ms,
+            "max_flush_ms": self._max_flush_ms,
+            "avg_flush_ms": self._total_flush_ms / max(1, self._flush_count),
+        }
+
+    # ----- Internal logic -------------------------------------------------
+    def _ensure_started(self) -> asyncio.Queue[PendingLogEvent]:
+        """Bind to the running loop and start the drain task if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self._queue_size)
+            self._loop = loop
+            self._task = None
+        if self._task is None or self._task.done():
+            self._stop = asyncio.Event()
+            self._task = loop.create_task(self._drain_loop(), name="log-event-writer")
+        return self._queue
+
+    def _drain_nowait(self, batch: list[PendingLogEvent]) -> list[PendingLogEvent]:
+        """Move queued events into ``batch`` up to the batch size limit."""
+        assert self._queue is not None  # nosec B101
+        while len(batch) < self._max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _drain_loop(self) -> None:
+        """Wait for events, linger briefly, then flush them as one batch.
+
+        Returns once ``shutdown`` sets the stop event, after writing the batch
+        in hand; the linger is cut short rather than cancelled.
+        """
+        assert self._queue is not None and self._stop is not None  # nosec B101
+        queue = self._queue
+        stop = self._stop
+        try:
+            while not stop.is_set():
+                self._idle = True
+                try:
+                    batch = [await queue.get()]
+                finally:
+                    self._idle = False
+                # Linger so concurrent callers share the INSERT, unless a full batch is already waiting
+                if queue.qsize() < self._max_batch - 1:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(stop.wait(), self._flush_interval)
+                await self._write_batch(self._drain_nowait(batch))
+                # The database driver can swallow a cancellation that lands mid-write
+                # (while tearing down the connection), so honour a pending cancel here
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise asyncio.CancelledError
+        except asyncio.CancelledError:
+            logger.debug("Log event writer drain loop cancelled")
+            raise
+        except Exception:
+            # Catch all exceptions to prevent the writer from dying silently
+            logger.exception("Log event writer drain loop crashed")
+
+    async def _write_batch(self, batch: list[PendingLogEvent]) -> None:
+        """Persist a batch with one multi-row INSERT per table (plus one blob upsert when deduplicating)."""
+        if not batch:
+            return
+
+        from sqlalchemy import insert
+
+        from src.backend.cc.mem0_models import BaseLog, EventLog
+        from src.backend.cc.payload_store import store_blobs
+
+        base_rows = [
+            {
+                "id": item.base_log_id,
+                "timestamp": item.timestamp,
+                "level": "INFO",
+                "message": item.message,
+                "payload": item.payload,
+                "payload_hash": item.blob["hash"] if item.blob is not None else None,
+            }
+            for item in batch
+        ]
+        event_rows = [
+            {
+                "id": item.event_log_id,
+                "base_log_id": item.base_log_id,
+                "event_type": f"{item.source}.event",
+                "event_data": item.event_data,
+                "payload_hash": item.blob["hash"] if item.blob is not None else None,
+                "created_at": item.timestamp,
+            }
+            for item in batch
+        ]
+
+        blobs = [item.blob for item in batch if item.blob is not None]
+
+        start = time.perf_counter()
+        try:
+            async with self._get_session_maker()() as session:
+                if blobs:
+                    await store_blobs(session, blobs)
+                await session.execute(insert(BaseLog).values(base_rows))
+                await session.execute(insert(EventLog).values(event_rows))
+                await session.commit()
+        except Exception as e:
+            self._failed_count += len(batch)
+            logger.error(f"Failed to write {len(batch)} log events to database: {e}")
+            return
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._flush_count += 1
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+
+        self._written_count += len(batch)
+
+    def _get_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        """Resolve the session factory once and reuse its engine for every flush."""
+        if self._session_maker is None:
+            from src.db.connection import get_async_session_maker
+
+            self._session_maker = get_async_session_maker()
+        return self._session_maker
+
+
+# Process-wide singleton
+_writer: LogEventWriter | None = None
+
+
+def get_log_writer() -> LogEventWriter:
+    """Get the process-wide log event writer, configured from settings."""
+    global _writer
+    if _writer is None:
+        try:
+            from src.common.config import get_settings
+
+            settings = get_settings()
+            _writer = LogEventWriter(
+                queue_size=settings.LOG_WRITER_QUEUE_SIZE,
+                max_batch=settings.LOG_WRITER_MAX_BATCH,
+                flush_interval=settings.LOG_WRITER_FLUSH_INTERVAL_MS / 1000,
+                payload_dedup=settings.LOG_PAYLOAD_DEDUP,
+            )
+        except Exception:
+            # Settings unavailable (e.g. isolated tooling) - fall back to defaults
+            _writer = LogEventWriter()
+    return _writer
+
+
+async def shutdown_log_writer() -> None:
+    """Flush and stop the process-wide writer. Call this on application shutdown."""
+    global _writer
+    if _writer is not None:
+        try:
+            await _writer.shutdown()
+        finally:
+            _writer = None
@@ -6,6 +6,9 @@ integration following the COS memory architecture.
 Key Features:
 - Rich console logging with color support
 - Async-first design with sync compatibility
+- Non-blocking batched writes when called inside a running event loop
+- Per-source/tag sampling and rate limiting of persisted events
+- Optional content-addressed storage of repeated payloads
 - PostgreSQL event storage integration
 - Type-safe interfaces with full type hints
 - Mem0 integration placeholder for future enhancements
@@ -14,12 +17,12 @@ Key Features:
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
 import logging
 import uuid
 from datetime import UTC, datetime
 from typing import Any, TypedDict
 
+from core_v2.utils.log_policy import get_log_policy
 from rich.logging import RichHandler
 
 # Configure rich logging handler
@@ -68,8 +71,12 @@ def log_event(
 ) -> LogEventResponse:
     """Log a structured memory event to PostgreSQL L1 memory.
 
-    This function handles both sync and async contexts automatically,
-    ensuring compatibility across different execution environments.
+    This function handles both sync and async contexts automatically. Outside
+    an event loop the event is written before returning. Inside a running loop
+    the event is queued on the background writer (see ``core_v2.utils.log_writer``)
+    and the response carries the pre-generated record IDs with status ``queued``.
+    Events rejected by the admission policy (see ``core_v2.utils.log_policy``)
+    return status ``sampled_out`` or ``rate_limited`` without touching the database.
 
     Args:
     ----
@@ -85,28 +92,124 @@ def log_event(
 
     """
     try:
-        # Try to get current event loop
         asyncio.get_running_loop()
-        # If we're in an event loop, we can't use asyncio.run()
-        # Create a task instead using a thread pool
-
-        def run_in_thread() -> LogEventResponse:
-            """Run async function in a new event loop within a thread."""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(log_event_async(source, data, tags, key, memo))
-            finally:
-                new_loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
-            return future.result(timeout=10)  # 10 second timeout
-
     except RuntimeError:
-        # No event loop running, safe to use asyncio.run()
+        # No event loop running, safe to use asyncio.run(); log_event_async applies the admission policy
         return asyncio.run(log_event_async(source, data, tags, key, memo))
 
+    rejected = _admission_response(source, data, tags, key, memo)
+    if rejected is not None:
+        return rejected
+
+    # Inside a running loop we must not block: hand the event to the background writer
+    return _submit_to_writer(source, data, tags, key, memo)
+
+
+def _admission_response(
+    source: str, data: str | dict[str, Any], tags: list[str] | None, key: str | None, memo: str | None
+) -> LogEventResponse | None:
+    """Apply the admission policy, returning the response for a rejected event or None to persist it."""
+    # Only events that would be persisted are subject to sampling
+    if memo is None:
+        return None
+    outcome = get_log_policy().decide(source, tags)
+    if outcome == "kept":
+        return None
+    return LogEventResponse(status=outcome, id=key or f"log-{source}-{uuid.uuid4().hex[:8]}", memo=memo, data=data)
+
+
+def _build_payload(
+    source: str, data: str | dict[str, Any], tags: list[str] | None, log_id: str, memo: str | None
+) -> dict[str, Any]:
+    """Build the structured BaseLog payload shared by the sync and batched write paths."""
+    payload: dict[str, Any] = {
+        "source": source,
+        "data": data,
+        "tags": tags or [],
+        "timestamp": datetime.now(UTC).isoformat(),
+        "log_id": log_id,
+    }
+
+    # Only include memo if provided
+    if memo is not None:
+        payload["memo"] = memo
+
+    return payload
+
+
+def _payload_dedup_enabled() -> bool:
+    """Check whether shared payload content is stored content-addressed (``LOG_PAYLOAD_DEDUP``).
+
+    The setting is read once, with the other writer settings, when the writer is created.
+    """
+    from core_v2.utils.log_writer import get_log_writer
+
+    enabled: bool = get_log_writer().payload_dedup
+    return enabled
+
+
+def _split_payloads(
+    payload: dict[str, Any], event_data: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Move the data/tags/memo shared by BaseLog.payload and EventLog.event_data into one blob.
+
+    Returns
+    -------
+        Tuple of (payload_blob row, inline BaseLog payload, inline EventLog event data)
+
+    """
+    from src.backend.cc.payload_store import blob_row, split_shared
+
+    shared, payload_inline = split_shared(payload)
+    _, event_inline = split_shared(event_data)
+    return blob_row(shared), payload_inline, event_inline
+
+
+def _submit_to_writer(
+    source: str,
+    data: str | dict[str, Any],
+    tags: list[str] | None,
+    key: str | None,
+    memo: str | None,
+) -> LogEventResponse:
+    """Queue an event on the background writer and return without waiting for the database."""
+    from core_v2.utils.log_writer import PendingLogEvent, get_log_writer
+
+    log_id = key or f"log-{source}-{uuid.uuid4().hex[:8]}"
+
+    # Match log_event_async: events without a memo are not persisted
+    if memo is None:
+        return LogEventResponse(status="mem0_stub", id=log_id, memo=None, data=data)
+
+    payload = _build_payload(source, data, tags, log_id, memo)
+    event_data: dict[str, Any] = {"data": data, "tags": tags or [], "memo": memo, "log_id": log_id}
+    blob = None
+    if _payload_dedup_enabled():
+        blob, payload, event_data = _split_payloads(payload, event_data)
+
+    pending = PendingLogEvent(
+        base_log_id=uuid.uuid4(),
+        event_log_id=uuid.uuid4(),
+        source=source,
+        message=f"[{source}] {memo or 'Event logged'}",
+        payload=payload,
+        event_data=event_data,
+        timestamp=datetime.now(UTC),
+        blob=blob,
+    )
+
+    if not get_log_writer().submit(pending):
+        return LogEventResponse(status="dropped", id=log_id, error="log writer queue full", memo=memo, data=data)
+
+    return LogEventResponse(
+        status="queued",
+        id=log_id,
+        base_log_id=str(pending.base_log_id),
+        event_log_id=str(pending.event_log_id),
+        memo=memo,
+        data=data,
+    )
+
 
 async def log_event_async(
     source: str,
@@ -117,7 +220,8 @@ async def log_event_async(
 ) -> LogEventResponse:
     """Async version of log_event for use in async contexts.
 
-    This is the core implementation that writes to PostgreSQL.
+    This is the core implementation that writes to PostgreSQL. The admission
+    policy applies as in :func:`log_event`.
 
     Args:
     ----
@@ -132,23 +236,18 @@ async def log_event_async(
         Response dictionary with database IDs and status
 
     """
+    rejected = _admission_response(source, data, tags, key, memo)
+    if rejected is not None:
+        return rejected
+
     from src.backend.cc.mem0_models import BaseLog, EventLog
+    from src.backend.cc.payload_store import store_blobs
     from src.db.connection import get_async_session_maker
 
     log_id = key or f"log-{source}-{uuid.uuid4().hex[:8]}"
 
     # Create structured payload
-    payload: dict[str, Any] = {
-        "source": source,
-        "data": data,
-        "tags": tags or [],
-        "timestamp": datetime.now(UTC).isoformat(),
-        "log_id": log_id,
-    }
-
-    # Only include memo if provided
-    if memo is not None:
-        payload["memo"] = memo
+    payload = _build_payload(source, data, tags, log_id, memo)
 
     # Return stub response immediately if memo is None
     if memo is None:
@@ -159,15 +258,25 @@ async def log_event_async(
             data=data,
         )
 
+    event_data: dict[str, Any] = {"data": data, "tags": tags or [], "memo": memo, "log_id": log_id}
+    blob = None
+    if _payload_dedup_enabled():
+        blob, payload, event_data = _split_payloads(payload, event_data)
+
     try:
         # Get database session
         async_session_maker = get_async_session_maker()
-        async with async_session_maker() as session:  # type: ignore[attr-defined]
+        async with async_session_maker() as session:
+            # Store the shared content once; both log rows reference it by hash
+            if blob is not None:
+                await store_blobs(session, [blob])
+
             # Create BaseLog entry
             base_log = BaseLog(
                 level="INFO",
                 message=f"[{source}] {memo or 'Event logged'}",
                 payload=payload,
+                payload_hash=blob["hash"] if blob is not None else None,
             )
             session.add(base_log)
             await session.flush()  # Get the ID
@@ -176,12 +285,8 @@ async def log_event_async(
             event_log = EventLog(
                 base_log_id=base_log.id,
                 event_type=f"{source}.event",
-                event_data={
-                    "data": data,
-                    "tags": tags or [],
-                    "memo": memo,
-                    "log_id": log_id,
-                },
+                event_data=event_data,
+                payload_hash=blob["hash"] if blob is not None else None,
             )
             session.add(event_log)
 
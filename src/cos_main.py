@@ -14,15 +14,18 @@ if str(src_path) not in sys.path:
 # Now import with consistent paths using src prefix
 from fastapi import FastAPI  # noqa: E402
 
+from src.backend.cc.cc_main import lifespan  # noqa: E402
 from src.backend.cc.router import router  # noqa: E402
 from src.common.logger import log_event  # noqa: E402
 from src.graph.router import router as graph_router  # noqa: E402
 
-# Create the FastAPI application instance
+# Create the FastAPI application instance. It serves the CC router, so it runs the CC lifespan:
+# background jobs (outbox relay, partition maintenance, rollups) and the log writer flush on shutdown
 app: FastAPI = FastAPI(
     title="COS Backend",
     description="Control and Orchestration System API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Mount the CC router
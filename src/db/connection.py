@@ -10,9 +10,9 @@ from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import Session, sessionmaker
 
 from src.common.logger import get_logger
 
@@ -90,16 +90,15 @@ def get_async_engine() -> AsyncEngine:
     return _create_engine_impl(db_url)
 
 
-def get_async_session_maker() -> sessionmaker[Session]:
+def get_async_session_maker() -> async_sessionmaker[AsyncSession]:
     """Get session maker - removes @lru_cache during Phase 2 to prevent caching issues."""
     engine = get_async_engine()
-    maker: sessionmaker[Session] = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
-    return maker
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     async_session = get_async_session_maker()
-    async with async_session() as session:  # type: ignore
+    async with async_session() as session:
         try:
             yield session
         finally:
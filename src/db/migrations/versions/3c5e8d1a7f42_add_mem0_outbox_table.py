@@ -0,0 +1,58 @@
+"""add_mem0_outbox_table.
+
+Revision ID: 3c5e8d1a7f42
+Revises: 1427af293951
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5e8d1a7f42"
+down_revision: str | None = "1427af293951"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create mem0_cc durable outbox table for L1 Redis publishing."""
+    op.create_table(
+        "outbox",
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            sa.Identity(always=False),
+            primary_key=True,
+            nullable=False,
+            comment="Outbox sequence",
+        ),
+        sa.Column("channel", sa.String(length=200), nullable=False, comment="Redis channel to publish to"),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Message payload",
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+            comment="UTC timestamp the message was enqueued",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        schema="mem0_cc",
+    )
+
+    op.create_index("ix_outbox_created_at", "outbox", ["created_at"], unique=False, schema="mem0_cc")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove mem0_cc outbox table."""
+    op.drop_index("ix_outbox_created_at", table_name="outbox", schema="mem0_cc")
+    op.drop_table("outbox", schema="mem0_cc")
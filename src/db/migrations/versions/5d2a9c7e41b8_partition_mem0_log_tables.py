@@ -0,0 +1,140 @@
+"""partition_mem0_log_tables.
+
+Convert mem0_cc.base_log and mem0_cc.event_log into range-partitioned tables.
+
+Existing rows are kept in place: each original table becomes a "history"
+partition covering everything up to the start of tomorrow (UTC), and daily
+partitions are created for the following week. A DEFAULT partition catches
+rows past the last daily partition, so inserts keep working if partition
+maintenance is not running. Further partitions (which take over matching rows
+from DEFAULT) and retention are handled at runtime by
+``src.backend.cc.partitions``.
+
+Postgres requires the partition key in every unique constraint, so the primary
+keys become (id, timestamp) / (id, created_at), and the foreign keys from
+event_log and prompt_trace to base_log(id) are dropped.
+
+Revision ID: 5d2a9c7e41b8
+Revises: 3c5e8d1a7f42
+Create Date: 2026-10-16 11:02:17.503921
+
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a9c7e41b8"
+down_revision: str | None = "3c5e8d1a7f42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = "mem0_cc"
+PREMAKE_DAYS = 7
+
+# table -> (partition key, column DDL, index name -> columns)
+TABLES: dict[str, tuple[str, str, dict[str, str]]] = {
+    "base_log": (
+        "timestamp",
+        """
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        "timestamp" TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        level VARCHAR(50) NOT NULL,
+        message TEXT NOT NULL,
+        payload JSONB
+        """,
+        {
+            "ix_base_log_timestamp": '"timestamp"',
+            "ix_base_log_level": "level",
+            "ix_base_log_level_timestamp": 'level, "timestamp"',
+        },
+    ),
+    "event_log": (
+        "created_at",
+        """
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        base_log_id UUID NOT NULL,
+        event_type VARCHAR(100) NOT NULL,
+        event_data JSONB,
+        request_id UUID,
+        trace_id VARCHAR(100),
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        """,
+        {
+            "ix_event_log_base_log_id": "base_log_id",
+            "ix_event_log_event_type": "event_type",
+            "ix_event_log_request_id": "request_id",
+            "ix_event_log_trace_id": "trace_id",
+            "ix_event_log_created_at": "created_at",
+            "ix_event_log_type_created": "event_type, created_at",
+        },
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema - Range-partition base_log and event_log, keeping existing rows as history partitions."""
+    bind = op.get_bind()
+    cutover: datetime = bind.execute(sa.text("SELECT date_trunc('day', now() AT TIME ZONE 'UTC')")).scalar()
+    cutover = cutover + timedelta(days=1)
+
+    # Unique constraints on a partitioned base_log cannot cover id alone
+    op.execute(f"ALTER TABLE {SCHEMA}.event_log DROP CONSTRAINT IF EXISTS event_log_base_log_id_fkey")
+    op.execute(f"ALTER TABLE {SCHEMA}.prompt_trace DROP CONSTRAINT IF EXISTS prompt_trace_base_log_id_fkey")
+
+    for table, (key, columns, indexes) in TABLES.items():
+        history = f"{table}_history"
+
+        # Free the index and constraint names for the new parent, then rename the original table
+        for index_name in indexes:
+            op.execute(f"DROP INDEX IF EXISTS {SCHEMA}.{index_name}")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f'ALTER TABLE {SCHEMA}.{table} ADD CONSTRAINT {history}_pkey PRIMARY KEY (id, "{key}")')
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} RENAME TO {history}")
+
+        op.execute(
+            f'CREATE TABLE {SCHEMA}.{table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id, "{key}")) '
+            f'PARTITION BY RANGE ("{key}")'
+        )
+        for index_name, index_columns in indexes.items():
+            op.execute(f"CREATE INDEX {index_name} ON {SCHEMA}.{table} ({index_columns})")
+
+        op.execute(
+            f"ALTER TABLE {SCHEMA}.{table} ATTACH PARTITION {SCHEMA}.{history} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{cutover.isoformat()}+00:00')"
+        )
+
+        start = cutover
+        for _ in range(PREMAKE_DAYS):
+            end = start + timedelta(days=1)
+            op.execute(
+                f"CREATE TABLE {SCHEMA}.{table}_p{start:%Y%m%d} PARTITION OF {SCHEMA}.{table} "
+                f"FOR VALUES FROM ('{start.isoformat()}+00:00') TO ('{end.isoformat()}+00:00')"
+            )
+            start = end
+
+        op.execute(f"CREATE TABLE {SCHEMA}.{table}_default PARTITION OF {SCHEMA}.{table} DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Copy partitioned rows back into plain tables and restore foreign keys."""
+    for table, (_key, columns, indexes) in TABLES.items():
+        op.execute(f"CREATE TABLE {SCHEMA}.{table}_flat ({columns}, CONSTRAINT {table}_flat_pkey PRIMARY KEY (id))")
+        op.execute(f"INSERT INTO {SCHEMA}.{table}_flat SELECT * FROM {SCHEMA}.{table}")  # noqa: S608
+        op.execute(f"DROP TABLE {SCHEMA}.{table} CASCADE")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table}_flat RENAME TO {table}")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} RENAME CONSTRAINT {table}_flat_pkey TO {table}_pkey")
+        for index_name, index_columns in indexes.items():
+            op.execute(f"CREATE INDEX {index_name} ON {SCHEMA}.{table} ({index_columns})")
+
+    op.execute(
+        f"ALTER TABLE {SCHEMA}.event_log ADD CONSTRAINT event_log_base_log_id_fkey "
+        f"FOREIGN KEY (base_log_id) REFERENCES {SCHEMA}.base_log (id) ON DELETE CASCADE"
+    )
+    op.execute(
+        f"ALTER TABLE {SCHEMA}.prompt_trace ADD CONSTRAINT prompt_trace_base_log_id_fkey "
+        f"FOREIGN KEY (base_log_id) REFERENCES {SCHEMA}.base_log (id) ON DELETE CASCADE"
+    )
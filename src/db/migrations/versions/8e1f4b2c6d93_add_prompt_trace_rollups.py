@@ -0,0 +1,81 @@
+"""add_prompt_trace_rollups.
+
+Revision ID: 8e1f4b2c6d93
+Revises: 5d2a9c7e41b8
+Create Date: 2026-10-16 13:41:52.287316
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8e1f4b2c6d93"
+down_revision: str | None = "5d2a9c7e41b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create hourly prompt_trace rollup and rollup watermark tables."""
+    op.create_table(
+        "prompt_trace_rollup",
+        sa.Column(
+            "bucket_start",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Start of the UTC hour covered by this rollup",
+        ),
+        sa.Column("call_count", sa.BigInteger(), nullable=False, comment="Number of prompt traces"),
+        sa.Column("total_tokens", sa.BigInteger(), nullable=False, comment="Sum of token_count"),
+        sa.Column("total_execution_ms", sa.BigInteger(), nullable=False, comment="Sum of execution_time_ms"),
+        sa.Column(
+            "latency_sketch",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Mergeable execution_time_ms quantile sketch",
+        ),
+        sa.Column(
+            "token_sketch",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Mergeable token_count quantile sketch",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+            comment="UTC timestamp of the last fold into this rollup",
+        ),
+        sa.PrimaryKeyConstraint("bucket_start"),
+        schema="mem0_cc",
+    )
+
+    op.create_table(
+        "rollup_watermark",
+        sa.Column("name", sa.String(length=100), nullable=False, comment="Rollup job name"),
+        sa.Column(
+            "last_created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=True,
+            comment="created_at of the last folded row",
+        ),
+        sa.Column(
+            "last_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="ID of the last folded row (tie breaker)",
+        ),
+        sa.PrimaryKeyConstraint("name"),
+        schema="mem0_cc",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove prompt_trace rollup tables."""
+    op.drop_table("rollup_watermark", schema="mem0_cc")
+    op.drop_table("prompt_trace_rollup", schema="mem0_cc")
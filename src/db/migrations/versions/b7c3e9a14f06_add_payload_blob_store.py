@@ -0,0 +1,87 @@
+"""add_payload_blob_store.
+
+Add the content-addressed ``payload_blob`` table and a nullable ``payload_hash``
+reference on ``base_log`` and ``event_log``.
+
+Existing rows are not rewritten: with no ``payload_hash`` they keep resolving to
+their inline JSON, and they age out through partition retention. New rows only
+use the blob store once ``LOG_PAYLOAD_DEDUP`` is enabled, so the migration can
+be applied ahead of the rollout.
+
+Revision ID: b7c3e9a14f06
+Revises: 8e1f4b2c6d93
+Create Date: 2026-10-16 15:20:44.918273
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c3e9a14f06"
+down_revision: str | None = "8e1f4b2c6d93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LOG_TABLES = ("base_log", "event_log")
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create payload_blob and add payload_hash to the L1 log tables."""
+    op.create_table(
+        "payload_blob",
+        sa.Column("hash", sa.String(length=64), nullable=False, comment="SHA-256 hex digest of canonical content"),
+        sa.Column(
+            "content",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Shared payload content",
+        ),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, comment="Canonical JSON size in bytes"),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+            comment="UTC timestamp of first use",
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+            comment="UTC timestamp of the latest reuse (refreshed at most hourly)",
+        ),
+        sa.PrimaryKeyConstraint("hash"),
+        schema="mem0_cc",
+    )
+
+    # Adding a nullable column without a default is a catalog-only change, also on partitioned tables
+    for table in LOG_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "payload_hash",
+                sa.String(length=64),
+                nullable=True,
+                comment="SHA-256 of the shared payload_blob content",
+            ),
+            schema="mem0_cc",
+        )
+        op.create_index(f"ix_{table}_payload_hash", table, ["payload_hash"], unique=False, schema="mem0_cc")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Inline blob content back into log rows and remove payload_blob."""
+    for table, column in (("base_log", "payload"), ("event_log", "event_data")):
+        op.execute(
+            f"UPDATE mem0_cc.{table} AS log SET {column} = blob.content || COALESCE(log.{column}, '{{}}'::jsonb) "  # noqa: S608
+            f"FROM mem0_cc.payload_blob AS blob WHERE log.payload_hash = blob.hash"
+        )
+        op.drop_index(f"ix_{table}_payload_hash", table_name=table, schema="mem0_cc")
+        op.drop_column(table, "payload_hash", schema="mem0_cc")
+
+    op.drop_table("payload_blob", schema="mem0_cc")
@@ -0,0 +1,48 @@
+"""add_prompt_trace_rollup_refold.
+
+Add the queue of rollup hours that must be rebuilt because prompt traces were
+backfilled with a ``created_at`` already behind the rollup watermark.
+
+Revision ID: c4a19d7e2b53
+Revises: b7c3e9a14f06
+Create Date: 2026-10-16 17:05:12.604118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a19d7e2b53"
+down_revision: str | None = "b7c3e9a14f06"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Create prompt_trace_rollup_refold."""
+    op.create_table(
+        "prompt_trace_rollup_refold",
+        sa.Column(
+            "bucket_start",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Start of the UTC hour to rebuild",
+        ),
+        sa.Column(
+            "requested_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+            comment="UTC timestamp of the first backfill into this hour since the last rebuild",
+        ),
+        sa.PrimaryKeyConstraint("bucket_start"),
+        schema="mem0_cc",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove prompt_trace_rollup_refold."""
+    op.drop_table("prompt_trace_rollup_refold", schema="mem0_cc")
@@ -5,12 +5,15 @@ and fallback to the standard bolt driver. Follows the singleton pattern
 established in src/db/connection.py.
 """
 
+import asyncio
 import os
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import Any
 
+from src.common.adaptive_timeout import AdaptiveTimeouts
 from src.common.config import get_settings
 from src.common.logger import log_event
 
@@ -91,6 +94,8 @@ class Neo4jClient:
         self._user = self.settings.NEO4J_USER
         self._password = self.settings.NEO4J_PASSWORD
         self._is_connected = False
+        # Per-query-type timeouts from observed latency, set up on connect when enabled
+        self.timeouts: AdaptiveTimeouts | None = None
 
     async def connect(self) -> None:
         """Establish connection to Neo4j database."""
@@ -105,6 +110,14 @@ class Neo4jClient:
                     connection_timeout=15,
                 )
 
+                if self.settings.NEO4J_ADAPTIVE_TIMEOUTS and self.timeouts is None:
+                    self.timeouts = AdaptiveTimeouts(
+                        default=self.settings.NEO4J_TIMEOUT_CEILING_S,
+                        floor=self.settings.NEO4J_TIMEOUT_FLOOR_S,
+                        ceiling=self.settings.NEO4J_TIMEOUT_CEILING_S,
+                        multiplier=self.settings.NEO4J_TIMEOUT_MULTIPLIER,
+                    )
+
                 # Verify connectivity
                 await self.verify_connectivity()
                 self._is_connected = True
@@ -181,16 +194,32 @@ class Neo4jClient:
                 raise
 
     async def execute_query(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Execute a Cypher query and return results as a list of dictionaries."""
+        """Execute a Cypher query and return results as a list of dictionaries.
+
+        With adaptive timeouts enabled, the query is cancelled once it runs
+        longer than the timeout derived from recent queries of the same type
+        (first Cypher keyword).
+        """
         async with self.session() as session:
             try:
-                result = await session.run(query, parameters or {})
-                records = [dict(record) async for record in result]
+                query_type = query.strip().split()[0].upper()
+                if self.timeouts is None:
+                    records = await self._fetch(session, query, parameters)
+                else:
+                    timeout = self.timeouts.timeout(query_type)
+                    started = time.perf_counter()
+                    try:
+                        async with asyncio.timeout(timeout):
+                            records = await self._fetch(session, query, parameters)
+                    except TimeoutError:
+                        self.timeouts.record(query_type, timeout, timed_out=True)
+                        raise
+                    self.timeouts.record(query_type, time.perf_counter() - started)
 
                 log_event(
                     source="graph",
                     data={
-                        "query_type": query.strip().split()[0].upper(),
+                        "query_type": query_type,
                         "record_count": len(records),
                         "has_parameters": bool(parameters),
                     },
@@ -212,6 +241,16 @@ class Neo4jClient:
                 )
                 raise Exception(f"Query failed: {e!s}") from e
 
+    @staticmethod
+    async def _fetch(session: AsyncSession, query: str, parameters: dict[str, Any] | None) -> list[dict[str, Any]]:
+        result = await session.run(query, parameters or {})
+        return [dict(record) async for record in result]
+
+    @property
+    def latency_metrics(self) -> dict[str, dict[str, Any]] | None:
+        """Get per-query-type latency quantiles and timeouts, or None when adaptive timeouts are off."""
+        return self.timeouts.metrics if self.timeouts is not None else None
+
     @property
     def is_connected(self) -> bool:
         """Check if the client is connected."""
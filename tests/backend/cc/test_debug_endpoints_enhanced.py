@@ -209,6 +209,18 @@ class TestRedisHealthEndpoint:
                 "last_failure_time": None,
                 "next_attempt_time": None,
             }
+            mock_pubsub.latency_metrics = {
+                "publish": {
+                    "count": 120,
+                    "total": 120,
+                    "timed_out": 0,
+                    "p50_ms": 0.25,
+                    "p99_ms": 0.8,
+                    "p999_ms": 0.9,
+                    "max_ms": 1.2,
+                    "timeout_ms": 50.0,
+                }
+            }
 
             # Mock Redis info
             mock_redis.info.return_value = {
@@ -241,6 +253,8 @@ class TestRedisHealthEndpoint:
             assert "ping_latency_ms" in perf_metrics
             assert isinstance(perf_metrics["ping_latency_ms"], int | float)
             assert perf_metrics["ping_latency_ms"] >= 0
+            assert perf_metrics["operation_latency"]["publish"]["p999_ms"] == 0.9
+            assert perf_metrics["operation_latency"]["publish"]["timeout_ms"] == 50.0
 
 
 class TestRedisHealthAggregation:
@@ -263,6 +277,7 @@ class TestRedisHealthAggregation:
                 "last_failure_time": None,
                 "next_attempt_time": None,
             }
+            mock_pubsub.latency_metrics = None
 
             # Mock Redis info
             mock_redis.info.return_value = {
@@ -306,6 +321,7 @@ class TestRedisHealthAggregation:
                 "last_failure_time": 1234567890,
                 "next_attempt_time": 1234567900,
             }
+            mock_pubsub.latency_metrics = None
 
             # Mock Redis info
             mock_redis.info.return_value = {
@@ -158,7 +158,7 @@ class TestRedisPubSub:
         result = await connected_pubsub.publish("test_channel", message)
 
         assert result == 2
-        mock_redis.publish.assert_called_once_with("test_channel", '{"test":"data","number":42}')
+        mock_redis.publish.assert_called_once_with("test_channel", b'\x01{"test":"data","number":42}')
 
     async def test_publish_not_connected(self, pubsub: RedisPubSub) -> None:
         """Test publishing when not connected (should auto-connect)."""
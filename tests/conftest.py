@@ -535,6 +535,9 @@ async def db_session(event_loop: asyncio.AbstractEventLoop, run_integration_mode
                         # Handle mem0 models dynamically to capture all attributes
                         obj_dict = {"id": obj.id}
                         for attr_name in dir(obj):
+                            # Computed properties (resolved_payload, ...) are derived, not stored
+                            if isinstance(getattr(type(obj), attr_name, None), property):
+                                continue
                             if not attr_name.startswith("_") and not callable(getattr(obj, attr_name)):
                                 try:
                                     value = getattr(obj, attr_name)
@@ -830,6 +833,21 @@ async def db_session(event_loop: asyncio.AbstractEventLoop, run_integration_mode
                 import re
                 from datetime import UTC, datetime
 
+                # Handle multi-row INSERT ... RETURNING id (log_l1_many): store rows, return ids in order
+                if isinstance(params, list) and getattr(query, "is_insert", False):
+                    import uuid
+
+                    table_name = {"base_log": "baselogs", "event_log": "eventlogs", "prompt_trace": "prompttraces"}.get(
+                        query.table.name, query.table.name + "s"
+                    )
+                    table_storage = self._storage.setdefault(table_name, {})
+                    inserted_ids = []
+                    for row in params:
+                        row_id = row.get("id") or uuid.uuid4()
+                        table_storage[str(row_id)] = {**row, "id": row_id}
+                        inserted_ids.append(row_id)
+                    return _MockAsyncResult(inserted_ids)
+
                 # Handle PostgreSQL schema queries specifically for P1 database schema tests
                 query_str = str(query).lower()
 
@@ -1646,6 +1664,21 @@ async def mem0_db_session(db_session: Any) -> AsyncGenerator[Any, None]:
     yield db_session
 
 
+@pytest.fixture
+def mock_session_maker() -> tuple[Any, Any]:
+    """Return a session factory yielding one AsyncMock session, and that session.
+
+    For background workers that take a ``session_maker`` (log writer, outbox relay).
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    session = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=context), session
+
+
 @pytest.fixture(scope="function")
 def test_client(client: TestClient | None) -> TestClient:
     if client is None:
@@ -6,6 +6,7 @@ with both integration and unit testing approaches.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import os
 from collections.abc import AsyncGenerator
@@ -14,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest  # Phase 2: Remove for skip removal
 
+from src.common.adaptive_timeout import AdaptiveTimeouts
 from src.graph.base import (
     USING_RUST_DRIVER,
     Neo4jClient,
@@ -277,6 +279,43 @@ class TestNeo4jClient:
             with pytest.raises(Exception, match="Query failed"):
                 await client.execute_query("INVALID QUERY")
 
+    @pytest.mark.asyncio
+    async def test_execute_query_empty_query_wrapped(self) -> None:
+        """Test an empty query fails with the wrapped query error."""
+        client = Neo4jClient()
+
+        with patch.object(client, "session") as mock_session_cm:
+            mock_session_cm.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+            mock_session_cm.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            with pytest.raises(Exception, match="Query failed"):
+                await client.execute_query("   ")
+
+    @pytest.mark.asyncio
+    async def test_execute_query_adaptive_timeout(self) -> None:
+        """Test that a query slower than its learned timeout is cancelled and recorded."""
+        client = Neo4jClient()
+        client.timeouts = AdaptiveTimeouts(default=5.0, floor=0.05, ceiling=5.0, min_samples=64)
+        for _ in range(64):
+            client.timeouts.record("MATCH", 0.002)
+        assert client.timeouts.timeout("MATCH") == 0.05
+
+        async def stalled_run(*_args: Any) -> Any:
+            await asyncio.sleep(1)
+
+        mock_session = AsyncMock()
+        mock_session.run.side_effect = stalled_run
+
+        with patch.object(client, "session") as mock_session_cm:
+            mock_session_cm.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session_cm.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            with pytest.raises(Exception, match="Query failed"):
+                await client.execute_query("MATCH (n) RETURN n")
+
+        assert client.latency_metrics is not None
+        assert client.latency_metrics["MATCH"]["timed_out"] == 1
+
     def test_is_connected_property(self) -> None:
         """Test the is_connected property."""
         client = Neo4jClient()
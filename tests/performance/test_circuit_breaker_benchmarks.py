@@ -0,0 +1,78 @@
+"""Call overhead benchmarks for the circuit breakers.
+
+Measures the per-call cost ``CircuitBreaker.call`` and
+``SlidingWindowCircuitBreaker.call`` add to a trivial operation while 1,000
+coroutines call through one breaker at the same time, as every Redis
+operation of a process does through the ``RedisPubSub`` breaker. The
+operation yields once so the coroutines interleave. Runs in-process; no
+Redis needed.
+
+Performance Targets:
+- Sliding-window breaker adds less overhead per call than the lock-based one
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from src.common.pubsub import CircuitBreaker
+from src.common.pubsub_breaker import SlidingWindowCircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+COROUTINES = 1_000
+CALLS_PER_COROUTINE = 50
+
+
+async def _operation() -> None:
+    await asyncio.sleep(0)
+
+
+async def _direct(func: Callable[[], Awaitable[Any]]) -> Any:
+    return await asyncio.wait_for(func(), timeout=10.0)
+
+
+async def _time_per_call_us(call: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]]) -> float:
+    async def worker() -> None:
+        for _ in range(CALLS_PER_COROUTINE):
+            await call(_operation)
+
+    # Best of three passes filters out GC pauses and scheduler noise
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(COROUTINES)))
+        best = min(best, (time.perf_counter() - start) / (COROUTINES * CALLS_PER_COROUTINE) * 1_000_000)
+    return best
+
+
+class TestCircuitBreakerOverhead:
+    """Per-call overhead of each breaker under 1,000 concurrent callers."""
+
+    async def test_call_overhead_under_concurrency(self) -> None:
+        baseline = await _time_per_call_us(_direct)
+        consecutive = await _time_per_call_us(CircuitBreaker(timeout=10.0).call)
+        sliding_breaker = SlidingWindowCircuitBreaker(timeout=10.0)
+        sliding = await _time_per_call_us(sliding_breaker.call)
+
+        logger.info(
+            "per call with %d coroutines: direct=%.2fus, CircuitBreaker=+%.2fus, SlidingWindowCircuitBreaker=+%.2fus",
+            COROUTINES,
+            baseline,
+            consecutive - baseline,
+            sliding - baseline,
+        )
+        assert sliding_breaker.metrics["total_successes"] == 3 * COROUTINES * CALLS_PER_COROUTINE
+        assert (
+            sliding < consecutive
+        ), f"Sliding-window breaker {sliding:.2f}us per call is not cheaper than CircuitBreaker {consecutive:.2f}us"
+
+
+# Performance test markers
+pytestmark = [pytest.mark.performance]
@@ -0,0 +1,113 @@
+"""Encode/decode benchmarks for pub/sub payload codecs.
+
+Measures per-message cost of each codec on ``mem0.recorded.cc`` payloads as
+built by ``log_l1`` (log id, timestamp and an ``event`` with event data and
+correlation IDs), against the stdlib ``json`` round trip publish used before
+codecs were introduced. Runs in-process; no Redis needed.
+
+Performance Targets:
+- orjson encode + decode at least 2x faster than stdlib json
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import pytest
+
+from src.common.pubsub_codecs import decode_payload, get_codec
+
+logger = logging.getLogger(__name__)
+
+ITERATIONS = 5_000
+
+
+def _l1_payload(data_size: int) -> dict[str, Any]:
+    return {
+        "log_id": str(uuid.uuid4()),
+        "created_at": datetime.now(UTC).isoformat(),
+        "event": {
+            "event_type": "user_action",
+            "event_data": {
+                "data": {"action": "save", "document": "x" * data_size, "version": 3, "score": 0.87},
+                "tags": ["cc", "user", "bench"],
+                "memo": "benchmark event",
+                "source": "cc",
+                "log_id": f"log-{uuid.uuid4().hex[:8]}",
+            },
+            "request_id": str(uuid.uuid4()),
+            "trace_id": uuid.uuid4().hex,
+        },
+    }
+
+
+def _time_us(fn: Callable[[], Any]) -> float:
+    # Best of three passes filters out GC pauses and scheduler noise
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            fn()
+        best = min(best, (time.perf_counter() - start) / ITERATIONS * 1_000_000)
+    return best
+
+
+def _stdlib_encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib_decode(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+class TestCodecBenchmarks:
+    """Per-message encode/decode cost by codec and payload size."""
+
+    @pytest.mark.parametrize("data_size", [64, 1024, 16_384])
+    def test_codec_encode_decode(self, data_size: int) -> None:
+        message = _l1_payload(data_size)
+        results: dict[str, tuple[float, float, int]] = {}
+
+        stdlib_bytes = _stdlib_encode(message)
+        results["stdlib json"] = (
+            _time_us(lambda: _stdlib_encode(message)),
+            _time_us(lambda: _stdlib_decode(stdlib_bytes)),
+            len(stdlib_bytes),
+        )
+
+        codecs = ["orjson"]
+        try:
+            get_codec("msgpack").frame({})
+            codecs.append("msgpack")
+        except ValueError:
+            logger.info("msgpack not installed; skipping msgpack codec")
+
+        for name in codecs:
+            codec = get_codec(name)
+            framed = codec.frame(message)
+            assert decode_payload(framed) == message
+            encode_us = _time_us(partial(codec.frame, message))
+            decode_us = _time_us(partial(decode_payload, framed))
+            results[name] = (encode_us, decode_us, len(framed))
+
+        for name, (encode_us, decode_us, size) in results.items():
+            logger.info(
+                "%s payload=%dB: encode=%.2fus decode=%.2fus size=%dB", name, data_size, encode_us, decode_us, size
+            )
+
+        stdlib_total = sum(results["stdlib json"][:2])
+        orjson_total = sum(results["orjson"][:2])
+        assert (
+            orjson_total * 2 <= stdlib_total
+        ), f"orjson round trip {orjson_total:.2f}us is not 2x faster than stdlib json {stdlib_total:.2f}us"
+
+
+# Performance test markers
+pytestmark = [pytest.mark.performance]
@@ -0,0 +1,140 @@
+"""L1 ingestion throughput benchmarks: per-event ``log_l1`` vs COPY-based ``bulk_ingest_l1``.
+
+Measures rows/second for 1k, 10k and 100k events with the same event mix
+(every event has a payload, every fifth carries prompt data), and how
+``log_l1`` throughput scales with concurrent callers on separate sessions.
+
+Performance Targets:
+- bulk_ingest_l1 at least 5x faster than sequential log_l1 for 1k events
+- bulk_ingest_l1 sustains ≥ 10,000 events/s for 10k+ events
+- log_l1 with 16 concurrent callers at least 2x the single-caller throughput
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.cc.bulk_ingest import L1EventInput, bulk_ingest_l1
+from src.backend.cc.logging import log_l1
+from src.db.connection import get_async_session_maker
+
+logger = logging.getLogger(__name__)
+
+
+def _make_events(count: int) -> list[L1EventInput]:
+    events: list[L1EventInput] = []
+    for i in range(count):
+        event: L1EventInput = {"event_type": "bench_event", "payload": {"seq": i, "source": "benchmark"}}
+        if i % 5 == 0:
+            event["prompt_data"] = {
+                "prompt_text": f"prompt {i}",
+                "response_text": f"response {i}",
+                "execution_time_ms": 12,
+                "token_count": 64,
+            }
+        events.append(event)
+    return events
+
+
+def _require_real_session(db_session: Any) -> None:
+    if os.getenv("RUN_INTEGRATION", "0") == "0" or not isinstance(db_session, AsyncSession):
+        pytest.skip("L1 ingest benchmarks require PostgreSQL (RUN_INTEGRATION=1)")
+
+
+class TestL1IngestBenchmarks:
+    """Compare per-event and COPY-based L1 ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_copy_vs_log_l1_1k(self, db_session: AsyncSession) -> None:
+        """Bulk COPY should beat sequential log_l1 by a wide margin."""
+        _require_real_session(db_session)
+        events = _make_events(1_000)
+
+        start = time.perf_counter()
+        for event in events:
+            await log_l1(
+                db_session,
+                event["event_type"],
+                payload=event.get("payload"),
+                prompt_data=event.get("prompt_data"),
+            )
+        per_event_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await bulk_ingest_l1(db_session, events)
+        bulk_time = time.perf_counter() - start
+
+        speedup = per_event_time / bulk_time
+        logger.info(
+            f"1k events: log_l1 {len(events) / per_event_time:.0f} ev/s, "
+            f"bulk_ingest_l1 {len(events) / bulk_time:.0f} ev/s ({speedup:.1f}x)"
+        )
+
+        assert len(result) == len(events)
+        assert speedup >= 5.0, f"bulk_ingest_l1 only {speedup:.1f}x faster than log_l1"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [10_000, pytest.param(100_000, marks=pytest.mark.slow)])
+    async def test_copy_throughput(self, db_session: AsyncSession, count: int) -> None:
+        """Bulk COPY throughput at larger batch sizes."""
+        _require_real_session(db_session)
+        events = _make_events(count)
+
+        start = time.perf_counter()
+        result = await bulk_ingest_l1(db_session, events)
+        elapsed = time.perf_counter() - start
+
+        throughput = count / elapsed
+        logger.info(f"{count} events via bulk_ingest_l1: {elapsed:.2f}s ({throughput:.0f} ev/s)")
+
+        assert len(result) == count
+        assert sum("prompt_trace_id" in ids for ids in result) == count // 5
+        assert throughput >= 10_000, f"bulk_ingest_l1 throughput {throughput:.0f} ev/s < 10,000"
+
+
+class TestLogL1Concurrency:
+    """Throughput of log_l1 as independent callers are added."""
+
+    CALLS_PER_CALLER = 50
+    CONCURRENCY_LEVELS = (1, 2, 4, 8, 16, 32, 64)
+
+    async def _run_callers(self, concurrency: int) -> float:
+        session_maker = get_async_session_maker()
+
+        async def caller(worker: int) -> None:
+            async with session_maker() as session:
+                for i in range(self.CALLS_PER_CALLER):
+                    await log_l1(session, "bench_concurrency", payload={"worker": worker, "seq": i})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(caller(worker) for worker in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        return concurrency * self.CALLS_PER_CALLER / elapsed
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_log_l1_scales_with_concurrent_callers(self, db_session: AsyncSession) -> None:
+        """Separate sessions must not serialize on a shared lock."""
+        _require_real_session(db_session)
+
+        results: dict[int, float] = {}
+        for concurrency in self.CONCURRENCY_LEVELS:
+            results[concurrency] = await self._run_callers(concurrency)
+            logger.info(f"log_l1 with {concurrency:2d} callers: {results[concurrency]:.0f} calls/s")
+
+        scaling = results[16] / results[1]
+        assert scaling >= 2.0, f"log_l1 throughput only scaled {scaling:.1f}x from 1 to 16 callers"
+
+
+# Performance test markers
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.requires_postgres,
+]
@@ -0,0 +1,127 @@
+"""Benchmarks for content-addressed payload deduplication of ``log_event`` writes.
+
+Writes the same event stream through ``LogEventWriter`` with payloads inline
+(the default) and deduplicated into ``payload_blob``, measuring insert
+throughput and on-disk growth of ``base_log``, ``event_log`` and
+``payload_blob`` (all partitions, indexes and TOAST included).
+
+The stream models a high-volume source: 5,000 events drawn from 20 distinct
+~1 KB payloads.
+
+Performance Targets:
+- Deduplicated writes grow the log tables at least 30% less than inline writes
+- Deduplicated insert throughput within 25% of inline throughput
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from core_v2.utils.log_writer import LogEventWriter, PendingLogEvent
+from core_v2.utils.logger import _build_payload, _split_payloads
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.cc.mem0_models import BaseLog, EventLog, PayloadBlob
+from src.db.connection import get_async_session_maker
+
+logger = logging.getLogger(__name__)
+
+EVENT_COUNT = 5_000
+DISTINCT_PAYLOADS = 20
+
+
+def _make_events(*, dedup: bool) -> list[PendingLogEvent]:
+    events: list[PendingLogEvent] = []
+    for i in range(EVENT_COUNT):
+        variant = i % DISTINCT_PAYLOADS
+        data = {"prompt": f"template {variant} " + "x" * 900, "model": "bench", "variant": variant}
+        log_id = f"log-bench-{uuid.uuid4().hex[:8]}"
+        memo = "benchmark event"
+        payload = _build_payload("bench", data, ["bench", "dedup"], log_id, memo)
+        event_data: dict[str, Any] = {"data": data, "tags": payload["tags"], "memo": memo, "log_id": log_id}
+        blob = None
+        if dedup:
+            blob, payload, event_data = _split_payloads(payload, event_data)
+        events.append(
+            PendingLogEvent(
+                base_log_id=uuid.uuid4(),
+                event_log_id=uuid.uuid4(),
+                source="bench",
+                message="[bench] benchmark event",
+                payload=payload,
+                event_data=event_data,
+                timestamp=datetime.now(UTC),
+                blob=blob,
+            )
+        )
+    return events
+
+
+async def _total_size(db: AsyncSession) -> int:
+    total = 0
+    for model in (BaseLog, EventLog, PayloadBlob):
+        # pg_partition_tree also covers plain tables, which are their own single node
+        result = await db.execute(
+            text("SELECT COALESCE(sum(pg_total_relation_size(relid)), 0) FROM pg_partition_tree(:table)"),
+            {"table": model.__table__.fullname},
+        )
+        total += int(result.scalar_one())
+    return total
+
+
+async def _write(events: list[PendingLogEvent]) -> tuple[float, int]:
+    session_maker = get_async_session_maker()
+    async with session_maker() as session:
+        before = await _total_size(session)
+
+    writer = LogEventWriter(queue_size=EVENT_COUNT, flush_interval=0.001, session_maker=session_maker)
+    start = time.perf_counter()
+    for event in events:
+        assert writer.submit(event)
+    await writer.shutdown()
+    elapsed = time.perf_counter() - start
+    assert writer.metrics["written_count"] == len(events)
+
+    async with session_maker() as session:
+        growth = await _total_size(session) - before
+    return len(events) / elapsed, growth
+
+
+class TestPayloadDedupBenchmarks:
+    """Compare inline and content-addressed log_event payload storage."""
+
+    @pytest.mark.asyncio
+    async def test_dedup_size_and_throughput(self, db_session: AsyncSession) -> None:
+        """Deduplication should shrink storage without a large throughput cost."""
+        if os.getenv("RUN_INTEGRATION", "0") == "0" or not isinstance(db_session, AsyncSession):
+            pytest.skip("Payload dedup benchmarks require PostgreSQL (RUN_INTEGRATION=1)")
+
+        inline_rate, inline_growth = await _write(_make_events(dedup=False))
+        dedup_rate, dedup_growth = await _write(_make_events(dedup=True))
+
+        logger.info(
+            f"{EVENT_COUNT} events / {DISTINCT_PAYLOADS} payloads: "
+            f"inline {inline_rate:.0f} ev/s, {inline_growth / 1024:.0f} KiB; "
+            f"dedup {dedup_rate:.0f} ev/s, {dedup_growth / 1024:.0f} KiB"
+        )
+
+        assert (
+            dedup_growth <= inline_growth * 0.7
+        ), f"dedup grew {dedup_growth} bytes vs {inline_growth} inline (expected ≥30% smaller)"
+        assert (
+            dedup_rate >= inline_rate * 0.75
+        ), f"dedup throughput {dedup_rate:.0f} ev/s vs {inline_rate:.0f} ev/s inline"
+
+
+# Performance test markers
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.requires_postgres,
+]
@@ -8,6 +8,12 @@ Performance Targets (Single-Developer Optimized):
 - Publish latency < 1ms (functional validation focus)
 - Throughput ≥ 500 msg/s (practical for single-dev hardware)
 - Connection pool efficiency (500 pings < 1s)
+- Pipelined publish_many ≥ 3x the throughput of a publish loop
+- Auto-batched concurrent publish reports flush sizes and added latency per linger window
+- Streams consumer groups: 4 consumers ≥ 2.5x the throughput of 1 on an I/O-bound handler
+- Sharded pub/sub receive throughput reported per shard count
+- Loopback delivery: same-process publish-to-handler latency ≥ 2x lower than via Redis
+- Subscriber recovery: delivery resumes within 1s of the subscriber connections being killed
 - Memory leak detection (functional validation)
 - Regression monitoring in CI/CD
 
@@ -18,8 +24,10 @@ fast CI execution. Optimized for MacBook Air + workstation hardware.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import gc
 import json
+import logging
 import time
 import tracemalloc
 from typing import TYPE_CHECKING
@@ -28,9 +36,14 @@ import psutil
 import pytest
 import redis.asyncio as redis
 
+from src.common.pubsub import RedisPubSub
+from src.common.redis_streams import RedisStreams
+
 if TYPE_CHECKING:
     from .conftest import PerformanceTestUtils
 
+logger = logging.getLogger(__name__)
+
 # Performance constants
 PUBLISH_LATENCY_MS = 1.0
 THROUGHPUT_MSG_S = 500
@@ -190,6 +203,298 @@ class TestRedisThroughputBenchmarks:
         assert throughput >= 500, f"Concurrent throughput {throughput:.0f} msg/s insufficient"  # Adjusted target
 
 
+class TestPublishManyBenchmarks:
+    """Compare pipelined RedisPubSub.publish_many against looping over publish."""
+
+    MESSAGE_COUNT = 1000
+    BATCH_SIZE = 100
+
+    @staticmethod
+    def _make_pubsub(client: redis.Redis) -> RedisPubSub:
+        # Reuse the benchmark client so both paths share one connection setup
+        pubsub = RedisPubSub()
+        pubsub._redis = client
+        pubsub._connected = True
+        return pubsub
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    async def test_publish_many_vs_publish_loop(self, perf_client: redis.Redis) -> None:
+        """Batched publishing should deliver several times the throughput of a publish loop."""
+        pubsub = self._make_pubsub(perf_client)
+        messages = [("bench_batch", {"seq": i, "payload": "x" * 64}) for i in range(self.MESSAGE_COUNT)]
+
+        # Warmup both paths
+        for channel, message in messages[:10]:
+            await pubsub.publish(channel, message)
+        await pubsub.publish_many(messages[:10])
+
+        start = time.perf_counter()
+        for channel, message in messages:
+            await pubsub.publish(channel, message)
+        loop_throughput = self.MESSAGE_COUNT / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for offset in range(0, self.MESSAGE_COUNT, self.BATCH_SIZE):
+            counts = await pubsub.publish_many(messages[offset : offset + self.BATCH_SIZE])
+            assert len(counts) == self.BATCH_SIZE
+        batch_throughput = self.MESSAGE_COUNT / (time.perf_counter() - start)
+
+        speedup = batch_throughput / loop_throughput
+        logger.info(
+            f"publish loop {loop_throughput:.0f} msg/s, publish_many({self.BATCH_SIZE}) "
+            f"{batch_throughput:.0f} msg/s ({speedup:.1f}x); {pubsub.publish_batch_metrics}"
+        )
+
+        metrics = pubsub.publish_batch_metrics
+        assert metrics["messages"] == self.MESSAGE_COUNT + 10
+        assert metrics["failed_batches"] == 0
+        assert speedup >= 3.0, f"publish_many only {speedup:.1f}x faster than a publish loop"
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 10, 100, 1000])
+    async def test_publish_many_batch_size_scaling(self, perf_client: redis.Redis, batch_size: int) -> None:
+        """Per-message cost should fall as the batch grows."""
+        pubsub = self._make_pubsub(perf_client)
+        batch = [("bench_batch_scaling", {"seq": i}) for i in range(batch_size)]
+        await pubsub.publish_many(batch)
+
+        rounds = max(1, 2000 // batch_size)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await pubsub.publish_many(batch)
+        throughput = rounds * batch_size / (time.perf_counter() - start)
+
+        logger.info(f"publish_many batch_size={batch_size}: {throughput:.0f} msg/s")
+        assert throughput >= THROUGHPUT_MSG_S, f"publish_many throughput {throughput:.0f} msg/s below target"
+
+
+class TestAutoBatchingBenchmarks:
+    """Measure concurrent publish throughput and added latency across linger windows."""
+
+    CONCURRENT_CALLERS = 200
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("linger_ms", [0.0, 0.5, 1.0, 5.0])
+    async def test_auto_batching_linger_tradeoff(self, perf_client: redis.Redis, linger_ms: float) -> None:
+        """Report throughput, flush sizes and added latency for each linger window (0 = no batching)."""
+        pubsub = TestPublishManyBenchmarks._make_pubsub(perf_client)
+        if linger_ms:
+            pubsub.enable_auto_batching(linger_ms=linger_ms, max_batch=100)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            await asyncio.gather(
+                *(pubsub.publish("bench_auto_batch", {"seq": i}) for i in range(self.CONCURRENT_CALLERS))
+            )
+        throughput = 5 * self.CONCURRENT_CALLERS / (time.perf_counter() - start)
+
+        logger.info(f"linger {linger_ms}ms: {throughput:.0f} msg/s, {pubsub.auto_batching_metrics}")
+        assert throughput >= THROUGHPUT_MSG_S, f"Throughput {throughput:.0f} msg/s below target"
+        if linger_ms:
+            metrics = pubsub.auto_batching_metrics
+            assert metrics is not None
+            assert metrics["avg_flush_size"] > 1, "Concurrent publishes were not batched"
+
+
+class TestStreamsConsumerScaling:
+    """Measure Redis Streams throughput as consumers are added to one consumer group."""
+
+    MESSAGE_COUNT = 400
+    HANDLER_DELAY_S = 0.002  # Simulated I/O-bound L2 handler (DB write, HTTP call)
+
+    async def _drain(self, perf_client: redis.Redis, consumers: int) -> float:
+        streams = RedisStreams(TestPublishManyBenchmarks._make_pubsub(perf_client), read_count=10, block_ms=50)
+        stream = f"bench_streams_{consumers}_{time.monotonic_ns()}"
+        done = asyncio.Event()
+        handled = 0
+
+        async def handler(_channel: str, _message: object) -> None:
+            nonlocal handled
+            await asyncio.sleep(self.HANDLER_DELAY_S)
+            handled += 1
+            if handled == self.MESSAGE_COUNT:
+                done.set()
+
+        try:
+            for i in range(consumers):
+                await streams.subscribe(stream, handler, group="bench", consumer=f"c{i}")
+            await streams.publish_many([(stream, {"seq": i}) for i in range(self.MESSAGE_COUNT)])
+            start = time.perf_counter()
+            await asyncio.wait_for(done.wait(), timeout=30)
+            throughput = self.MESSAGE_COUNT / (time.perf_counter() - start)
+            assert await streams.pending_count(stream, "bench") == 0
+        finally:
+            await streams.disconnect()
+            await perf_client.delete(stream)
+        return throughput
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    async def test_consumer_group_scaling(self, perf_client: redis.Redis) -> None:
+        """Throughput should grow close to linearly with consumers sharing a group."""
+        throughput = {consumers: await self._drain(perf_client, consumers) for consumers in (1, 2, 4)}
+
+        logger.info(
+            "streams consumer scaling: "
+            + ", ".join(f"{consumers} consumer(s) {rate:.0f} msg/s" for consumers, rate in throughput.items())
+        )
+        assert throughput[2] >= 1.5 * throughput[1], f"2 consumers only {throughput[2] / throughput[1]:.1f}x of 1"
+        assert throughput[4] >= 2.5 * throughput[1], f"4 consumers only {throughput[4] / throughput[1]:.1f}x of 1"
+
+
+class TestShardedReceiveThroughput:
+    """Measure pub/sub receive throughput as channels are spread over more subscriber connections."""
+
+    CHANNELS = 32
+    MESSAGES_PER_CHANNEL = 100
+
+    async def _receive(self, perf_client: redis.Redis, shards: int) -> float:
+        pubsub = TestPublishManyBenchmarks._make_pubsub(perf_client)
+        if shards > 1:
+            await pubsub.enable_sharding(shards)
+        prefix = f"bench_shards_{shards}_{time.monotonic_ns()}"
+        channels = [f"{prefix}.{i}" for i in range(self.CHANNELS)]
+        total = self.CHANNELS * self.MESSAGES_PER_CHANNEL
+        done = asyncio.Event()
+        received = 0
+
+        async def handler(_channel: str, _message: object) -> None:
+            nonlocal received
+            received += 1
+            if received == total:
+                done.set()
+
+        publisher = TestPublishManyBenchmarks._make_pubsub(perf_client)
+        publisher._sharded_commands = pubsub._sharded_commands
+        try:
+            for channel in channels:
+                await pubsub.subscribe(channel, handler)
+            batch = [(channel, {"seq": i}) for i in range(self.MESSAGES_PER_CHANNEL) for channel in channels]
+            start = time.perf_counter()
+            for offset in range(0, total, 500):
+                await publisher.publish_many(batch[offset : offset + 500])
+            await asyncio.wait_for(done.wait(), timeout=30)
+            throughput = total / (time.perf_counter() - start)
+        finally:
+            # Leave the shared benchmark client open for the next run
+            pubsub._redis = None
+            pubsub._pool = None
+            await pubsub.disconnect()
+        return throughput
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    async def test_receive_throughput_by_shard_count(self, perf_client: redis.Redis) -> None:
+        """Report receive throughput for 1, 2 and 4 subscriber connections."""
+        throughput = {shards: await self._receive(perf_client, shards) for shards in (1, 2, 4)}
+
+        logger.info(
+            "sharded receive: "
+            + ", ".join(f"{shards} shard(s) {rate:.0f} msg/s" for shards, rate in throughput.items())
+        )
+        # One event loop decodes every shard, so the gain comes from overlapping socket reads, not parallelism
+        assert min(throughput.values()) >= THROUGHPUT_MSG_S, f"Receive throughput below target: {throughput}"
+
+
+class TestLoopbackLatency:
+    """Compare same-process publish-to-handler latency with and without loopback delivery."""
+
+    ROUNDS = 200
+
+    async def _median_latency_us(self, perf_client: redis.Redis, *, loopback: bool) -> float:
+        pubsub = TestPublishManyBenchmarks._make_pubsub(perf_client)
+        if loopback:
+            pubsub.enable_loopback()
+        channel = f"bench_loopback_{loopback}_{time.monotonic_ns()}"
+        arrived = asyncio.Event()
+        latencies: list[float] = []
+
+        async def handler(_channel: str, message: dict[str, float]) -> None:
+            latencies.append((time.perf_counter() - message["sent"]) * 1_000_000)
+            arrived.set()
+
+        try:
+            await pubsub.subscribe(channel, handler)
+            await asyncio.sleep(0.05)
+            for _ in range(self.ROUNDS):
+                arrived.clear()
+                await pubsub.publish(channel, {"sent": time.perf_counter()})
+                await asyncio.wait_for(arrived.wait(), timeout=5)
+        finally:
+            # Leave the shared benchmark client open for the next run
+            pubsub._redis = None
+            await pubsub.disconnect()
+        return sorted(latencies)[len(latencies) // 2]
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    async def test_loopback_cuts_local_latency(self, perf_client: redis.Redis) -> None:
+        """A handler in the publishing process should see the message long before the Redis round trip ends."""
+        via_redis = await self._median_latency_us(perf_client, loopback=False)
+        looped_back = await self._median_latency_us(perf_client, loopback=True)
+
+        logger.info(f"local delivery p50: via Redis {via_redis:.0f}us, loopback {looped_back:.0f}us")
+        assert looped_back * 2 <= via_redis, f"Loopback p50 {looped_back:.0f}us vs {via_redis:.0f}us via Redis"
+
+
+class TestReconnectRecovery:
+    """Kill the subscriber connections server-side and time how long until messages arrive again."""
+
+    ROUNDS = 5
+    RECOVERY_S = 1.0
+
+    async def _time_to_recovery(self, perf_client: redis.Redis, pubsub: RedisPubSub, channel: str) -> float:
+        arrived = asyncio.Event()
+
+        async def handler(_channel: str, _message: object) -> None:
+            arrived.set()
+
+        await pubsub.subscribe(channel, handler)
+        await pubsub.psubscribe(f"{channel}.*", handler)
+        await asyncio.sleep(0.05)
+
+        killed_at = time.perf_counter()
+        await perf_client.execute_command("CLIENT", "KILL", "TYPE", "pubsub")
+        arrived.clear()
+        # Keep publishing until a message gets through the rebuilt connection
+        while not arrived.is_set():
+            await perf_client.publish(channel, json.dumps({"sent": time.perf_counter()}))
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(arrived.wait(), timeout=0.001)
+            assert time.perf_counter() - killed_at < 30, "Subscriber never recovered"
+        recovery = time.perf_counter() - killed_at
+        await pubsub.unsubscribe(channel)
+        await pubsub.punsubscribe(f"{channel}.*")
+        return recovery
+
+    @pytest.mark.functional
+    @pytest.mark.asyncio
+    async def test_time_to_recovery_after_connection_kill(self, perf_client: redis.Redis) -> None:
+        """Report time-to-recovery and reconnect gaps for repeated subscriber connection kills."""
+        pubsub = TestPublishManyBenchmarks._make_pubsub(perf_client)
+        pubsub.configure_reconnect(backoff_base=0.05, backoff_max=1.0)
+        try:
+            recoveries = [
+                await self._time_to_recovery(perf_client, pubsub, f"bench_reconnect_{i}") for i in range(self.ROUNDS)
+            ]
+            metrics = pubsub.reconnect_metrics
+        finally:
+            # Leave the shared benchmark client open for the next run
+            pubsub._redis = None
+            await pubsub.disconnect()
+
+        recoveries.sort()
+        logger.info(
+            f"time to recovery over {self.ROUNDS} kills: p50 {recoveries[len(recoveries) // 2] * 1000:.1f}ms, "
+            f"max {recoveries[-1] * 1000:.1f}ms; reconnects {metrics['reconnects']}, "
+            f"attempts {metrics['attempts']}, max gap {metrics['max_gap_s'] * 1000:.1f}ms"
+        )
+        assert recoveries[-1] < self.RECOVERY_S, f"Slowest recovery {recoveries[-1]:.3f}s over {self.RECOVERY_S}s"
+
+
 class TestConnectionPoolBenchmarks:
     """Connection pool efficiency benchmarks."""
 
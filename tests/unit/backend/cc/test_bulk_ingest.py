@@ -0,0 +1,84 @@
+"""Unit tests for COPY-based L1 bulk ingestion."""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.backend.cc.bulk_ingest import (
+    BASE_LOG_COLUMNS,
+    EVENT_LOG_COLUMNS,
+    PROMPT_TRACE_COLUMNS,
+    build_l1_rows,
+    bulk_ingest_l1,
+)
+from src.backend.cc.logging import parse_request_id
+
+
+class TestBuildL1Rows:
+    """Test COPY record construction."""
+
+    def test_rows_follow_log_l1_rules(self) -> None:
+        base_rows, event_rows, prompt_rows, ids = build_l1_rows(
+            [
+                {"event_type": "a", "payload": {"k": 1}},
+                {"event_type": "b", "prompt_data": {"prompt_text": "p", "token_count": 3}},
+            ]
+        )
+
+        assert len(base_rows) == 2
+        assert len(event_rows) == 1
+        assert len(prompt_rows) == 1
+        assert set(ids[0]) == {"base_log_id", "event_log_id"}
+        assert set(ids[1]) == {"base_log_id", "prompt_trace_id"}
+        assert base_rows[0][2:4] == ("INFO", "Event: a")
+        assert event_rows[0][1] == ids[0]["base_log_id"]
+        assert prompt_rows[0][1] == ids[1]["base_log_id"]
+        assert len(base_rows[0]) == len(BASE_LOG_COLUMNS)
+        assert len(event_rows[0]) == len(EVENT_LOG_COLUMNS)
+        assert len(prompt_rows[0]) == len(PROMPT_TRACE_COLUMNS)
+
+    def test_request_id_and_timestamp_passthrough(self) -> None:
+        request_id = uuid.uuid4()
+        timestamp = datetime(2024, 1, 1, tzinfo=UTC)
+
+        base_rows, event_rows, _, _ = build_l1_rows(
+            [{"event_type": "a", "payload": {}, "request_id": str(request_id), "timestamp": timestamp}]
+        )
+
+        assert event_rows[0][4] == request_id
+        assert base_rows[0][1] == timestamp
+
+    def test_invalid_request_id_gets_new_uuid(self) -> None:
+        assert isinstance(parse_request_id("not-a-uuid"), uuid.UUID)
+
+
+class TestBulkIngestL1:
+    """Test COPY dispatch against a mocked asyncpg connection."""
+
+    @pytest.mark.asyncio
+    async def test_copies_parents_first_and_commits(self) -> None:
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        raw = MagicMock(driver_connection=driver)
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw)
+        db = MagicMock()
+        db.connection = AsyncMock(return_value=connection)
+        db.commit = AsyncMock()
+
+        result = await bulk_ingest_l1(db, [{"event_type": "a", "payload": {"x": 1}}])
+
+        tables = [call.args[0] for call in driver.copy_records_to_table.await_args_list]
+        assert tables == ["base_log", "event_log"]
+        assert len(result) == 1
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_input_is_noop(self) -> None:
+        db = MagicMock()
+        db.connection = AsyncMock()
+
+        assert await bulk_ingest_l1(db, []) == []
+        db.connection.assert_not_awaited()
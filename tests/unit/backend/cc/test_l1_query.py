@@ -0,0 +1,167 @@
+"""Unit tests for the L1 event log read path."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.backend.cc.l1_query import (
+    CorrelationCache,
+    EventLogFilter,
+    build_event_log_query,
+    build_timeline,
+    decode_cursor,
+    encode_cursor,
+    get_correlation_timeline,
+    load_correlated_logs,
+    query_event_logs,
+)
+
+
+class TestCursor:
+    """Test opaque keyset cursors."""
+
+    def test_round_trip(self) -> None:
+        created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        event_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, event_id)) == (created_at, event_id)
+
+    def test_malformed_cursor_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor")
+
+
+class TestEventLogQuery:
+    """Test query construction and paging."""
+
+    def test_filters_and_keyset_order(self) -> None:
+        stmt = build_event_log_query(EventLogFilter(event_type="cc.event", trace_id="abc"))
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "event_log.event_type = " in sql
+        assert "event_log.trace_id = " in sql
+        assert "ORDER BY event_log.created_at DESC, event_log.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    def test_payload_blob_is_eager_loaded_explicitly(self) -> None:
+        stmt = build_event_log_query(EventLogFilter())
+
+        loaded = [str(option.path) for option in stmt._with_options]
+        assert any("EventLog.payload_blob" in path for path in loaded)
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_from_last_row_when_more_rows_exist(self) -> None:
+        now = datetime.now(UTC)
+        rows = [SimpleNamespace(id=uuid.uuid4(), created_at=now - timedelta(seconds=i)) for i in range(3)]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rows
+        db = AsyncMock()
+        db.execute.return_value = result
+
+        page, next_cursor = await query_event_logs(db, EventLogFilter(), limit=2)
+
+        assert page == rows[:2]
+        assert next_cursor is not None
+        assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self) -> None:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        db = AsyncMock()
+        db.execute.return_value = result
+
+        cursor = encode_cursor(datetime.now(UTC), uuid.uuid4())
+        page, next_cursor = await query_event_logs(db, EventLogFilter(), cursor=cursor)
+
+        assert page == []
+        assert next_cursor is None
+
+
+class TestCorrelation:
+    """Test correlation timelines and their cache."""
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        cache = CorrelationCache(max_size=2)
+        cache.put(("trace_id", "a"), [])
+        cache.put(("trace_id", "b"), [])
+        assert cache.get(("trace_id", "a")) == []
+
+        cache.put(("trace_id", "c"), [])
+
+        assert cache.get(("trace_id", "b")) is None
+        assert len(cache) == 2
+
+    def test_cache_entries_expire(self) -> None:
+        cache = CorrelationCache(ttl=0.0)
+        cache.put(("trace_id", "a"), [{"kind": "base_log"}])
+
+        assert cache.get(("trace_id", "a")) is None
+
+    def test_timeline_orders_all_record_kinds_by_timestamp(self) -> None:
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        base_id = uuid.uuid4()
+        event = SimpleNamespace(
+            id=uuid.uuid4(),
+            base_log_id=base_id,
+            event_type="agent.step",
+            resolved_event_data={},
+            request_id=None,
+            trace_id="t",
+            created_at=start + timedelta(seconds=2),
+        )
+        prompt = SimpleNamespace(
+            id=uuid.uuid4(),
+            prompt_text="p",
+            response_text="r",
+            execution_time_ms=5,
+            token_count=7,
+            created_at=start + timedelta(seconds=1),
+        )
+        base_log = SimpleNamespace(
+            id=base_id, timestamp=start, level="INFO", message="m", event_logs=[event], prompt_traces=[prompt]
+        )
+
+        timeline = build_timeline([base_log])
+
+        assert [entry["kind"] for entry in timeline] == ["base_log", "prompt_trace", "event_log"]
+
+    @pytest.mark.asyncio
+    async def test_requires_exactly_one_key(self) -> None:
+        with pytest.raises(ValueError, match="Exactly one"):
+            await load_correlated_logs(AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(self) -> None:
+        cache = CorrelationCache()
+        load = AsyncMock(return_value=[])
+
+        with (
+            patch("src.backend.cc.l1_query.get_correlation_cache", return_value=cache),
+            patch("src.backend.cc.l1_query.load_correlated_logs", load),
+            patch("src.backend.cc.l1_query.build_timeline", return_value=[{"kind": "base_log"}]),
+        ):
+            first = await get_correlation_timeline(AsyncMock(), trace_id="t")
+            second = await get_correlation_timeline(AsyncMock(), trace_id="t")
+
+        assert first == ([{"kind": "base_log"}], False)
+        assert second == ([{"kind": "base_log"}], True)
+        load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_lookup_still_requires_exactly_one_key(self) -> None:
+        cache = CorrelationCache()
+        request_id = uuid.uuid4()
+        cache.put(("request_id", str(request_id)), [{"kind": "base_log"}])
+
+        with patch("src.backend.cc.l1_query.get_correlation_cache", return_value=cache):
+            with pytest.raises(ValueError, match="Exactly one"):
+                await get_correlation_timeline(AsyncMock(), request_id=request_id, trace_id="t")
+            with pytest.raises(ValueError, match="Exactly one"):
+                await get_correlation_timeline(AsyncMock())
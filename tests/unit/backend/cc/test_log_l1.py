@@ -14,7 +14,7 @@ from unittest.mock import Mock, patch
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.backend.cc.logging import log_l1
+from src.backend.cc.logging import log_l1, log_l1_many
 from src.backend.cc.mem0_models import BaseLog, EventLog, PromptTrace
 
 
@@ -236,3 +236,33 @@ class TestLogL1ParameterHandling:
         assert event_log.event_data == complex_payload
         assert event_log.event_data is not None
         assert event_log.event_data["user"]["name"] == "John"
+
+
+class TestLogL1Many:
+    """Test the batched log_l1_many API."""
+
+    async def test_batch_returns_ids_in_input_order(self, test_db_session: AsyncSession) -> None:
+        """Each event gets its own id map, matching the log_l1 record rules."""
+        result = await log_l1_many(
+            test_db_session,
+            [
+                {"event_type": "batch_a", "payload": {"seq": 1}},
+                {"event_type": "batch_b", "prompt_data": {"prompt_text": "p"}},
+                {"event_type": "batch_c", "payload": {"seq": 3}, "prompt_data": {"prompt_text": "q"}},
+            ],
+        )
+
+        assert len(result) == 3
+        assert set(result[0]) == {"base_log_id", "event_log_id"}
+        assert set(result[1]) == {"base_log_id", "prompt_trace_id"}
+        assert set(result[2]) == {"base_log_id", "event_log_id", "prompt_trace_id"}
+
+        event_log = await test_db_session.get(EventLog, result[2]["event_log_id"])
+        assert event_log is not None
+        assert event_log.base_log_id == result[2]["base_log_id"]
+        assert event_log.event_type == "batch_c"
+        assert event_log.event_data == {"seq": 3}
+
+    async def test_empty_batch_is_noop(self, test_db_session: AsyncSession) -> None:
+        """An empty batch writes nothing."""
+        assert await log_l1_many(test_db_session, []) == []
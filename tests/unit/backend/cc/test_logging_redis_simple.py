@@ -182,6 +182,56 @@ class TestAfterCommitEventListener:
         mock_session.info.pop.assert_called_once_with("l1_outbox", None)
 
 
+class TestBatchPublishing:
+    """Test pipelined publishing of log_l1_many batches."""
+
+    @patch("src.backend.cc.logging.get_pubsub")
+    @patch("src.backend.cc.logging.logfire")
+    async def test_publish_l1_events_uses_one_pipeline(self, mock_logfire: Mock, mock_get_pubsub: AsyncMock) -> None:
+        """All events in a batch go through a single publish_many call."""
+        from src.backend.cc.logging import _publish_l1_events
+
+        mock_pubsub = AsyncMock()
+        mock_pubsub.publish_many.return_value = [1, 1]
+        mock_get_pubsub.return_value = mock_pubsub
+
+        batch = [(uuid.uuid4(), {"event": {"event_type": "a"}}), (uuid.uuid4(), {"event": {"event_type": "b"}})]
+        await _publish_l1_events(batch)
+
+        mock_pubsub.publish_many.assert_awaited_once_with([("mem0.recorded.cc", data) for _, data in batch])
+        mock_pubsub.publish.assert_not_called()
+
+    @patch("src.backend.cc.logging.get_pubsub")
+    @patch("src.backend.cc.logging.logfire")
+    async def test_publish_l1_events_falls_back_per_event(self, mock_logfire: Mock, mock_get_pubsub: AsyncMock) -> None:
+        """A failed pipeline degrades to the log_only fallback without raising."""
+        from src.backend.cc.logging import _publish_l1_events
+
+        mock_pubsub = AsyncMock()
+        mock_pubsub.publish_many.side_effect = Exception("Redis down")
+        mock_get_pubsub.return_value = mock_pubsub
+
+        await _publish_l1_events([(uuid.uuid4(), {"event": {}}), (uuid.uuid4(), {"event": {}})])
+
+        assert mock_pubsub.publish_with_fallback.await_count == 2
+
+    @patch("src.backend.cc.logging.asyncio.get_running_loop")
+    @patch("src.backend.cc.logging._publish_l1_events")
+    def test_after_commit_schedules_one_task_per_batch(self, mock_publish: AsyncMock, mock_get_loop: Mock) -> None:
+        """Each queued batch is published by exactly one task."""
+        from src.backend.cc.logging import _after_commit_publish_batches
+
+        mock_loop = Mock()
+        mock_get_loop.return_value = mock_loop
+        mock_session = Mock()
+        mock_session.info = {"l1_outbox_batches": [[(uuid.uuid4(), {}), (uuid.uuid4(), {})]]}
+
+        _after_commit_publish_batches(mock_session)
+
+        assert "l1_outbox_batches" not in mock_session.info
+        assert mock_loop.create_task.call_count == 1
+
+
 class TestRedisChannelAndMessageFormat:
     """Test Redis channel naming and message format specifications."""
 
@@ -0,0 +1,80 @@
+"""Unit tests for the durable L1 outbox relay."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.backend.cc.outbox_relay import OutboxRelay
+
+
+def _claiming(mock_session_maker: tuple[MagicMock, AsyncMock], rows: list[Any]) -> tuple[MagicMock, AsyncMock]:
+    maker, session = mock_session_maker
+    claim_result = MagicMock()
+    claim_result.all.return_value = rows
+    session.execute.side_effect = [claim_result, MagicMock()]
+    return maker, session
+
+
+def _row(row_id: int, age_seconds: float = 1.0) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=row_id,
+        channel="mem0.recorded.cc",
+        payload={"log_id": str(row_id)},
+        created_at=datetime.now(UTC) - timedelta(seconds=age_seconds),
+    )
+
+
+class TestOutboxRelay:
+    """Test claim, publish and delete behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_relay_once_publishes_and_deletes_batch(
+        self, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        maker, session = _claiming(mock_session_maker, [_row(1, age_seconds=2.0), _row(2)])
+        relay = OutboxRelay(batch_size=10, session_maker=maker)
+        pubsub = AsyncMock()
+        pubsub.publish_many.return_value = [1, 1]
+
+        with patch("src.backend.cc.outbox_relay.get_pubsub", AsyncMock(return_value=pubsub)):
+            relayed = await relay.relay_once()
+
+        assert relayed == 2
+        pubsub.publish_many.assert_awaited_once_with(
+            [("mem0.recorded.cc", {"log_id": "1"}), ("mem0.recorded.cc", {"log_id": "2"})]
+        )
+        assert session.execute.await_count == 2  # claim + delete
+        session.commit.assert_awaited_once()
+        assert relay.metrics["relayed_count"] == 2
+        assert relay.metrics["last_lag_ms"] >= 2000
+
+    @pytest.mark.asyncio
+    async def test_claim_uses_skip_locked(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, session = _claiming(mock_session_maker, [])
+        relay = OutboxRelay(session_maker=maker)
+
+        assert await relay.relay_once() == 0
+
+        claim = session.execute.await_args_list[0].args[0]
+        assert "SKIP LOCKED" in str(claim.compile(compile_kwargs={"literal_binds": True}, dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_keeps_rows(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, session = _claiming(mock_session_maker, [_row(1)])
+        relay = OutboxRelay(session_maker=maker)
+        pubsub = AsyncMock()
+        pubsub.publish_many.side_effect = Exception("Redis down")
+
+        with patch("src.backend.cc.outbox_relay.get_pubsub", AsyncMock(return_value=pubsub)):
+            relayed = await relay.relay_once()
+
+        assert relayed == 0
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+        assert relay.metrics["failed_batches"] == 1
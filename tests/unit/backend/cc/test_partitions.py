@@ -0,0 +1,116 @@
+"""Unit tests for L1 log partition maintenance."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.backend.cc.partitions import (
+    PartitionInfo,
+    drop_expired_partitions,
+    ensure_partitions,
+    next_period,
+    partition_name,
+    period_start,
+)
+
+
+class TestPeriodHelpers:
+    """Test period arithmetic and naming."""
+
+    def test_daily_periods(self) -> None:
+        start = period_start(datetime(2026, 3, 31, 17, 5, tzinfo=UTC), "day")
+
+        assert start == datetime(2026, 3, 31, tzinfo=UTC)
+        assert next_period(start, "day") == datetime(2026, 4, 1, tzinfo=UTC)
+        assert partition_name("event_log", start, "day") == "event_log_p20260331"
+
+    def test_monthly_periods_roll_over_year(self) -> None:
+        start = period_start(datetime(2026, 12, 15, tzinfo=UTC), "month")
+
+        assert start == datetime(2026, 12, 1, tzinfo=UTC)
+        assert next_period(start, "month") == datetime(2027, 1, 1, tzinfo=UTC)
+        assert partition_name("base_log", start, "month") == "base_log_p202612"
+
+
+class TestPartitionMaintenance:
+    """Test DDL issued against a mocked session."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_skips_covered_periods(self) -> None:
+        db = AsyncMock()
+        existing = [
+            PartitionInfo("base_log", "base_log_history", None, datetime(2026, 5, 2, tzinfo=UTC)),
+        ]
+
+        with (
+            patch("src.backend.cc.partitions.is_partitioned", AsyncMock(side_effect=[True, False])),
+            patch("src.backend.cc.partitions.list_partitions", AsyncMock(return_value=existing)),
+            patch("src.backend.cc.partitions.default_partition", AsyncMock(return_value=None)),
+        ):
+            created = await ensure_partitions(db, ahead=2, now=datetime(2026, 5, 1, 12, tzinfo=UTC))
+
+        assert created == ["base_log_p20260502", "base_log_p20260503"]
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ensure_moves_rows_out_of_default_partition(self) -> None:
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(rowcount=3)
+        existing = [
+            PartitionInfo("event_log", "event_log_history", None, datetime(2026, 5, 2, tzinfo=UTC)),
+        ]
+
+        with (
+            patch("src.backend.cc.partitions.is_partitioned", AsyncMock(side_effect=[False, True])),
+            patch("src.backend.cc.partitions.list_partitions", AsyncMock(return_value=existing)),
+            patch("src.backend.cc.partitions.default_partition", AsyncMock(return_value="event_log_default")),
+        ):
+            created = await ensure_partitions(db, ahead=1, now=datetime(2026, 5, 1, 12, tzinfo=UTC))
+
+        assert created == ["event_log_p20260502"]
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert statements[0] == 'LOCK TABLE "mem0_cc"."event_log_default" IN SHARE ROW EXCLUSIVE MODE'
+        assert "LIKE" in statements[1]
+        assert 'DELETE FROM "mem0_cc"."event_log_default"' in statements[2]
+        assert '"created_at" >= :lower' in statements[2]
+        assert db.execute.await_args_list[2].args[1] == {
+            "lower": datetime(2026, 5, 2, tzinfo=UTC),
+            "upper": datetime(2026, 5, 3, tzinfo=UTC),
+        }
+        assert "ATTACH PARTITION" in statements[3]
+
+    @pytest.mark.asyncio
+    async def test_drop_only_fully_expired_partitions(self) -> None:
+        db = AsyncMock()
+        partitions = [
+            PartitionInfo("event_log", "event_log_history", None, datetime(2026, 1, 1, tzinfo=UTC)),
+            PartitionInfo(
+                "event_log", "event_log_p20260420", datetime(2026, 4, 20, tzinfo=UTC), datetime(2026, 4, 21, tzinfo=UTC)
+            ),
+        ]
+
+        with (
+            patch("src.backend.cc.partitions.is_partitioned", AsyncMock(side_effect=[False, True])),
+            patch("src.backend.cc.partitions.list_partitions", AsyncMock(return_value=partitions)),
+            patch("src.backend.cc.partitions.default_partition", AsyncMock(return_value="event_log_default")),
+        ):
+            dropped = await drop_expired_partitions(db, retention_days=30, now=datetime(2026, 5, 1, tzinfo=UTC))
+
+        assert dropped == ["event_log_history"]
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert any("DETACH PARTITION" in statement for statement in statements)
+        assert any("DROP TABLE" in statement for statement in statements)
+        assert any('DELETE FROM "mem0_cc"."event_log_default"' in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_non_partitioned_tables_are_untouched(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        with patch("src.backend.cc.partitions.is_partitioned", AsyncMock(return_value=False)):
+            assert await ensure_partitions(db, ahead=7) == []
+
+        db.execute.assert_not_awaited()
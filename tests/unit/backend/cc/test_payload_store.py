@@ -0,0 +1,89 @@
+"""Unit tests for the content-addressed payload store."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.backend.cc.mem0_models import EventLog, PayloadBlob
+from src.backend.cc.payload_store import blob_row, content_hash, prune_orphan_blobs, split_shared, store_blobs
+
+
+class TestContentHashing:
+    """Test canonical hashing and payload splitting."""
+
+    def test_hash_ignores_key_order(self) -> None:
+        first, _ = content_hash({"data": {"a": 1, "b": 2}, "tags": ["x"]})
+        second, _ = content_hash({"tags": ["x"], "data": {"b": 2, "a": 1}})
+
+        assert first == second
+        assert len(first) == 64
+
+    def test_hash_differs_for_different_content(self) -> None:
+        assert content_hash({"data": 1})[0] != content_hash({"data": 2})[0]
+
+    def test_base_and_event_payloads_share_one_blob(self) -> None:
+        payload = {"source": "cc", "data": {"k": "v"}, "tags": ["t"], "timestamp": "now", "log_id": "l", "memo": "m"}
+        event_data = {"data": {"k": "v"}, "tags": ["t"], "memo": "m", "log_id": "l"}
+
+        payload_shared, payload_inline = split_shared(payload)
+        event_shared, event_inline = split_shared(event_data)
+
+        assert blob_row(payload_shared)["hash"] == blob_row(event_shared)["hash"]
+        assert payload_inline == {"source": "cc", "timestamp": "now", "log_id": "l"}
+        assert event_inline == {"log_id": "l"}
+
+
+class TestStoreBlobs:
+    """Test blob upserts against a mocked session."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_collapse_into_one_sorted_upsert(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock()
+        rows = [blob_row({"data": "b"}), blob_row({"data": "a"}), blob_row({"data": "b"})]
+
+        await store_blobs(db, rows)
+
+        db.execute.assert_awaited_once()
+        params = db.execute.await_args.args[0].compile().params
+        hashes = [value for key, value in params.items() if key.startswith("hash")]
+        assert hashes == sorted({row["hash"] for row in rows})
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_skip_the_database(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        await store_blobs(db, [])
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_prune_returns_deleted_count(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+
+        assert await prune_orphan_blobs(db, retention_days=30) == 3
+        statement = str(db.execute.await_args.args[0])
+        assert "DELETE FROM" in statement
+        assert "EXISTS" in statement
+
+
+class TestResolvedPayloads:
+    """Test merging blob content back into log rows."""
+
+    def test_inline_fields_win_over_blob_content(self) -> None:
+        event_log = EventLog(event_type="cc.event", event_data={"log_id": "l"})
+        set_committed_value(
+            event_log, "payload_blob", PayloadBlob(hash="h", content={"data": 1, "memo": "m"}, size_bytes=10)
+        )
+
+        assert event_log.resolved_event_data == {"data": 1, "memo": "m", "log_id": "l"}
+
+    def test_rows_without_blob_resolve_inline(self) -> None:
+        event_log = EventLog(event_type="cc.event", event_data={"data": 1})
+
+        assert event_log.resolved_event_data == {"data": 1}
@@ -0,0 +1,233 @@
+"""Unit tests for incremental prompt trace rollups."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.backend.cc.mem0_models import PromptTraceRollup, RollupWatermark
+from src.backend.cc.prompt_rollups import (
+    bucket_start,
+    fold_new_traces,
+    get_rollups,
+    mark_backfilled_traces,
+    refold_backfilled_hours,
+)
+from src.common.quantile_sketch import QuantileSketch
+
+
+def _result(*, scalar_one: object = None, rows: list[object] | None = None, scalars: list[object] | None = None):
+    result = MagicMock()
+    result.scalar_one.return_value = scalar_one
+    result.all.return_value = rows or []
+    result.scalars.return_value.all.return_value = scalars or []
+    return result
+
+
+def _trace(created_at: datetime, execution_time_ms: int | None, token_count: int | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), created_at=created_at, execution_time_ms=execution_time_ms, token_count=token_count
+    )
+
+
+def _rollup(hour: datetime, latencies: list[int], tokens: list[int]) -> PromptTraceRollup:
+    latency_sketch, token_sketch = QuantileSketch(), QuantileSketch()
+    latency_sketch.extend(latencies)
+    token_sketch.extend(tokens)
+    return PromptTraceRollup(
+        bucket_start=hour,
+        call_count=len(latencies),
+        total_tokens=sum(tokens),
+        total_execution_ms=sum(latencies),
+        latency_sketch=latency_sketch.to_dict(),
+        token_sketch=token_sketch.to_dict(),
+    )
+
+
+class TestFoldNewTraces:
+    """Test folding traces into hourly rollups against a mocked session."""
+
+    @pytest.mark.asyncio
+    async def test_caught_up_commits_without_changes(self) -> None:
+        watermark = RollupWatermark(name="prompt_trace_hourly")
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[_result(), _result(scalar_one=watermark), _result()])
+        db.commit = AsyncMock()
+
+        assert await fold_new_traces(db) == 0
+
+        db.commit.assert_awaited_once()
+        assert watermark.last_created_at is None
+
+    @pytest.mark.asyncio
+    async def test_folds_into_existing_and_new_hours_and_advances_watermark(self) -> None:
+        now = datetime(2026, 5, 1, 12, 30, tzinfo=UTC)
+        watermark = RollupWatermark(name="prompt_trace_hourly")
+        existing = _rollup(datetime(2026, 5, 1, 10, tzinfo=UTC), [100], [50])
+        traces = [
+            _trace(datetime(2026, 5, 1, 10, 15, tzinfo=UTC), 200, 70),
+            _trace(datetime(2026, 5, 1, 11, 5, tzinfo=UTC), 300, None),
+            _trace(datetime(2026, 5, 1, 11, 45, tzinfo=UTC), None, 30),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _result(),
+                _result(scalar_one=watermark),
+                _result(rows=traces),
+                _result(scalars=[existing]),
+            ]
+        )
+        db.commit = AsyncMock()
+
+        assert await fold_new_traces(db, now=now) == 3
+
+        assert existing.call_count == 2
+        assert existing.total_execution_ms == 300
+        assert existing.total_tokens == 120
+        assert QuantileSketch.from_dict(existing.latency_sketch).count == 2
+
+        new_rollup = db.add.call_args.args[0]
+        assert new_rollup.bucket_start == datetime(2026, 5, 1, 11, tzinfo=UTC)
+        assert new_rollup.call_count == 2
+        assert QuantileSketch.from_dict(new_rollup.latency_sketch).count == 1
+        assert QuantileSketch.from_dict(new_rollup.token_sketch).count == 1
+
+        assert watermark.last_created_at == traces[-1].created_at
+        assert watermark.last_id == traces[-1].id
+        db.commit.assert_awaited_once()
+
+
+class TestBackfilledHours:
+    """Test rebuilding hours that received traces behind the watermark."""
+
+    @pytest.mark.asyncio
+    async def test_mark_queues_distinct_hours_older_than_settle_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "src.backend.cc.prompt_rollups.get_settings",
+            lambda: SimpleNamespace(L1_ROLLUP_ENABLED=True, L1_ROLLUP_SETTLE_S=5.0),
+        )
+        now = datetime(2026, 5, 1, 12, 30, tzinfo=UTC)
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        timestamps = [
+            datetime(2026, 5, 1, 9, 10, tzinfo=UTC),
+            datetime(2026, 5, 1, 9, 50, tzinfo=UTC),
+            datetime(2026, 5, 1, 11, 0, tzinfo=UTC),
+            datetime(2026, 5, 1, 12, 29, 59, tzinfo=UTC),
+            None,
+        ]
+        assert await mark_backfilled_traces(db, timestamps, now=now) == 2
+
+        params = db.execute.await_args.args[0].compile().params
+        assert sorted(v for v in params.values() if isinstance(v, datetime)) == [
+            datetime(2026, 5, 1, 9, tzinfo=UTC),
+            datetime(2026, 5, 1, 11, tzinfo=UTC),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mark_is_noop_when_rollups_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "src.backend.cc.prompt_rollups.get_settings",
+            lambda: SimpleNamespace(L1_ROLLUP_ENABLED=False, L1_ROLLUP_SETTLE_S=5.0),
+        )
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        assert await mark_backfilled_traces(db, [datetime(2020, 1, 1, tzinfo=UTC)]) == 0
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refold_rebuilds_queued_hours_behind_watermark(self) -> None:
+        now = datetime(2026, 5, 1, 12, 30, tzinfo=UTC)
+        watermark = RollupWatermark(
+            name="prompt_trace_hourly", last_created_at=datetime(2026, 5, 1, 11, 20, tzinfo=UTC), last_id=uuid.uuid4()
+        )
+        stale = _rollup(datetime(2026, 5, 1, 10, tzinfo=UTC), [100], [50])
+        rebuilt_traces = [_trace(now, 100, 50), _trace(now, 400, 10)]
+        db = MagicMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _result(),
+                _result(scalar_one=watermark),
+                _result(
+                    scalars=[
+                        datetime(2026, 5, 1, 12, tzinfo=UTC),
+                        datetime(2026, 5, 1, 10, tzinfo=UTC),
+                        datetime(2026, 5, 1, 11, tzinfo=UTC),
+                        datetime(2026, 1, 1, tzinfo=UTC),
+                    ]
+                ),
+                _result(rows=rebuilt_traces),
+                _result(rows=[_trace(now, 250, 5)]),
+            ]
+        )
+        db.get = AsyncMock(side_effect=[stale, None])
+        db.commit = AsyncMock()
+
+        rebuilt = await refold_backfilled_hours(db, retention_days=30, now=now)
+
+        # The hour after the watermark is left to fold_new_traces, the expired one is skipped
+        assert rebuilt == [datetime(2026, 5, 1, 10, tzinfo=UTC), datetime(2026, 5, 1, 11, tzinfo=UTC)]
+        assert stale.call_count == 2
+        assert stale.total_execution_ms == 500
+        assert stale.total_tokens == 60
+        assert QuantileSketch.from_dict(stale.latency_sketch).max == 400
+        new_rollup = db.add.call_args.args[0]
+        assert new_rollup.bucket_start == datetime(2026, 5, 1, 11, tzinfo=UTC)
+        assert new_rollup.call_count == 1
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refold_before_first_fold_only_clears_queue(self) -> None:
+        db = MagicMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _result(),
+                _result(scalar_one=RollupWatermark(name="prompt_trace_hourly")),
+                _result(scalars=[datetime(2026, 5, 1, 10, tzinfo=UTC)]),
+            ]
+        )
+        db.commit = AsyncMock()
+
+        assert await refold_backfilled_hours(db) == []
+        assert db.execute.await_count == 3
+        db.commit.assert_awaited_once()
+
+
+class TestGetRollups:
+    """Test merging hourly rollups over a range."""
+
+    def test_bucket_start_truncates_to_hour(self) -> None:
+        assert bucket_start(datetime(2026, 5, 1, 10, 59, 59, tzinfo=UTC)) == datetime(2026, 5, 1, 10, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_merges_hours(self) -> None:
+        rollups = [
+            _rollup(datetime(2026, 5, 1, 10, tzinfo=UTC), [100, 200], [10, 20]),
+            _rollup(datetime(2026, 5, 1, 11, tzinfo=UTC), [300, 400], [30, 40]),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=_result(scalars=rollups))
+
+        summary = await get_rollups(db, datetime(2026, 5, 1, 10, 30, tzinfo=UTC), datetime(2026, 5, 1, 12, tzinfo=UTC))
+
+        assert summary["start"] == datetime(2026, 5, 1, 10, tzinfo=UTC)
+        assert summary["call_count"] == 4
+        assert summary["total_tokens"] == 100
+        assert summary["latency_ms"]["count"] == 4
+        assert summary["latency_ms"]["max"] == 400
+        assert summary["latency_ms"]["mean"] == 250
+        assert len(summary["buckets"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_range(self) -> None:
+        moment = datetime(2026, 5, 1, tzinfo=UTC)
+
+        with pytest.raises(ValueError, match="end must be after start"):
+            await get_rollups(MagicMock(), moment, moment)
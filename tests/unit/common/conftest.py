@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -95,6 +96,33 @@ def mock_redis_config() -> Any:
     )()
 
 
+@pytest.fixture
+def pubsub(mock_redis_config: Any, monkeypatch: Any) -> Any:
+    """Return a connected RedisPubSub whose mocked Redis client reports 2 subscribers."""
+    from src.common.pubsub import RedisPubSub
+
+    monkeypatch.setattr("src.common.pubsub._REDIS_AVAILABLE", True)
+    monkeypatch.setattr("src.common.pubsub.get_redis_config", lambda: mock_redis_config)
+    instance = RedisPubSub()
+    instance._redis = AsyncMock()
+    instance._redis.publish = AsyncMock(return_value=2)
+    instance._connected = True
+    return instance
+
+
+@pytest.fixture
+def fake_redis_pubsub(fake_redis: Any, mock_redis_config: Any, monkeypatch: Any) -> Any:
+    """Return a RedisPubSub connected to the fakeredis client."""
+    from src.common.pubsub import RedisPubSub
+
+    monkeypatch.setattr("src.common.pubsub._REDIS_AVAILABLE", True)
+    monkeypatch.setattr("src.common.pubsub.get_redis_config", lambda: mock_redis_config)
+    instance = RedisPubSub()
+    instance._redis = fake_redis
+    instance._connected = True
+    return instance
+
+
 @pytest.fixture
 def circuit_breaker_config() -> dict[str, Any]:
     """Return standard circuit breaker configuration for testing."""
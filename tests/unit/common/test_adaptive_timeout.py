@@ -0,0 +1,135 @@
+"""Unit tests for latency histograms and adaptive operation timeouts."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from freezegun import freeze_time
+
+from src.common.adaptive_timeout import SUB_BUCKETS, AdaptiveTimeouts, LatencyHistogram
+from src.common.pubsub import RedisPubSub
+
+
+class TestLatencyHistogram:
+    """Test quantile accuracy and the rolling window."""
+
+    def test_quantiles_within_relative_error(self) -> None:
+        histogram = LatencyHistogram()
+        for micros in range(1, 10_001):
+            histogram.record(micros / 1_000_000)
+
+        assert histogram.count == 10_000
+        for q, exact in ((0.5, 0.005), (0.99, 0.0099), (0.999, 0.00999)):
+            estimate = histogram.quantile(q)
+            assert estimate is not None
+            assert exact <= estimate <= exact * (1 + 1 / SUB_BUCKETS) + 1e-6
+
+    def test_sub_bucket_range_is_exact(self) -> None:
+        histogram = LatencyHistogram()
+        for micros in (0, 3, 15):
+            histogram.record(micros / 1_000_000)
+
+        assert histogram.quantiles(0.0, 0.5, 1.0) == [0.0, 0.000003, 0.000015]
+
+    def test_empty_and_out_of_range(self) -> None:
+        histogram = LatencyHistogram()
+        assert histogram.quantile(0.99) is None
+
+        histogram.record(10_000.0)  # Beyond the last bucket
+        assert histogram.max_us == 10_000_000_000
+        assert histogram.quantile(1.0) is not None
+
+    def test_old_slots_age_out(self) -> None:
+        with freeze_time("2023-01-01 00:00:00") as frozen:
+            histogram = LatencyHistogram(window=6.0, slots=3)
+            histogram.record(1.0)
+            frozen.tick(2)
+            histogram.record(0.001)
+            assert histogram.count == 2
+
+            frozen.tick(5)  # The 1s sample's slot is now outside the window
+            assert histogram.count == 1
+            assert histogram.quantile(1.0) == pytest.approx(0.001, rel=1 / SUB_BUCKETS)
+            assert histogram.total == 2
+
+
+class TestAdaptiveTimeouts:
+    """Test how timeouts are derived, bounded and reported."""
+
+    def test_default_until_min_samples(self) -> None:
+        timeouts = AdaptiveTimeouts(default=5.0, floor=0.01, ceiling=5.0, min_samples=10, refresh_every=1)
+        for _ in range(9):
+            timeouts.record("publish", 0.001)
+        assert timeouts.timeout("publish") == 5.0
+
+        timeouts.record("publish", 0.001)
+        assert timeouts.timeout("publish") == pytest.approx(0.01)  # 4 x ~1ms is under the floor
+        assert timeouts.timeout("ping") == 5.0
+
+    def test_timeout_tracks_tail_latency_within_bounds(self) -> None:
+        timeouts = AdaptiveTimeouts(
+            default=5.0, floor=0.001, ceiling=1.0, multiplier=4.0, min_samples=10, refresh_every=10
+        )
+        for _ in range(100):
+            timeouts.record("info", 0.02)
+        assert 0.08 <= timeouts.timeout("info") <= 0.08 * (1 + 1 / SUB_BUCKETS)
+
+        for _ in range(1000):
+            timeouts.record("info", 2.0)
+        assert timeouts.timeout("info") == 1.0
+
+    def test_metrics_report_quantiles_and_timeouts(self) -> None:
+        timeouts = AdaptiveTimeouts(default=5.0, floor=0.01, ceiling=5.0)
+        timeouts.record("ping", 0.002)
+        timeouts.record("ping", 5.0, timed_out=True)
+
+        metrics = timeouts.metrics["ping"]
+        assert metrics["count"] == metrics["total"] == 2
+        assert metrics["timed_out"] == 1
+        assert metrics["max_ms"] == 5000.0
+        assert metrics["timeout_ms"] == 5000.0
+        assert metrics["p50_ms"] == pytest.approx(2.0, rel=1 / SUB_BUCKETS)
+
+    def test_invalid_bounds_rejected(self) -> None:
+        with pytest.raises(ValueError, match="floor"):
+            AdaptiveTimeouts(default=1.0, floor=2.0, ceiling=1.0)
+
+
+class TestRedisPubSubAdaptiveTimeouts:
+    """Test adaptive timeouts on RedisPubSub over fakeredis."""
+
+    async def test_publishes_are_timed_per_operation(self, fake_redis_pubsub: RedisPubSub) -> None:
+        assert fake_redis_pubsub.latency_metrics is None
+        fake_redis_pubsub.enable_adaptive_timeouts(min_samples=5)
+
+        for i in range(5):
+            await fake_redis_pubsub.publish("events", {"n": i})
+        await fake_redis_pubsub.publish_many([("events", {"n": 5})])
+
+        metrics = fake_redis_pubsub.latency_metrics
+        assert metrics is not None
+        assert metrics["publish"]["total"] == 5
+        assert metrics["publish_many"]["total"] == 1
+        assert metrics["publish"]["timeout_ms"] == fake_redis_pubsub._circuit_breaker.timeout * 1000
+
+    async def test_stalled_call_times_out_from_learned_latency(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.enable_adaptive_timeouts(floor=0.05, min_samples=64)
+        adaptive = fake_redis_pubsub._adaptive_timeouts
+        assert adaptive is not None
+        for _ in range(64):
+            adaptive.record("numsub", 0.001)
+        assert adaptive.timeout("numsub") == 0.05
+
+        async def stalled(*_args: Any, **_kwargs: Any) -> Any:
+            await asyncio.sleep(1)
+
+        fake_redis_pubsub._redis.pubsub_numsub = stalled  # type: ignore[union-attr]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(TimeoutError):
+            await fake_redis_pubsub.get_subscribers_count("events")
+
+        assert loop.time() - started < 0.5
+        assert adaptive.metrics["numsub"]["timed_out"] == 1
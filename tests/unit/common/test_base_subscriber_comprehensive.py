@@ -608,6 +608,26 @@ class TestSubscribeToChannel:
             # Should call unsubscribe for cleanup
             mock_pubsub.unsubscribe.assert_called()
 
+    async def test_subscribe_to_channel_wraps_non_dict_payloads(self) -> None:
+        """Test raw codec bytes and JSON arrays reach consumers as a dict envelope."""
+        with patch("src.common.base_subscriber.get_pubsub") as mock_get_pubsub:
+            subscribed = asyncio.Event()
+            mock_pubsub = AsyncMock()
+            mock_pubsub.subscribe.side_effect = lambda *_args: subscribed.set()
+            mock_get_pubsub.return_value = mock_pubsub
+
+            iterator = subscribe_to_channel("raw", max_idle_time=1.0)
+            first = asyncio.ensure_future(iterator.__anext__())
+            await asyncio.wait_for(subscribed.wait(), timeout=1.0)
+            handler = mock_pubsub.subscribe.await_args.args[1]
+
+            await handler("raw", b"\x00\xff")
+            await handler("raw", [1, 2])
+
+            assert await first == {"payload": b"\x00\xff"}
+            assert await iterator.__anext__() == {"payload": [1, 2]}
+            await iterator.aclose()
+
 
 class TestPublishToDLQ:
     """Test publish_to_dlq helper function."""
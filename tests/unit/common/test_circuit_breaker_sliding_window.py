@@ -0,0 +1,204 @@
+"""Unit tests for the sliding-window circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from src.common.pubsub import CircuitBreakerError, CircuitBreakerState
+from src.common.pubsub_breaker import SlidingWindowCircuitBreaker
+
+
+async def _succeed() -> str:
+    return "ok"
+
+
+async def _fail() -> str:
+    raise ValueError("Failure")
+
+
+@pytest.fixture
+def breaker() -> SlidingWindowCircuitBreaker:
+    """Breaker that opens at 50% failures over at least 4 calls in a 10s window."""
+    return SlidingWindowCircuitBreaker(
+        window=10.0,
+        buckets=10,
+        minimum_calls=4,
+        failure_rate_threshold=0.5,
+        recovery_timeout=1.0,
+        success_threshold=2,
+        timeout=0.5,
+        expected_exception=ValueError,
+    )
+
+
+class TestSlidingWindowRates:
+    """Test opening on window rates rather than consecutive failures."""
+
+    async def test_interleaved_failures_open_at_rate_threshold(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        # Consecutive counting would never open here: every failure is followed by a success
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+            assert await breaker.call(_succeed) == "ok"
+
+        assert breaker.state is CircuitBreakerState.CLOSED  # Successes do not trip the check
+        with pytest.raises(ValueError):
+            await breaker.call(_fail)
+
+        assert breaker.state is CircuitBreakerState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            await breaker.call(_succeed)
+        assert breaker.metrics["state_transitions"]["closed_to_open"] == 1
+
+    async def test_below_minimum_calls_stays_closed(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+
+        assert breaker.state is CircuitBreakerState.CLOSED
+        assert breaker.metrics["window_calls"] == 3
+        assert breaker.metrics["window_failure_rate"] == 1.0
+
+    async def test_old_failures_leave_the_window(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        with freeze_time("2023-01-01 00:00:00") as frozen:
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await breaker.call(_fail)
+            frozen.tick(11)
+
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+            assert breaker.window_counts == (1, 1, 0)
+            assert breaker.state is CircuitBreakerState.CLOSED
+
+    async def test_slow_calls_open_circuit(self) -> None:
+        breaker = SlidingWindowCircuitBreaker(
+            minimum_calls=2, slow_call_rate_threshold=0.5, slow_call_duration=0.01, timeout=1.0
+        )
+
+        async def slow() -> str:
+            await asyncio.sleep(0.02)
+            return "late"
+
+        assert await breaker.call(slow) == "late"
+        assert breaker.state is CircuitBreakerState.CLOSED
+        assert await breaker.call(slow) == "late"
+
+        assert breaker.state is CircuitBreakerState.OPEN
+        assert breaker.metrics["window_slow_call_rate"] == 1.0
+
+    async def test_unexpected_exceptions_are_not_failures(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        async def type_error() -> str:
+            raise TypeError("not a Redis failure")
+
+        for _ in range(5):
+            with pytest.raises(TypeError):
+                await breaker.call(type_error)
+
+        assert breaker.state is CircuitBreakerState.CLOSED
+        assert breaker.metrics["total_requests"] == 5
+        assert breaker.window_counts == (0, 0, 0)
+
+
+class TestSlidingWindowRecovery:
+    """Test HALF_OPEN probing and closing."""
+
+    async def _open(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        for _ in range(4):
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+        assert breaker.state is CircuitBreakerState.OPEN
+
+    async def test_probes_close_circuit_and_reset_window(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        with freeze_time("2023-01-01 00:00:00") as frozen:
+            await self._open(breaker)
+            frozen.tick(2)
+
+            assert await breaker.call(_succeed) == "ok"
+            assert breaker.state is CircuitBreakerState.HALF_OPEN
+            assert await breaker.call(_succeed) == "ok"
+
+            assert breaker.state is CircuitBreakerState.CLOSED
+            # The failures from before the outage no longer count
+            assert breaker.window_counts == (0, 0, 0)
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+            assert breaker.state is CircuitBreakerState.CLOSED
+
+    async def test_failed_probe_reopens(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        with freeze_time("2023-01-01 00:00:00") as frozen:
+            await self._open(breaker)
+            frozen.tick(2)
+
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+
+            assert breaker.state is CircuitBreakerState.OPEN
+            assert breaker.metrics["state_transitions"]["half_open_to_open"] == 1
+
+    async def test_half_open_limits_concurrent_probes(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        release = asyncio.Event()
+
+        async def held() -> str:
+            await release.wait()
+            return "ok"
+
+        with freeze_time("2023-01-01 00:00:00") as frozen:
+            await self._open(breaker)
+            frozen.tick(2)
+
+            probe = asyncio.create_task(breaker.call(held))
+            await asyncio.sleep(0)
+            with pytest.raises(CircuitBreakerError, match="probe"):
+                await breaker.call(_succeed)
+            release.set()
+            assert await probe == "ok"
+            assert await breaker.call(_succeed) == "ok"
+
+        assert breaker.state is CircuitBreakerState.CLOSED
+
+
+class TestSlidingWindowLogging:
+    """Test rate-limited failure logging."""
+
+    async def test_failure_warnings_are_rate_limited(self, breaker: SlidingWindowCircuitBreaker) -> None:
+        breaker.minimum_calls = 1000
+        with (
+            patch("src.common.pubsub_breaker._LOGFIRE_AVAILABLE", True),
+            patch("src.common.pubsub_breaker.logfire", create=True) as logfire,
+        ):
+            for _ in range(10):
+                with pytest.raises(ValueError):
+                    await breaker.call(_fail)
+
+            assert logfire.warning.call_count == 1
+            assert breaker.metrics["suppressed_logs"] == 9
+
+            breaker._last_log -= breaker.log_interval
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+            kwargs: dict[str, Any] = logfire.warning.call_args.kwargs
+            assert kwargs["suppressed"] == 9
+            assert breaker.metrics["suppressed_logs"] == 0
+
+    async def test_failure_warnings_logged_without_logfire(
+        self, breaker: SlidingWindowCircuitBreaker, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        breaker.minimum_calls = 1000
+        with patch("src.common.pubsub_breaker._LOGFIRE_AVAILABLE", False), caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await breaker.call(_fail)
+            breaker._last_log -= breaker.log_interval
+            with pytest.raises(ValueError):
+                await breaker.call(_fail)
+
+        warnings = [record.getMessage() for record in caplog.records if "failures recorded" in record.getMessage()]
+        assert len(warnings) == 2
+        assert warnings[1].endswith("(2 warnings suppressed)")
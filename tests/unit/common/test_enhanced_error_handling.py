@@ -357,15 +357,17 @@ class TestGracefulDegradation:
         assert result["fallback_used"] is True
         assert result["fallback_strategy"] == "memory_queue"
 
-        # Verify message was queued in memory
-        assert hasattr(enhanced_pubsub, "_memory_queue")
-        assert len(enhanced_pubsub._memory_queue) == 1
-        queued_item = enhanced_pubsub._memory_queue[0]
-        assert queued_item["channel"] == "test_channel"
-        assert queued_item["message"] == test_message
-
-    async def test_publish_with_fallback_file_queue(self, enhanced_pubsub: RedisPubSub, mock_logfire: Any) -> None:
+        # Verify the encoded message was queued in memory for replay
+        assert enhanced_pubsub._fallback is not None
+        queued = await enhanced_pubsub._fallback.memory.peek(10)
+        assert queued == [("test_channel", enhanced_pubsub.encode_message("test_channel", test_message))]
+        assert enhanced_pubsub.fallback_metrics["memory"]["depth"] == 1
+
+    async def test_publish_with_fallback_file_queue(
+        self, enhanced_pubsub: RedisPubSub, mock_logfire: Any, tmp_path: Any
+    ) -> None:
         """Test publish_with_fallback with file_queue strategy."""
+        await enhanced_pubsub.configure_fallback(file_dir=tmp_path)
         # Configure primary to fail
         enhanced_pubsub._redis.publish.side_effect = CircuitBreakerError("Circuit breaker open")
 
@@ -378,6 +380,8 @@ class TestGracefulDegradation:
         assert result["success"] is True
         assert result["fallback_used"] is True
         assert result["fallback_strategy"] == "file_queue"
+        assert enhanced_pubsub.fallback_metrics["file"]["depth"] == 1
+        assert any(tmp_path.glob("*.seg"))
 
 
 class TestCorrelationIdTracking:
@@ -0,0 +1,168 @@
+"""Tests for log_event admission control and sampling policy."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from core_v2.utils.log_policy import LogAdmissionPolicy, LogPolicyRule, TokenBucket, parse_rules
+
+
+class TestLogPolicyRule:
+    """Test rule matching and parsing."""
+
+    def test_rule_matches_source_and_tag_subset(self) -> None:
+        rule = LogPolicyRule(source="graph", tags=frozenset({"query"}))
+
+        assert rule.matches("graph", frozenset({"query", "success"}))
+        assert not rule.matches("cc", frozenset({"query"}))
+        assert not rule.matches("graph", frozenset({"success"}))
+
+    def test_wildcard_source(self) -> None:
+        rule = LogPolicyRule(source="*", tags=frozenset({"read"}))
+
+        assert rule.matches("cc", frozenset({"read"}))
+        assert rule.matches("graph", frozenset({"read", "db"}))
+
+    def test_parse_rules_rejects_invalid_sample_rate(self) -> None:
+        with pytest.raises(ValueError, match="sample_rate"):
+            parse_rules([{"source": "cc", "sample_rate": 1.5}])
+
+    def test_parse_rules_builds_frozen_tags(self) -> None:
+        rules = parse_rules([{"source": "graph", "tags": ["query", "success"], "rate_limit": 10}])
+
+        assert rules[0].tags == frozenset({"query", "success"})
+        assert rules[0].rate_limit == 10.0
+
+
+class TestLogAdmissionPolicy:
+    """Test sampling, rate limiting and always-keep behaviour."""
+
+    def test_no_rules_admits_everything(self) -> None:
+        policy = LogAdmissionPolicy()
+
+        assert all(policy.admit("cc", ["read"]) for _ in range(100))
+        assert policy.metrics["kept"] == 100
+        assert policy.metrics["dropped"] == 0
+
+    def test_sampling_uses_ratio(self) -> None:
+        values = iter([0.05, 0.5, 0.95])
+        policy = LogAdmissionPolicy(
+            rules=[LogPolicyRule(source="graph", tags=frozenset({"query"}), sample_rate=0.1)],
+            random_func=lambda: next(values),
+        )
+
+        results = [policy.admit("graph", ["query", "success"]) for _ in range(3)]
+
+        assert results == [True, False, False]
+        assert policy.metrics["by_source"]["graph"] == {"kept": 1, "sampled_out": 2, "rate_limited": 0}
+
+    def test_errors_always_kept(self) -> None:
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="graph", sample_rate=0.0)])
+
+        assert policy.admit("graph", ["query", "error"])
+        assert not policy.admit("graph", ["query", "success"])
+
+    def test_rate_limit_caps_burst(self) -> None:
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="cc", rate_limit=1.0, burst=3)])
+
+        results = [policy.admit("cc", []) for _ in range(5)]
+
+        assert results.count(True) == 3
+        assert policy.metrics["rate_limited"] == 2
+
+    def test_first_matching_rule_wins(self) -> None:
+        policy = LogAdmissionPolicy(
+            rules=[
+                LogPolicyRule(source="cc", tags=frozenset({"health"}), sample_rate=1.0),
+                LogPolicyRule(source="cc", sample_rate=0.0),
+            ]
+        )
+
+        assert policy.admit("cc", ["health"])
+        assert not policy.admit("cc", ["module"])
+
+    def test_configure_replaces_rules_at_runtime(self) -> None:
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="cc", sample_rate=0.0)])
+        assert not policy.admit("cc", [])
+
+        policy.configure([])
+
+        assert policy.admit("cc", [])
+        assert policy.metrics["sampled_out"] == 1
+
+    def test_concurrent_admits_are_all_counted(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="cc", tags=frozenset({"noisy"}), sample_rate=0.0)])
+
+        def admit_many(source: str) -> None:
+            for i in range(2000):
+                policy.admit(source, ["noisy"] if i % 2 else [])
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(admit_many, ["cc", "cc", "graph", "graph"]))
+
+        metrics = policy.metrics
+        assert metrics["by_source"]["cc"] == {"kept": 2000, "sampled_out": 2000, "rate_limited": 0}
+        assert metrics["by_source"]["graph"]["kept"] == 4000
+
+    def test_invalid_settings_are_logged_and_admit_all(self, monkeypatch: Any, caplog: Any) -> None:
+        import core_v2.utils.log_policy as log_policy_module
+
+        from src.common.config import get_settings
+
+        monkeypatch.setattr(log_policy_module, "_policy", None)
+        monkeypatch.setattr(get_settings(), "LOG_POLICY_RULES", [{"source": "cc", "sample_rate": 2.0}])
+
+        with caplog.at_level("ERROR", logger="cos.log_policy"):
+            policy = log_policy_module.get_log_policy()
+
+        assert policy.rules == []
+        assert "Invalid log admission policy settings" in caplog.text
+
+
+class TestTokenBucket:
+    """Test token bucket refill."""
+
+    def test_refills_over_time(self, monkeypatch: Any) -> None:
+        import core_v2.utils.log_policy as log_policy_module
+
+        now = [100.0]
+        monkeypatch.setattr(log_policy_module.time, "monotonic", lambda: now[0])
+        bucket = TokenBucket(rate=2.0, burst=1)
+
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        now[0] += 0.5
+        assert bucket.try_acquire()
+
+
+class TestLogEventIntegration:
+    """Test that log_event consults the policy."""
+
+    def test_sampled_out_event_skips_write(self, monkeypatch: Any) -> None:
+        import core_v2.utils.log_policy as log_policy_module
+        from core_v2.utils.logger import log_event
+
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="noisy", sample_rate=0.0)])
+        monkeypatch.setattr(log_policy_module, "_policy", policy)
+
+        result = log_event(source="noisy", data={}, tags=["read"], memo="dropped")
+
+        assert result["status"] == "sampled_out"
+        assert policy.metrics["by_source"]["noisy"]["sampled_out"] == 1
+
+    async def test_rate_limited_event_skips_async_write(self, monkeypatch: Any) -> None:
+        import core_v2.utils.log_policy as log_policy_module
+        from core_v2.utils.logger import log_event, log_event_async
+
+        policy = LogAdmissionPolicy(rules=[LogPolicyRule(source="noisy", rate_limit=0.001, burst=1)])
+        policy._buckets[0].try_acquire()  # Spend the only token
+        monkeypatch.setattr(log_policy_module, "_policy", policy)
+
+        result = await log_event_async(source="noisy", data={}, tags=["read"], memo="dropped")
+        queued = log_event(source="noisy", data={}, tags=["read"], memo="dropped")
+
+        assert result["status"] == queued["status"] == "rate_limited"
+        assert policy.metrics["by_source"]["noisy"]["rate_limited"] == 2
@@ -0,0 +1,218 @@
+"""Tests for the background batched log_event writer."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from core_v2.utils.log_writer import LogEventWriter, PendingLogEvent
+
+
+def _pending(source: str = "test") -> PendingLogEvent:
+    return PendingLogEvent(
+        base_log_id=uuid.uuid4(),
+        event_log_id=uuid.uuid4(),
+        source=source,
+        message=f"[{source}] memo",
+        payload={"source": source},
+        event_data={"memo": "memo"},
+        timestamp=datetime.now(UTC),
+    )
+
+
+class TestLogEventWriter:
+    """Test queueing, batching and metrics of LogEventWriter."""
+
+    async def test_submit_batches_into_single_flush(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, session = mock_session_maker
+        writer = LogEventWriter(flush_interval=0.01, session_maker=maker)
+
+        for _ in range(25):
+            assert writer.submit(_pending())
+
+        await asyncio.sleep(0.05)
+
+        # One INSERT per table, one commit for all 25 events
+        assert session.execute.await_count == 2
+        session.commit.assert_awaited_once()
+        assert writer.metrics["written_count"] == 25
+        assert writer.metrics["flush_count"] == 1
+        await writer.shutdown()
+
+    async def test_queue_full_drops_and_counts(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, _ = mock_session_maker
+        writer = LogEventWriter(queue_size=2, flush_interval=1.0, session_maker=maker)
+
+        results = [writer.submit(_pending()) for _ in range(5)]
+
+        assert results.count(False) >= 2
+        assert writer.metrics["dropped_count"] == results.count(False)
+        await writer.shutdown()
+
+    async def test_shutdown_flushes_pending_events(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, session = mock_session_maker
+        writer = LogEventWriter(flush_interval=10.0, session_maker=maker)
+
+        writer.submit(_pending())
+        writer.submit(_pending())
+        await writer.shutdown()
+
+        assert writer.metrics["written_count"] == 2
+        assert writer.metrics["queue_depth"] == 0
+        session.commit.assert_awaited()
+
+    async def test_shutdown_writes_batch_held_while_lingering(
+        self, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        maker, session = mock_session_maker
+        writer = LogEventWriter(flush_interval=10.0, session_maker=maker)
+
+        writer.submit(_pending())
+        writer.submit(_pending())
+        # Let the drain task dequeue the first event and start its linger
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert writer.metrics["queue_depth"] == 1
+
+        await asyncio.wait_for(writer.shutdown(), timeout=1.0)
+
+        assert writer.metrics["written_count"] == 2
+        assert writer.metrics["failed_count"] == 0
+        session.commit.assert_awaited_once()
+
+    async def test_shutdown_waits_for_batch_being_written(
+        self, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        maker, session = mock_session_maker
+        commit_started = asyncio.Event()
+        release_commit = asyncio.Event()
+
+        async def slow_commit() -> None:
+            commit_started.set()
+            await release_commit.wait()
+
+        session.commit.side_effect = slow_commit
+        writer = LogEventWriter(flush_interval=0.0, session_maker=maker)
+
+        writer.submit(_pending())
+        drain_task = writer._task
+        await asyncio.wait_for(commit_started.wait(), timeout=1.0)
+        shutdown = asyncio.ensure_future(writer.shutdown())
+        await asyncio.sleep(0.01)
+        assert not shutdown.done()
+
+        release_commit.set()
+        await asyncio.wait_for(shutdown, timeout=1.0)
+
+        assert drain_task is not None and not drain_task.cancelled()
+        assert writer.metrics["written_count"] == 1
+
+    async def test_shutdown_completes_when_driver_swallows_cancellation(
+        self, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        maker, session = mock_session_maker
+        commit_started = asyncio.Event()
+
+        async def slow_commit() -> None:
+            commit_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # asyncpg/SQLAlchemy connection teardown can absorb the cancellation
+                return
+
+        session.commit.side_effect = slow_commit
+        writer = LogEventWriter(flush_interval=0.0, session_maker=maker)
+
+        writer.submit(_pending())
+        drain_task = writer._task
+        await asyncio.wait_for(commit_started.wait(), timeout=1.0)
+        shutdown = asyncio.ensure_future(writer.shutdown(timeout=0.05))
+        await asyncio.wait({shutdown}, timeout=1.0)
+
+        assert shutdown.done()
+        assert drain_task is not None and drain_task.cancelled()
+
+    async def test_database_error_counts_failures(self, mock_session_maker: tuple[MagicMock, AsyncMock]) -> None:
+        maker, session = mock_session_maker
+        session.execute.side_effect = RuntimeError("db down")
+        writer = LogEventWriter(flush_interval=10.0, session_maker=maker)
+
+        writer.submit(_pending())
+        await writer.flush()
+
+        metrics: dict[str, Any] = writer.metrics
+        assert metrics["failed_count"] == 1
+        assert metrics["written_count"] == 0
+        await writer.shutdown()
+
+    async def test_deduplicated_payloads_add_one_blob_upsert(
+        self, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        from src.backend.cc.payload_store import blob_row
+
+        maker, session = mock_session_maker
+        writer = LogEventWriter(flush_interval=10.0, session_maker=maker)
+        blob = blob_row({"data": {"k": "v"}, "tags": [], "memo": "memo"})
+
+        for _ in range(3):
+            pending = _pending()
+            pending.blob = blob
+            writer.submit(pending)
+        await writer.flush()
+
+        # Blob upsert plus one INSERT per table
+        assert session.execute.await_count == 3
+        assert writer.metrics["written_count"] == 3
+        await writer.shutdown()
+
+
+class TestLogEventInRunningLoop:
+    """Test that log_event hands off to the writer inside a running loop."""
+
+    async def test_log_event_returns_queued_ids(
+        self, monkeypatch: Any, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        import core_v2.utils.log_writer as log_writer_module
+        from core_v2.utils.logger import log_event
+
+        maker, _ = mock_session_maker
+        writer = LogEventWriter(flush_interval=10.0, session_maker=maker)
+        monkeypatch.setattr(log_writer_module, "_writer", writer)
+
+        result = log_event(source="cc", data={"k": "v"}, tags=["t"], memo="queued event")
+
+        assert result["status"] == "queued"
+        assert uuid.UUID(result["base_log_id"])
+        assert uuid.UUID(result["event_log_id"])
+        assert writer.metrics["queue_depth"] == 1
+        await writer.shutdown()
+
+    async def test_log_event_uses_writer_payload_dedup_setting(
+        self, monkeypatch: Any, mock_session_maker: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        import core_v2.utils.log_writer as log_writer_module
+        from core_v2.utils.logger import log_event
+
+        maker, _ = mock_session_maker
+        writer = LogEventWriter(flush_interval=10.0, payload_dedup=True, session_maker=maker)
+        monkeypatch.setattr(log_writer_module, "_writer", writer)
+
+        assert log_event(source="cc", data={"k": "v"}, tags=["t"], memo="deduplicated")["status"] == "queued"
+
+        assert writer._queue is not None
+        pending = writer._queue.get_nowait()
+        assert pending.blob is not None
+        assert "data" not in pending.payload
+        assert pending.blob["content"]["data"] == {"k": "v"}
+        await writer.shutdown()
+
+    async def test_log_event_without_memo_is_stub(self) -> None:
+        from core_v2.utils.logger import log_event
+
+        result = log_event(source="cc", data="x", memo=None)
+
+        assert result["status"] == "mem0_stub"
@@ -0,0 +1,78 @@
+"""Unit tests for auto-batched RedisPubSub.publish."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.common.pubsub import PublishError, RedisPubSub
+
+
+async def _echo_counts(serialized: Sequence[tuple[str, bytes]], correlation_id: str | None = None) -> list[int]:
+    # Report each message's position so callers can check they got their own result
+    return list(range(len(serialized)))
+
+
+@pytest.fixture
+def pubsub(pubsub: RedisPubSub) -> RedisPubSub:
+    """Return the shared RedisPubSub with its pipeline send replaced by a mock."""
+    pubsub._publish_encoded = AsyncMock(side_effect=_echo_counts)  # type: ignore[method-assign]
+    return pubsub
+
+
+class TestPublishAutoBatching:
+    """Test linger/size flushing and per-caller results."""
+
+    async def test_concurrent_publishes_share_one_flush(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_auto_batching(linger_ms=5, max_batch=100)
+
+        results = await asyncio.gather(*(pubsub.publish("ch", {"n": i}) for i in range(10)))
+
+        assert results == list(range(10))
+        pubsub._publish_encoded.assert_awaited_once()
+        metrics = pubsub.auto_batching_metrics
+        assert metrics is not None
+        assert metrics["flushes"] == 1
+        assert metrics["linger_flushes"] == 1
+        assert metrics["avg_flush_size"] == 10
+        assert metrics["avg_added_latency_ms"] >= 0
+
+    async def test_full_batch_flushes_without_waiting_for_linger(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_auto_batching(linger_ms=10_000, max_batch=4)
+
+        results = await asyncio.wait_for(asyncio.gather(*(pubsub.publish("ch", {"n": i}) for i in range(8))), 1.0)
+
+        assert results == [0, 1, 2, 3, 0, 1, 2, 3]
+        assert pubsub.auto_batching_metrics["size_flushes"] == 2  # type: ignore[index]
+
+    async def test_batch_failure_reaches_every_caller(self, pubsub: RedisPubSub) -> None:
+        pubsub._publish_encoded.side_effect = PublishError("Redis down")  # type: ignore[attr-defined]
+        pubsub.enable_auto_batching(linger_ms=1, max_batch=100)
+
+        results = await asyncio.gather(*(pubsub.publish("ch", {"n": i}) for i in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, PublishError) for result in results)
+        assert pubsub.auto_batching_metrics["failed_flushes"] == 1  # type: ignore[index]
+
+    async def test_unserializable_message_fails_only_its_caller(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_auto_batching(linger_ms=1, max_batch=100)
+
+        good, bad = await asyncio.gather(
+            pubsub.publish("ch", {"ok": True}), pubsub.publish("ch", {"bad": {1}}), return_exceptions=True
+        )
+
+        assert good == 0
+        assert isinstance(bad, PublishError)
+
+    async def test_disable_flushes_pending_messages(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_auto_batching(linger_ms=10_000, max_batch=100)
+        pending = asyncio.create_task(pubsub.publish("ch", {"n": 1}))
+        await asyncio.sleep(0)
+
+        await pubsub.disable_auto_batching()
+
+        assert await pending == 0
+        assert pubsub.auto_batching_metrics is None
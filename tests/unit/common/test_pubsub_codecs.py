@@ -0,0 +1,118 @@
+"""Unit tests for pub/sub payload codecs and per-channel codec selection."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.common import pubsub_codecs
+from src.common.pubsub import PublishError, RedisPubSub
+from src.common.pubsub_codecs import CodecError, PayloadCodec, decode_payload, get_codec, register_codec
+
+
+class TestCodecs:
+    """Test framing, header dispatch and legacy JSON fallback."""
+
+    def test_orjson_round_trip(self) -> None:
+        message = {"n": 1, "text": "héllo", "nested": {"tags": ["a", "b"]}}
+
+        framed = get_codec("orjson").frame(message)
+
+        assert framed[:1] == b"\x01"
+        assert decode_payload(framed) == message
+
+    def test_orjson_stringifies_non_str_keys(self) -> None:
+        assert decode_payload(get_codec("orjson").frame({1: "one"})) == {"1": "one"}
+
+    def test_raw_passes_bytes_through(self) -> None:
+        envelope = b'{"event_type":"event_log"}'
+
+        framed = get_codec("raw").frame(envelope)
+
+        assert framed == b"\x03" + envelope
+        assert decode_payload(framed) == envelope
+
+    def test_raw_rejects_non_bytes(self) -> None:
+        with pytest.raises(CodecError):
+            get_codec("raw").frame({"n": 1})
+
+    def test_headerless_payload_decodes_as_json(self) -> None:
+        assert decode_payload(b'{"legacy": true}') == {"legacy": True}
+        assert decode_payload('{"legacy": true}') == {"legacy": True}
+
+    def test_malformed_payload_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            decode_payload(b"\x01{not json")
+
+    def test_msgpack_round_trip(self) -> None:
+        pytest.importorskip("msgpack")
+        message = {"n": 1, "blob": b"\x00\xff", "values": [1.5, None]}
+
+        framed = get_codec("msgpack").frame(message)
+
+        assert framed[:1] == b"\x02"
+        assert decode_payload(framed) == message
+
+    def test_msgpack_without_package_raises_codec_error(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(pubsub_codecs, "_MSGPACK_AVAILABLE", False)
+
+        with pytest.raises(CodecError, match="msgpack"):
+            get_codec("msgpack").frame({"n": 1})
+
+    def test_unknown_codec_name(self) -> None:
+        with pytest.raises(ValueError, match="Unknown pub/sub codec"):
+            get_codec("protobuf")
+
+    def test_register_rejects_header_clash_and_json_start_bytes(self) -> None:
+        class Clash(PayloadCodec):
+            name = "clash"
+            header = b"\x01"
+
+        class Brace(PayloadCodec):
+            name = "brace"
+            header = b"{"
+
+        with pytest.raises(ValueError, match="already used"):
+            register_codec(Clash())
+        with pytest.raises(ValueError, match="control byte"):
+            register_codec(Brace())
+
+
+class TestChannelCodecs:
+    """Test codec selection on RedisPubSub."""
+
+    async def test_channel_override_and_reset(self, pubsub: RedisPubSub) -> None:
+        pubsub.set_channel_codec("envelopes", "raw")
+
+        await pubsub.publish("envelopes", b'{"pre":"encoded"}')
+        await pubsub.publish("events", {"n": 1})
+
+        sent = [call.args for call in pubsub._redis.publish.await_args_list]
+        assert sent == [("envelopes", b'\x03{"pre":"encoded"}'), ("events", b'\x01{"n":1}')]
+        assert pubsub.codecs == {"default": "orjson", "channels": {"envelopes": "raw"}}
+
+        pubsub.set_channel_codec("envelopes", None)
+        assert pubsub.codecs["channels"] == {}
+
+    async def test_codec_rejection_raises_publish_error(self, pubsub: RedisPubSub) -> None:
+        pubsub.set_channel_codec("envelopes", "raw")
+
+        with pytest.raises(PublishError, match="serialize"):
+            await pubsub.publish("envelopes", {"not": "bytes"})
+
+    async def test_mixed_publishers_reach_handlers_decoded(self, pubsub: RedisPubSub) -> None:
+        received: list[Any] = []
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append(message)
+
+        pubsub._handlers["ch"] = [handler]
+        for data in (b'\x01{"codec":"orjson"}', b'{"codec":"legacy"}', b"\x03opaque"):
+            await pubsub._handle_message({"channel": b"ch", "data": data})
+
+        assert received == [{"codec": "orjson"}, {"codec": "legacy"}, b"opaque"]
+
+    def test_unknown_default_codec_rejected(self, pubsub: RedisPubSub) -> None:
+        with pytest.raises(ValueError):
+            pubsub.set_default_codec("nope")
@@ -0,0 +1,202 @@
+"""Unit tests for the per-channel RedisPubSub dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.common.pubsub import RedisPubSub
+from src.common.pubsub_codecs import get_codec
+
+
+def _message(channel: str, data: Any) -> dict[str, Any]:
+    return {"type": "message", "channel": channel.encode(), "data": get_codec("orjson").frame(data)}
+
+
+class _Gate:
+    """Handler that records messages and blocks until released."""
+
+    def __init__(self) -> None:
+        self.received: list[Any] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, _channel: str, message: Any) -> None:
+        self.received.append(message)
+        await self.release.wait()
+
+
+class _FakeRedisPubSub:
+    async def unsubscribe(self, *_channels: str) -> None:
+        return None
+
+
+@pytest.fixture
+async def pubsub(pubsub: RedisPubSub) -> Any:
+    """Return the shared RedisPubSub, stopping dispatcher workers after the test."""
+    yield pubsub
+    if pubsub._dispatcher is not None:
+        await pubsub._dispatcher.close()
+
+
+class TestChannelDispatcher:
+    """Test queueing, overflow policies and per-channel metrics."""
+
+    async def test_slow_channel_does_not_stall_others(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=10)
+        slow = _Gate()
+        fast: list[Any] = []
+
+        async def fast_handler(_channel: str, message: Any) -> None:
+            fast.append(message)
+
+        pubsub._handlers = {"slow": [slow], "fast": [fast_handler]}
+
+        await pubsub._dispatch_message(_message("slow", {"n": 0}))
+        await pubsub._dispatch_message(_message("slow", {"n": 1}))
+        for i in range(3):
+            await pubsub._dispatch_message(_message("fast", {"n": i}))
+        await asyncio.wait_for(pubsub._dispatcher._channels["fast"].queue.join(), timeout=1)  # type: ignore[union-attr]
+
+        assert fast == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert slow.received == [{"n": 0}]
+        assert pubsub._dispatcher.depth("slow") == 1  # type: ignore[union-attr]
+
+        slow.release.set()
+        await asyncio.wait_for(pubsub._dispatcher.join(), timeout=1)  # type: ignore[union-attr]
+        assert slow.received == [{"n": 0}, {"n": 1}]
+
+    async def test_drop_oldest_discards_queued_messages(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=2, policy="drop_oldest")
+        gate = _Gate()
+        pubsub._handlers = {"ch": [gate]}
+
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        await asyncio.sleep(0)  # The worker takes n=0 and blocks in the handler
+        for i in range(1, 5):
+            await pubsub._dispatch_message(_message("ch", {"n": i}))
+        gate.release.set()
+        await asyncio.wait_for(pubsub._dispatcher.join(), timeout=1)  # type: ignore[union-attr]
+
+        assert gate.received == [{"n": 0}, {"n": 3}, {"n": 4}]
+        stats = pubsub.dispatcher_metrics["channels"]["ch"]  # type: ignore[index]
+        assert stats["dropped"] == 2
+        assert stats["delivered"] == 3
+
+    async def test_spill_keeps_order_and_bounds_overflow(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=2, policy="spill", spill_size=3)
+        gate = _Gate()
+        pubsub._handlers = {"ch": [gate]}
+
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        await asyncio.sleep(0)
+        for i in range(1, 8):
+            await pubsub._dispatch_message(_message("ch", {"n": i}))
+
+        stats = pubsub.dispatcher_metrics["channels"]["ch"]  # type: ignore[index]
+        assert (stats["depth"], stats["spill_depth"]) == (2, 3)
+        assert stats["spilled"] == 5
+        assert stats["dropped"] == 2
+
+        gate.release.set()
+        await asyncio.wait_for(pubsub._dispatcher.join(), timeout=1)  # type: ignore[union-attr]
+        assert [m["n"] for m in gate.received] == [0, 1, 2, 5, 6, 7]
+
+    async def test_block_waits_for_room(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=1)
+        gate = _Gate()
+        pubsub._handlers = {"ch": [gate]}
+
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        await asyncio.sleep(0)
+        await pubsub._dispatch_message(_message("ch", {"n": 1}))
+        blocked = asyncio.create_task(pubsub._dispatch_message(_message("ch", {"n": 2})))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await asyncio.wait_for(pubsub._dispatcher.join(), timeout=1)  # type: ignore[union-attr]
+        assert [m["n"] for m in gate.received] == [0, 1, 2]
+
+    async def test_handler_error_does_not_stop_worker(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=10)
+        received: list[Any] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            if message["n"] == 0:
+                raise RuntimeError("boom")
+            received.append(message)
+
+        pubsub._handlers = {"ch": [handler]}
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        await pubsub._dispatch_message(_message("ch", {"n": 1}))
+        await asyncio.wait_for(pubsub._dispatcher.join(), timeout=1)  # type: ignore[union-attr]
+
+        assert received == [{"n": 1}]
+
+    async def test_unsubscribe_stops_channel_workers(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=10)
+        gate = _Gate()
+        pubsub._handlers = {"ch": [gate]}
+        pubsub._subscribers = {"ch"}
+        pubsub._pubsub = _FakeRedisPubSub()
+
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        await asyncio.sleep(0)
+        await pubsub.unsubscribe("ch")
+
+        assert pubsub.dispatcher_metrics["channels"] == {}  # type: ignore[index]
+
+    async def test_reenabling_stops_previous_workers(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=10)
+        received: list[Any] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+
+        pubsub._handlers = {"ch": [handler]}
+        await pubsub._dispatch_message(_message("ch", {"n": 0}))
+        previous = pubsub._dispatcher
+        assert previous is not None
+        workers = list(previous._channels["ch"].workers)
+
+        await pubsub.enable_dispatcher(queue_size=5, workers=2)
+
+        assert received == [{"n": 0}]
+        assert all(task.done() for task in workers)
+        assert pubsub._dispatcher is not previous
+        assert pubsub.dispatcher_metrics["queue_size"] == 5  # type: ignore[index]
+
+    async def test_health_check_reports_dispatcher(self, pubsub: RedisPubSub) -> None:
+        await pubsub.enable_dispatcher(queue_size=5, policy="spill")
+
+        health = await pubsub.health_check()
+
+        assert health["dispatcher"]["policy"] == "spill"
+        assert health["dispatcher"]["queue_size"] == 5
+
+
+class TestListenLoopWithDispatcher:
+    """Test the listen loop handing messages to the dispatcher over fakeredis."""
+
+    async def test_messages_reach_handlers_through_dispatcher(self, fake_redis_pubsub: RedisPubSub) -> None:
+        await fake_redis_pubsub.enable_dispatcher(queue_size=10)
+        received: list[Any] = []
+        done = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+            if len(received) == 3:
+                done.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            for i in range(3):
+                await fake_redis_pubsub.publish("events", {"n": i})
+            await asyncio.wait_for(done.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [{"n": 0}, {"n": 1}, {"n": 2}]
@@ -0,0 +1,296 @@
+"""Unit tests for the publish_with_fallback stores and their replay."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.common.pubsub import CircuitBreaker, PubSubError, RedisPubSub, cleanup_pubsub, get_pubsub
+from src.common.pubsub_fallback import QueueLockedError, ReplayRing, SegmentFileQueue
+from src.common.redis_config import RedisConfig
+
+
+async def _drained(pubsub: RedisPubSub, strategy: str) -> dict[str, Any]:
+    store = "file" if strategy == "file_queue" else "memory"
+    async with asyncio.timeout(2):
+        while True:
+            metrics = pubsub.fallback_metrics
+            assert metrics is not None
+            if metrics[store]["depth"] == 0:
+                return metrics
+            await asyncio.sleep(0.01)
+
+
+class TestReplayRing:
+    """Test the in-memory ring's limits."""
+
+    async def test_drops_oldest_beyond_count_and_bytes(self) -> None:
+        ring = ReplayRing(max_messages=3, max_bytes=10)
+        for i in range(4):
+            await ring.append("ch", bytes([i]) * 2)
+        assert await ring.peek(10) == [("ch", b"\x01\x01"), ("ch", b"\x02\x02"), ("ch", b"\x03\x03")]
+
+        await ring.append("ch", b"x" * 8)
+        assert [payload for _, payload in await ring.peek(10)] == [b"\x03\x03", b"x" * 8]
+        assert ring.metrics == {"depth": 2, "bytes": 10, "enqueued": 5, "dropped": 3, "replayed": 0}
+
+    async def test_commit_after_overflow_keeps_newer_messages(self) -> None:
+        ring = ReplayRing(max_messages=2)
+        await ring.append("ch", b"a")
+        await ring.append("ch", b"b")
+        batch = await ring.peek(2)
+        # Both peeked messages are pushed out while the batch is in flight
+        await ring.append("ch", b"c")
+        await ring.append("ch", b"d")
+
+        await ring.commit(len(batch))
+        assert await ring.peek(10) == [("ch", b"c"), ("ch", b"d")]
+
+
+class TestSegmentFileQueue:
+    """Test segment rolling, commits and recovery of the file queue."""
+
+    async def test_peek_and_commit_across_segments(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path, segment_bytes=64, fsync_every=2)
+        messages = [(f"ch.{i}", f"payload-{i}".encode()) for i in range(10)]
+        for channel, payload in messages:
+            await queue.append(channel, payload)
+        assert queue.metrics["segments"] > 2
+
+        first = await queue.peek(4)
+        assert first == messages[:4]
+        await queue.commit(4)
+        rest = await queue.peek(100)
+        assert rest == messages[4:]
+        await queue.commit(len(rest))
+
+        assert len(queue) == 0
+        assert await queue.peek(10) == []
+        # Consumed segments are deleted; only the current one is left
+        assert len(list(tmp_path.glob("*.seg"))) == 1
+        await queue.close()
+
+    async def test_restart_resumes_from_committed_position(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path, segment_bytes=64)
+        for i in range(6):
+            await queue.append("ch", str(i).encode())
+        await queue.commit(len(await queue.peek(2)))
+        await queue.close()
+
+        reopened = await SegmentFileQueue.open(tmp_path, segment_bytes=64)
+        assert len(reopened) == 4
+        assert [payload for _, payload in await reopened.peek(10)] == [b"2", b"3", b"4", b"5"]
+        await reopened.close()
+
+    async def test_depth_recorded_on_close_and_recounted_after_crash(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path)
+        for i in range(3):
+            await queue.append("ch", str(i).encode())
+        await queue.close()
+
+        # A clean close recorded the depth, so reopening reads no segment
+        with patch.object(SegmentFileQueue, "_count_records", side_effect=AssertionError("rescanned")):
+            reopened = await SegmentFileQueue.open(tmp_path)
+        assert len(reopened) == 3
+        await reopened.append("ch", b"3")
+        await reopened.sync()
+        # The process dies without closing the queue
+        reopened._lock.close()
+
+        recovered = await SegmentFileQueue.open(tmp_path)
+        assert len(recovered) == 4
+        await recovered.close()
+
+    async def test_torn_tail_is_skipped(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path)
+        await queue.append("ch", b"kept")
+        await queue.append("ch", b"torn")
+        await queue.close()
+        segment = next(tmp_path.glob("*.seg"))
+        segment.write_bytes(segment.read_bytes()[:-2])
+
+        reopened = await SegmentFileQueue.open(tmp_path)
+        assert await reopened.peek(10) == [("ch", b"kept")]
+        assert reopened.metrics["corrupt_records"] >= 1
+        await reopened.close()
+
+    async def test_oldest_segments_dropped_beyond_max_bytes(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path, segment_bytes=64, max_bytes=256)
+        for i in range(50):
+            await queue.append("ch", f"{i:04d}".encode() * 4)
+
+        metrics = queue.metrics
+        assert metrics["bytes"] <= 256
+        assert metrics["dropped_segments"] > 0
+        remaining = await queue.peek(100)
+        assert len(remaining) == len(queue) < 50
+        assert remaining[-1] == ("ch", b"0049" * 4)
+        await queue.close()
+
+    async def test_locked_directory_is_refused(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path)
+        with pytest.raises(QueueLockedError, match="in use"):
+            await SegmentFileQueue.open(tmp_path)
+        await queue.close()
+
+        reopened = await SegmentFileQueue.open(tmp_path)
+        await reopened.close()
+
+    async def test_commit_must_follow_peek(self, tmp_path: Path) -> None:
+        queue = await SegmentFileQueue.open(tmp_path)
+        await queue.append("ch", b"x")
+        with pytest.raises(ValueError, match="peek"):
+            await queue.commit(1)
+        await queue.close()
+
+
+class TestFallbackReplay:
+    """Test replay of parked messages once the circuit breaker recovers, over fakeredis."""
+
+    @pytest.mark.parametrize("strategy", ["memory_queue", "file_queue"])
+    async def test_parked_messages_replayed_in_order(
+        self, fake_redis_pubsub: RedisPubSub, tmp_path: Path, strategy: str
+    ) -> None:
+        await fake_redis_pubsub.configure_fallback(file_dir=tmp_path, replay_rate=0, replay_batch=4)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.3, success_threshold=1)
+        fake_redis_pubsub._circuit_breaker = breaker
+        received: list[Any] = []
+        done = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+            if len(received) == 10:
+                done.set()
+
+        async def fail() -> None:
+            raise ConnectionError("down")
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            with pytest.raises(ConnectionError):
+                await breaker.call(fail)
+            for i in range(10):
+                result = await fake_redis_pubsub.publish_with_fallback("events", {"n": i}, fallback_strategy=strategy)
+                assert result["fallback_used"] is True
+                assert result["success"] is True
+
+            await asyncio.wait_for(done.wait(), timeout=2)
+            # The last batch is committed just after it was delivered
+            metrics = await _drained(fake_redis_pubsub, strategy)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [{"n": i} for i in range(10)]
+        store = metrics["file"] if strategy == "file_queue" else metrics["memory"]
+        assert store["replayed"] == 10
+        # One single-message probe while half-open, then full batches
+        assert metrics["replayed_batches"] == 4
+        assert metrics["failed_batches"] == 0
+
+    async def test_store_errors_do_not_end_replay(self, fake_redis_pubsub: RedisPubSub) -> None:
+        await fake_redis_pubsub.configure_fallback(replay_rate=0)
+        fallback = fake_redis_pubsub._fallback
+        assert fallback is not None
+        fallback._retry_interval = 0.01
+        received = asyncio.Event()
+
+        async def handler(_channel: str, _message: Any) -> None:
+            received.set()
+
+        peek = fallback.memory.peek
+        failures = [OSError("segment vanished"), ValueError("unreadable")]
+
+        async def flaky_peek(count: int) -> list[tuple[str, bytes]]:
+            if failures:
+                raise failures.pop(0)
+            return await peek(count)
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            with patch.object(fallback.memory, "peek", flaky_peek):
+                await fallback.park("events", fake_redis_pubsub.encode_message("events", {"n": 1}), durable=False)
+                await asyncio.wait_for(received.wait(), timeout=2)
+            metrics = await _drained(fake_redis_pubsub, "memory_queue")
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert metrics["store_errors"] == 2
+        assert metrics["replayed_batches"] == 1
+
+    @pytest.mark.parametrize("locked", [False, True])
+    async def test_file_queue_kept_in_memory_without_usable_directory(
+        self, fake_redis_pubsub: RedisPubSub, tmp_path: Path, locked: bool
+    ) -> None:
+        holder = await SegmentFileQueue.open(tmp_path) if locked else None
+        await fake_redis_pubsub.configure_fallback(file_dir=tmp_path if locked else None)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        fake_redis_pubsub._circuit_breaker = breaker
+
+        async def fail() -> None:
+            raise ConnectionError("down")
+
+        try:
+            with pytest.raises(ConnectionError):
+                await breaker.call(fail)
+            result = await fake_redis_pubsub.publish_with_fallback("events", {"n": 1}, fallback_strategy="file_queue")
+            metrics = fake_redis_pubsub.fallback_metrics
+            assert metrics is not None
+        finally:
+            await fake_redis_pubsub.disconnect()
+            if holder is not None:
+                await holder.close()
+
+        assert result["success"] is True
+        assert metrics["file"] is None
+        assert metrics["memory"]["depth"] == 1
+
+    async def test_leftover_file_queue_replayed_on_configure(
+        self, fake_redis_pubsub: RedisPubSub, tmp_path: Path
+    ) -> None:
+        queue = await SegmentFileQueue.open(tmp_path)
+        await queue.append("events", fake_redis_pubsub.encode_message("events", {"n": 1}))
+        await queue.close()
+        received: list[Any] = []
+        done = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+            done.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            await fake_redis_pubsub.configure_fallback(file_dir=tmp_path)
+            await asyncio.wait_for(done.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [{"n": 1}]
+        reopened = await SegmentFileQueue.open(tmp_path)
+        assert len(reopened) == 0
+        await reopened.close()
+
+    async def test_singleton_keeps_file_queue_when_first_connect_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        config = RedisConfig(redis_fallback_dir=str(tmp_path))
+        monkeypatch.setattr("src.common.pubsub.get_redis_config", lambda: config)
+        await cleanup_pubsub()
+        try:
+            with (
+                patch.object(RedisPubSub, "connect", AsyncMock(side_effect=PubSubError("down"))),
+                pytest.raises(PubSubError),
+            ):
+                await get_pubsub()
+            pubsub = await get_pubsub()
+            assert pubsub._fallback is not None
+            assert await pubsub._fallback.open_file_queue() is not None
+        finally:
+            await cleanup_pubsub()
+
+        # Stopping the never-connected singleton released the directory
+        reopened = await SegmentFileQueue.open(tmp_path)
+        await reopened.close()
@@ -0,0 +1,91 @@
+"""Unit tests for lean (untraced) RedisPubSub publishing."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.common.pubsub import PublishError, PublishTimings, RedisPubSub
+
+
+class TestLeanPublish:
+    """Test the untraced publish path and its sampling."""
+
+    async def test_lean_publish_encodes_once_and_records_timing(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_lean_publish(sample_rate=0)
+
+        result = await pubsub.publish("ch", {"n": 1, "text": "héllo"})
+
+        assert result == 2
+        payload = b"\x01" + '{"n":1,"text":"héllo"}'.encode()
+        pubsub._redis.publish.assert_awaited_once_with("ch", payload)
+        metrics = pubsub.lean_publish_metrics
+        assert metrics["enabled"] is True
+        assert metrics["publishes"] == 1
+        assert metrics["bytes"] == len(payload)
+        assert metrics["p50_ms"] is not None
+
+    async def test_sampled_calls_take_traced_path(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_lean_publish(sample_rate=0.25)
+
+        for i in range(8):
+            await pubsub.publish("ch", {"n": i})
+
+        # Every 4th call is traced and not counted in the lean timings
+        assert pubsub._redis.publish.await_count == 8
+        assert pubsub.lean_publish_metrics["publishes"] == 6
+
+    async def test_failure_raises_publish_error_and_counts(self, pubsub: RedisPubSub) -> None:
+        pubsub._redis.publish.side_effect = RuntimeError("boom")
+        pubsub.enable_lean_publish(sample_rate=0)
+
+        with pytest.raises(PublishError):
+            await pubsub.publish("ch", {"n": 1})
+
+        assert pubsub.lean_publish_metrics["errors"] == 1
+        assert pubsub.lean_publish_metrics["publishes"] == 0
+
+    async def test_unserializable_message_raises_publish_error(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_lean_publish(sample_rate=0)
+
+        with pytest.raises(PublishError, match="serialize"):
+            await pubsub.publish("ch", {"bad": {1}})
+
+        pubsub._redis.publish.assert_not_awaited()
+
+    async def test_publish_encoded_works_without_lean_mode(self, pubsub: RedisPubSub) -> None:
+        assert await pubsub.publish_encoded("ch", b'{"n":1}') == 2
+
+        pubsub._redis.publish.assert_awaited_once_with("ch", b'{"n":1}')
+        assert pubsub.lean_publish_metrics["enabled"] is False
+        assert pubsub.lean_publish_metrics["publishes"] == 1
+
+    def test_invalid_sample_rate_rejected(self, pubsub: RedisPubSub) -> None:
+        with pytest.raises(ValueError, match="sample_rate"):
+            pubsub.enable_lean_publish(sample_rate=1.5)
+
+
+class TestPublishTimings:
+    """Test the preallocated latency counters."""
+
+    def test_quantiles_use_bucket_upper_bounds(self) -> None:
+        timings = PublishTimings()
+        for _ in range(99):
+            timings.record(100_000, 10)  # 0.1ms
+        timings.record(5_000_000, 10)  # 5ms
+
+        assert timings.count == 100
+        assert timings.slow == 1
+        assert timings.bytes == 1000
+        # 100_000ns lands in the (65.5us, 131us] bucket
+        assert timings.quantile_ms(0.5) == pytest.approx(0.131072)
+        assert timings.quantile_ms(1.0) == pytest.approx(5.0)
+
+    def test_huge_latency_lands_in_last_bucket(self) -> None:
+        timings = PublishTimings()
+        timings.record(10**12, 1)
+
+        assert timings.buckets[-1] == 1
+        assert timings.quantile_ms(0.5) == pytest.approx(10**6)
+
+    def test_empty_timings(self) -> None:
+        assert PublishTimings().to_dict()["p99_ms"] is None
@@ -0,0 +1,124 @@
+"""Unit tests for in-process loopback delivery in RedisPubSub."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.common.pubsub import PublishError, RedisPubSub
+from src.common.pubsub_loopback import LoopbackEchoes
+
+
+class TestLoopbackEchoes:
+    """Test echo expectation bookkeeping."""
+
+    def test_consumes_expected_copies_only(self) -> None:
+        echoes = LoopbackEchoes()
+        echoes.expect("ch", b"\x01{}", 2)
+
+        assert echoes.consume("ch", b"\x01{}") is True
+        assert echoes.consume("ch", b"\x01{}") is True
+        assert echoes.consume("ch", b"\x01{}") is False
+        assert echoes.consume("other", b"\x01{}") is False
+        assert echoes.metrics["suppressed"] == 2
+
+    def test_forget_and_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 100.0
+        monkeypatch.setattr("src.common.pubsub_loopback.time.monotonic", lambda: now)
+        echoes = LoopbackEchoes(ttl=1.0)
+
+        echoes.expect("ch", b"a", 1)
+        echoes.forget("ch", b"a", 1)
+        assert echoes.consume("ch", b"a") is False
+
+        echoes.expect("ch", b"b", 1)
+        now = 102.0
+        assert echoes.consume("ch", b"b") is False
+        assert echoes.metrics == {"delivered": 0, "suppressed": 0, "expired": 1, "pending": 0}
+
+
+class TestLoopbackDelivery:
+    """Test local delivery and suppression of the copy from Redis over fakeredis."""
+
+    async def test_local_handler_gets_object_once(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.enable_loopback()
+        received: list[Any] = []
+        done = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+            done.set()
+
+        message = {"n": 1}
+        try:
+            await fake_redis_pubsub.subscribe("mem0.recorded.cc", handler)
+            await fake_redis_pubsub.psubscribe("mem0.recorded.*", handler)
+            assert await fake_redis_pubsub.publish("mem0.recorded.cc", message) == 2
+            await asyncio.wait_for(done.wait(), timeout=1)
+            # Give the copies from Redis time to arrive and be dropped
+            await asyncio.sleep(0.05)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert len(received) == 2
+        assert all(item is message for item in received)
+        metrics = fake_redis_pubsub.loopback_metrics
+        assert metrics is not None
+        assert metrics["suppressed"] == 2
+        assert metrics["pending"] == 0
+
+    async def test_remote_messages_still_delivered(self, fake_redis_pubsub: RedisPubSub, fake_redis: Any) -> None:
+        fake_redis_pubsub.enable_loopback()
+        received: list[Any] = []
+        done = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+            if len(received) == 2:
+                done.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            await fake_redis_pubsub.publish("events", {"from": "local"})
+            # Another process publishing the same bytes after the echo was consumed
+            await asyncio.sleep(0.05)
+            await fake_redis.publish("events", fake_redis_pubsub.encode_message("events", {"from": "local"}))
+            await asyncio.wait_for(done.wait(), timeout=1)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [{"from": "local"}, {"from": "local"}]
+
+    async def test_publish_many_loops_back_matching_items(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.enable_loopback()
+        received: list[tuple[str, Any]] = []
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append((channel, message))
+
+        try:
+            await fake_redis_pubsub.subscribe("a", handler)
+            await fake_redis_pubsub.publish_many([("a", {"n": 1}), ("b", {"n": 2}), ("a", {"n": 3})])
+            await asyncio.sleep(0.05)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [("a", {"n": 1}), ("a", {"n": 3})]
+        assert fake_redis_pubsub.loopback_metrics["suppressed"] == 2  # type: ignore[index]
+
+    async def test_failed_publish_withdraws_expected_echo(self, pubsub: RedisPubSub) -> None:
+        pubsub.enable_loopback()
+        pubsub._redis.publish.side_effect = ConnectionError("down")
+
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        pubsub._handlers = {"ch": [handler]}
+        pubsub._rebuild_router()
+
+        with pytest.raises(PublishError):
+            await pubsub.publish("ch", {"n": 1})
+        assert pubsub.loopback_metrics["pending"] == 0  # type: ignore[index]
+        assert pubsub.loopback_metrics["delivered"] == 1  # type: ignore[index]
@@ -16,6 +16,7 @@ import gc
 import os
 import time
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -296,6 +297,44 @@ class TestRedisPubSubPerformance:
 
         print(f"Circuit breaker overhead: {mean_time_ms:.2f}ms for {config['test_iterations']} operations")  # noqa: T201
 
+    @pytest.mark.benchmark
+    async def test_lean_publish_skips_spans_and_reuses_timings(
+        self,
+        redis_pubsub_with_mocks: RedisPubSub,
+        redis_test_utils: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Lean publish opens a span only for sampled calls and records into preallocated buckets."""
+        import src.common.pubsub as pubsub_module
+
+        pubsub = redis_pubsub_with_mocks
+        test_message = redis_test_utils.generate_test_message(100)
+        span = MagicMock()
+        monkeypatch.setattr(pubsub_module.logfire, "span", span)
+
+        for _ in range(10):
+            await pubsub.publish("lean_benchmark", test_message)
+        assert span.call_count == 10
+
+        calls = 500
+        pubsub.enable_lean_publish(sample_rate=0.01)
+        timings = pubsub._publish_timings
+        buckets = timings.buckets
+        span.reset_mock()
+
+        for _ in range(calls):
+            await pubsub.publish("lean_benchmark", test_message)
+
+        # One traced call per 100, the rest counted in place in the same bucket array
+        sampled = calls // 100
+        assert span.call_count == sampled
+        assert timings.buckets is buckets
+        assert len(buckets) == timings.BUCKETS
+        assert sum(buckets) == timings.count == calls - sampled
+        assert pubsub.lean_publish_metrics["publishes"] == calls - sampled
+
+        print(f"Lean publish: {pubsub.lean_publish_metrics}")  # noqa: T201
+
 
 class TestRedisPubSubStressTests:
     """Stress tests for Redis Pub/Sub under extreme conditions.
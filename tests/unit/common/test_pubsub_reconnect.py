@@ -0,0 +1,143 @@
+"""Unit tests for the supervised Pub/Sub listener's reconnects, over fakeredis."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.common.pubsub import RedisPubSub
+
+
+def _reconnected(pubsub: RedisPubSub) -> asyncio.Event:
+    """Return an event set once the listener has reconnected."""
+    event = asyncio.Event()
+    reconnect = pubsub._reconnect_listener
+
+    async def reconnect_and_signal(shard: Any) -> bool:
+        reconnected = await reconnect(shard)
+        event.set()
+        return reconnected
+
+    pubsub._reconnect_listener = reconnect_and_signal  # type: ignore[method-assign]
+    return event
+
+
+def _break_connection(connection: Any) -> None:
+    # The listen loop's next read fails as if the server had dropped the socket
+    connection.parse_response = AsyncMock(side_effect=RedisConnectionError("Connection reset by peer"))
+
+
+class TestListenerReconnect:
+    """Test that a failed listener connection is rebuilt and resubscribed."""
+
+    async def test_channels_and_patterns_resubscribed(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.configure_reconnect(backoff_base=0.001, backoff_max=0.01)
+        reconnected = _reconnected(fake_redis_pubsub)
+        received: list[tuple[str, Any]] = []
+        both_received = asyncio.Event()
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append((channel, message))
+            if len(received) == 2:
+                both_received.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            await fake_redis_pubsub.psubscribe("audit.*", handler)
+            broken = fake_redis_pubsub._pubsub
+            task = fake_redis_pubsub._listening_task
+            _break_connection(broken)
+            # The listener's next read fails, losing this message with the connection
+            await fake_redis_pubsub.publish("events", {"n": 0})
+
+            await asyncio.wait_for(reconnected.wait(), timeout=2)
+            assert fake_redis_pubsub._pubsub is not broken
+            assert fake_redis_pubsub._listening_task is task
+            assert task is not None and not task.done()
+
+            await fake_redis_pubsub.publish("events", {"n": 1})
+            await fake_redis_pubsub.publish("audit.login", {"n": 2})
+            await asyncio.wait_for(both_received.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [("events", {"n": 1}), ("audit.login", {"n": 2})]
+        metrics = fake_redis_pubsub.reconnect_metrics
+        assert metrics["attempts"] == 1
+        assert metrics["failed_attempts"] == 0
+        assert 0 < metrics["last_gap_s"] == metrics["max_gap_s"] == metrics["total_gap_s"]
+
+    async def test_retries_with_backoff_until_redis_answers(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.configure_reconnect(backoff_base=0.001, backoff_max=0.01)
+        reconnected = _reconnected(fake_redis_pubsub)
+        received = asyncio.Event()
+
+        async def handler(_channel: str, _message: Any) -> None:
+            received.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            redis_client = fake_redis_pubsub._redis
+            assert redis_client is not None
+            redis_client.ping = AsyncMock(
+                side_effect=[RedisConnectionError("down"), RedisConnectionError("down"), True]
+            )
+            _break_connection(fake_redis_pubsub._pubsub)
+            await fake_redis_pubsub.publish("events", {"n": 0})
+
+            await asyncio.wait_for(reconnected.wait(), timeout=2)
+            received.clear()
+            await fake_redis_pubsub.publish("events", {"n": 1})
+            await asyncio.wait_for(received.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        metrics = fake_redis_pubsub.reconnect_metrics
+        assert metrics["attempts"] == 3
+        assert metrics["failed_attempts"] == 2
+
+    async def test_disconnect_stops_a_reconnecting_listener(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.configure_reconnect(backoff_base=10.0, backoff_max=10.0)
+
+        async def handler(_channel: str, _message: Any) -> None:
+            pass
+
+        await fake_redis_pubsub.subscribe("events", handler)
+        task = fake_redis_pubsub._listening_task
+        assert task is not None
+        _break_connection(fake_redis_pubsub._pubsub)
+        await fake_redis_pubsub.publish("events", {"n": 0})
+        await asyncio.sleep(0.05)  # Now waiting out the backoff
+
+        await asyncio.wait_for(fake_redis_pubsub.disconnect(), timeout=1)
+        assert task.done()
+        assert fake_redis_pubsub.reconnect_metrics["reconnects"] == 0
+
+    @pytest.mark.parametrize("sharded_commands", [False, True])
+    async def test_shard_connection_resubscribed(self, fake_redis_pubsub: RedisPubSub, sharded_commands: bool) -> None:
+        await fake_redis_pubsub.enable_sharding(2, sharded_commands=sharded_commands)
+        fake_redis_pubsub.configure_reconnect(backoff_base=0.001, backoff_max=0.01)
+        reconnected = _reconnected(fake_redis_pubsub)
+        received = asyncio.Event()
+
+        async def handler(_channel: str, message: Any) -> None:
+            if message == {"n": 1}:
+                received.set()
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            shard = fake_redis_pubsub._shard_for("events")
+            broken = shard.connection
+            _break_connection(broken)
+            await fake_redis_pubsub.publish("events", {"n": 0})
+
+            await asyncio.wait_for(reconnected.wait(), timeout=2)
+            assert shard.connection is not broken
+            await fake_redis_pubsub.publish("events", {"n": 1})
+            await asyncio.wait_for(received.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
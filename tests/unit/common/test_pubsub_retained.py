@@ -0,0 +1,148 @@
+"""Unit tests for retained last messages on Pub/Sub channels, over fakeredis."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.common.base_subscriber import subscribe_to_channel
+from src.common.pubsub import RedisPubSub
+
+
+async def _retained_message(pubsub: RedisPubSub, channel: str) -> Any:
+    retained = await pubsub.get_retained(channel)
+    assert retained is not None
+    return retained[0]
+
+
+class TestRetainedMessages:
+    """Test that retained channels keep their last message for late subscribers."""
+
+    async def test_late_subscriber_receives_last_message(self, fake_redis_pubsub: RedisPubSub, fake_redis: Any) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 60.0)
+        received: list[Any] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+
+        try:
+            assert await fake_redis_pubsub.publish("state", {"version": 1}) == 0
+            assert await fake_redis_pubsub.publish("state", {"version": 2}) == 0
+            assert 0 < await fake_redis.pttl("retained:state") <= 60_000
+
+            await fake_redis_pubsub.subscribe("state", handler)
+            # Delivered before subscribe returned
+            assert received == [{"version": 2}]
+
+            retained = await fake_redis_pubsub.get_retained("state")
+            assert retained is not None
+            assert retained[0] == {"version": 2}
+            assert retained[1] > 0
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert fake_redis_pubsub.retained_metrics == {
+            "channels": {"state": 60.0},
+            "stored": 2,
+            "delivered": 1,
+            "missed": 0,
+        }
+
+    async def test_each_attached_handler_receives_it(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 60.0)
+        first, second = AsyncMock(), AsyncMock()
+        try:
+            await fake_redis_pubsub.publish("state", {"version": 1})
+            await fake_redis_pubsub.subscribe("state", first)
+            await fake_redis_pubsub.subscribe("state", second)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        first.assert_awaited_once_with("state", {"version": 1})
+        second.assert_awaited_once_with("state", {"version": 1})
+
+    async def test_other_channels_are_not_stored(self, fake_redis_pubsub: RedisPubSub, fake_redis: Any) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 60.0)
+        handler = AsyncMock()
+        try:
+            await fake_redis_pubsub.publish("events", {"n": 1})
+            await fake_redis_pubsub.subscribe("events", handler)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert not await fake_redis.exists("retained:events")
+        handler.assert_not_awaited()
+        assert fake_redis_pubsub.retained_metrics["stored"] == 0
+
+    async def test_untraced_and_batched_publishes_are_stored(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.set_channel_retained("a", 60.0)
+        fake_redis_pubsub.set_channel_retained("b", 60.0)
+        handler = AsyncMock()
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            counts = await fake_redis_pubsub.publish_many(
+                [("a", {"n": 1}), ("events", {"n": 2}), ("b", {"n": 3}), ("a", {"n": 4})]
+            )
+            assert counts == [0, 1, 0, 0]
+            assert await _retained_message(fake_redis_pubsub, "a") == {"n": 4}
+            assert await _retained_message(fake_redis_pubsub, "b") == {"n": 3}
+
+            await fake_redis_pubsub.publish_encoded("b", fake_redis_pubsub.encode_message("b", {"n": 5}))
+            assert await _retained_message(fake_redis_pubsub, "b") == {"n": 5}
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert fake_redis_pubsub.retained_metrics["stored"] == 4
+
+    async def test_expired_message_is_not_delivered(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 0.05)
+        handler = AsyncMock()
+        try:
+            await fake_redis_pubsub.publish("state", {"version": 1})
+            await asyncio.sleep(0.1)
+            await fake_redis_pubsub.subscribe("state", handler)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        handler.assert_not_awaited()
+        assert fake_redis_pubsub.retained_metrics["missed"] == 1
+
+    async def test_read_failure_leaves_subscription_working(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 60.0)
+        received = asyncio.Event()
+
+        async def handler(_channel: str, _message: Any) -> None:
+            received.set()
+
+        try:
+            with patch.object(fake_redis_pubsub._redis, "hmget", AsyncMock(side_effect=RedisConnectionError("down"))):
+                await fake_redis_pubsub.subscribe("state", handler)
+            assert not received.is_set()
+
+            await fake_redis_pubsub.publish("state", {"version": 1})
+            await asyncio.wait_for(received.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+    async def test_subscribe_to_channel_yields_retained_message_first(self, fake_redis_pubsub: RedisPubSub) -> None:
+        fake_redis_pubsub.set_channel_retained("state", 60.0)
+        await fake_redis_pubsub.publish("state", {"version": 1})
+        try:
+            with patch("src.common.base_subscriber.get_pubsub", AsyncMock(return_value=fake_redis_pubsub)):
+                messages = subscribe_to_channel("state", max_idle_time=1.0)
+                assert await anext(messages) == {"version": 1}
+                await messages.aclose()
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+    def test_set_channel_retained_validates_and_clears(self, fake_redis_pubsub: RedisPubSub) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            fake_redis_pubsub.set_channel_retained("state", 0)
+
+        fake_redis_pubsub.set_channel_retained("state", 30.0)
+        fake_redis_pubsub.set_channel_retained("state", None)
+        assert fake_redis_pubsub.retained_metrics["channels"] == {}
@@ -0,0 +1,139 @@
+"""Unit tests for pattern subscriptions and the compiled channel router."""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import random
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.common.pubsub import RedisPubSub
+from src.common.pubsub_codecs import get_codec
+from src.common.pubsub_router import ChannelRouter
+
+
+class TestChannelRouter:
+    """Test glob matching against Redis PSUBSCRIBE semantics."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "channel", "expected"),
+        [
+            ("mem0.recorded.*", "mem0.recorded.user", True),
+            ("mem0.recorded.*", "mem0.recorded.", True),
+            ("mem0.recorded.*", "mem0.deleted.user", False),
+            ("*", "", True),
+            ("h?llo", "hello", True),
+            ("h?llo", "hllo", False),
+            ("h[ae]llo", "hallo", True),
+            ("h[ae]llo", "hillo", False),
+            ("h[^e]llo", "hallo", True),
+            ("h[^e]llo", "hello", False),
+            ("h[a-b]llo", "hbllo", True),
+            ("h[a-b]llo", "hcllo", False),
+            (r"h\*llo", "h*llo", True),
+            (r"h\*llo", "hello", False),
+            ("a*b*c", "axxbyyc", True),
+            ("a*b*c", "axxbyy", False),
+            ("a**c", "abc", True),
+        ],
+    )
+    def test_glob_semantics(self, pattern: str, channel: str, expected: bool) -> None:
+        router = ChannelRouter(patterns=[pattern])
+
+        assert (router.match_patterns(channel) == (pattern,)) is expected
+
+    def test_exact_channel_comes_before_patterns(self) -> None:
+        router = ChannelRouter(channels=["mem0.recorded.user"], patterns=["*.user", "mem0.*", "other.*"])
+
+        assert router.match("mem0.recorded.user") == ("mem0.recorded.user", "*.user", "mem0.*")
+        assert router.match("mem0.deleted.agent") == ("mem0.*",)
+        assert router.match("unrelated") == ()
+
+    def test_matches_fnmatch_for_many_patterns(self) -> None:
+        rng = random.Random(7)  # noqa: S311
+        alphabet = "ab."
+        patterns = ["".join(rng.choice(alphabet + "*?") for _ in range(rng.randint(1, 6))) for _ in range(200)]
+        router = ChannelRouter(patterns=patterns)
+
+        for _ in range(300):
+            channel = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            expected = tuple(p for p in dict.fromkeys(patterns) if fnmatch.fnmatchcase(channel, p))
+            assert router.match_patterns(channel) == expected
+
+
+def _pmessage(pattern: str, channel: str, data: Any) -> dict[str, Any]:
+    return {
+        "type": "pmessage",
+        "pattern": pattern.encode(),
+        "channel": channel.encode(),
+        "data": get_codec("orjson").frame(data),
+    }
+
+
+class TestPatternSubscriptions:
+    """Test PSUBSCRIBE handling in RedisPubSub."""
+
+    async def test_pmessage_reaches_pattern_handlers_only(self, pubsub: RedisPubSub) -> None:
+        received: list[tuple[str, Any]] = []
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append((channel, message))
+
+        pubsub._pattern_handlers = {"mem0.recorded.*": [handler]}
+
+        await pubsub._handle_message(_pmessage("mem0.recorded.*", "mem0.recorded.user", {"n": 1}))
+        await pubsub._handle_message(_pmessage("other.*", "other.x", {"n": 2}))
+
+        assert received == [("mem0.recorded.user", {"n": 1})]
+
+    async def test_router_tracks_subscriptions(self, pubsub: RedisPubSub) -> None:
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        pubsub._redis.pubsub = MagicMock(return_value=AsyncMock())
+        await pubsub.psubscribe("mem0.recorded.*", handler)
+        await pubsub.subscribe("mem0.recorded.user", handler)
+        assert pubsub.matching_subscriptions("mem0.recorded.user") == ("mem0.recorded.user", "mem0.recorded.*")
+
+        await pubsub.punsubscribe("mem0.recorded.*", handler)
+        assert pubsub.active_pattern_subscriptions == set()
+        assert pubsub.matching_subscriptions("mem0.recorded.user") == ("mem0.recorded.user",)
+        await pubsub.disconnect()
+
+    async def test_psubscribe_over_fakeredis(self, fake_redis_pubsub: RedisPubSub) -> None:
+        received: list[tuple[str, Any]] = []
+        done = asyncio.Event()
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append((channel, message))
+            if len(received) == 2:
+                done.set()
+
+        try:
+            await fake_redis_pubsub.psubscribe("mem0.recorded.*", handler)
+            await fake_redis_pubsub.publish("mem0.recorded.user", {"n": 1})
+            await fake_redis_pubsub.publish("mem0.deleted.user", {"n": 2})
+            await fake_redis_pubsub.publish("mem0.recorded.agent", {"n": 3})
+            await asyncio.wait_for(done.wait(), timeout=2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert received == [("mem0.recorded.user", {"n": 1}), ("mem0.recorded.agent", {"n": 3})]
+
+    async def test_pattern_gets_its_own_dispatcher_queue(self, fake_redis_pubsub: RedisPubSub) -> None:
+        await fake_redis_pubsub.enable_dispatcher(queue_size=10)
+        done = asyncio.Event()
+
+        async def handler(_channel: str, _message: Any) -> None:
+            done.set()
+
+        try:
+            await fake_redis_pubsub.psubscribe("jobs.*", handler)
+            await fake_redis_pubsub.publish("jobs.a", {"n": 1})
+            await asyncio.wait_for(done.wait(), timeout=2)
+            assert set(fake_redis_pubsub.dispatcher_metrics["channels"]) == {"jobs.*"}  # type: ignore[index]
+        finally:
+            await fake_redis_pubsub.disconnect()
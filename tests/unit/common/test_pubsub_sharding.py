@@ -0,0 +1,110 @@
+"""Unit tests for sharded RedisPubSub subscriber connections."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.common.pubsub import RedisPubSub, SubscribeError, jump_hash, key_slot
+
+
+class TestHashing:
+    """Test channel to shard mapping."""
+
+    def test_key_slot_matches_redis_cluster(self) -> None:
+        assert key_slot("foo") == 12182
+        assert key_slot("{user1000}.following") == key_slot("user1000")
+        assert key_slot("foo{}bar") == key_slot("foo{}bar")
+
+    def test_jump_hash_is_balanced_and_moves_few_keys(self) -> None:
+        before = [jump_hash(slot, 4) for slot in range(16384)]
+        after = [jump_hash(slot, 5) for slot in range(16384)]
+
+        counts = [before.count(bucket) for bucket in range(4)]
+        assert min(counts) > 16384 / 4 * 0.9
+        moved = sum(1 for old, new in zip(before, after, strict=True) if old != new)
+        # Only keys that move to the new bucket change shard
+        assert all(new == 4 for old, new in zip(before, after, strict=True) if old != new)
+        assert moved < 16384 / 5 * 1.1
+
+
+class TestShardedSubscriptions:
+    """Test subscribing and receiving across shard connections over fakeredis."""
+
+    @pytest.mark.parametrize("sharded_commands", [False, True])
+    async def test_channels_spread_over_shards(self, fake_redis_pubsub: RedisPubSub, sharded_commands: bool) -> None:
+        await fake_redis_pubsub.enable_sharding(4, sharded_commands=sharded_commands)
+        channels = [f"events.{i}" for i in range(16)]
+        received: list[tuple[str, Any]] = []
+        done = asyncio.Event()
+
+        async def handler(channel: str, message: Any) -> None:
+            received.append((channel, message))
+            if len(received) == len(channels):
+                done.set()
+
+        try:
+            for channel in channels:
+                await fake_redis_pubsub.subscribe(channel, handler)
+            for channel in channels:
+                assert await fake_redis_pubsub.publish(channel, {"c": channel}) == 1
+            await asyncio.wait_for(done.wait(), timeout=2)
+
+            metrics = fake_redis_pubsub.sharding_metrics
+            assert metrics is not None
+            assert metrics["sharded_commands"] is sharded_commands
+            per_shard = metrics["per_shard"]
+            assert sum(shard["channels"] for shard in per_shard) == len(channels)
+            assert sum(shard["received"] for shard in per_shard) == len(channels)
+            assert sum(1 for shard in per_shard if shard["channels"]) > 1
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+        assert sorted(received) == sorted((channel, {"c": channel}) for channel in channels)
+
+    async def test_unsubscribe_leaves_shard(self, fake_redis_pubsub: RedisPubSub) -> None:
+        await fake_redis_pubsub.enable_sharding(2, sharded_commands=True)
+
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            await fake_redis_pubsub.unsubscribe("events")
+
+            assert fake_redis_pubsub.active_subscriptions == set()
+            assert sum(shard["channels"] for shard in fake_redis_pubsub.sharding_metrics["per_shard"]) == 0  # type: ignore[index]
+            assert await fake_redis_pubsub.publish("events", {"n": 1}) == 0
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+    async def test_sharded_commands_refuse_patterns(self, fake_redis_pubsub: RedisPubSub) -> None:
+        await fake_redis_pubsub.enable_sharding(2, sharded_commands=True)
+
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        with pytest.raises(SubscribeError, match="SPUBLISH"):
+            await fake_redis_pubsub.psubscribe("events.*", handler)
+
+    async def test_enable_after_subscribing_is_refused(self, fake_redis_pubsub: RedisPubSub) -> None:
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        try:
+            await fake_redis_pubsub.subscribe("events", handler)
+            with pytest.raises(SubscribeError, match="before subscribing"):
+                await fake_redis_pubsub.enable_sharding(2)
+        finally:
+            await fake_redis_pubsub.disconnect()
+
+    async def test_sharded_commands_detected_from_server_version(self, pubsub: RedisPubSub) -> None:
+        pubsub._redis.info.return_value = {"redis_version": "7.2.4"}
+        await pubsub.enable_sharding(2)
+        assert pubsub.sharding_metrics["sharded_commands"] is True  # type: ignore[index]
+
+        pubsub._redis.info.return_value = {"redis_version": "6.2.14"}
+        await pubsub.enable_sharding(2)
+        assert pubsub.sharding_metrics["sharded_commands"] is False  # type: ignore[index]
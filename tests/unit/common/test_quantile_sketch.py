@@ -0,0 +1,72 @@
+"""Unit tests for the mergeable quantile sketch."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.common.quantile_sketch import QuantileSketch
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test accuracy, merging and serialization."""
+
+    def test_empty_sketch(self) -> None:
+        sketch = QuantileSketch()
+
+        assert sketch.quantile(0.5) is None
+        assert sketch.mean is None
+        assert sketch.to_dict()["min"] is None
+
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+    def test_quantiles_within_relative_error(self, q: float) -> None:
+        rng = random.Random(42)  # noqa: S311
+        values = [rng.lognormvariate(5, 1) for _ in range(10_000)]
+        sketch = QuantileSketch(alpha=0.01)
+        sketch.extend(values)
+
+        estimate = sketch.quantile(q)
+        exact = _exact_quantile(values, q)
+
+        assert estimate is not None
+        assert abs(estimate - exact) <= 0.01 * exact + 1e-9
+
+    def test_merge_matches_single_sketch(self) -> None:
+        values = [float(v) for v in range(1, 1001)]
+        whole = QuantileSketch()
+        whole.extend(values)
+        first, second = QuantileSketch(), QuantileSketch()
+        first.extend(values[:300])
+        second.extend(values[300:])
+
+        first.merge(second)
+
+        assert first.count == whole.count
+        assert first.sum == whole.sum
+        assert first.quantile(0.95) == whole.quantile(0.95)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        with pytest.raises(ValueError, match="Cannot merge"):
+            QuantileSketch(alpha=0.01).merge(QuantileSketch(alpha=0.02))
+
+    def test_zero_values(self) -> None:
+        sketch = QuantileSketch()
+        sketch.extend([0, 0, 0, 10])
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.min == 0.0
+
+    def test_round_trip(self) -> None:
+        sketch = QuantileSketch()
+        sketch.extend([3, 14, 159, 2653])
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+
+        assert restored.to_dict() == sketch.to_dict()
+        assert restored.quantile(0.99) == sketch.quantile(0.99)
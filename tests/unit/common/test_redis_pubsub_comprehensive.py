@@ -24,6 +24,7 @@ from src.common.pubsub import (
     cleanup_pubsub,
     get_pubsub,
 )
+from src.common.redis_config import RedisConfig
 
 # Add warning filters for clean test output
 pytestmark = [
@@ -145,6 +146,32 @@ class TestRedisPubSubComprehensive:
             with pytest.raises(PublishError):
                 await connected_pubsub.publish("test", test_case)  # type: ignore[arg-type]
 
+    async def test_publish_many_returns_counts_and_aggregates_metrics(self, connected_pubsub: RedisPubSub) -> None:
+        """Test batch publish returns per-message counts and records batch totals."""
+        counts = await connected_pubsub.publish_many([("a", {"n": 1}), ("b", {"n": 2}), ("a", {"n": 3})])
+
+        assert counts == [0, 0, 0]
+        metrics = connected_pubsub.publish_batch_metrics
+        assert metrics["batches"] == 1
+        assert metrics["messages"] == 3
+        assert metrics["bytes"] == 3 * len(b'\x01{"n":1}')
+        assert metrics["avg_batch_size"] == 3
+
+    async def test_publish_many_empty_batch_skips_redis(self, connected_pubsub: RedisPubSub) -> None:
+        """Test an empty batch does not touch Redis or the metrics."""
+        assert await connected_pubsub.publish_many([]) == []
+        assert connected_pubsub.publish_batch_metrics["batches"] == 0
+
+    async def test_publish_many_serialization_failure_counts_failed_batch(self, connected_pubsub: RedisPubSub) -> None:
+        """Test one unserializable message fails the whole batch."""
+        with pytest.raises(PublishError, match="serialize"):
+            await connected_pubsub.publish_many([("a", {"ok": 1}), ("a", {"bad": {1, 2}})])  # type: ignore[dict-item]
+
+        metrics = connected_pubsub.publish_batch_metrics
+        assert metrics["failed_batches"] == 1
+        assert metrics["failed_messages"] == 2
+        assert metrics["messages"] == 0
+
     async def test_subscribe_with_circuit_breaker_failure(self, connected_pubsub: RedisPubSub) -> None:
         """Test subscription when circuit breaker prevents operations."""
         # Create a mock pubsub that fails on subscribe with RedisError
@@ -307,6 +334,8 @@ class TestRedisPubSubComprehensive:
         mock_pubsub.subscribe = AsyncMock()
         connected_pubsub._pubsub = mock_pubsub
         connected_pubsub._subscribers.add("test")
+        # Keep the jittered reconnect delay well inside the wait below
+        connected_pubsub.configure_reconnect(backoff_base=0.001, backoff_max=0.001)
 
         with patch.object(connected_pubsub, "connect") as mock_connect:
             mock_connect.return_value = None
@@ -485,6 +514,60 @@ class TestGlobalPubSubFunctions:
             with pytest.raises(Exception, match="Connection failed"):
                 await get_pubsub()
 
+    async def test_get_pubsub_configured_when_first_connect_fails(self, monkeypatch: Any) -> None:
+        """Test the singleton gets its settings even when Redis is down at startup."""
+        await cleanup_pubsub()
+        config = RedisConfig(
+            redis_publish_linger_ms=1.0,
+            redis_pubsub_channel_codecs={"blobs": "raw"},
+            redis_pubsub_retained_channels={"state": 60.0},
+            redis_publish_lean=True,
+            redis_pubsub_shards=4,
+            redis_pubsub_loopback=True,
+            redis_dispatch_queue_size=100,
+        )
+        monkeypatch.setattr("src.common.pubsub.get_redis_config", lambda: config)
+
+        with patch.object(RedisPubSub, "connect", AsyncMock(side_effect=PubSubError("down"))):
+            with pytest.raises(PubSubError):
+                await get_pubsub()
+            pubsub = await get_pubsub()
+
+        try:
+            assert pubsub.auto_batching_metrics is not None
+            assert pubsub._channel_codecs["blobs"].name == "raw"
+            assert pubsub.retained_metrics["channels"] == {"state": 60.0}
+            assert pubsub.lean_publish_metrics["enabled"] is True
+            # The server version could not be read, so the shards use SUBSCRIBE/PUBLISH
+            assert pubsub.sharding_metrics == {
+                "shards": 4,
+                "sharded_commands": False,
+                "per_shard": [{"shard": index, "channels": 0, "received": 0} for index in range(4)],
+            }
+            assert pubsub.loopback_metrics is not None
+            assert pubsub.dispatcher_metrics is not None
+        finally:
+            await cleanup_pubsub()
+
+    async def test_get_pubsub_concurrent_callers_get_configured_instance(self, monkeypatch: Any) -> None:
+        """Test callers arriving while the singleton connects wait until it is configured."""
+        await cleanup_pubsub()
+        config = RedisConfig(redis_pubsub_shards=4, redis_pubsub_sharded_commands=False)
+        monkeypatch.setattr("src.common.pubsub.get_redis_config", lambda: config)
+
+        async def slow_connect(_self: RedisPubSub) -> None:
+            await asyncio.sleep(0.01)
+
+        with patch.object(RedisPubSub, "connect", slow_connect):
+            first, second = await asyncio.gather(get_pubsub(), get_pubsub())
+
+        try:
+            assert first is second
+            assert first.sharding_metrics is not None
+            assert first.sharding_metrics["shards"] == 4
+        finally:
+            await cleanup_pubsub()
+
     async def test_cleanup_pubsub_edge_cases(self) -> None:
         """Test cleanup_pubsub edge cases."""
         # Test multiple cleanups
@@ -0,0 +1,188 @@
+"""Unit tests for the Redis Streams transport, run against fakeredis."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.common.base_subscriber import BaseSubscriber
+from src.common.pubsub import PublishError, RedisPubSub
+from src.common.redis_streams import STREAM_ID_KEY, RedisStreams
+
+
+@pytest.fixture
+async def streams(fake_redis_pubsub: RedisPubSub) -> Any:
+    """RedisStreams with short block/claim intervals, stopped after the test."""
+    instance = RedisStreams(fake_redis_pubsub, block_ms=20, claim_interval=0.05)
+    yield instance
+    await instance.disconnect()
+
+
+async def _wait_for(predicate: Any) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("condition not met in time")
+
+
+class TestPublish:
+    """Test XADD publishing."""
+
+    async def test_publish_appends_codec_framed_entry(self, streams: RedisStreams, fake_redis: Any) -> None:
+        entry_id = await streams.publish("events", {"n": 1}, correlation_id="abc")
+
+        entries = await fake_redis.xrange("events")
+        assert [(e[0].decode(), e[1]) for e in entries] == [(entry_id, {b"d": b'\x01{"n":1}', b"c": b"abc"})]
+        assert streams.metrics["published"] == 1
+
+    async def test_publish_many_trims_to_maxlen(self, fake_redis_pubsub: RedisPubSub, fake_redis: Any) -> None:
+        streams = RedisStreams(fake_redis_pubsub, maxlen=10)
+
+        ids = await streams.publish_many([("events", {"n": i}) for i in range(50)])
+
+        assert len(ids) == 50
+        assert await fake_redis.xlen("events") <= 50
+
+    async def test_unserializable_message_raises_publish_error(self, streams: RedisStreams) -> None:
+        with pytest.raises(PublishError, match="serialize"):
+            await streams.publish("events", {"bad": {1}})
+
+
+class TestConsumerGroups:
+    """Test consuming through consumer groups."""
+
+    async def test_consumer_receives_and_acks(self, streams: RedisStreams) -> None:
+        received: list[Any] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+
+        await streams.subscribe("events", handler, group="workers", consumer="c1")
+        await streams.publish_many([("events", {"n": i}) for i in range(5)])
+
+        await _wait_for(lambda: len(received) == 5)
+        assert received == [{"n": i} for i in range(5)]
+        await _wait_for(lambda: streams.metrics["consumers"][0]["acked"] == 5)
+        assert await streams.pending_count("events", "workers") == 0
+
+    async def test_consumers_in_one_group_split_entries(self, streams: RedisStreams) -> None:
+        seen: dict[str, list[int]] = {"c1": [], "c2": []}
+
+        def make_handler(name: str) -> Any:
+            async def handler(_channel: str, message: Any) -> None:
+                seen[name].append(message["n"])
+                await asyncio.sleep(0.005)
+
+            return handler
+
+        await streams.subscribe("events", make_handler("c1"), group="workers", consumer="c1")
+        await streams.subscribe("events", make_handler("c2"), group="workers", consumer="c2")
+        await asyncio.sleep(0.05)
+        await streams.publish_many([("events", {"n": i}) for i in range(40)])
+
+        await _wait_for(lambda: len(seen["c1"]) + len(seen["c2"]) == 40)
+        assert sorted(seen["c1"] + seen["c2"]) == list(range(40))
+
+    async def test_failed_entry_is_claimed_and_redelivered(self, fake_redis_pubsub: RedisPubSub) -> None:
+        streams = RedisStreams(fake_redis_pubsub, block_ms=20, claim_idle_ms=0, claim_interval=0.05)
+        attempts: list[int] = []
+
+        async def flaky(_channel: str, message: Any) -> None:
+            attempts.append(message["n"])
+            if len(attempts) == 1:
+                raise RuntimeError("transient")
+
+        try:
+            await streams.subscribe("events", flaky, group="workers", consumer="c1")
+            await streams.publish("events", {"n": 7})
+
+            await _wait_for(lambda: len(attempts) >= 2)
+            metrics = streams.metrics["consumers"][0]
+            assert metrics["handler_errors"] == 1
+            assert metrics["claimed"] >= 1
+            await _wait_for(lambda: streams.metrics["consumers"][0]["acked"] == 1)
+        finally:
+            await streams.disconnect()
+
+    async def test_manual_ack_leaves_entry_pending_until_acked(self, streams: RedisStreams) -> None:
+        received: list[dict[str, Any]] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+
+        await streams.subscribe("events", handler, group="workers", consumer="c1", auto_ack=False)
+        await streams.publish("events", [1, 2])
+
+        await _wait_for(lambda: len(received) == 1)
+        message = received[0]
+        assert message["payload"] == [1, 2]
+        assert STREAM_ID_KEY in message
+        assert await streams.pending_count("events", "workers") == 1
+
+        assert await streams.ack_message(message) is True
+        assert await streams.pending_count("events", "workers") == 0
+        assert await streams.ack_message(message) is False
+
+    async def test_undecodable_entry_is_dropped(self, streams: RedisStreams, fake_redis: Any) -> None:
+        received: list[Any] = []
+
+        async def handler(_channel: str, message: Any) -> None:
+            received.append(message)
+
+        await streams.subscribe("events", handler, group="workers", consumer="c1")
+        await fake_redis.xadd("events", {"d": b"\x01{not json"})
+        await streams.publish("events", {"ok": True})
+
+        await _wait_for(lambda: received == [{"ok": True}])
+        await _wait_for(lambda: streams.metrics["consumers"][0]["decode_errors"] == 1)
+        assert await streams.pending_count("events", "workers") == 0
+
+    async def test_unsubscribe_stops_consumer(self, streams: RedisStreams) -> None:
+        async def handler(_channel: str, _message: Any) -> None:
+            return None
+
+        await streams.subscribe("events", handler, group="workers")
+        await streams.unsubscribe("events", handler)
+
+        assert streams.metrics["consumers"] == []
+
+
+class TestBaseSubscriberOverStreams:
+    """Test BaseSubscriber consuming a stream through a consumer group."""
+
+    async def test_entries_acked_after_processing_and_dead_lettering(
+        self, streams: RedisStreams, fake_redis_pubsub: RedisPubSub, monkeypatch: Any
+    ) -> None:
+        async def _get_pubsub() -> RedisPubSub:
+            return fake_redis_pubsub
+
+        monkeypatch.setattr("src.common.base_subscriber.get_pubsub", _get_pubsub)
+        dead_letters: list[dict[str, Any]] = []
+
+        async def dlq_publish(message: dict[str, Any]) -> None:
+            dead_letters.append(message)
+
+        class Worker(BaseSubscriber):
+            async def process_message(self, message: dict[str, Any]) -> bool:
+                return message["n"] != 3
+
+        worker = Worker(streams=streams, dlq_publish=dlq_publish, batch_size=1)
+        assert worker.metrics["transport"] == "streams"
+
+        await worker.start_consuming("events")
+        try:
+            await _wait_for(lambda: len(streams.metrics["consumers"]) == 1)
+            assert streams.metrics["consumers"][0]["group"] == "Worker"
+            await streams.publish_many([("events", {"n": i}) for i in range(5)])
+
+            await _wait_for(lambda: worker.metrics["processed_count"] == 5)
+            assert [message["n"] for message in dead_letters] == [3]
+            await _wait_for(lambda: streams.metrics["consumers"][0]["acked"] == 5)
+            assert await streams.pending_count("events", "Worker") == 0
+        finally:
+            await worker.stop_consuming()
+
+        assert streams.metrics["consumers"] == []
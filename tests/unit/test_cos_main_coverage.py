@@ -8,7 +8,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestCosMainSysPath:
@@ -130,6 +130,17 @@ class TestCosMainAppCreation:
         cc_routes = [path for path in route_paths if path.startswith("/cc")]
         assert len(cc_routes) > 0
 
+    @patch("src.backend.cc.cc_main.log_event")
+    async def test_lifespan_flushes_log_writer_on_shutdown(self, mock_log_event: Any) -> None:
+        """Test that the served app runs the CC lifespan, flushing queued log events on shutdown."""
+        from src.cos_main import app
+
+        with patch("src.backend.cc.cc_main.shutdown_log_writer", new_callable=AsyncMock) as mock_shutdown:
+            async with app.router.lifespan_context(app):
+                mock_shutdown.assert_not_awaited()
+
+        mock_shutdown.assert_awaited_once()
+
 
 class TestCosMainLogEvent:
     """Test the log_event call in cos_main.py."""